@@ -13,7 +13,7 @@ This script demonstrates:
 
 from datetime import date, timedelta
 from unittest.mock import Mock
-from triage.models import JiraIssue, TaskClassification, TaskCategory
+from triage.models import IssueState, JiraIssue, TaskClassification, TaskCategory
 from triage.task_classifier import TaskClassifier
 from triage.plan_generator import PlanGenerator
 
@@ -96,9 +96,12 @@ def main():
     day1_date = date.today()
     day1_classifications = [classifier.classify_task(task) for task in day1_tasks]
     
-    # Simulate that PROJ-101 and PROJ-102 are completed (not in active tasks anymore)
-    day2_active_tasks = [day1_tasks[2]]  # Only PROJ-103 remains
-    mock_jira_client.fetch_active_tasks.return_value = day2_active_tasks
+    # Simulate that PROJ-101 and PROJ-102 are completed (resolved in JIRA)
+    mock_jira_client.fetch_issue_states.return_value = {
+        "PROJ-101": IssueState("PROJ-101", "Done", "done", "Done", "user@example.com"),
+        "PROJ-102": IssueState("PROJ-102", "Done", "done", "Done", "user@example.com"),
+        "PROJ-103": IssueState("PROJ-103", "To Do", "new", None, "user@example.com"),
+    }
     
     # Calculate and save closure record
     closure_record = plan_generator.save_closure_record(day1_date, day1_classifications[:3])
@@ -28,6 +28,8 @@ import boto3
 # Add parent directory to path to import triage package
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from triage.closure_store import create_closure_store
+from triage.dependency_graph import DependencyGraph
 from triage.core.actions_api import CoreActionsAPI
 from triage.core.event_bus import EventBus
 from triage.jira_client import JiraClient
@@ -111,15 +113,19 @@ async def initialize_registry() -> PluginRegistry:
         )
         logger.info("JIRA client initialized")
 
-        # Initialize task classifier and plan generator
-        classifier = TaskClassifier()
+        # Initialize task classifier and plan generator; issue links decide
+        # which tasks wait on work outside the backlog
+        dependency_graph = DependencyGraph(jira_client)
+        classifier = TaskClassifier(dependency_graph=dependency_graph)
 
         # Use /tmp for closure tracking in Lambda
         closure_dir = os.path.join('/tmp', '.triage', 'closure')
         generator = PlanGenerator(
             jira_client,
             classifier,
-            closure_tracking_dir=closure_dir
+            closure_tracking_dir=closure_dir,
+            closure_store=create_closure_store(closure_dir, os.environ.get('DATABASE_URL')),
+            dependency_graph=dependency_graph
         )
         logger.info("Task classifier and plan generator initialized")
 
@@ -6,7 +6,7 @@ import json
 import os
 import sys
 import logging
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import Dict, Any, Optional
 import boto3
 
@@ -16,6 +16,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from triage.jira_client import JiraClient
 from triage.task_classifier import TaskClassifier
 from triage.plan_generator import PlanGenerator
+from triage.closure_store import DEFAULT_USER_ID, ClosureStore, create_closure_store
+from triage.dependency_graph import DependencyGraph
+from triage.models import DailyPlan
+from triage.plan_cache import PlanCache, create_plan_cache
+from triage.plan_prewarmer import PlanPrewarmer
+from triage.plan_renderer import PlanRenderer
 
 # Configure logging
 logger = logging.getLogger()
@@ -23,6 +29,37 @@ logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 
 secrets_client = boto3.client('secretsmanager')
 
+# Local closure directory (/tmp is the only writable directory in Lambda)
+CLOSURE_DIR = os.path.join('/tmp', '.triage', 'closure')
+
+# Closure store reused across warm invocations
+_closure_store: Optional[ClosureStore] = None
+
+def get_closure_store() -> ClosureStore:
+    """
+    Get the closure store shared by all plan functions (PostgreSQL at DATABASE_URL).
+    
+    Without DATABASE_URL, records fall back to SQLite in /tmp, which is
+    private to the function instance and lost when it is recycled.
+    """
+    global _closure_store
+    if _closure_store is None:
+        database_url = os.environ.get('DATABASE_URL')
+        if not database_url:
+            logger.warning("DATABASE_URL is not set: closure records and plans are kept in /tmp of this instance only")
+        _closure_store = create_closure_store(CLOSURE_DIR, database_url)
+    return _closure_store
+
+# Plan cache reused across warm invocations
+_plan_cache: Optional[PlanCache] = None
+
+def get_plan_cache() -> PlanCache:
+    """Get the plan cache (stored next to the closure records)."""
+    global _plan_cache
+    if _plan_cache is None:
+        _plan_cache = create_plan_cache(CLOSURE_DIR, get_closure_store())
+    return _plan_cache
+
 def get_jira_credentials() -> Dict[str, str]:
     """Retrieve JIRA credentials from Secrets Manager."""
     secret_name = os.environ['JIRA_SECRET_NAME']
@@ -57,6 +94,54 @@ def health_check(event: Dict, context: Any) -> Dict:
         'timestamp': datetime.utcnow().isoformat()
     })
 
+def create_plan_generator(user_id: str = DEFAULT_USER_ID) -> PlanGenerator:
+    """Create a plan generator with the stored JIRA credentials, closure store and plan cache."""
+    creds = get_jira_credentials()
+    
+    jira_client = JiraClient(
+        base_url=creds['jira_base_url'],
+        email=creds['jira_email'],
+        api_token=creds['jira_api_token'],
+        project=creds.get('jira_project')  # Optional project filter
+    )
+    
+    # Issue links decide which tasks wait on work outside the backlog
+    dependency_graph = DependencyGraph(jira_client)
+    return PlanGenerator(
+        jira_client,
+        TaskClassifier(dependency_graph=dependency_graph),
+        closure_tracking_dir=CLOSURE_DIR,
+        closure_store=get_closure_store(),
+        user_id=user_id,
+        plan_cache=get_plan_cache(),
+        dependency_graph=dependency_graph
+    )
+
+def plan_response(plan: DailyPlan, page: Optional[Dict] = None) -> Dict[str, Any]:
+    """
+    Build the response body of a daily plan (JSON and Markdown rendered in one pass).
+    
+    Other tasks are paginated so the payload stays bounded: ``page`` may
+    carry 'limit' (default: PlanRenderer.OTHER_TASKS_PAGE_SIZE, at most
+    PlanRenderer.MAX_OTHER_TASKS_PAGE_SIZE) and the 'cursor' returned as
+    other_tasks_next_cursor by the previous page.
+    
+    Raises:
+        ValueError: If the limit is not an integer or the cursor is invalid
+    """
+    page = page or {}
+    rendered = PlanRenderer.default().render(
+        plan,
+        formats=('json', 'markdown'),
+        other_tasks_limit=PlanRenderer.page_limit(page.get('limit')),
+        other_tasks_cursor=page.get('cursor')
+    )
+    return {
+        'success': True,
+        'date': plan.date.isoformat(),
+        'plan': {**rendered.json, 'markdown': rendered.markdown}
+    }
+
 def generate_plan(event: Dict, context: Any) -> Dict:
     """
     Generate daily plan.
@@ -64,7 +149,9 @@ def generate_plan(event: Dict, context: Any) -> Dict:
     POST /api/v1/plan
     Body: {
         "date": "2026-02-17" (optional, defaults to today),
-        "closure_rate": 0.67 (optional)
+        "closure_rate": 0.67 (optional),
+        "limit": 50 (optional, other tasks per page),
+        "cursor": "..." (optional, other_tasks_next_cursor of the previous page)
     }
     """
     try:
@@ -76,66 +163,26 @@ def generate_plan(event: Dict, context: Any) -> Dict:
         
         logger.info(f"Generating plan for {plan_date}")
         
-        # Get JIRA credentials
-        creds = get_jira_credentials()
+        generator = create_plan_generator()
         
-        # Initialize components
-        jira_client = JiraClient(
-            base_url=creds['jira_base_url'],
-            email=creds['jira_email'],
-            api_token=creds['jira_api_token'],
-            project=creds.get('jira_project')  # Optional project filter
-        )
-        
-        classifier = TaskClassifier()
-        
-        # Use /tmp for closure tracking in Lambda (only writable directory)
-        closure_dir = os.path.join('/tmp', '.triage', 'closure')
-        generator = PlanGenerator(jira_client, classifier, closure_tracking_dir=closure_dir)
-        
-        # Fetch and classify tasks
-        issues = jira_client.fetch_active_tasks()
+        # Fetch tasks; classification and selection are skipped if the backlog is unchanged
+        issues = generator.jira_client.fetch_active_tasks()
         logger.info(f"Fetched {len(issues)} active issues")
         
-        classified_tasks = [classifier.classify_task(issue) for issue in issues]
-        
-        # Generate plan
         plan = generator.generate_daily_plan(
-            previous_closure_rate=closure_rate
+            previous_closure_rate=closure_rate,
+            issues=issues,
+            plan_date=date.fromisoformat(plan_date)
         )
         
-        # Convert to markdown
-        markdown = plan.to_markdown()
+        return create_response(200, plan_response(plan, body))
         
-        return create_response(200, {
-            'success': True,
-            'date': plan_date,
-            'plan': {
-                'priorities': [
-                    {
-                        'key': p.task.key,
-                        'summary': p.task.summary,
-                        'estimated_days': p.estimated_days,
-                        'category': p.category.value
-                    }
-                    for p in plan.priorities
-                ],
-                'admin_block': {
-                    'tasks': [
-                        {
-                            'key': t.task.key,
-                            'summary': t.task.summary
-                        }
-                        for t in plan.admin_block.tasks
-                    ],
-                    'time_allocation_minutes': plan.admin_block.time_allocation_minutes,
-                    'scheduled_time': plan.admin_block.scheduled_time
-                } if plan.admin_block else None,
-                'other_tasks_count': len(plan.other_tasks),
-                'markdown': markdown
-            }
+    except ValueError as e:
+        logger.warning(f"Invalid plan request: {e}")
+        return create_response(400, {
+            'success': False,
+            'error': str(e)
         })
-        
     except Exception as e:
         logger.error(f"Error generating plan: {e}", exc_info=True)
         return create_response(500, {
@@ -147,18 +194,28 @@ def get_plan(event: Dict, context: Any) -> Dict:
     """
     Get existing plan for a date.
     
-    GET /api/v1/plan/{date}
+    GET /api/v1/plan/{date}?limit=50&cursor=...
     """
     try:
         plan_date = event['pathParameters']['date']
+        page = event.get('queryStringParameters') or {}
         logger.info(f"Retrieving plan for {plan_date}")
         
-        # For now, regenerate the plan
-        # In future, could cache in DynamoDB or S3
+        # Serve the stored plan; generate it if none is stored yet
+        cached = get_plan_cache().load(date.fromisoformat(plan_date))
+        if cached is not None:
+            return create_response(200, plan_response(cached.plan, page))
+        
         return generate_plan({
-            'body': json.dumps({'date': plan_date})
+            'body': json.dumps({**page, 'date': plan_date})
         }, context)
         
+    except ValueError as e:
+        logger.warning(f"Invalid plan request: {e}")
+        return create_response(400, {
+            'success': False,
+            'error': str(e)
+        })
     except Exception as e:
         logger.error(f"Error retrieving plan: {e}", exc_info=True)
         return create_response(500, {
@@ -166,6 +223,67 @@ def get_plan(event: Dict, context: Any) -> Dict:
             'error': str(e)
         })
 
+def prewarm_plans(event: Dict, context: Any) -> Dict:
+    """
+    Pre-generate the morning plan ahead of its deadline.
+    
+    Invoked on a schedule every PREWARM_TICK_MINUTES minutes from the start
+    of the pre-generation window up to the deadline. Each tick runs the
+    draft and refresh stages that fell due since the previous tick, so the
+    plan is stored (and refreshed only if the backlog changed) by the
+    deadline. Plans are stored in the plan cache at DATABASE_URL, which the
+    generate_plan run scheduled at the deadline and get_plan read from.
+    
+    Environment:
+        PLAN_DEADLINE: Time plans must be ready, HH:MM UTC (default: 07:00)
+        PREWARM_WINDOW_MINUTES: Length of the pre-generation window (default: 60)
+        PREWARM_REFRESH_MINUTES: Length of the final refresh stage (default: 10)
+        PREWARM_TICK_MINUTES: Interval between scheduled invocations (default: 5)
+    """
+    try:
+        hour, minute = map(int, os.environ.get('PLAN_DEADLINE', '07:00').split(':'))
+        window_minutes = int(os.environ.get('PREWARM_WINDOW_MINUTES', '60'))
+        refresh_minutes = int(os.environ.get('PREWARM_REFRESH_MINUTES', '10'))
+        tick_minutes = int(os.environ.get('PREWARM_TICK_MINUTES', '5'))
+        
+        # Align to the tick so consecutive invocations cover contiguous intervals
+        now = datetime.utcnow()
+        until = now.replace(minute=now.minute - now.minute % tick_minutes, second=0, microsecond=0)
+        since = until - timedelta(minutes=tick_minutes)
+        deadline = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        
+        prewarmer = PlanPrewarmer(
+            create_plan_generator,
+            window_minutes=window_minutes,
+            refresh_minutes=refresh_minutes
+        )
+        tasks = prewarmer.due([DEFAULT_USER_ID], deadline, since, until)
+        
+        for task in tasks:
+            prewarmer.run(task, deadline)
+        
+        logger.info(f"Pre-generation tick {until.isoformat()}: {len(tasks)} plan(s) generated")
+        
+        return create_response(200, {
+            'success': True,
+            'date': deadline.date().isoformat(),
+            'runs': [
+                {
+                    'user_id': task.user_id,
+                    'stage': task.stage,
+                    'fire_at': task.fire_at.isoformat()
+                }
+                for task in tasks
+            ]
+        })
+        
+    except Exception as e:
+        logger.error(f"Error pre-generating plans: {e}", exc_info=True)
+        return create_response(500, {
+            'success': False,
+            'error': str(e)
+        })
+
 def approve_plan(event: Dict, context: Any) -> Dict:
     """
     Approve or reject a plan.
@@ -186,8 +304,8 @@ def approve_plan(event: Dict, context: Any) -> Dict:
         
         logger.info(f"Plan approval for {plan_date}: {approved}")
         
-        # Here you would implement the approval logic
-        # For now, just acknowledge
+        # The stored plan is regenerated on the next request
+        get_plan_cache().invalidate(plan_date=date.fromisoformat(plan_date))
         
         return create_response(200, {
             'success': True,
@@ -232,9 +350,12 @@ def decompose_task(event: Dict, context: Any) -> Dict:
         
         classifier = TaskClassifier()
         
-        # Use /tmp for closure tracking in Lambda (only writable directory)
-        closure_dir = os.path.join('/tmp', '.triage', 'closure')
-        generator = PlanGenerator(jira_client, classifier, closure_tracking_dir=closure_dir)
+        generator = PlanGenerator(
+            jira_client,
+            classifier,
+            closure_tracking_dir=CLOSURE_DIR,
+            closure_store=get_closure_store()
+        )
         
         # Fetch the specific task
         issue = jira_client.get_task_by_key(task_id)
@@ -123,6 +123,8 @@ async def initialize_registry():
     from triage.jira_client import JiraClient
     from triage.task_classifier import TaskClassifier
     from triage.plan_generator import PlanGenerator
+    from triage.closure_store import create_closure_store
+    from triage.dependency_graph import DependencyGraph
     
     if _registry is not None:
         logger.info("Reusing existing Plugin Registry (warm Lambda)")
@@ -148,15 +150,19 @@ async def initialize_registry():
         )
         logger.info("JIRA client initialized")
         
-        # Initialize task classifier and plan generator
-        classifier = TaskClassifier()
+        # Initialize task classifier and plan generator; issue links decide
+        # which tasks wait on work outside the backlog
+        dependency_graph = DependencyGraph(jira_client)
+        classifier = TaskClassifier(dependency_graph=dependency_graph)
         
         # Use /tmp for closure tracking in Lambda
         closure_dir = os.path.join('/tmp', '.triage', 'closure')
         generator = PlanGenerator(
             jira_client,
             classifier,
-            closure_tracking_dir=closure_dir
+            closure_tracking_dir=closure_dir,
+            closure_store=create_closure_store(closure_dir, os.environ.get('DATABASE_URL')),
+            dependency_graph=dependency_graph
         )
         logger.info("Task classifier and plan generator initialized")
         
@@ -14,6 +14,7 @@ from hypothesis import given
 from hypothesis import strategies as st
 
 from triage.models import (
+    IssueState,
     JiraIssue,
 )
 from triage.plan_generator import PlanGenerator
@@ -101,9 +102,17 @@ def test_property_30_closure_rate_calculation(data):
     # Generate completion set
     completed_keys = data.draw(completion_set_strategy(priority_tasks_raw))
 
-    # Active tasks are those NOT completed
-    active_tasks = [task for task in priority_tasks_raw if task.key not in completed_keys]
-    mock_jira_client.fetch_active_tasks.return_value = active_tasks
+    # Completed tasks are resolved, the others are still in progress
+    mock_jira_client.fetch_issue_states.return_value = {
+        task.key: IssueState(
+            key=task.key,
+            status="Done" if task.key in completed_keys else "In Progress",
+            status_category="done" if task.key in completed_keys else "indeterminate",
+            resolution="Done" if task.key in completed_keys else None,
+            assignee=task.assignee,
+        )
+        for task in priority_tasks_raw
+    }
 
     # Create classifier and plan generator
     classifier = TaskClassifier()
@@ -129,6 +138,10 @@ def test_property_30_closure_rate_calculation(data):
     # Verify closure rate is in valid range
     assert 0.0 <= closure_rate <= 1.0, f"Closure rate {closure_rate} is outside valid range [0.0, 1.0]"
 
+    # Verify only the priority keys were queried, in a single request
+    mock_jira_client.fetch_issue_states.assert_called_once()
+    mock_jira_client.fetch_active_tasks.assert_not_called()
+
 
 # Property 31: Closure Rate Display
 @given(st.floats(min_value=0.0, max_value=1.0))
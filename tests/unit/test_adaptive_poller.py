@@ -0,0 +1,143 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for AdaptivePoller."""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from triage.adaptive_poller import AdaptivePoller
+from triage.background_scheduler import BackgroundScheduler
+from triage.jira_client import JiraRateLimitError
+from triage.models import JiraIssue
+
+# A Wednesday
+NOW = datetime(2026, 2, 18, 10, 0)
+
+
+class TestAdaptivePoller:
+    """Test suite for AdaptivePoller."""
+
+    def test_quiet_polls_back_off_and_changes_reset(self):
+        """Test that the interval doubles up to the maximum and drops back when blockers change."""
+        poller = AdaptivePoller(min_interval_seconds=60, max_interval_seconds=600)
+        assert poller.start(NOW) == NOW
+
+        intervals = []
+        for _ in range(5):
+            poller.observe(blockers=0, changed=False)
+            intervals.append(poller.metrics().interval_seconds)
+        assert intervals == [120, 240, 480, 600, 600]
+        assert poller.metrics().reason == AdaptivePoller.REASON_QUIET
+        assert poller.metrics().quiet_polls == 5
+
+        poller.observe(blockers=1, changed=True)
+        assert poller.next_poll(NOW) == NOW + timedelta(seconds=60)
+        metrics = poller.metrics()
+        assert (metrics.reason, metrics.quiet_polls, metrics.next_poll_at) == (
+            AdaptivePoller.REASON_CHANGES,
+            0,
+            NOW + timedelta(seconds=60),
+        )
+
+    def test_handled_blockers_back_off_to_blocker_interval(self):
+        """Test that open blockers that did not change back off, but only up to the blocker interval."""
+        poller = AdaptivePoller(min_interval_seconds=60, max_interval_seconds=3600, blocker_interval_seconds=300)
+        poller.start(NOW)
+
+        intervals = []
+        for _ in range(4):
+            poller.observe(blockers=2, changed=False)
+            intervals.append(poller.metrics().interval_seconds)
+        assert intervals == [120, 240, 300, 300]
+        assert poller.metrics().reason == AdaptivePoller.REASON_BLOCKERS
+
+        # A quiet backlog backs off past the blocker interval; open blockers bring it back down
+        for _ in range(3):
+            poller.observe(blockers=0, changed=False)
+        assert poller.metrics().interval_seconds == 2400
+        poller.observe(blockers=1, changed=False)
+        assert poller.metrics().interval_seconds == 300
+
+    def test_working_hours(self):
+        """Test that polls outside the working hours wait for the next working period."""
+        poller = AdaptivePoller(max_interval_seconds=7200, working_hours="08:00-19:00", working_days=range(5))
+        friday_evening = datetime(2026, 2, 20, 18, 30)
+        poller.interval = timedelta(hours=1)
+
+        assert poller.next_poll(friday_evening) == datetime(2026, 2, 23, 8, 0)
+        assert poller.metrics().reason == AdaptivePoller.REASON_OFF_HOURS
+        assert poller.start(datetime(2026, 2, 18, 6, 0)) == datetime(2026, 2, 18, 8, 0)
+        assert poller.next_poll(NOW) == NOW + timedelta(seconds=60)
+
+    def test_rate_limit(self):
+        """Test that a rate limit backs off and delays the next poll until it ends."""
+        poller = AdaptivePoller(min_interval_seconds=60)
+        poller.start(NOW)
+
+        poller.observe_error(rate_limited=True)
+        assert poller.metrics().reason == AdaptivePoller.REASON_RATE_LIMITED
+        assert poller.next_poll(NOW) == NOW + timedelta(seconds=120)
+        assert poller.next_poll(NOW, not_before=NOW + timedelta(minutes=10)) == NOW + timedelta(minutes=10)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"min_interval_seconds": 0},
+            {"min_interval_seconds": 600, "max_interval_seconds": 60},
+            {"backoff_factor": 0.5},
+            {"blocker_interval_seconds": 0},
+            {"working_hours": "19:00-08:00"},
+            {"working_hours": "8h-19h"},
+            {"working_days": [7]},
+        ],
+    )
+    def test_invalid_configuration(self, kwargs):
+        """Test that invalid bounds and working hours are rejected."""
+        with pytest.raises(ValueError):
+            AdaptivePoller(**kwargs)
+
+
+class TestBackgroundSchedulerAdaptivePolling:
+    """Test suite for adaptive polling in BackgroundScheduler."""
+
+    def test_polls_drive_interval(self):
+        """Test that poll outcomes and JIRA rate limits set the next poll of the scheduler."""
+        jira_client = Mock()
+        jira_client.rate_limited_until = None
+        jira_client.fetch_blocking_tasks.return_value = []
+        scheduler = BackgroundScheduler(
+            jira_client=jira_client, plan_generator=Mock(), adaptive_poller=AdaptivePoller(min_interval_seconds=60)
+        )
+        scheduler.queue_operation = Mock()
+
+        scheduler._check_blocking_tasks()
+        assert scheduler._next_poll_run(NOW) == NOW + timedelta(seconds=120)
+
+        jira_client.fetch_blocking_tasks.return_value = [
+            JiraIssue("PROJ-1", "Outage", "", "Bug", "Blocker", "To Do", "user@example.com")
+        ]
+        scheduler._check_blocking_tasks()
+        assert scheduler._next_poll_run(NOW) == NOW + timedelta(seconds=60)
+        assert scheduler.polling_metrics().reason == AdaptivePoller.REASON_CHANGES
+
+        # The blocker was handled; it stays open without changing
+        scheduler._handle_blocking_task(jira_client.fetch_blocking_tasks.return_value[0])
+        scheduler._check_blocking_tasks()
+        assert scheduler._next_poll_run(NOW) == NOW + timedelta(seconds=120)
+        assert scheduler.polling_metrics().reason == AdaptivePoller.REASON_BLOCKERS
+
+        jira_client.fetch_blocking_tasks.side_effect = JiraRateLimitError("Rate limit exceeded")
+        jira_client.rate_limited_until = NOW + timedelta(minutes=5)
+        scheduler._check_blocking_tasks()
+        assert scheduler._next_poll_run(NOW) == NOW + timedelta(minutes=5)
+        assert scheduler.polling_metrics().reason == AdaptivePoller.REASON_RATE_LIMITED
+
+    def test_fixed_interval_has_no_metrics(self):
+        """Test that schedulers without an adaptive poller report no polling metrics."""
+        scheduler = BackgroundScheduler(jira_client=Mock(), plan_generator=Mock())
+
+        assert scheduler.polling_metrics() is None
@@ -0,0 +1,137 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for AdminBlockPacker."""
+
+import pytest
+
+from triage.admin_block_packer import AdminBlockPacker
+from triage.models import JiraIssue, TaskCategory, TaskClassification
+
+
+def make_admin_task(key: str, minutes: int) -> TaskClassification:
+    """Build an administrative task classification with an effort in minutes."""
+    issue = JiraIssue(
+        key=key,
+        summary=f"Admin task {key}",
+        description="An admin task",
+        issue_type="Administrative Task",
+        priority="Low",
+        status="To Do",
+        assignee="user@example.com",
+        labels=["admin"],
+    )
+    return TaskClassification(
+        task=issue,
+        category=TaskCategory.ADMINISTRATIVE,
+        is_priority_eligible=False,
+        has_dependencies=False,
+        estimated_days=minutes / (8 * 60),
+    )
+
+
+class TestAdminBlockPacker:
+    """Test suite for AdminBlockPacker."""
+
+    def test_pack_maximizes_minutes(self):
+        """Test that the minutes objective fills the block better than smallest-first."""
+        tasks = [make_admin_task("ADM-1", 20), make_admin_task("ADM-2", 30), make_admin_task("ADM-3", 60)]
+
+        packer = AdminBlockPacker()
+        packer.sync(tasks)
+        [block] = packer.pack(["14:00-15:30"])
+
+        # Smallest-first would stop at 20 + 30 = 50 minutes
+        assert block.time_allocation_minutes == 90
+        assert {c.task.key for c in block.tasks} == {"ADM-2", "ADM-3"}
+
+    def test_pack_maximizes_count(self):
+        """Test that the count objective fits as many tasks as possible."""
+        tasks = [make_admin_task("ADM-1", 20), make_admin_task("ADM-2", 30), make_admin_task("ADM-3", 60)]
+
+        packer = AdminBlockPacker(objective="count")
+        packer.sync(tasks)
+        [block] = packer.pack(["14:00-15:30"])
+
+        assert [c.task.key for c in block.tasks] == ["ADM-1", "ADM-2"]
+        assert block.time_allocation_minutes == 50
+
+    def test_pack_prefers_older_tasks_on_ties(self):
+        """Test that equally sized tasks are packed oldest first."""
+        tasks = [make_admin_task(f"ADM-{i}", 45) for i in (5, 3, 9, 1)]
+
+        packer = AdminBlockPacker()
+        packer.sync(tasks)
+        [block] = packer.pack(["14:00-15:30"])
+
+        assert [c.task.key for c in block.tasks] == ["ADM-1", "ADM-3"]
+
+    def test_pack_multiple_blocks(self):
+        """Test that each task lands in at most one of several blocks."""
+        tasks = [make_admin_task(f"ADM-{i}", 45) for i in range(1, 6)]
+
+        packer = AdminBlockPacker()
+        packer.sync(tasks)
+        blocks = packer.pack(["09:00-10:30", "14:00-15:30"])
+
+        assert [b.scheduled_time for b in blocks] == ["09:00-10:30", "14:00-15:30"]
+        assert [c.task.key for c in blocks[0].tasks] == ["ADM-1", "ADM-2"]
+        assert [c.task.key for c in blocks[1].tasks] == ["ADM-3", "ADM-4"]
+        assert all(b.time_allocation_minutes <= 90 for b in blocks)
+
+    def test_short_block_is_limited_to_its_time_range(self):
+        """Test that a block shorter than max_minutes only gets the tasks that fit its range."""
+        tasks = [make_admin_task("ADM-1", 20), make_admin_task("ADM-2", 30), make_admin_task("ADM-3", 60)]
+
+        for objective in AdminBlockPacker.OBJECTIVES:
+            packer = AdminBlockPacker(objective=objective)
+            packer.sync(tasks)
+            extra, main = packer.pack(["09:00-09:30", "14:00-15:30"])
+
+            assert extra.time_allocation_minutes <= 30
+            assert [c.task.key for c in extra.tasks] == (["ADM-2"] if objective == "minutes" else ["ADM-1"])
+            assert main.time_allocation_minutes <= 90
+
+    def test_invalid_block_time(self):
+        """Test that malformed or empty block time ranges are rejected."""
+        packer = AdminBlockPacker()
+        for scheduled_time in ("9am-10am", "15:30-14:00", "14:00"):
+            with pytest.raises(ValueError):
+                packer.pack([scheduled_time])
+
+    def test_sync_is_incremental(self):
+        """Test that sync applies additions, removals and re-estimates."""
+        packer = AdminBlockPacker()
+        packer.sync([make_admin_task("ADM-1", 30), make_admin_task("ADM-2", 30)])
+
+        packer.sync([make_admin_task("ADM-2", 90), make_admin_task("ADM-3", 10)])
+        [block] = packer.pack(["14:00-15:30"])
+
+        assert len(packer) == 2
+        assert [c.task.key for c in block.tasks] == ["ADM-2"]
+        assert block.time_allocation_minutes == 90
+
+    def test_oversized_tasks_are_deferred(self):
+        """Test that tasks longer than a block are never packed."""
+        packer = AdminBlockPacker()
+        packer.sync([make_admin_task("ADM-1", 120)])
+        [block] = packer.pack(["14:00-15:30"])
+
+        assert block.tasks == []
+        assert block.time_allocation_minutes == 0
+
+    def test_heap_compaction_keeps_live_tasks(self):
+        """Test that repeated updates do not grow the heap without bound."""
+        packer = AdminBlockPacker()
+        for minutes in range(1, 200):
+            packer.sync([make_admin_task("ADM-1", minutes % 80 + 1)])
+
+        assert len(packer._heap) <= 2 * len(packer) + 16
+        [block] = packer.pack(["14:00-15:30"])
+        assert [c.task.key for c in block.tasks] == ["ADM-1"]
+
+    def test_invalid_objective(self):
+        """Test that unknown objectives are rejected."""
+        with pytest.raises(ValueError):
+            AdminBlockPacker(objective="random")
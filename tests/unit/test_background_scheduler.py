@@ -0,0 +1,339 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for BackgroundScheduler timers."""
+
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from triage.background_scheduler import BackgroundScheduler, OperationPriority
+from triage.models import JiraIssue
+from triage.operation_store import SQLiteOperationStore
+from triage.plan_prewarmer import PlanPrewarmer
+from triage.plan_schedule import PlanSchedule
+
+NOW = datetime(2026, 2, 17, 6, 0)
+
+
+def make_scheduler(**kwargs) -> BackgroundScheduler:
+    """Build a scheduler with mocked dependencies and no blocking tasks."""
+    jira_client = Mock()
+    jira_client.fetch_blocking_tasks.return_value = []
+    return BackgroundScheduler(jira_client=jira_client, plan_generator=Mock(), **kwargs)
+
+
+class TestBackgroundSchedulerTimers:
+    """Test suite for the BackgroundScheduler timer heap."""
+
+    def test_timers_fire_in_due_order(self):
+        """Test that timers run when due, earliest first, and one-shot timers are dropped."""
+        scheduler = make_scheduler()
+        fired = []
+        done = threading.Event()
+
+        scheduler.start()
+        try:
+            scheduler.schedule_timer("late", lambda: (fired.append("late"), done.set()), delay_seconds=0.2)
+            scheduler.schedule_timer("early", lambda: fired.append("early"), delay_seconds=0.05)
+            assert done.wait(timeout=5)
+        finally:
+            scheduler.stop()
+
+        assert fired == ["early", "late"]
+        assert set(scheduler._timers) == {BackgroundScheduler.POLL_TIMER}
+
+    def test_replaced_and_cancelled_timers_do_not_fire(self):
+        """Test that only the latest registration of a timer name runs."""
+        scheduler = make_scheduler()
+        fired = []
+        done = threading.Event()
+
+        scheduler.start()
+        try:
+            scheduler.schedule_timer("job", lambda: fired.append("old"), delay_seconds=0.05)
+            scheduler.schedule_timer("job", lambda: fired.append("new"), delay_seconds=0.1)
+            scheduler.schedule_timer("other", lambda: fired.append("other"), delay_seconds=0.05)
+            assert scheduler.cancel_timer("other")
+            scheduler.schedule_timer("end", done.set, delay_seconds=0.2)
+            assert done.wait(timeout=5)
+        finally:
+            scheduler.stop()
+
+        assert fired == ["new"]
+        assert not scheduler.cancel_timer("other")
+
+    def test_stop_is_immediate(self):
+        """Test that stopping does not wait for the poll interval."""
+        scheduler = make_scheduler(poll_interval_minutes=15)
+        scheduler.start()
+        time.sleep(0.1)
+
+        started = time.monotonic()
+        scheduler.stop()
+
+        assert time.monotonic() - started < 1
+        assert not scheduler._timer_thread.is_alive()
+        assert not scheduler._queue_thread.is_alive()
+        scheduler.jira_client.fetch_blocking_tasks.assert_called_once()
+
+    def test_invalid_timer(self):
+        """Test that negative delays and non-positive intervals are rejected."""
+        scheduler = make_scheduler()
+
+        with pytest.raises(ValueError):
+            scheduler.schedule_timer("job", Mock(), delay_seconds=-1)
+        with pytest.raises(ValueError):
+            scheduler.schedule_timer("job", Mock(), interval_seconds=0)
+
+
+class TestBackgroundSchedulerWorkerPool:
+    """Test suite for concurrent execution of queued operations."""
+
+    def test_slow_plan_does_not_hold_up_blockers(self):
+        """Test that blocking task handlers run while a plan is being generated."""
+        scheduler = make_scheduler()
+        plan_running = threading.Event()
+        release_plan = threading.Event()
+        handled = []
+
+        def generate_plan():
+            plan_running.set()
+            release_plan.wait(timeout=5)
+
+        scheduler.start()
+        try:
+            scheduler.queue_operation("generate_daily_plan", generate_plan)
+            assert plan_running.wait(timeout=5)
+            for i in range(3):
+                scheduler.queue_operation("handle_blocking_task", handled.append, OperationPriority.BLOCKING, i)
+
+            deadline = time.monotonic() + 5
+            while len(handled) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert sorted(handled) == [0, 1, 2]
+            assert not release_plan.is_set()
+        finally:
+            release_plan.set()
+            scheduler.stop()
+
+    def test_blocker_replan_does_not_wait_for_plan_generation(self):
+        """Test that a blocker is replanned from the current plan while the next plan is generated."""
+        scheduler = make_scheduler()
+        generator = scheduler.plan_generator
+        plan = Mock(priorities=[], admin_block=Mock(tasks=[]))
+        generator.generate_daily_plan.return_value = plan
+        scheduler._generate_daily_plan()
+
+        plan_running = threading.Event()
+
+        def slow_plan():
+            plan_running.set()
+            time.sleep(1)
+            return plan
+
+        generator.generate_daily_plan.side_effect = slow_plan
+        worker = threading.Thread(target=scheduler._generate_daily_plan)
+        worker.start()
+        try:
+            assert plan_running.wait(timeout=5)
+            started = time.monotonic()
+            replan = scheduler._handle_blocking_task(make_blocker("PROJ-9"))
+            latency = time.monotonic() - started
+        finally:
+            worker.join()
+
+        assert latency < 0.5
+        assert replan is generator.fork.return_value.generate_replan.return_value
+        generator.generate_replan.assert_not_called()
+
+    def test_operation_type_limit(self):
+        """Test that no more operations of a type run at once than its limit."""
+        scheduler = make_scheduler(max_workers=4, operation_limits={"sync": 2})
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def sync():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+        for _ in range(6):
+            scheduler.queue_operation("sync", sync)
+        scheduler.start()
+        while not scheduler._operation_queue.empty():
+            time.sleep(0.01)
+        scheduler.stop()
+
+        assert len(peak) == 6
+        assert max(peak) == 2
+
+    def test_stop_drains_running_operations(self):
+        """Test that stop waits for the operations that are already running."""
+        scheduler = make_scheduler()
+        started = threading.Event()
+        finished = []
+
+        def slow():
+            started.set()
+            time.sleep(0.2)
+            finished.append(True)
+
+        scheduler.start()
+        scheduler.queue_operation("slow", slow)
+        assert started.wait(timeout=5)
+        scheduler.stop()
+
+        assert finished == [True]
+
+    def test_invalid_pool_configuration(self):
+        """Test that pool sizes and operation limits must be positive."""
+        with pytest.raises(ValueError):
+            make_scheduler(max_workers=0)
+        with pytest.raises(ValueError):
+            make_scheduler(operation_limits={"generate_daily_plan": 0})
+
+
+def make_blocker(key: str, status: str = "To Do") -> JiraIssue:
+    """Build a blocking task."""
+    return JiraIssue(
+        key=key,
+        summary=f"Task {key}",
+        description="A task",
+        issue_type="Bug",
+        priority="Blocker",
+        status=status,
+        assignee="user@example.com",
+    )
+
+
+class TestOperationDeduplication:
+    """Test suite for merging duplicate operations and handling each blocker once."""
+
+    def test_pending_duplicates_are_merged(self):
+        """Test that a pending operation runs once, with the latest arguments and highest priority."""
+        scheduler = make_scheduler()
+        calls = []
+
+        assert scheduler.queue_operation("sync", calls.append, OperationPriority.NORMAL, 1, operation_key="sync")
+        assert not scheduler.queue_operation("sync", calls.append, OperationPriority.NORMAL, 2, operation_key="sync")
+        assert scheduler.queue_operation("sync", calls.append, OperationPriority.BLOCKING, 3, operation_key="sync")
+        scheduler.queue_operation("other", calls.append, OperationPriority.NORMAL, "other")
+
+        scheduler.start()
+        while not scheduler._operation_queue.empty():
+            time.sleep(0.01)
+        scheduler.stop()
+
+        assert calls == [3, "other"]
+        assert scheduler._pending == {}
+
+    def test_blocker_is_handled_once_per_status(self):
+        """Test that polls only queue blockers that are new, changed or back after being resolved."""
+        scheduler = make_scheduler()
+        polls = [
+            [make_blocker("PROJ-1"), make_blocker("PROJ-2")],
+            [make_blocker("PROJ-1"), make_blocker("PROJ-2")],
+            [make_blocker("PROJ-1", status="In Progress")],
+            [make_blocker("PROJ-1", status="In Progress"), make_blocker("PROJ-2")],
+        ]
+        queued = []
+
+        for blockers in polls:
+            scheduler.jira_client.fetch_blocking_tasks.return_value = blockers
+            with patch.object(scheduler, "queue_operation") as queue_operation:
+                scheduler._check_blocking_tasks()
+            tasks = [c.kwargs["task"] for c in queue_operation.call_args_list]
+            queued.append([t.key for t in tasks])
+            for task in tasks:
+                scheduler._handle_blocking_task(task)
+
+        assert queued == [["PROJ-1", "PROJ-2"], [], ["PROJ-1"], ["PROJ-2"]]
+
+
+class TestDailyPlanTimer:
+    """Test suite for the wake-up times of the daily plan timer."""
+
+    def test_next_run_is_plan_time(self):
+        """Test that the timer wakes at the plan time, or the next day once the plan is generated."""
+        scheduler = make_scheduler()
+        scheduler.schedule_daily_plan("07:00")
+
+        assert scheduler._next_daily_plan_run(NOW) == datetime(2026, 2, 17, 7, 0)
+
+        with patch.object(scheduler, "_now", return_value=datetime(2026, 2, 17, 7, 0)):
+            scheduler._check_daily_plan_schedule()
+        assert scheduler._next_daily_plan_run(datetime(2026, 2, 17, 7, 0)) == datetime(2026, 2, 18, 7, 0)
+
+    def test_overdue_plan_runs_right_away(self):
+        """Test that a plan missed while the scheduler was down is generated on start."""
+        scheduler = make_scheduler()
+        scheduler.schedule_daily_plan("05:00")
+
+        assert scheduler._next_daily_plan_run(NOW) == NOW
+
+    def test_next_run_includes_prewarm_stages(self):
+        """Test that pending pre-generation stages are woken up for before the plan time."""
+        scheduler = make_scheduler()
+        scheduler.schedule_daily_plan("07:00")
+        scheduler.plan_generator.user_id = "user"
+        scheduler._prewarmer = PlanPrewarmer(Mock(), window_minutes=60, refresh_minutes=10)
+        draft, refresh = scheduler._prewarmer.schedule(["user"], datetime(2026, 2, 17, 7, 0))
+
+        assert scheduler._next_daily_plan_run(NOW) == draft.fire_at
+
+        scheduler._prewarm_done.add((NOW.date(), "draft"))
+        assert scheduler._next_daily_plan_run(NOW) == refresh.fire_at
+
+        # An overdue stage runs right away
+        late = refresh.fire_at + timedelta(seconds=1)
+        assert scheduler._next_daily_plan_run(late) == late
+
+
+class TestUserPlanSchedule:
+    """Test suite for the daily plans of many users."""
+
+    def test_due_user_plans_are_generated_with_their_generators(self, tmp_path):
+        """Test that due plans are queued per user and missed ones are caught up from the store."""
+        store = SQLiteOperationStore(str(tmp_path / "operations.db"))
+        store.set_state("last_plan_date:late", "2026-03-02")
+        generators = {}
+        scheduler = make_scheduler(
+            plan_schedule=PlanSchedule(),
+            generator_factory=lambda user_id: generators.setdefault(user_id, Mock()),
+            operation_store=store,
+        )
+        # 05:00 UTC on the local clock of the scheduler
+        now = datetime(2026, 3, 3, 5, 0, tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+
+        with patch.object(scheduler, "_now", return_value=now):
+            assert scheduler.schedule_user_plan("late", "04:00")
+            assert scheduler.schedule_user_plan("madrid", "09:00", "Europe/Madrid")
+            assert scheduler._next_user_plan_run(now) == now
+            with patch.object(scheduler, "queue_operation") as queue_operation:
+                scheduler._check_user_plan_schedule()
+
+        kwargs = queue_operation.call_args.kwargs
+        assert queue_operation.call_count == 1
+        assert (kwargs["user_id"], kwargs["plan_date"]) == ("late", date(2026, 3, 3))
+        assert kwargs["idempotency_key"] == "generate_user_plan:late:2026-03-03"
+        assert store.get_state("last_plan_date:late") == "2026-03-03"
+
+        payload = scheduler._encode_payload("generate_user_plan", kwargs)
+        scheduler._generate_user_plan(**scheduler._decode_payload("generate_user_plan", payload))
+        generators["late"].generate_daily_plan.assert_called_once_with(plan_date=date(2026, 3, 3))
+
+    def test_user_plans_require_a_generator_factory(self):
+        """Test that a plan schedule needs a generator factory and user plans need a schedule."""
+        with pytest.raises(ValueError):
+            make_scheduler(plan_schedule=PlanSchedule())
+        with pytest.raises(ValueError):
+            make_scheduler().schedule_user_plan("user", "08:00")
@@ -11,8 +11,10 @@ from unittest.mock import Mock, patch
 from click.testing import CliRunner
 
 from triage.cli import Config, cli
+from triage.closure_store import SQLiteClosureStore
 from triage.models import (
     AdminBlock,
+    ClosureRecord,
     DailyPlan,
     JiraIssue,
     TaskCategory,
@@ -353,3 +355,65 @@ class TestCLI:
 
             assert result.exit_code == 0
             mock_gen_instance.generate_daily_plan.assert_called_once_with(previous_closure_rate=0.67)
+
+    @patch("triage.cli.PlanGenerator")
+    @patch("triage.cli.TaskClassifier")
+    @patch("triage.cli.JiraClient")
+    def test_generate_plan_horizon(self, mock_jira, mock_classifier, mock_generator):
+        """Test that --days plans several working days in one horizon run."""
+        runner = CliRunner()
+
+        mock_plans = [
+            DailyPlan(
+                date=date(2026, 1, day),
+                priorities=[],
+                admin_block=AdminBlock(tasks=[], time_allocation_minutes=0, scheduled_time="14:00-15:30"),
+                other_tasks=[],
+            )
+            for day in (23, 26)
+        ]
+
+        mock_gen_instance = Mock()
+        mock_gen_instance.generate_horizon_plan.return_value = mock_plans
+        mock_generator.return_value = mock_gen_instance
+
+        with patch.dict(
+            os.environ,
+            {
+                "JIRA_BASE_URL": "https://test.atlassian.net",
+                "JIRA_EMAIL": "test@example.com",
+                "JIRA_API_TOKEN": "test-token",
+            },
+        ):
+            result = runner.invoke(cli, ["generate-plan", "--days", "2"])
+
+            assert result.exit_code == 0
+            mock_gen_instance.generate_horizon_plan.assert_called_once_with(days=2, previous_closure_rate=None)
+            mock_gen_instance.generate_daily_plan.assert_not_called()
+            assert "# Daily Plan - 2026-01-23" in result.output
+            assert "# Daily Plan - 2026-01-26" in result.output
+
+    def test_closure_stats_shows_trends(self, tmp_path):
+        """Test that closure-stats prints rolling trends from the closure store."""
+        store = SQLiteClosureStore(str(tmp_path / "closure.db"))
+        store.save_record(
+            ClosureRecord(
+                date=date(2026, 2, 17),
+                total_priorities=2,
+                completed_priorities=1,
+                closure_rate=0.5,
+                incomplete_tasks=["PROJ-2"],
+            ),
+            user_id="alice",
+        )
+        store.close()
+
+        runner = CliRunner()
+        with patch.dict(os.environ, {"CLOSURE_TRACKING_DIR": str(tmp_path), "DATABASE_URL": ""}):
+            result = runner.invoke(cli, ["closure-stats", "--as-of", "2026-02-18", "--team"])
+
+        assert result.exit_code == 0
+        assert "as of 2026-02-18" in result.output
+        lines = result.output.splitlines()
+        assert lines[2].split()[:4] == ["alice", "50%", "50%", "50%"]
+        assert lines[3].split()[0] == "team"
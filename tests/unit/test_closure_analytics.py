@@ -0,0 +1,86 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for ClosureAnalytics."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from triage.closure_analytics import ClosureAnalytics
+from triage.closure_store import SQLiteClosureStore
+from triage.models import ClosureRecord
+
+AS_OF = date(2026, 3, 31)
+
+
+def save_day(store: SQLiteClosureStore, user_id: str, days_ago: int, completed: int, total: int = 3) -> None:
+    """Save a closure record for a day relative to AS_OF."""
+    store.save_record(
+        ClosureRecord(
+            date=AS_OF - timedelta(days=days_ago),
+            total_priorities=total,
+            completed_priorities=completed,
+            closure_rate=completed / total if total else 0.0,
+            incomplete_tasks=[f"PROJ-{i}" for i in range(total - completed)],
+        ),
+        user_id=user_id,
+    )
+
+
+@pytest.fixture
+def store():
+    """Create an in-memory closure store."""
+    return SQLiteClosureStore(":memory:")
+
+
+class TestClosureAnalytics:
+    """Test suite for ClosureAnalytics."""
+
+    def test_rolling_windows(self, store):
+        """Test rolling means and carry-over over 7/30/90-day windows."""
+        save_day(store, "alice", 0, 3)
+        save_day(store, "alice", 6, 0)
+        save_day(store, "alice", 20, 3)
+        save_day(store, "alice", 80, 0)
+        save_day(store, "alice", 100, 3)  # Outside all windows
+
+        trend = ClosureAnalytics(store).user_trends(AS_OF)["alice"]
+
+        assert trend.rolling_closure_rate == {7: 0.5, 30: pytest.approx(2 / 3), 90: 0.5}
+        assert trend.carry_over == {7: 3, 30: 3, 90: 6}
+        assert trend.days_recorded == 4
+
+    def test_streaks_skip_days_without_plans(self, store):
+        """Test that streaks count fully closed planned days and ignore gaps."""
+        for days_ago, completed in [(0, 3), (2, 3), (5, 3), (6, 1), (7, 3), (8, 3), (9, 3), (10, 3)]:
+            save_day(store, "alice", days_ago, completed)
+
+        trend = ClosureAnalytics(store).user_trends(AS_OF)["alice"]
+
+        assert trend.current_streak == 3
+        assert trend.longest_streak == 4
+
+    def test_team_trend_weights_by_priorities(self, store):
+        """Test that the team trend aggregates members per day."""
+        save_day(store, "alice", 0, 3)
+        save_day(store, "bob", 0, 0, total=1)
+        save_day(store, "carol", 1, 2)
+
+        analytics = ClosureAnalytics(store)
+        team = analytics.team_trend(AS_OF, ["alice", "bob"])
+
+        assert team.user_id == "team"
+        assert team.rolling_closure_rate[7] == 0.75
+        assert team.carry_over[7] == 1
+        assert set(analytics.user_trends(AS_OF)) == {"alice", "bob", "carol"}
+
+    def test_rolling_closure_rates_series(self, store):
+        """Test the per-day rolling series."""
+        save_day(store, "alice", 3, 3)
+        save_day(store, "alice", 1, 0)
+
+        series = ClosureAnalytics(store).rolling_closure_rates(AS_OF - timedelta(days=4), AS_OF, 2, "alice")
+
+        assert series == [None, 1.0, 1.0, 0.0, 0.0]
@@ -0,0 +1,115 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for closure record storage."""
+
+import json
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+
+from triage.closure_store import PostgresClosureStore, SQLiteClosureStore, create_closure_store
+from triage.models import ClosureRecord
+from triage.plan_generator import PlanGenerator
+from triage.task_classifier import TaskClassifier
+
+
+def make_record(plan_date: date, completed: int = 1, total: int = 3) -> ClosureRecord:
+    """Build a closure record with the first tasks completed."""
+    keys = [f"PROJ-{i}" for i in range(1, total + 1)]
+    return ClosureRecord(
+        date=plan_date,
+        total_priorities=total,
+        completed_priorities=completed,
+        closure_rate=completed / total,
+        incomplete_tasks=keys[completed:],
+    )
+
+
+class TestSQLiteClosureStore:
+    """Test suite for SQLiteClosureStore."""
+
+    def test_save_and_load_record(self, tmp_path):
+        """Test that a saved record is loaded back per user and date."""
+        store = SQLiteClosureStore(str(tmp_path / "closure.db"))
+        store.save_record(make_record(date(2026, 2, 17)), user_id="alice")
+
+        assert store.load_record(date(2026, 2, 17), user_id="alice") == make_record(date(2026, 2, 17))
+        assert store.load_record(date(2026, 2, 17), user_id="bob") is None
+        assert store.load_record(date(2026, 2, 18), user_id="alice") is None
+
+    def test_record_completion_updates_record(self, tmp_path):
+        """Test that a priority completion updates counts and incomplete tasks."""
+        store = SQLiteClosureStore(str(tmp_path / "closure.db"))
+        store.save_record(make_record(date(2026, 2, 17)))
+
+        store.record_completion("PROJ-2", date(2026, 2, 17), was_priority=True)
+        store.record_completion("OTHER-1", date(2026, 2, 17), was_priority=False)
+
+        record = store.load_record(date(2026, 2, 17))
+        assert record.completed_priorities == 2
+        assert record.incomplete_tasks == ["PROJ-3"]
+        assert record.closure_rate == pytest.approx(2 / 3)
+
+    def test_load_history_range(self, tmp_path):
+        """Test that range queries return records grouped by user in date order."""
+        store = SQLiteClosureStore(str(tmp_path / "closure.db"))
+        for day in (20, 18, 19, 10):
+            store.save_record(make_record(date(2026, 2, day)), user_id="alice")
+        store.save_record(make_record(date(2026, 2, 19), completed=3), user_id="bob")
+
+        history = store.load_history(date(2026, 2, 15), date(2026, 2, 19))
+
+        assert [r.date.day for r in history["alice"]] == [18, 19]
+        assert [r.closure_rate for r in history["bob"]] == [1.0]
+        assert [r.date.day for r in store.load_range(date(2026, 2, 1), date(2026, 2, 28), "alice")] == [10, 18, 19, 20]
+
+    def test_postgres_store_requires_connection(self):
+        """Test that the PostgreSQL store needs a URL or a pool with its loop."""
+        with pytest.raises(ValueError):
+            PostgresClosureStore()
+        with pytest.raises(ValueError):
+            PostgresClosureStore(pool=Mock())
+
+    def test_postgres_store_is_shared_per_database_url(self, tmp_path):
+        """Test that stores created for the same database URL share one pool."""
+        first = create_closure_store(str(tmp_path), "postgresql://db/triage")
+
+        assert isinstance(first, PostgresClosureStore)
+        assert create_closure_store(str(tmp_path / "other"), "postgresql://db/triage") is first
+        assert create_closure_store(str(tmp_path), "postgresql://db/other") is not first
+        assert isinstance(create_closure_store(str(tmp_path)), SQLiteClosureStore)
+
+
+class TestPlanGeneratorClosureStore:
+    """Test suite for closure tracking through PlanGenerator."""
+
+    def test_generator_uses_sqlite_by_default(self, tmp_path):
+        """Test that closure records are stored in a SQLite database, not per-day files."""
+        generator = PlanGenerator(Mock(), TaskClassifier(), closure_tracking_dir=str(tmp_path))
+        generator.closure_store.save_record(make_record(date(2026, 2, 17)))
+
+        assert (tmp_path / "closure.db").exists()
+        assert not list(tmp_path.glob("closure_*.json"))
+        assert generator.get_previous_closure_rate(date(2026, 2, 18)) == pytest.approx(1 / 3)
+
+    def test_legacy_json_record_is_imported(self, tmp_path):
+        """Test that a legacy per-day JSON record is read and imported into the store."""
+        data = {
+            "date": "2026-02-17",
+            "total_priorities": 2,
+            "completed_priorities": 1,
+            "closure_rate": 0.5,
+            "incomplete_tasks": ["PROJ-2"],
+        }
+        (tmp_path / "closure_2026-02-17.json").write_text(json.dumps(data))
+
+        generator = PlanGenerator(Mock(), TaskClassifier(), closure_tracking_dir=str(tmp_path))
+        generator.record_completion("PROJ-2", date(2026, 2, 17), was_priority=True)
+
+        record = generator.closure_store.load_record(date(2026, 2, 17))
+        assert record.completed_priorities == 2
+        assert record.incomplete_tasks == []
+        assert record.closure_rate == 1.0
@@ -10,7 +10,17 @@ from unittest.mock import Mock
 import pytest
 
 from triage.core.actions_api import CoreActionsAPI
-from triage.models import AdminBlock, ClosureRecord, DailyPlan, JiraIssue, SubtaskSpec, TaskCategory, TaskClassification
+from triage.models import (
+    AdminBlock,
+    ClosureRecord,
+    ClosureTrend,
+    DailyPlan,
+    DecompositionResult,
+    JiraIssue,
+    SubtaskSpec,
+    TaskCategory,
+    TaskClassification,
+)
 
 
 @pytest.fixture
@@ -133,6 +143,26 @@ async def test_generate_plan_exception(core_api, mock_jira_client):
     assert result.error_code == "PLAN_GENERATION_FAILED"
 
 
+@pytest.mark.asyncio
+async def test_get_stored_plan(core_api, mock_plan_generator, mock_jira_client):
+    """Test that the stored plan is returned without contacting JIRA."""
+    plan = Mock(spec=DailyPlan)
+    mock_plan_generator.get_stored_plan = Mock(return_value=plan)
+
+    result = await core_api.get_stored_plan(user_id="test_user", plan_date=date(2026, 2, 17))
+
+    assert result.success is True
+    assert result.data["plan"] is plan
+    mock_plan_generator.get_stored_plan.assert_called_once_with(date(2026, 2, 17))
+    mock_jira_client.fetch_active_tasks.assert_not_called()
+
+    mock_plan_generator.get_stored_plan.return_value = None
+    result = await core_api.get_stored_plan(user_id="test_user")
+
+    assert result.success is False
+    assert result.error_code == "PLAN_NOT_FOUND"
+
+
 @pytest.mark.asyncio
 async def test_approve_plan_success(core_api):
     """Test successful plan approval."""
@@ -222,6 +252,42 @@ async def test_get_status_with_closure_record(core_api, mock_plan_generator):
     assert result.data["closure_rate"] == 0.67
 
 
+@pytest.mark.asyncio
+async def test_get_status_with_trends(core_api, mock_plan_generator):
+    """Test that closure trends are included on request."""
+    mock_plan_generator.get_closure_trend.return_value = ClosureTrend(
+        user_id="default",
+        as_of=date(2026, 2, 17),
+        days_recorded=5,
+        rolling_closure_rate={7: 0.8, 30: 0.75, 90: None},
+        carry_over={7: 1, 30: 4, 90: 4},
+        current_streak=2,
+        longest_streak=3,
+    )
+
+    mock_plan_generator.get_team_closure_trend.return_value = ClosureTrend(
+        user_id="team",
+        as_of=date(2026, 2, 17),
+        days_recorded=9,
+        rolling_closure_rate={7: 0.6, 30: 0.7, 90: 0.7},
+        carry_over={7: 5, 30: 12, 90: 12},
+        current_streak=0,
+        longest_streak=4,
+    )
+
+    result = await core_api.get_status(user_id="test_user", plan_date=date(2026, 2, 17), include_trends=True)
+
+    assert result.success is True
+    trends = result.data["trends"]
+    assert trends["rolling_closure_rate"] == {"7d": 0.8, "30d": 0.75, "90d": None}
+    assert trends["carry_over"]["30d"] == 4
+    assert trends["current_streak"] == 2
+    assert trends["team"]["rolling_closure_rate"] == {"7d": 0.6, "30d": 0.7, "90d": 0.7}
+    assert trends["team"]["longest_streak"] == 4
+    mock_plan_generator.get_closure_trend.assert_called_once_with(date(2026, 2, 17), user_id="test_user")
+    mock_plan_generator.get_team_closure_trend.assert_called_once_with(date(2026, 2, 17))
+
+
 @pytest.mark.asyncio
 async def test_get_status_no_record(core_api, mock_plan_generator):
     """Test getting status when no closure record exists."""
@@ -278,3 +344,49 @@ async def test_configure_settings_validation(core_api):
     assert "approval_timeout_hours" not in result.data["settings"]
     assert "max_priorities" not in result.data["settings"]
     assert "unknown_setting" not in result.data["settings"]
+
+
+@pytest.mark.asyncio
+async def test_decompose_tasks_batch(core_api, mock_jira_client, mock_plan_generator):
+    """Test that a batch is fetched once and only approved parents are created."""
+    mock_tasks = {
+        key: JiraIssue(
+            key=key,
+            summary="Long running task",
+            description="Test description",
+            issue_type="Task",
+            priority="High",
+            status="To Do",
+            assignee="test@example.com",
+            story_points=8,
+        )
+        for key in ("TEST-1", "TEST-2")
+    }
+    mock_jira_client.fetch_tasks_by_keys = Mock(return_value=mock_tasks)
+    subtask = SubtaskSpec(summary="Subtask 1", description="Description 1", estimated_days=0.75, order=1)
+    mock_plan_generator.propose_decompositions = Mock(return_value={"TEST-1": [subtask], "TEST-2": [subtask]})
+    mock_plan_generator.create_decompositions = Mock(
+        return_value={"TEST-2": DecompositionResult("TEST-2", [subtask], created_keys=["TEST-9"])}
+    )
+
+    result = await core_api.decompose_tasks(
+        user_id="test_user", task_keys=["TEST-1", "TEST-2", "TEST-3"], create_keys=["TEST-2"]
+    )
+
+    assert result.success is True
+    mock_jira_client.fetch_tasks_by_keys.assert_called_once_with(["TEST-1", "TEST-2", "TEST-3"])
+    mock_plan_generator.create_decompositions.assert_called_once_with({"TEST-2": [subtask]})
+    assert [r["task_key"] for r in result.data["results"]] == ["TEST-1", "TEST-2", "TEST-3"]
+    assert result.data["results"][1]["created_keys"] == ["TEST-9"]
+    assert result.data["results"][2]["error"] == "Task not found"
+    assert result.data["count"] == 2
+    assert result.data["created"] == 1
+
+
+@pytest.mark.asyncio
+async def test_decompose_tasks_rejects_unknown_create_keys(core_api):
+    """Test that only requested tasks can be approved for creation."""
+    result = await core_api.decompose_tasks(user_id="test_user", task_keys=["TEST-1"], create_keys=["TEST-2"])
+
+    assert result.success is False
+    assert result.error_code == "INVALID_TASK_KEY"
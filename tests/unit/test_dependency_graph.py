@@ -0,0 +1,200 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for DependencyGraph."""
+
+from dataclasses import replace
+from unittest.mock import Mock
+
+from triage.dependency_graph import DependencyGraph
+from triage.models import IssueLink, IssueState, JiraIssue
+from triage.plan_generator import PlanGenerator
+from triage.task_classifier import TaskClassifier
+
+
+def make_issue(key: str, *links: tuple) -> JiraIssue:
+    """Build a story with (link type, target key) links."""
+    return JiraIssue(
+        key=key,
+        summary=f"Task {key}",
+        description="A task",
+        issue_type="Story",
+        priority="Medium",
+        status="To Do",
+        assignee="user@example.com",
+        story_points=1,
+        issue_links=[IssueLink(link_type=t, target_key=k, target_summary=f"Task {k}") for t, k in links],
+    )
+
+
+def make_jira_client(states: dict) -> Mock:
+    """Build a JIRA client answering state lookups from a dictionary."""
+    jira_client = Mock()
+    jira_client.MAX_KEYS_PER_QUERY = 2
+    jira_client.fetch_issue_states.side_effect = lambda keys: {k: states[k] for k in keys if k in states}
+    return jira_client
+
+
+class TestDependencyGraph:
+    """Test suite for DependencyGraph."""
+
+    def test_resolved_external_blocker_does_not_block(self):
+        """Test that only unresolved blockers count, with external issues hydrated in batches."""
+        jira_client = make_jira_client(
+            {
+                "EXT-1": IssueState("EXT-1", "Done", "done", "Done"),
+                "EXT-2": IssueState("EXT-2", "In Progress", "indeterminate"),
+            }
+        )
+        graph = DependencyGraph(jira_client)
+
+        graph.sync(
+            [
+                make_issue("PROJ-1", ("is blocked by", "EXT-1")),
+                make_issue("PROJ-2", ("is blocked by", "EXT-2")),
+                make_issue("PROJ-3", ("depends on", "EXT-3")),
+            ]
+        )
+
+        assert jira_client.fetch_issue_states.call_count == 2
+        assert not graph.is_blocked("PROJ-1")
+        assert graph.is_blocked("PROJ-2")
+        assert not graph.is_blocked("PROJ-3")  # EXT-3 no longer exists
+
+        # Already hydrated issues are not fetched again
+        graph.sync([make_issue("PROJ-1", ("is blocked by", "EXT-1"))])
+        assert jira_client.fetch_issue_states.call_count == 2
+
+    def test_transitive_blocking_and_unblock_scores(self):
+        """Test root blockers and downstream counts along chains of blockers."""
+        graph = DependencyGraph(make_jira_client({"EXT-1": IssueState("EXT-1", "To Do", "new")}))
+        graph.sync(
+            [
+                make_issue("PROJ-1", ("blocks", "PROJ-2"), ("blocks", "PROJ-3")),
+                make_issue("PROJ-2", ("is blocked by", "PROJ-1"), ("blocks", "PROJ-4")),
+                make_issue("PROJ-3"),
+                make_issue("PROJ-4"),
+                make_issue("PROJ-5", ("is blocked by", "EXT-1")),
+            ]
+        )
+
+        assert graph.root_blockers("PROJ-4") == {"PROJ-1"}
+        assert not graph.is_externally_blocked("PROJ-4")
+        assert graph.is_externally_blocked("PROJ-5")
+        assert graph.unblocks_count("PROJ-1") == 3
+        assert graph.unblocks_count("PROJ-2") == 1
+        assert graph.unblocks_count("EXT-1") == 1
+
+    def test_incremental_updates_and_cycles(self):
+        """Test that changed links are re-indexed and cycles are reported."""
+        graph = DependencyGraph()
+        graph.sync(
+            [
+                make_issue("PROJ-1", ("blocks", "PROJ-2")),
+                make_issue("PROJ-2", ("is blocked by", "PROJ-1"), ("blocks", "PROJ-3")),
+            ]
+        )
+        assert graph.find_cycles() == []
+
+        graph.update([make_issue("PROJ-3", ("blocks", "PROJ-1"))])
+        assert graph.find_cycles() == [["PROJ-1", "PROJ-2", "PROJ-3"]]
+        assert graph.root_blockers("PROJ-1") == {"PROJ-2", "PROJ-3"}
+
+        # Dropping the link breaks the cycle
+        graph.update([make_issue("PROJ-3")])
+        assert graph.find_cycles() == []
+        assert graph.unblocks_count("PROJ-1") == 2
+
+        # A removed blocker that is still linked becomes external and unresolved until hydrated
+        graph.update(removed_keys=["PROJ-1"])
+        assert "PROJ-1" not in graph
+        assert graph.external_states() == {"PROJ-1": None}
+        assert graph.is_blocked("PROJ-2")
+
+    def test_plan_generator_ranks_unblocking_tasks_first(self, tmp_path):
+        """Test that a resolved blocker frees a task and unblocking tasks rank first."""
+        issues = [
+            make_issue("PROJ-1", ("is blocked by", "EXT-1")),
+            make_issue("PROJ-2"),
+            make_issue("PROJ-3", ("blocks", "PROJ-4")),
+            make_issue("PROJ-4"),
+        ]
+        jira_client = make_jira_client({"EXT-1": IssueState("EXT-1", "Closed", "done", "Fixed")})
+        jira_client.fetch_active_tasks.return_value = issues
+        graph = DependencyGraph(jira_client)
+        plan_generator = PlanGenerator(
+            jira_client,
+            TaskClassifier(dependency_graph=graph),
+            closure_tracking_dir=str(tmp_path),
+            selection_strategy="greedy",
+            dependency_graph=graph,
+        )
+
+        plan = plan_generator.generate_daily_plan(previous_closure_rate=0.5)
+
+        assert [c.task.key for c in plan.priorities] == ["PROJ-3", "PROJ-1"]
+        # PROJ-4 only waits on backlog work, so it is not a third-party dependency
+        assert [c.task.key for c in plan_generator.ranked_backlog] == ["PROJ-3", "PROJ-1", "PROJ-2", "PROJ-4"]
+
+    def test_unresolved_external_blockers_are_refreshed_on_sync(self):
+        """Test that a sync looks up unresolved external blockers again, unless their TTL has not expired."""
+        states = {"EXT-1": IssueState("EXT-1", "In Progress", "indeterminate")}
+        jira_client = make_jira_client(states)
+        graph = DependencyGraph(jira_client)
+        issues = [make_issue("PROJ-1", ("is blocked by", "EXT-1")), make_issue("PROJ-2", ("is blocked by", "PROJ-1"))]
+
+        graph.sync(issues)
+        assert graph.is_blocked("PROJ-1")
+
+        states["EXT-1"] = IssueState("EXT-1", "Done", "done", "Done")
+        assert graph.sync(issues) == {"PROJ-1", "PROJ-2"}
+        assert not graph.is_blocked("PROJ-1")
+        assert jira_client.fetch_issue_states.call_count == 2
+
+        # Resolved issues are not looked up again
+        graph.sync(issues)
+        assert jira_client.fetch_issue_states.call_count == 2
+
+        # Within the TTL, unresolved issues are not looked up again either
+        throttled = DependencyGraph(jira_client, external_ttl_seconds=3600)
+        states["EXT-1"] = IssueState("EXT-1", "In Progress", "indeterminate")
+        throttled.sync(issues)
+        throttled.sync(issues)
+        assert jira_client.fetch_issue_states.call_count == 3
+
+    def test_update_returns_tasks_with_changed_scores(self):
+        """Test that updates report the upstream and downstream tasks of changed links."""
+        graph = DependencyGraph()
+        graph.sync([make_issue("PROJ-1", ("blocks", "PROJ-2")), make_issue("PROJ-2"), make_issue("PROJ-3")])
+
+        # PROJ-1 and PROJ-2 gain a task downstream, PROJ-4 gains blockers
+        affected = graph.update([make_issue("PROJ-4", ("is blocked by", "PROJ-2"))])
+
+        assert affected == {"PROJ-1", "PROJ-2", "PROJ-4"}
+        assert graph.unblocks_count("PROJ-1") == 2
+        assert graph.update([make_issue("PROJ-3")]) == set()
+
+    def test_replan_reranks_tasks_whose_unblock_score_changed(self, tmp_path):
+        """Test that a replan re-ranks snapshot tasks whose score changed through a delta's links."""
+        issues = [make_issue("PROJ-1"), make_issue("PROJ-2"), make_issue("PROJ-3")]
+        jira_client = make_jira_client({})
+        jira_client.fetch_active_tasks.return_value = issues
+        graph = DependencyGraph(jira_client)
+        plan_generator = PlanGenerator(
+            jira_client,
+            TaskClassifier(dependency_graph=graph),
+            closure_tracking_dir=str(tmp_path),
+            dependency_graph=graph,
+        )
+        plan = plan_generator.generate_daily_plan(previous_closure_rate=0.5)
+        assert [c.task.key for c in plan_generator.ranked_backlog] == ["PROJ-1", "PROJ-2", "PROJ-3"]
+
+        # A new task blocked by PROJ-3 makes PROJ-3 unblock one task
+        blocker = replace(make_issue("PROJ-9"), priority="Blocker")
+        plan_generator.generate_replan(
+            blocker, plan, changed_issues=[make_issue("PROJ-4", ("is blocked by", "PROJ-3"))]
+        )
+
+        assert [c.task.key for c in plan_generator.ranked_backlog][:2] == ["PROJ-3", "PROJ-1"]
+        jira_client.fetch_active_tasks.assert_called_once()
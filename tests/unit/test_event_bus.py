@@ -7,11 +7,15 @@ Unit tests for EventBus.
 """
 
 import asyncio
+import logging
+import threading
+import time
+import tracemalloc
 from datetime import datetime
 
 import pytest
 
-from triage.core.event_bus import Event, EventBus
+from triage.core.event_bus import CircuitBreaker, Event, EventBus, EventBusBridge, EventQueue
 
 
 @pytest.fixture
@@ -276,3 +280,417 @@ async def test_start_stop_processing(event_bus):
 
     # Task should be cancelled
     assert event_bus._processing_task.cancelled() or event_bus._processing_task.done()
+
+
+def test_publish_threadsafe_runs_handlers_on_loop_thread(event_bus):
+    """Test that events published from sync code are delivered in key order on the bus loop thread."""
+    received = []
+
+    async def handler(event):
+        received.append((event.event_data["n"], threading.current_thread().name))
+
+    event_bus.subscribe("task_blocked", handler)
+
+    futures = [event_bus.publish_threadsafe(Event("task_blocked", {"n": n}, key="PROJ-1")) for n in range(5)]
+    for future in futures:
+        assert future.result(timeout=5) is True
+    event_bus.close(timeout=5)
+
+    assert [n for n, _ in received] == [0, 1, 2, 3, 4]
+    assert {name for _, name in received} == {EventBusBridge.THREAD_NAME}
+
+
+def test_publish_threadsafe_applies_overflow_policies():
+    """Test that events from sync code are subject to the event queue's overflow policies without blocking."""
+    event_bus = EventBus(
+        max_queue_size=1, consumers=1, overflow_policies={"plan_generated": EventQueue.OVERFLOW_DROP_NEWEST}
+    )
+    started = threading.Event()
+    release = threading.Event()
+
+    async def handler(event):
+        started.set()
+        await asyncio.get_running_loop().run_in_executor(None, release.wait, 5)
+
+    event_bus.subscribe("task_blocked", handler)
+    bridge = EventBusBridge(event_bus)
+
+    running = bridge.submit(Event("task_blocked", {}))
+    assert started.wait(timeout=5)
+    queued = bridge.submit(Event("task_blocked", {}))
+    assert queued.result(timeout=5) is True
+
+    # The queue is full: plan events are dropped, blocker events wait for room on the loop thread
+    assert bridge.submit(Event("plan_generated", {})).result(timeout=5) is False
+    waiting = bridge.submit(Event("task_blocked", {}))
+    time.sleep(0.05)
+    assert not waiting.done()
+    assert bridge.pending == 1
+    assert event_bus.queue_metrics().dropped == {"plan_generated": 1}
+
+    release.set()
+    bridge.close(timeout=5)
+
+    assert running.result(timeout=0) and waiting.result(timeout=0)
+    assert bridge.pending == 0
+    assert event_bus.queue_metrics().depth == 0
+    assert not bridge.is_running()
+    with pytest.raises(RuntimeError):
+        bridge.submit(Event("task_blocked", {}))
+
+
+def test_publish_threadsafe_runs_queue_consumers():
+    """Test that events from sync code go through the event queue and its concurrent consumers."""
+    event_bus = EventBus(consumers=2)
+    release = threading.Event()
+    handled = []
+
+    async def slow_plan_handler(event):
+        await asyncio.get_running_loop().run_in_executor(None, release.wait, 5)
+        handled.append(event.event_type)
+
+    async def blocker_handler(event):
+        handled.append(event.event_type)
+
+    event_bus.subscribe("plan_generated", slow_plan_handler)
+    event_bus.subscribe("task_blocked", blocker_handler)
+
+    assert event_bus.publish_threadsafe(Event("plan_generated", {})).result(timeout=5)
+    assert event_bus.publish_threadsafe(Event("task_blocked", {}, key="PROJ-1")).result(timeout=5)
+    deadline = time.monotonic() + 5
+    while not handled and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert handled == ["task_blocked"]
+
+    release.set()
+    event_bus.close(timeout=5)
+
+    assert handled == ["task_blocked", "plan_generated"]
+    assert event_bus.queue_metrics().high_water >= 1
+    assert event_bus.queue_metrics().depth == 0
+
+
+def test_publish_threadsafe_stays_bounded_under_sustained_overload(caplog):
+    """Stress test: sync producers outpacing a slow handler do not grow the bridge's pending events or memory."""
+    caplog.set_level(logging.ERROR, logger="triage.core.event_bus")
+    event_bus = EventBus(
+        max_queue_size=10,
+        consumers=1,
+        overflow_policies={
+            "plan_generated": EventQueue.OVERFLOW_DROP_NEWEST,
+            "task_blocked": EventQueue.OVERFLOW_DROP_OLDEST,
+            "approval_timeout": EventQueue.OVERFLOW_COALESCE,
+        },
+    )
+
+    async def slow_handler(event):
+        await asyncio.sleep(0.001)
+
+    for event_type in ("plan_generated", "task_blocked", "approval_timeout", "task_updated"):
+        event_bus.subscribe(event_type, slow_handler)
+
+    def produce(count, event_types):
+        for i in range(count):
+            event_type = event_types[i % len(event_types)]
+            future = event_bus.publish_threadsafe(Event(event_type, {"payload": "x" * 256}, key=f"PROJ-{i % 5}"))
+            assert event_bus._bridge.pending <= 10
+        return future
+
+    tracemalloc.start()
+    try:
+        produce(2000, ["plan_generated", "task_blocked", "approval_timeout"])
+        baseline = tracemalloc.get_traced_memory()[0]
+        produce(30000, ["plan_generated", "task_blocked", "approval_timeout"])
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+        # Blocking events make the producer wait for room instead of piling up
+        last_blocking = produce(200, ["task_updated"])
+    finally:
+        tracemalloc.stop()
+        event_bus.close(timeout=10)
+
+    assert last_blocking.result(timeout=0) is True
+    metrics = event_bus.queue_metrics()
+    assert metrics.dropped["plan_generated"] > 5000
+    assert metrics.dropped["task_blocked"] > 5000
+    assert metrics.coalesced["approval_timeout"] > 5000
+    assert metrics.depth == 0
+    # 30,000 events of ~300 bytes would need more than 9 MB if they were all kept
+    assert growth < 512 * 1024
+
+
+@pytest.mark.asyncio
+async def test_publish_threadsafe_from_running_loop(event_bus):
+    """Test that publishing from a coroutine does not run handlers inline on its loop."""
+    caller_loop = asyncio.get_running_loop()
+    handler_loops = []
+
+    async def handler(event):
+        handler_loops.append(asyncio.get_running_loop())
+
+    event_bus.subscribe("plan_generated", handler)
+
+    future = event_bus.publish_threadsafe(Event("plan_generated", {}))
+    await asyncio.wrap_future(future)
+    event_bus.close(timeout=5)
+
+    assert len(handler_loops) == 1
+    assert handler_loops[0] is not caller_loop
+
+
+@pytest.mark.asyncio
+async def test_overflow_policies():
+    """Test that a full queue drops or coalesces events per event type and reports it."""
+    event_bus = EventBus(
+        max_queue_size=2,
+        overflow_policies={
+            "newest": EventQueue.OVERFLOW_DROP_NEWEST,
+            "oldest": EventQueue.OVERFLOW_DROP_OLDEST,
+            "coalesced": EventQueue.OVERFLOW_COALESCE,
+        },
+    )
+
+    assert await event_bus.publish_async(Event("oldest", {"n": 1}))
+    assert await event_bus.publish_async(Event("newest", {"n": 1}))
+    assert not await event_bus.publish_async(Event("newest", {"n": 2}))
+    assert await event_bus.publish_async(Event("oldest", {"n": 2}))
+    queued = [event_bus.event_queue.get_nowait() for _ in range(2)]
+    assert [(e.event_type, e.event_data["n"]) for e in queued] == [("newest", 1), ("oldest", 2)]
+
+    # Coalescing keeps the position of the queued event with the same key
+    await event_bus.publish_async(Event("coalesced", {"n": 1}, key="PROJ-1"))
+    await event_bus.publish_async(Event("coalesced", {"n": 1}, key="PROJ-2"))
+    assert await event_bus.publish_async(Event("coalesced", {"n": 2}, key="PROJ-1"))
+    queued = [event_bus.event_queue.get_nowait() for _ in range(2)]
+    assert [(e.key, e.event_data["n"]) for e in queued] == [("PROJ-1", 2), ("PROJ-2", 1)]
+
+    metrics = event_bus.queue_metrics()
+    assert metrics.depth == 0
+    assert metrics.max_size == 2
+    assert metrics.high_water == 2
+    assert metrics.dropped == {"newest": 1, "oldest": 1}
+    assert metrics.coalesced == {"coalesced": 1}
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure():
+    """Test that producers wait for room when the policy is to block."""
+    event_bus = EventBus(max_queue_size=1)
+    await event_bus.publish_async(Event("plan_generated", {}))
+
+    blocked = asyncio.create_task(event_bus.publish_async(Event("plan_generated", {})))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    event_bus.event_queue.get_nowait()
+    assert await asyncio.wait_for(blocked, timeout=1)
+    assert event_bus.queue_metrics().dropped == {}
+
+
+def test_invalid_overflow_policy():
+    """Test that unknown overflow policies and negative sizes are rejected."""
+    with pytest.raises(ValueError):
+        EventBus(overflow_policies={"task_blocked": "drop_everything"})
+    with pytest.raises(ValueError):
+        EventBus(max_queue_size=-1)
+
+
+@pytest.mark.asyncio
+async def test_memory_stays_flat_under_sustained_overload(caplog):
+    """Stress test: a producer outpacing a slow handler does not grow the queue or memory."""
+    caplog.set_level(logging.ERROR, logger="triage.core.event_bus")
+    event_bus = EventBus(max_queue_size=100, default_overflow_policy=EventQueue.OVERFLOW_DROP_OLDEST)
+    handled = []
+
+    async def slow_handler(event):
+        await asyncio.sleep(0)
+        handled.append(1)
+
+    event_bus.subscribe("task_blocked", slow_handler)
+    event_bus.start_processing()
+
+    async def produce(count):
+        for i in range(count):
+            await event_bus.publish_async(Event("task_blocked", {"task_key": f"PROJ-{i}", "payload": "x" * 256}))
+            if i % 100 == 0:
+                await asyncio.sleep(0)
+            assert event_bus.event_queue.qsize() <= 100
+
+    tracemalloc.start()
+    try:
+        await produce(5000)
+        baseline = tracemalloc.get_traced_memory()[0]
+        await produce(50000)
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+        event_bus.stop_processing()
+
+    metrics = event_bus.queue_metrics()
+    assert metrics.high_water == 100
+    assert metrics.dropped["task_blocked"] > 40000
+    assert handled
+    # 50,000 events of ~300 bytes would need more than 15 MB if they were all kept
+    assert growth < 512 * 1024
+
+
+@pytest.mark.asyncio
+async def test_high_priority_lane_is_drained_first_with_fairness():
+    """Test that high-priority events go first, with normal events taken between bursts."""
+    queue = EventQueue(high_priority_event_types=["task_blocked"], high_lane_burst=2)
+    for n in range(3):
+        await queue.put(Event("plan_generated", {"n": n}))
+    for n in range(5):
+        await queue.put(Event("task_blocked", {"n": n}))
+
+    taken = [queue.get_nowait() for _ in range(8)]
+
+    assert [(e.event_type[0], e.event_data["n"]) for e in taken] == [
+        ("t", 0),
+        ("t", 1),
+        ("p", 0),
+        ("t", 2),
+        ("t", 3),
+        ("p", 1),
+        ("t", 4),
+        ("p", 2),
+    ]
+    assert queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_consumers_keep_per_key_order():
+    """Test that consumers run concurrently while events with the same key stay in order."""
+    event_bus = EventBus(consumers=4)
+    processed = {}
+    active_keys = set()
+    running = []
+
+    async def handler(event):
+        assert event.key not in active_keys, "Events with the same key must not overlap"
+        active_keys.add(event.key)
+        running.append(len(active_keys))
+        await asyncio.sleep(0.001 * (event.event_data["n"] % 3))
+        active_keys.discard(event.key)
+        processed.setdefault(event.key, []).append(event.event_data["n"])
+
+    event_bus.subscribe("plan_generated", handler)
+    for n in range(10):
+        for key in ("user-1", "user-2", "user-3"):
+            await event_bus.publish_async(Event("plan_generated", {"n": n}, key=key))
+
+    event_bus.start_processing()
+    await asyncio.wait_for(event_bus.event_queue.join(), timeout=5)
+    event_bus.stop_processing()
+
+    assert processed == {key: list(range(10)) for key in ("user-1", "user-2", "user-3")}
+    assert max(running) > 1
+    assert event_bus._key_backlog == {}
+
+
+@pytest.mark.asyncio
+async def test_slow_fan_out_does_not_delay_urgent_events():
+    """Test that a blocking task event is handled while a slow plan event is still running."""
+    event_bus = EventBus(consumers=2)
+    release = asyncio.Event()
+    handled = []
+
+    async def slow_plan_handler(event):
+        await release.wait()
+        handled.append(event.event_type)
+
+    async def blocker_handler(event):
+        handled.append(event.event_type)
+
+    event_bus.subscribe("plan_generated", slow_plan_handler)
+    event_bus.subscribe("task_blocked", blocker_handler)
+    event_bus.start_processing()
+
+    await event_bus.publish_async(Event("plan_generated", {}))
+    await asyncio.sleep(0.01)
+    await event_bus.publish_async(Event("task_blocked", {}, key="PROJ-1"))
+    await asyncio.sleep(0.01)
+    assert handled == ["task_blocked"]
+
+    release.set()
+    await asyncio.wait_for(event_bus.event_queue.join(), timeout=5)
+    event_bus.stop_processing()
+    assert handled == ["task_blocked", "plan_generated"]
+
+
+@pytest.mark.asyncio
+async def test_hung_handler_is_cut_off_at_its_timeout():
+    """Test that a hung handler does not hold up publishing or the other handlers."""
+    event_bus = EventBus(handler_timeout_seconds=0.05)
+    received = []
+
+    async def fast_handler(event):
+        received.append(event)
+
+    async def hung_handler(event):
+        await asyncio.sleep(10)
+
+    event_bus.subscribe("plan_generated", fast_handler)
+    event_bus.subscribe("plan_generated", hung_handler)
+
+    started = time.monotonic()
+    await event_bus.publish(Event("plan_generated", {}))
+
+    assert time.monotonic() - started < 1
+    assert len(received) == 1
+    metrics = {m.handler.rsplit(".", 1)[-1]: m for m in event_bus.handler_metrics()}
+    assert metrics["hung_handler"].timeouts == 1
+    assert sum(count for bound, count in metrics["hung_handler"].latency_histogram.items() if bound >= 0.05) == 1
+    assert metrics["fast_handler"].timeouts == 0
+    assert sum(metrics["fast_handler"].latency_histogram.values()) == 1
+
+
+def test_handler_timeout_resolution():
+    """Test that subscription timeouts override event type timeouts, which override the default."""
+
+    async def handler(event):
+        pass
+
+    event_bus = EventBus(handler_timeout_seconds=5, event_timeouts={"plan_generated": 30})
+    event_bus.subscribe("plan_generated", handler, timeout_seconds=1)
+    event_bus.subscribe("task_blocked", handler)
+
+    assert event_bus.handler_timeout("plan_generated", handler) == 1
+    assert event_bus.handler_timeout("plan_generated", lambda event: None) == 30
+    assert event_bus.handler_timeout("task_blocked", handler) == 5
+    with pytest.raises(ValueError):
+        event_bus.subscribe("task_blocked", handler, timeout_seconds=0)
+    with pytest.raises(ValueError):
+        EventBus(event_timeouts={"task_blocked": -1})
+
+
+@pytest.mark.asyncio
+async def test_handler_is_quarantined_after_repeated_timeouts():
+    """Test that a handler that keeps timing out is skipped, then tried again after the quarantine."""
+    event_bus = EventBus(handler_timeout_seconds=0.01, quarantine_seconds=0.1)
+    calls = []
+    hang = True
+
+    async def flaky_handler(event):
+        calls.append(event)
+        if hang:
+            await asyncio.sleep(10)
+
+    event_bus.subscribe("task_blocked", flaky_handler)
+
+    for _ in range(EventBus.QUARANTINE_AFTER_TIMEOUTS + 2):
+        await event_bus.publish(Event("task_blocked", {}))
+
+    [metrics] = event_bus.handler_metrics()
+    assert len(calls) == EventBus.QUARANTINE_AFTER_TIMEOUTS
+    assert metrics.circuit_state == CircuitBreaker.OPEN
+    assert metrics.skipped == 2
+
+    # After the quarantine, a successful trial call closes the breaker
+    hang = False
+    await asyncio.sleep(0.1)
+    await event_bus.publish(Event("task_blocked", {}))
+
+    [metrics] = event_bus.handler_metrics()
+    assert len(calls) == EventBus.QUARANTINE_AFTER_TIMEOUTS + 1
+    assert metrics.circuit_state == CircuitBreaker.CLOSED
+    assert metrics.calls == EventBus.QUARANTINE_AFTER_TIMEOUTS + 1
@@ -210,6 +210,30 @@ class TestJiraClientErrorHandling:
         second_sleep = mock_sleep.call_args_list[1][0][0]
         assert 2.0 <= second_sleep <= 2.4
 
+    @patch("triage.jira_client.requests.Session.request")
+    @patch("time.sleep")
+    def test_rate_limit_end_is_recorded(self, mock_sleep, mock_request):
+        """Test that the end of a rate limit is kept for callers pacing their requests."""
+        from datetime import datetime, timedelta
+
+        from triage.jira_client import JiraRateLimitError
+
+        mock_response_429 = Mock()
+        mock_response_429.status_code = 429
+        mock_response_429.headers = {"Retry-After": "120"}
+        mock_response_429.text = "Rate limit exceeded"
+        mock_request.return_value = mock_response_429
+
+        client = JiraClient(
+            base_url="https://test.atlassian.net", email="test@example.com", api_token="test-token", max_retries=1
+        )
+        assert client.rate_limited_until is None
+
+        with pytest.raises(JiraRateLimitError):
+            client.fetch_active_tasks()
+
+        assert client.rate_limited_until > datetime.now() + timedelta(seconds=100)
+
     @patch("triage.jira_client.requests.Session.request")
     def test_invalid_jql_query_error(self, mock_request):
         """Test handling of invalid JQL queries (400 response)."""
@@ -404,3 +428,106 @@ class TestJiraClientErrorHandling:
 
         assert "410" in str(exc_info.value)
         assert "no longer available" in str(exc_info.value).lower()
+
+
+class TestFetchIssueStates:
+    """Tests for fetch_issue_states method."""
+
+    @staticmethod
+    def _issue(key: str, status: str, category: str, resolution=None) -> dict:
+        """Build a search result with only the closure fields."""
+        return {
+            "key": key,
+            "fields": {
+                "status": {"name": status, "statusCategory": {"key": category}},
+                "resolution": {"name": resolution} if resolution else None,
+                "assignee": {"emailAddress": "test@example.com"},
+            },
+        }
+
+    @patch("triage.jira_client.requests.Session.request")
+    def test_fetch_issue_states_single_query(self, mock_request):
+        """Test that all keys are fetched in one key-in search with minimal fields."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "issues": [
+                self._issue("PROJ-1", "Done", "done", "Done"),
+                self._issue("PROJ-2", "In Progress", "indeterminate"),
+            ]
+        }
+        mock_request.return_value = mock_response
+
+        client = JiraClient(base_url="https://test.atlassian.net", email="test@example.com", api_token="test-token")
+        states = client.fetch_issue_states(["PROJ-1", "PROJ-2"])
+
+        assert mock_request.call_count == 1
+        params = mock_request.call_args.kwargs["params"]
+        assert params["jql"] == "key in (PROJ-1, PROJ-2)"
+        assert params["fields"] == "status,resolution,assignee"
+
+        assert states["PROJ-1"].resolution == "Done"
+        assert states["PROJ-1"].status_category == "done"
+        assert states["PROJ-2"].resolution is None
+        assert states["PROJ-2"].assignee == "test@example.com"
+
+    @patch("triage.jira_client.requests.Session.request")
+    def test_fetch_issue_states_skips_missing_keys(self, mock_request):
+        """Test that keys rejected by JIRA are dropped and the query is retried."""
+        error_response = Mock()
+        error_response.status_code = 400
+        error_response.text = "Bad request"
+        error_response.json.return_value = {
+            "errorMessages": ["An issue with key 'PROJ-9' does not exist for field 'key'."]
+        }
+
+        ok_response = Mock()
+        ok_response.status_code = 200
+        ok_response.json.return_value = {"issues": [self._issue("PROJ-1", "To Do", "new")]}
+
+        mock_request.side_effect = [error_response, ok_response]
+
+        client = JiraClient(base_url="https://test.atlassian.net", email="test@example.com", api_token="test-token")
+        states = client.fetch_issue_states(["PROJ-1", "PROJ-9"])
+
+        assert mock_request.call_args.kwargs["params"]["jql"] == "key in (PROJ-1)"
+        assert set(states) == {"PROJ-1"}
+
+    def test_fetch_issue_states_empty(self):
+        """Test that no request is made without keys."""
+        client = JiraClient(base_url="https://test.atlassian.net", email="test@example.com", api_token="test-token")
+        client.session = Mock()
+
+        assert client.fetch_issue_states([]) == {}
+        client.session.request.assert_not_called()
+
+
+class TestFetchTasksByKeys:
+    """Tests for fetch_tasks_by_keys method."""
+
+    @patch("triage.jira_client.requests.Session.request")
+    def test_fetch_tasks_by_keys_batches_queries(self, mock_request):
+        """Test that keys are fetched MAX_KEYS_PER_QUERY at a time and missing keys are skipped."""
+
+        def search(method, url, params, **kwargs):
+            keys = params["jql"][len("key in (") : -1].split(", ")
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {
+                "issues": [
+                    {"key": key, "fields": {"summary": f"Task {key}", "status": {"name": "To Do"}}}
+                    for key in keys
+                    if key != "PROJ-7"
+                ]
+            }
+            return response
+
+        mock_request.side_effect = search
+
+        client = JiraClient(base_url="https://test.atlassian.net", email="test@example.com", api_token="test-token")
+        keys = [f"PROJ-{i}" for i in range(1, JiraClient.MAX_KEYS_PER_QUERY + 11)]
+        issues = client.fetch_tasks_by_keys(keys + keys[:3])
+
+        assert mock_request.call_count == 2
+        assert list(issues) == [key for key in keys if key != "PROJ-7"]
+        assert issues["PROJ-1"].summary == "Task PROJ-1"
@@ -0,0 +1,256 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for the durable scheduler operation store."""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from triage.adaptive_poller import AdaptivePoller
+from triage.background_scheduler import BackgroundScheduler, OperationPriority
+from triage.closure_store import PostgresClosureStore
+from triage.models import IssueLink, JiraIssue
+from triage.operation_store import (
+    OperationStore,
+    PostgresOperationStore,
+    SQLiteOperationStore,
+    create_operation_store,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """SQLite operation store in a temporary directory."""
+    store = SQLiteOperationStore(str(tmp_path / "operations.db"))
+    yield store
+    store.close()
+
+
+class TestSQLiteOperationStore:
+    """Test suite for SQLiteOperationStore."""
+
+    def test_idempotency_key(self, store):
+        """Test that work with a known idempotency key is only enqueued once."""
+        assert store.enqueue("sync", {"n": 1}, idempotency_key="sync:1")
+        assert not store.enqueue("sync", {"n": 2}, idempotency_key="sync:1")
+        assert store.enqueue("sync", {"n": 3})
+        assert store.enqueue("sync", {"n": 4})
+
+        assert [op.payload["n"] for op in store.claim(limit=10)] == [1, 3, 4]
+
+    def test_claims_follow_priority_and_leases(self, store):
+        """Test that claims return visible operations in priority order, each to one claimer."""
+        store.enqueue("normal", {}, priority=1)
+        store.enqueue("blocking", {}, priority=0)
+        store.enqueue("later", {}, priority=0, delay_seconds=60)
+
+        first = store.claim()
+        second = store.claim()
+
+        assert [op.operation_type for op in first + second] == ["blocking", "normal"]
+        assert store.claim() == []
+
+    def test_expired_lease_is_claimed_again(self, store):
+        """Test at-least-once delivery when a claimer does not finish in time."""
+        store.enqueue("sync", {})
+        [lost] = store.claim(visibility_timeout_seconds=0)
+
+        [reclaimed] = store.claim()
+
+        assert reclaimed.operation_id == lost.operation_id
+        assert reclaimed.attempts == 2
+        assert not store.complete(lost)
+        assert store.complete(reclaimed)
+        assert store.claim(visibility_timeout_seconds=0) == []
+
+    def test_failed_operation_is_retried_then_given_up(self, store):
+        """Test that released operations come back until MAX_ATTEMPTS claims were made."""
+        store.enqueue("sync", {})
+
+        for attempt in range(1, OperationStore.MAX_ATTEMPTS + 1):
+            [operation] = store.claim()
+            assert operation.attempts == attempt
+            assert store.release(operation)
+
+        assert store.claim() == []
+
+    def test_purge_forgets_idempotency_keys(self, store):
+        """Test that purging finished operations allows the same work again."""
+        store.enqueue("sync", {}, idempotency_key="sync")
+        [operation] = store.claim()
+        store.complete(operation)
+
+        assert store.purge(older_than_seconds=3600) == 0
+        assert not store.enqueue("sync", {}, idempotency_key="sync")
+        assert store.purge(older_than_seconds=-1) == 1
+        assert store.enqueue("sync", {}, idempotency_key="sync")
+
+    def test_state(self, store):
+        """Test that schedule state values are stored and replaced."""
+        assert store.get_state("last_plan_date") is None
+
+        store.set_state("last_plan_date", "2026-02-17")
+        store.set_state("last_plan_date", "2026-02-18")
+
+        assert store.get_state("last_plan_date") == "2026-02-18"
+
+    def test_concurrent_claims_do_not_overlap(self, tmp_path):
+        """Test that replicas sharing the database file never claim the same operation."""
+        path = str(tmp_path / "operations.db")
+        writer = SQLiteOperationStore(path)
+        for i in range(200):
+            writer.enqueue("sync", {"n": i})
+        replicas = [SQLiteOperationStore(path) for _ in range(4)]
+        claimed = [[] for _ in replicas]
+
+        def drain(replica, into):
+            while operations := replica.claim(limit=3):
+                into.extend(op.payload["n"] for op in operations)
+
+        threads = [threading.Thread(target=drain, args=(r, c)) for r, c in zip(replicas, claimed)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(n for c in claimed for n in c) == list(range(200))
+
+    def test_create_operation_store(self, tmp_path):
+        """Test that PostgreSQL deployments share the closure store's pool."""
+        postgres = create_operation_store(str(tmp_path), PostgresClosureStore(pool=Mock(), loop=Mock()))
+
+        assert isinstance(postgres, PostgresOperationStore)
+        assert isinstance(create_operation_store(str(tmp_path)), SQLiteOperationStore)
+
+
+class TestBackgroundSchedulerDurableQueue:
+    """Test suite for BackgroundScheduler with a durable operation store."""
+
+    def test_plan_survives_restart_and_is_not_duplicated(self, store):
+        """Test that a plan queued before a crash runs once after a restart."""
+        generator = Mock()
+        generator.user_id = "user"
+        generator.generate_daily_plan.return_value = Mock(priorities=[], admin_block=Mock(tasks=[]))
+        crashed = BackgroundScheduler(jira_client=Mock(), plan_generator=generator, operation_store=store)
+        crashed.schedule_daily_plan("07:00")
+        crashed._now = lambda: datetime(2026, 2, 17, 7, 0)
+        crashed._check_daily_plan_schedule()
+
+        restarted = BackgroundScheduler(jira_client=Mock(), plan_generator=generator, operation_store=store)
+        restarted.schedule_daily_plan("07:00")
+        restarted._now = lambda: datetime(2026, 2, 17, 7, 5)
+        restarted._arm_daily_plan_timer = Mock()
+        restarted.start()
+        try:
+            deadline = time.monotonic() + 5
+            while not generator.generate_daily_plan.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+            restarted._check_daily_plan_schedule()
+        finally:
+            restarted.stop()
+
+        generator.generate_daily_plan.assert_called_once()
+        assert restarted._last_plan_date == datetime(2026, 2, 17).date()
+        # The operation completed instead of waiting for a retry
+        assert store.purge(older_than_seconds=-1) == 1
+
+    def test_blocking_task_payload_round_trip(self, store):
+        """Test that a stored blocking task reaches its handler unchanged."""
+        task = JiraIssue(
+            key="PROJ-1",
+            summary="Outage",
+            description="",
+            issue_type="Bug",
+            priority="Blocker",
+            status="To Do",
+            assignee="user@example.com",
+            issue_links=[IssueLink("blocks", "PROJ-2", "Task PROJ-2")],
+        )
+        scheduler = BackgroundScheduler(jira_client=Mock(), plan_generator=Mock(), operation_store=store)
+
+        assert scheduler.queue_operation(
+            "handle_blocking_task", Mock(), OperationPriority.BLOCKING, idempotency_key="PROJ-1", task=task
+        )
+        assert not scheduler.queue_operation(
+            "handle_blocking_task", Mock(), OperationPriority.BLOCKING, idempotency_key="PROJ-1", task=task
+        )
+
+        [leased] = store.claim()
+        assert scheduler._decode_payload(leased.operation_type, leased.payload) == {"task": task}
+
+    def test_returning_blocker_is_handled_again(self, store):
+        """Test that replicas handle an open blocker once, and again after it stopped blocking and came back."""
+        blocker = JiraIssue("PROJ-1", "Outage", "", "Bug", "Blocker", "To Do", "user@example.com")
+        clock = iter(datetime(2026, 2, 17, 9, minute) for minute in range(10))
+        replicas = [
+            BackgroundScheduler(jira_client=Mock(), plan_generator=Mock(), operation_store=store) for _ in range(2)
+        ]
+        for replica in replicas:
+            replica._now = lambda: next(clock)
+
+        handled = []
+        for replica, blockers in [(replicas[0], [blocker]), (replicas[1], [blocker]), (replicas[0], [])]:
+            replica.jira_client.fetch_blocking_tasks.return_value = blockers
+            replica._check_blocking_tasks()
+            handled.append(len(store.claim(limit=10)))
+        replicas[0].jira_client.fetch_blocking_tasks.return_value = [blocker]
+        replicas[0]._check_blocking_tasks()
+        handled.append(len(store.claim(limit=10)))
+
+        assert handled == [1, 0, 0, 1]
+
+    def test_blocker_queued_by_another_replica_backs_off(self, store):
+        """Test that a replica treats a blocker already in the store as handled instead of changed."""
+        blocker = JiraIssue("PROJ-1", "Outage", "", "Bug", "Blocker", "To Do", "user@example.com")
+        replicas = []
+        for _ in range(2):
+            replica = BackgroundScheduler(
+                jira_client=Mock(),
+                plan_generator=Mock(),
+                operation_store=store,
+                adaptive_poller=AdaptivePoller(min_interval_seconds=60),
+            )
+            replica.jira_client.fetch_blocking_tasks.return_value = [blocker]
+            replica._now = lambda: datetime(2026, 2, 17, 9, 0)
+            replicas.append(replica)
+
+        replicas[0]._check_blocking_tasks()
+        replicas[1]._check_blocking_tasks()
+        replicas[1]._check_blocking_tasks()
+
+        poller = replicas[1].adaptive_poller
+        assert poller.reason == AdaptivePoller.REASON_BLOCKERS
+        assert poller.interval > poller.min_interval
+        assert "PROJ-1" in replicas[1]._handled_blockers
+        assert len(store.claim(limit=10)) == 1
+
+    def test_running_operation_keeps_its_lease(self, store):
+        """Test that the lease of a long operation is extended until it finishes."""
+        generator = Mock()
+        generator.user_id = "user"
+
+        def slow_plan():
+            time.sleep(0.3)
+            return Mock(priorities=[], admin_block=Mock(tasks=[]))
+
+        generator.generate_daily_plan.side_effect = slow_plan
+        store.extend_lease = Mock(wraps=store.extend_lease)
+        scheduler = BackgroundScheduler(jira_client=Mock(), plan_generator=generator, operation_store=store)
+        scheduler.LEASE_HEARTBEAT_SECONDS = 0.05
+        scheduler.queue_operation("generate_daily_plan", Mock(), idempotency_key="plan")
+
+        scheduler.start()
+        try:
+            deadline = time.monotonic() + 5
+            while store.purge(older_than_seconds=-1) == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            scheduler.stop()
+
+        assert store.extend_lease.call_count >= 2
+        assert not any(name.startswith("lease:") for name in scheduler._timers)
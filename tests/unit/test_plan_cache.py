@@ -0,0 +1,138 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for the plan cache."""
+
+from dataclasses import replace
+from datetime import date
+from unittest.mock import Mock, patch
+
+from triage.models import IssueLink, JiraIssue
+from triage.plan_cache import SQLitePlanCache, backlog_fingerprint, plan_from_dict, plan_to_dict
+from triage.plan_generator import PlanGenerator
+from triage.task_classifier import TaskClassifier
+
+
+def make_issue(key: str, priority: str = "Medium", story_points: int = 1) -> JiraIssue:
+    """Build a simple story."""
+    return JiraIssue(
+        key=key,
+        summary=f"Task {key}",
+        description="A task",
+        issue_type="Story",
+        priority=priority,
+        status="To Do",
+        assignee="user@example.com",
+        story_points=story_points,
+        labels=["backend"],
+    )
+
+
+def make_generator(tmp_path, issues):
+    """Build a plan generator with a SQLite plan cache and a mocked JIRA client."""
+    jira_client = Mock()
+    jira_client.fetch_active_tasks.return_value = issues
+    return PlanGenerator(
+        jira_client,
+        TaskClassifier(),
+        closure_tracking_dir=str(tmp_path),
+        plan_cache=SQLitePlanCache(str(tmp_path / "plans.db")),
+    )
+
+
+class TestBacklogFingerprint:
+    """Test suite for backlog fingerprints."""
+
+    def test_fingerprint_ignores_order(self):
+        """Test that the fingerprint does not depend on issue order."""
+        issues = [make_issue("PROJ-1"), make_issue("PROJ-2")]
+        assert backlog_fingerprint(issues, 0.5) == backlog_fingerprint(list(reversed(issues)), 0.5)
+
+    def test_fingerprint_changes_with_issue_or_parameters(self):
+        """Test that any changed field or parameter changes the fingerprint."""
+        issues = [make_issue("PROJ-1"), make_issue("PROJ-2")]
+        fingerprint = backlog_fingerprint(issues, 0.5)
+
+        changed = [issues[0], replace(issues[1], status="In Progress")]
+        assert backlog_fingerprint(changed, 0.5) != fingerprint
+        assert backlog_fingerprint(issues, 0.6) != fingerprint
+
+
+class TestSQLitePlanCache:
+    """Test suite for SQLitePlanCache."""
+
+    def test_plan_round_trip(self, tmp_path):
+        """Test that a stored plan is loaded back unchanged."""
+        issues = [make_issue("PROJ-1"), make_issue("PROJ-2", story_points=13)]
+        issues[0].issue_links = [IssueLink(link_type="blocks", target_key="PROJ-2", target_summary="Task PROJ-2")]
+        plan = make_generator(tmp_path, issues).generate_daily_plan(previous_closure_rate=0.5, issues=issues)
+
+        assert plan_from_dict(plan_to_dict(plan)) == plan
+
+        cache = SQLitePlanCache(":memory:")
+        cache.save(plan, "abc")
+        cached = cache.load(plan.date)
+        assert cached.fingerprint == "abc"
+        assert cached.plan == plan
+
+        cache.invalidate(plan_date=plan.date)
+        assert cache.load(plan.date) is None
+
+
+class TestPlanGeneratorPlanCache:
+    """Test suite for plan caching in PlanGenerator."""
+
+    def test_unchanged_backlog_skips_recomputation(self, tmp_path):
+        """Test that an unchanged backlog is served from the cache without classifying."""
+        issues = [make_issue(f"PROJ-{i}") for i in range(1, 5)]
+        generator = make_generator(tmp_path, issues)
+        plan_date = date(2026, 2, 17)
+
+        plan = generator.generate_daily_plan(previous_closure_rate=0.5, plan_date=plan_date)
+
+        with patch.object(generator.classifier, "classify_task") as classify_task:
+            cached_plan = generator.generate_daily_plan(previous_closure_rate=0.5, plan_date=plan_date)
+
+        classify_task.assert_not_called()
+        assert cached_plan == plan
+        assert generator.get_stored_plan(plan_date) == plan
+
+    def test_stored_plan_keeps_snapshot_for_replan(self, tmp_path):
+        """Test that a plan served from the cache still lets the next replan skip JIRA."""
+        issues = [make_issue(f"PROJ-{i}") for i in range(1, 5)]
+        make_generator(tmp_path, issues).generate_daily_plan(previous_closure_rate=0.5)
+
+        # Another instance sharing the cache serves the stored plan
+        generator = make_generator(tmp_path, issues)
+        plan = generator.generate_daily_plan(previous_closure_rate=0.5)
+        replan = generator.generate_replan(make_issue("PROJ-99", priority="Blocker"), plan)
+
+        generator.jira_client.fetch_active_tasks.assert_called_once()
+        assert [c.task.key for c in replan.priorities][0] == "PROJ-99"
+        assert {c.task.key for c in replan.other_tasks} | {c.task.key for c in replan.priorities} >= {
+            f"PROJ-{i}" for i in range(1, 5)
+        }
+
+    def test_changed_backlog_regenerates(self, tmp_path):
+        """Test that a changed backlog produces and stores a new plan."""
+        issues = [make_issue(f"PROJ-{i}") for i in range(1, 5)]
+        generator = make_generator(tmp_path, issues)
+        plan_date = date(2026, 2, 17)
+
+        generator.generate_daily_plan(previous_closure_rate=0.5, plan_date=plan_date)
+        generator.jira_client.fetch_active_tasks.return_value = issues + [make_issue("PROJ-9", priority="High")]
+        plan = generator.generate_daily_plan(previous_closure_rate=0.5, plan_date=plan_date)
+
+        assert plan.priorities[0].task.key == "PROJ-9"
+        assert generator.get_stored_plan(plan_date) == plan
+
+    def test_replan_invalidates_stored_plan(self, tmp_path):
+        """Test that a replan drops the stored plan of the day."""
+        issues = [make_issue(f"PROJ-{i}") for i in range(1, 5)]
+        generator = make_generator(tmp_path, issues)
+
+        plan = generator.generate_daily_plan(previous_closure_rate=0.5)
+        generator.generate_replan(make_issue("PROJ-99", priority="Blocker"), plan)
+
+        assert generator.get_stored_plan() is None
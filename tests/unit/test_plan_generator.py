@@ -7,7 +7,9 @@
 from datetime import date
 from unittest.mock import Mock
 
-from triage.models import JiraIssue
+import pytest
+
+from triage.models import ClosureOutcome, IssueState, JiraIssue, TaskCategory, TaskClassification
 from triage.plan_generator import PlanGenerator
 from triage.task_classifier import TaskClassifier
 
@@ -138,3 +140,413 @@ class TestPlanGenerator:
 
         # Verify some tasks were deferred
         assert len(plan.admin_block.tasks) < len(tasks)
+
+    def test_generate_daily_plan_with_classified_tasks(self):
+        """Test that pre-classified tasks skip the JIRA fetch."""
+        task = JiraIssue(
+            key="PROJ-1",
+            summary="Quick bug fix",
+            description="Fix a small bug",
+            issue_type="Bug",
+            priority="High",
+            status="To Do",
+            assignee="user@example.com",
+            story_points=1,
+        )
+
+        mock_jira_client = Mock()
+        classifier = TaskClassifier()
+        plan_generator = PlanGenerator(mock_jira_client, classifier)
+
+        plan_date = date(2026, 2, 17)
+        plan = plan_generator.generate_daily_plan(
+            classified_tasks=[classifier.classify_task(task)], plan_date=plan_date, previous_closure_rate=0.5
+        )
+
+        mock_jira_client.fetch_active_tasks.assert_not_called()
+        assert plan.date == plan_date
+        assert [c.task.key for c in plan.priorities] == ["PROJ-1"]
+
+    def test_generate_daily_plan_with_issues(self):
+        """Test that pre-fetched issues are classified without a JIRA fetch."""
+        task = JiraIssue(
+            key="PROJ-1",
+            summary="Quick bug fix",
+            description="Fix a small bug",
+            issue_type="Bug",
+            priority="High",
+            status="To Do",
+            assignee="user@example.com",
+            story_points=1,
+        )
+
+        mock_jira_client = Mock()
+        classifier = Mock(wraps=TaskClassifier())
+        plan_generator = PlanGenerator(mock_jira_client, classifier)
+
+        plan = plan_generator.generate_daily_plan(issues=[task], previous_closure_rate=0.5)
+
+        mock_jira_client.fetch_active_tasks.assert_not_called()
+        assert classifier.classify_task.call_count == 1
+        assert [c.task.key for c in plan.priorities] == ["PROJ-1"]
+
+    def _make_eligible(self, key: str, estimated_days: float, priority: str = "Medium") -> TaskClassification:
+        """Build a priority-eligible classification with a fixed effort."""
+        issue = JiraIssue(
+            key=key,
+            summary=f"Task {key}",
+            description="A task",
+            issue_type="Story",
+            priority=priority,
+            status="To Do",
+            assignee="user@example.com",
+        )
+        return TaskClassification(
+            task=issue,
+            category=TaskCategory.PRIORITY_ELIGIBLE,
+            is_priority_eligible=True,
+            has_dependencies=False,
+            estimated_days=estimated_days,
+        )
+
+    def test_knapsack_selection_fills_capacity(self):
+        """Test that knapsack selection uses capacity the greedy walk leaves unused."""
+        tasks = [
+            self._make_eligible("PROJ-1", 0.5, priority="High"),
+            self._make_eligible("PROJ-2", 0.7),
+            self._make_eligible("PROJ-3", 0.5),
+        ]
+
+        greedy = PlanGenerator(Mock(), TaskClassifier(), selection_strategy="greedy")
+        knapsack = PlanGenerator(Mock(), TaskClassifier())
+
+        greedy_keys = [c.task.key for c in greedy._select_priorities(tasks)]
+        knapsack_keys = [c.task.key for c in knapsack._select_priorities(tasks)]
+
+        assert greedy_keys == ["PROJ-1", "PROJ-3"]
+        assert knapsack_keys == ["PROJ-1", "PROJ-3"]
+
+        tasks = [
+            self._make_eligible("PROJ-1", 0.3, priority="High"),
+            self._make_eligible("PROJ-2", 0.8),
+            self._make_eligible("PROJ-3", 0.6),
+            self._make_eligible("PROJ-4", 0.7),
+        ]
+
+        greedy_keys = [c.task.key for c in greedy._select_priorities(tasks)]
+        knapsack_keys = [c.task.key for c in knapsack._select_priorities(tasks)]
+
+        # Greedy takes PROJ-1 and PROJ-3 (0.9 days); knapsack fills the day exactly
+        assert greedy_keys == ["PROJ-1", "PROJ-3"]
+        assert knapsack_keys == ["PROJ-1", "PROJ-4"]
+
+    def test_knapsack_selection_prefers_rank_on_ties(self):
+        """Test that equally good selections are resolved by rank order."""
+        tasks = [self._make_eligible(f"PROJ-{i}", 0.5) for i in range(10, 0, -1)]
+
+        plan_generator = PlanGenerator(Mock(), TaskClassifier())
+        selected = plan_generator._select_priorities(tasks)
+
+        assert [c.task.key for c in selected] == ["PROJ-1", "PROJ-2"]
+        assert sum(c.estimated_days for c in selected) <= 1.0
+
+    def test_knapsack_selection_keeps_top_ranked_task(self):
+        """Test that the top-ranked task is kept even when others fill the day better."""
+        tasks = [
+            self._make_eligible("PROJ-1", 0.6, priority="High"),
+            self._make_eligible("PROJ-2", 0.5),
+            self._make_eligible("PROJ-3", 0.5),
+        ]
+
+        plan_generator = PlanGenerator(Mock(), TaskClassifier())
+
+        assert [c.task.key for c in plan_generator._select_priorities(tasks)] == ["PROJ-1"]
+
+    def test_knapsack_selection_accepts_exact_fits(self):
+        """Test that efforts adding up to exactly one day are not rejected by rounding."""
+        tasks = [
+            self._make_eligible("PROJ-1", 0.35, priority="High"),
+            self._make_eligible("PROJ-2", 0.35),
+            self._make_eligible("PROJ-3", 0.3),
+        ]
+
+        plan_generator = PlanGenerator(Mock(), TaskClassifier())
+
+        selected = plan_generator._select_priorities(tasks)
+
+        assert sorted(c.task.key for c in selected) == ["PROJ-1", "PROJ-2", "PROJ-3"]
+
+    def test_invalid_selection_strategy(self):
+        """Test that unknown selection strategies are rejected."""
+        with pytest.raises(ValueError):
+            PlanGenerator(Mock(), TaskClassifier(), selection_strategy="random")
+
+    def test_invalid_admin_block_time(self):
+        """Test that admin block times that are not HH:MM-HH:MM ranges are rejected."""
+        with pytest.raises(ValueError):
+            PlanGenerator(Mock(), TaskClassifier(), admin_block_times=["14:00-15:30", "9am"])
+
+    def test_generate_daily_plan_with_multiple_admin_blocks(self):
+        """Test that admin overflow spills into additional configured blocks."""
+        tasks = [
+            JiraIssue(
+                key=f"ADMIN-{i}",
+                summary=f"Admin task {i}",
+                description="An admin task",
+                issue_type="Administrative Task",
+                priority="Low",
+                status="To Do",
+                assignee="user@example.com",
+                time_estimate=2880,  # 0.1 days = 48 minutes
+                labels=["admin"],
+            )
+            for i in range(1, 5)
+        ]
+
+        mock_jira_client = Mock()
+        mock_jira_client.fetch_active_tasks.return_value = tasks
+
+        plan_generator = PlanGenerator(
+            mock_jira_client, TaskClassifier(), admin_block_times=["09:00-10:30", "14:00-15:30"]
+        )
+        plan = plan_generator.generate_daily_plan(previous_closure_rate=0.5)
+
+        assert plan.admin_block.scheduled_time == "09:00-10:30"
+        assert len(plan.additional_admin_blocks) == 1
+        assert plan.additional_admin_blocks[0].scheduled_time == "14:00-15:30"
+
+        block_keys = [c.task.key for b in [plan.admin_block] + plan.additional_admin_blocks for c in b.tasks]
+        assert block_keys == ["ADMIN-1", "ADMIN-2"]
+        assert {c.task.key for c in plan.other_tasks} == {"ADMIN-3", "ADMIN-4"}
+
+    def test_replan_reuses_ranked_backlog(self):
+        """Test that a second plan re-ranks only the changed task."""
+        tasks = [
+            JiraIssue(
+                key=f"PROJ-{i}",
+                summary=f"Task {i}",
+                description="A task",
+                issue_type="Story",
+                priority="Medium",
+                status="To Do",
+                assignee="user@example.com",
+                story_points=1,
+            )
+            for i in range(1, 6)
+        ]
+
+        mock_jira_client = Mock()
+        classifier = TaskClassifier()
+        plan_generator = PlanGenerator(mock_jira_client, classifier, selection_strategy="greedy")
+
+        plan1 = plan_generator.generate_daily_plan(issues=tasks, previous_closure_rate=0.5)
+        assert [c.task.key for c in plan1.priorities] == ["PROJ-1", "PROJ-2"]
+
+        tasks[4] = JiraIssue(
+            key="PROJ-5",
+            summary="Task 5",
+            description="A task",
+            issue_type="Story",
+            priority="Highest",
+            status="To Do",
+            assignee="user@example.com",
+            story_points=1,
+        )
+        plan2 = plan_generator.generate_daily_plan(issues=tasks, previous_closure_rate=0.5)
+
+        assert [c.task.key for c in plan2.priorities] == ["PROJ-5", "PROJ-1"]
+        assert len(plan_generator.ranked_backlog) == 5
+
+    def _make_issue(self, key: str, priority: str = "Medium", status: str = "To Do") -> JiraIssue:
+        """Build a one-story-point issue."""
+        return JiraIssue(
+            key=key,
+            summary=f"Task {key}",
+            description="A task",
+            issue_type="Story",
+            priority=priority,
+            status=status,
+            assignee="user@example.com",
+            story_points=1,
+        )
+
+    def test_replan_from_fresh_snapshot_skips_jira(self):
+        """Test that a replan right after a plan does not fetch active tasks again."""
+        tasks = [self._make_issue(f"PROJ-{i}") for i in range(1, 5)]
+
+        mock_jira_client = Mock()
+        mock_jira_client.fetch_active_tasks.return_value = tasks
+        plan_generator = PlanGenerator(mock_jira_client, TaskClassifier())
+
+        plan = plan_generator.generate_daily_plan(previous_closure_rate=0.5)
+        assert mock_jira_client.fetch_active_tasks.call_count == 1
+
+        blocker = self._make_issue("PROJ-99", priority="Blocker")
+        new_plan = plan_generator.generate_replan(blocker, plan)
+
+        assert mock_jira_client.fetch_active_tasks.call_count == 1
+        assert new_plan.priorities[0].task.key == "PROJ-99"
+        assert len(new_plan.priorities) == 3
+        assert new_plan.previous_closure_rate == 0.5
+
+    def test_replan_applies_delta(self):
+        """Test that changed and removed tasks from the delta are reflected in the replan."""
+        tasks = [self._make_issue(f"PROJ-{i}") for i in range(1, 5)]
+
+        mock_jira_client = Mock()
+        plan_generator = PlanGenerator(mock_jira_client, TaskClassifier(), selection_strategy="greedy")
+        plan = plan_generator.generate_daily_plan(issues=tasks, previous_closure_rate=0.5)
+
+        blocker = self._make_issue("PROJ-99", priority="Blocker")
+        new_plan = plan_generator.generate_replan(
+            blocker,
+            plan,
+            changed_issues=[self._make_issue("PROJ-4", priority="Highest")],
+            removed_keys=["PROJ-1"],
+        )
+
+        mock_jira_client.fetch_active_tasks.assert_not_called()
+        assert [c.task.key for c in new_plan.priorities] == ["PROJ-99", "PROJ-4", "PROJ-2"]
+        all_keys = {c.task.key for c in new_plan.priorities + new_plan.other_tasks}
+        assert all_keys == {"PROJ-2", "PROJ-3", "PROJ-4", "PROJ-99"}
+
+    def test_fork_replans_independently(self):
+        """Test that a fork replans from the same snapshot without changing the original."""
+        tasks = [self._make_issue(f"PROJ-{i}") for i in range(1, 5)]
+
+        mock_jira_client = Mock()
+        plan_generator = PlanGenerator(mock_jira_client, TaskClassifier(), selection_strategy="greedy")
+        plan = plan_generator.generate_daily_plan(issues=tasks, previous_closure_rate=0.5)
+
+        fork = plan_generator.fork()
+        new_plan = fork.generate_replan(self._make_issue("PROJ-99", priority="Blocker"), plan, removed_keys=["PROJ-1"])
+
+        mock_jira_client.fetch_active_tasks.assert_not_called()
+        assert fork.jira_client is mock_jira_client
+        assert fork.closure_store is plan_generator.closure_store
+        assert [c.task.key for c in new_plan.priorities] == ["PROJ-99", "PROJ-2", "PROJ-3"]
+        assert "PROJ-1" in plan_generator.ranked_backlog
+        assert "PROJ-1" not in fork.ranked_backlog
+        assert set(plan_generator._snapshot) == {f"PROJ-{i}" for i in range(1, 5)}
+
+    def test_replan_with_stale_snapshot_fetches(self):
+        """Test that a stale snapshot makes the replan fetch active tasks."""
+        tasks = [self._make_issue(f"PROJ-{i}") for i in range(1, 3)]
+
+        mock_jira_client = Mock()
+        mock_jira_client.fetch_active_tasks.return_value = tasks
+        plan_generator = PlanGenerator(mock_jira_client, TaskClassifier())
+        plan_generator.SNAPSHOT_MAX_AGE_SECONDS = -1
+
+        plan = plan_generator.generate_daily_plan(previous_closure_rate=0.5)
+        plan_generator.generate_replan(self._make_issue("PROJ-99", priority="Blocker"), plan)
+
+        assert mock_jira_client.fetch_active_tasks.call_count == 2
+
+    def test_verify_priority_closure(self, tmp_path):
+        """Test that closure verification tells resolved from out-of-scope priorities."""
+        priorities = [
+            self._make_eligible(key, 0.25) for key in ("PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4", "PROJ-5", "PROJ-6")
+        ]
+        for classification in priorities:
+            classification.task.assignee = "user@example.com"
+
+        mock_jira_client = Mock()
+        mock_jira_client.fetch_issue_states.return_value = {
+            "PROJ-1": IssueState("PROJ-1", "Done", "done", "Done", "user@example.com"),
+            "PROJ-2": IssueState("PROJ-2", "In Progress", "indeterminate", None, "user@example.com"),
+            "PROJ-3": IssueState("PROJ-3", "Closed", "done", "Won't Do", "user@example.com"),
+            "PROJ-4": IssueState("PROJ-4", "To Do", "new", None, "someone@example.com"),
+            "PROJ-6": IssueState("PROJ-6", "Closed", "done", None, "user@example.com"),
+        }
+        plan_generator = PlanGenerator(mock_jira_client, TaskClassifier(), closure_tracking_dir=str(tmp_path))
+
+        record = plan_generator.save_closure_record(date(2026, 2, 17), priorities)
+
+        mock_jira_client.fetch_issue_states.assert_called_once_with([c.task.key for c in priorities])
+        mock_jira_client.fetch_active_tasks.assert_not_called()
+        assert plan_generator.verify_priority_closure(priorities[:2]) == {
+            "PROJ-1": ClosureOutcome.RESOLVED,
+            "PROJ-2": ClosureOutcome.INCOMPLETE,
+        }
+        assert record.completed_priorities == 2
+        assert record.incomplete_tasks == ["PROJ-2"]
+        assert record.out_of_scope_tasks == ["PROJ-3", "PROJ-4", "PROJ-5"]
+        assert record.closure_rate == pytest.approx(2 / 6)
+        assert plan_generator.load_closure_record(date(2026, 2, 17)) == record
+
+    def test_create_decompositions_preserves_order_per_parent(self, tmp_path):
+        """Test that subtasks are created in order per parent and failures stay per parent."""
+        mock_jira_client = Mock()
+        mock_jira_client.get_subtask_context.side_effect = lambda parent_key: parent_key
+        created = {}
+
+        def create_subtask(parent_key, spec, context):
+            if parent_key == "PROJ-3" and spec.order == 2:
+                raise RuntimeError("JIRA unavailable")
+            created.setdefault(parent_key, []).append(spec.order)
+            return f"{parent_key}-{spec.order}"
+
+        mock_jira_client.create_subtask.side_effect = create_subtask
+        plan_generator = PlanGenerator(mock_jira_client, TaskClassifier(), closure_tracking_dir=str(tmp_path))
+        tasks = [
+            JiraIssue(
+                key=f"PROJ-{i}",
+                summary=f"Task {i}",
+                description="A long task",
+                issue_type="Story",
+                priority="Medium",
+                status="To Do",
+                assignee="user@example.com",
+                story_points=8,
+            )
+            for i in range(1, 5)
+        ]
+
+        proposals = plan_generator.propose_decompositions(tasks + tasks[:1])
+        results = plan_generator.create_decompositions(proposals)
+
+        assert list(results) == ["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4"]
+        assert mock_jira_client.get_subtask_context.call_count == 4
+        for key in ("PROJ-1", "PROJ-2", "PROJ-4"):
+            specs = proposals[key]
+            assert results[key].error is None
+            assert results[key].created_keys == [f"{key}-{spec.order}" for spec in specs]
+            assert created[key] == sorted(created[key])
+        assert results["PROJ-3"].created_keys == ["PROJ-3-1"]
+        assert results["PROJ-3"].error == "JIRA unavailable"
+
+    @pytest.mark.parametrize("strategy", PlanGenerator.SELECTION_STRATEGIES)
+    def test_horizon_plan_assigns_days_from_one_ranking(self, tmp_path, strategy):
+        """Test that a week is planned from one fetch, with each task scheduled at most once."""
+        issues = [self._make_eligible(f"PROJ-{i}", 0.5).task for i in range(1, 21)]
+        issues[0].priority = "High"
+        mock_jira_client = Mock()
+        mock_jira_client.fetch_active_tasks.return_value = issues
+        plan_generator = PlanGenerator(
+            mock_jira_client, TaskClassifier(), closure_tracking_dir=str(tmp_path), selection_strategy=strategy
+        )
+
+        # Friday start: the horizon skips the weekend
+        plans = plan_generator.generate_horizon_plan(start_date=date(2026, 2, 20), previous_closure_rate=0.5)
+
+        mock_jira_client.fetch_active_tasks.assert_called_once()
+        assert [p.date for p in plans] == [date(2026, 2, d) for d in (20, 23, 24, 25, 26)]
+        assert [p.previous_closure_rate for p in plans] == [0.5, None, None, None, None]
+
+        scheduled = [c.task.key for p in plans for c in p.priorities]
+        assert len(scheduled) == len(set(scheduled)) == 10
+        assert plans[0].priorities[0].task.key == "PROJ-1"
+        assert not {c.task.key for c in plans[-1].other_tasks} & set(scheduled)
+
+        # The first day matches a single daily plan
+        daily = plan_generator.generate_daily_plan(
+            issues=issues, plan_date=date(2026, 2, 20), previous_closure_rate=0.5
+        )
+        assert daily.priorities == plans[0].priorities
+        assert daily.other_tasks == plans[0].other_tasks
+
+    def test_horizon_plan_rejects_empty_horizon(self):
+        """Test that at least one day must be planned."""
+        with pytest.raises(ValueError):
+            PlanGenerator(Mock(), TaskClassifier()).generate_horizon_plan(days=0)
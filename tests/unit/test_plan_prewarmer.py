@@ -0,0 +1,147 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for PlanPrewarmer."""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from triage.background_scheduler import BackgroundScheduler
+from triage.models import JiraIssue
+from triage.plan_cache import SQLitePlanCache
+from triage.plan_generator import PlanGenerator
+from triage.plan_prewarmer import PlanPrewarmer
+from triage.task_classifier import TaskClassifier
+
+DEADLINE = datetime(2026, 2, 17, 7, 0)
+
+
+def make_generator(tmp_path) -> PlanGenerator:
+    """Build a plan generator with a plan cache and a mocked JIRA backlog."""
+    issues = [
+        JiraIssue(
+            key=f"PROJ-{i}",
+            summary=f"Task {i}",
+            description="A task",
+            issue_type="Story",
+            priority="Medium",
+            status="To Do",
+            assignee="user@example.com",
+            story_points=1,
+        )
+        for i in range(1, 5)
+    ]
+    jira_client = Mock()
+    jira_client.fetch_active_tasks.return_value = issues
+    return PlanGenerator(
+        jira_client,
+        TaskClassifier(),
+        closure_tracking_dir=str(tmp_path),
+        plan_cache=SQLitePlanCache(str(tmp_path / "plans.db")),
+    )
+
+
+class TestPlanPrewarmer:
+    """Test suite for PlanPrewarmer."""
+
+    def test_schedule_spreads_users_across_stages(self):
+        """Test that drafts and refreshes are evenly spread before the deadline."""
+        prewarmer = PlanPrewarmer(Mock(), window_minutes=60, refresh_minutes=10)
+        user_ids = [f"user-{i}" for i in range(100)]
+
+        tasks = prewarmer.schedule(user_ids, DEADLINE)
+        drafts = [t for t in tasks if t.stage == "draft"]
+        refreshes = [t for t in tasks if t.stage == "refresh"]
+
+        assert len(drafts) == len(refreshes) == 100
+        assert all(DEADLINE - timedelta(minutes=60) <= t.fire_at < DEADLINE - timedelta(minutes=10) for t in drafts)
+        assert all(DEADLINE - timedelta(minutes=10) <= t.fire_at < DEADLINE for t in refreshes)
+
+        # Even spacing: 50 minutes over 100 users
+        gaps = {b.fire_at - a.fire_at for a, b in zip(drafts, drafts[1:])}
+        assert gaps == {timedelta(seconds=30)}
+
+        # Slots are stable and every user gets one slot per stage
+        assert prewarmer.schedule(reversed(user_ids), DEADLINE) == tasks
+        assert {t.user_id for t in drafts} == set(user_ids)
+
+    def test_due_selects_interval(self):
+        """Test that due returns only the runs inside the interval."""
+        prewarmer = PlanPrewarmer(Mock(), window_minutes=60, refresh_minutes=10)
+        user_ids = [f"user-{i}" for i in range(10)]
+        ticks = [DEADLINE - timedelta(minutes=m) for m in range(65, -5, -5)]
+
+        runs = [
+            task for since, until in zip(ticks, ticks[1:]) for task in prewarmer.due(user_ids, DEADLINE, since, until)
+        ]
+
+        assert runs == prewarmer.schedule(user_ids, DEADLINE)
+
+    def test_invalid_window(self):
+        """Test that the refresh stage must fit in the window."""
+        with pytest.raises(ValueError):
+            PlanPrewarmer(Mock(), window_minutes=10, refresh_minutes=10)
+
+    def test_refresh_reuses_unchanged_draft(self, tmp_path):
+        """Test that a refresh with an unchanged backlog does not recompute the plan."""
+        generator = make_generator(tmp_path)
+        prewarmer = PlanPrewarmer(lambda _user_id: generator)
+        draft, refresh = prewarmer.schedule([generator.user_id], DEADLINE)
+
+        plan = prewarmer.run(draft, DEADLINE)
+        with patch.object(generator.classifier, "classify_task") as classify_task:
+            refreshed = prewarmer.run(refresh, DEADLINE)
+
+        classify_task.assert_not_called()
+        assert refreshed == plan
+        assert generator.get_stored_plan(DEADLINE.date()) == plan
+
+    def test_run_requires_plan_cache(self, tmp_path):
+        """Test that drafts cannot be kept without a plan cache."""
+        generator = PlanGenerator(Mock(), TaskClassifier(), closure_tracking_dir=str(tmp_path))
+        prewarmer = PlanPrewarmer(lambda _user_id: generator)
+        [draft, _] = prewarmer.schedule([generator.user_id], DEADLINE)
+
+        with pytest.raises(ValueError):
+            prewarmer.run(draft, DEADLINE)
+
+
+class TestBackgroundSchedulerPrewarm:
+    """Test suite for daily plan pre-generation in BackgroundScheduler."""
+
+    def test_prewarm_queues_latest_due_stage_once(self, tmp_path):
+        """Test that only the latest overdue stage is queued, once per day."""
+        generator = make_generator(tmp_path)
+        scheduler = BackgroundScheduler(jira_client=Mock(), plan_generator=generator)
+        scheduler.schedule_daily_plan("07:00", prewarm_minutes=60)
+
+        with patch.object(scheduler, "queue_operation") as queue_operation:
+            scheduler._check_prewarm_schedule(DEADLINE - timedelta(minutes=1))
+            scheduler._check_prewarm_schedule(DEADLINE - timedelta(seconds=30))
+
+        queue_operation.assert_called_once()
+        assert queue_operation.call_args.kwargs["task"].stage == "refresh"
+
+    def test_scheduled_plan_uses_draft(self, tmp_path):
+        """Test that the plan at the scheduled time is the stored draft."""
+        generator = make_generator(tmp_path)
+        scheduler = BackgroundScheduler(jira_client=Mock(), plan_generator=generator)
+        scheduler.schedule_daily_plan("07:00", prewarm_minutes=60)
+
+        draft = generator.generate_daily_plan()
+        with patch.object(generator, "generate_daily_plan") as generate_daily_plan:
+            plan = scheduler._generate_daily_plan()
+
+        generate_daily_plan.assert_not_called()
+        assert plan == draft
+
+    def test_prewarm_requires_plan_cache(self, tmp_path):
+        """Test that pre-generation is rejected without a plan cache."""
+        generator = PlanGenerator(Mock(), TaskClassifier(), closure_tracking_dir=str(tmp_path))
+        scheduler = BackgroundScheduler(jira_client=Mock(), plan_generator=generator)
+
+        with pytest.raises(ValueError):
+            scheduler.schedule_daily_plan("07:00", prewarm_minutes=60)
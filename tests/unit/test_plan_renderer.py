@@ -0,0 +1,224 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for PlanRenderer."""
+
+import io
+import json
+from dataclasses import replace
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+
+from triage.core.actions_api import CoreActionResult
+from triage.models import AdminBlock, DailyPlan, JiraIssue, TaskCategory, TaskClassification
+from triage.plan_renderer import PlanRenderer
+from triage.plugins.interface import PluginMessage, PluginResponse
+from triage.plugins.slack.slack_plugin import SlackPlugin
+
+
+def make_classification(key: str, category: TaskCategory = TaskCategory.PRIORITY_ELIGIBLE) -> TaskClassification:
+    """Build a half-day classification."""
+    issue = JiraIssue(
+        key=key,
+        summary=f"Task {key}",
+        description="A task",
+        issue_type="Story",
+        priority="High",
+        status="To Do",
+        assignee="user@example.com",
+        story_points=3,
+    )
+    return TaskClassification(
+        task=issue,
+        category=category,
+        is_priority_eligible=category == TaskCategory.PRIORITY_ELIGIBLE,
+        has_dependencies=False,
+        estimated_days=0.5,
+    )
+
+
+def make_plan(other_count: int = 2) -> DailyPlan:
+    """Build a plan with every section populated."""
+    return DailyPlan(
+        date=date(2026, 2, 17),
+        priorities=[make_classification("PROJ-1"), make_classification("PROJ-2")],
+        admin_block=AdminBlock(
+            tasks=[make_classification("ADM-1", TaskCategory.ADMINISTRATIVE)],
+            time_allocation_minutes=30,
+            scheduled_time="14:00-15:30",
+        ),
+        other_tasks=[make_classification(f"PROJ-{i}") for i in range(10, 10 + other_count)],
+        previous_closure_rate=0.67,
+        decomposition_suggestions=[replace(make_classification("PROJ-5", TaskCategory.LONG_RUNNING), estimated_days=3)],
+        blocked_tasks=[make_classification("PROJ-6")],
+    )
+
+
+class TestPlanRenderer:
+    """Test suite for PlanRenderer."""
+
+    def test_render_all_formats(self):
+        """Test that one pass emits consistent Markdown, JSON and Slack blocks."""
+        plan = make_plan()
+        rendered = PlanRenderer().render(plan)
+
+        assert rendered.markdown == plan.to_markdown()
+        assert "1. **[PROJ-1] Task PROJ-1**" in rendered.markdown
+        assert "- [ ] [ADM-1] Task ADM-1" in rendered.markdown
+
+        json.dumps(rendered.json)
+        assert [p["key"] for p in rendered.json["priorities"]] == ["PROJ-1", "PROJ-2"]
+        assert rendered.json["admin_block"]["tasks"][0]["key"] == "ADM-1"
+        assert rendered.json["other_tasks_count"] == 2
+
+        assert rendered.slack_blocks[0]["type"] == "header"
+        slack_text = "\n".join(b["text"]["text"] for b in rendered.slack_blocks)
+        assert "1. *[PROJ-1] Task PROJ-1*" in slack_text
+        assert "**" not in slack_text
+
+    def test_render_selected_formats(self):
+        """Test that formats that were not requested are not rendered."""
+        rendered = PlanRenderer().render(make_plan(), formats=("json",))
+
+        assert rendered.json is not None
+        assert rendered.markdown is None
+        assert rendered.slack_blocks is None
+
+    def test_unchanged_tasks_reuse_fragments(self):
+        """Test that a replan only renders the tasks whose fields changed."""
+        renderer = PlanRenderer()
+        plan = make_plan()
+        renderer.render(plan)
+        misses = renderer.misses
+
+        replan = replace(plan, priorities=[replace(make_classification("PROJ-1"), estimated_days=1.0)])
+        renderer.render(replan)
+
+        assert renderer.misses == misses + 1
+
+    def test_fragment_cache_is_bounded(self):
+        """Test that the least recently used fragments are evicted."""
+        renderer = PlanRenderer(max_fragments=5)
+        renderer.render(make_plan(other_count=20))
+
+        assert len(renderer._fragments) == 5
+
+    def test_long_sections_are_split_for_slack(self):
+        """Test that Slack sections stay within the text size limit."""
+        rendered = PlanRenderer().render(make_plan(other_count=500), formats=("slack",))
+
+        assert all(len(b["text"]["text"]) <= PlanRenderer.SLACK_SECTION_MAX_CHARS for b in rendered.slack_blocks)
+        slack_text = "\n".join(b["text"]["text"] for b in rendered.slack_blocks)
+        assert all(f"• [PROJ-{i}] Task PROJ-{i}\n" in slack_text + "\n" for i in range(10, 510))
+
+    def test_invalid_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            PlanRenderer().render(make_plan(), formats=("html",))
+
+    def test_slack_plugin_uses_rendered_blocks(self):
+        """Test that pre-rendered plan blocks replace the Markdown content in Slack."""
+        blocks = PlanRenderer().render(make_plan(), formats=("slack",)).slack_blocks
+        response = PluginResponse(
+            content="# Daily Plan",
+            actions=[{"type": "button", "text": "Approve", "action_id": "approve_plan"}],
+            metadata={"plan_date": "2026-02-17", "blocks": blocks},
+        )
+
+        converted = SlackPlugin()._convert_to_slack_blocks(response)
+
+        assert converted[: len(blocks)] == blocks
+        assert [b["type"] for b in converted[len(blocks) :]] == ["divider", "actions", "context"]
+
+
+class TestPlanRendererPagination:
+    """Test suite for streamed and paginated plan output."""
+
+    def test_write_markdown_matches_render(self):
+        """Test that the streamed Markdown is identical to the rendered document."""
+        plan = make_plan(other_count=200)
+        stream = io.StringIO()
+
+        PlanRenderer().write_markdown(plan, stream)
+
+        assert stream.getvalue() == plan.to_markdown()
+
+    def test_pages_cover_other_tasks_once(self):
+        """Test that following cursors visits every other task exactly once."""
+        renderer = PlanRenderer()
+        plan = make_plan(other_count=25)
+
+        rendered = renderer.render(plan, other_tasks_limit=10)
+        keys = [t["key"] for t in rendered.json["other_tasks"]]
+        assert rendered.json["other_tasks_count"] == 25
+        assert "- _...and 15 more_" in rendered.markdown
+        assert "PROJ-20" not in rendered.markdown
+
+        cursor = rendered.next_cursor
+        while cursor:
+            page = renderer.render_other_tasks(plan, other_tasks_limit=10, other_tasks_cursor=cursor)
+            keys += [t["key"] for t in page.json["other_tasks"]]
+            cursor = page.next_cursor
+
+        assert keys == [f"PROJ-{i}" for i in range(10, 35)]
+
+    def test_cursor_of_other_plan_is_rejected(self):
+        """Test that a cursor cannot be replayed against another day's plan."""
+        plan = make_plan(other_count=25)
+        cursor = PlanRenderer().render(plan, other_tasks_limit=10).next_cursor
+
+        with pytest.raises(ValueError):
+            PlanRenderer().render(replace(plan, date=date(2026, 2, 18)), other_tasks_cursor=cursor)
+        with pytest.raises(ValueError):
+            PlanRenderer().render(plan, other_tasks_cursor="not-a-cursor")
+
+    def test_page_limit_is_clamped(self):
+        """Test that client page limits are clamped to the allowed page sizes and must be integers."""
+        assert PlanRenderer.page_limit(None) == PlanRenderer.OTHER_TASKS_PAGE_SIZE
+        assert PlanRenderer.page_limit("10") == 10
+        assert PlanRenderer.page_limit(1000000) == PlanRenderer.MAX_OTHER_TASKS_PAGE_SIZE
+        assert PlanRenderer.page_limit("-5") == 1
+
+        for limit in ("ten", 2.5, True, [10]):
+            with pytest.raises(ValueError):
+                PlanRenderer.page_limit(limit)
+
+        plan = make_plan(other_count=PlanRenderer.MAX_OTHER_TASKS_PAGE_SIZE + 5)
+        page = PlanRenderer().render_other_tasks(plan, formats=["json"], other_tasks_limit=1000000)
+        assert len(page.json["other_tasks"]) == PlanRenderer.MAX_OTHER_TASKS_PAGE_SIZE
+
+    @pytest.mark.asyncio
+    async def test_slack_plan_command_pages_other_tasks(self):
+        """Test that the Slack plan is paginated and "Show more" returns the next page."""
+        plan = make_plan(other_count=PlanRenderer.OTHER_TASKS_PAGE_SIZE + 5)
+        core_api = AsyncMock()
+        core_api.generate_plan.return_value = CoreActionResult(
+            success=True, data={"plan": plan, "markdown": plan.to_markdown()}
+        )
+        plugin = SlackPlugin()
+        plugin.core_api = core_api
+
+        response = await plugin._handle_plan_command(PluginMessage("T1", "U1", "", command="plan"))
+        [more] = [a for a in response.actions if a["action_id"] == "plan_more"]
+
+        message = PluginMessage(
+            "T1", "U1", "", command="plan", metadata={"action_id": "plan_more", "action_value": more["value"]}
+        )
+        core_api.get_stored_plan.return_value = CoreActionResult(success=True, data={"plan": plan})
+        page = await plugin._handle_plan_command(message)
+
+        assert page.actions == []
+        assert page.content.splitlines()[2:] == [f"- [PROJ-{i}] Task PROJ-{i}" for i in range(60, 65)]
+        # The page comes from the stored plan, without generating it again
+        core_api.generate_plan.assert_called_once()
+        core_api.get_stored_plan.assert_called_once_with(user_id="U1", plan_date=plan.date)
+
+        # Without a stored plan, the plan is generated once more for the page
+        core_api.get_stored_plan.return_value = CoreActionResult(success=False, error_code="PLAN_NOT_FOUND")
+        page = await plugin._handle_plan_command(message)
+
+        assert page.content.splitlines()[2:] == [f"- [PROJ-{i}] Task PROJ-{i}" for i in range(60, 65)]
+        assert core_api.generate_plan.call_count == 2
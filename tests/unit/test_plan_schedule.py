@@ -0,0 +1,95 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for PlanSchedule."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from triage.plan_schedule import PlanSchedule, ScheduledPlan
+
+# Tuesday
+NOW = datetime(2026, 3, 3, 5, 0, tzinfo=timezone.utc)
+
+
+class TestPlanSchedule:
+    """Test suite for PlanSchedule."""
+
+    def test_plans_fire_in_utc_order_across_time_zones(self):
+        """Test that local plan times are ordered by their UTC time."""
+        schedule = PlanSchedule()
+        schedule.add_user("madrid", "08:00", "Europe/Madrid", now=NOW)  # 07:00 UTC
+        schedule.add_user("new-york", "08:00", "America/New_York", now=NOW)  # 13:00 UTC
+        schedule.add_user("tokyo", "08:00", "Asia/Tokyo", now=NOW)  # 23:00 UTC the day before
+
+        # Today's plan in Tokyo is overdue and caught up right away
+        assert schedule.next_fire_at() == datetime(2026, 3, 2, 23, 0, tzinfo=timezone.utc)
+        assert [(run.user_id, run.plan_date) for run in schedule.pop_due(NOW)] == [("tokyo", date(2026, 3, 3))]
+        assert schedule.next_fire_at() == datetime(2026, 3, 3, 7, 0, tzinfo=timezone.utc)
+
+        due = schedule.pop_due(datetime(2026, 3, 3, 13, 0, tzinfo=timezone.utc))
+        assert [(run.user_id, run.plan_date) for run in due] == [
+            ("madrid", date(2026, 3, 3)),
+            ("new-york", date(2026, 3, 3)),
+        ]
+        # Tokyo's plan for Wednesday is due on Tuesday evening UTC
+        tokyo = schedule.pop_due(datetime(2026, 3, 3, 23, 0, tzinfo=timezone.utc))
+        assert tokyo == [ScheduledPlan("tokyo", date(2026, 3, 4), datetime(2026, 3, 3, 23, 0, tzinfo=timezone.utc))]
+        assert schedule.next_fire_at() == datetime(2026, 3, 4, 7, 0, tzinfo=timezone.utc)
+        assert schedule.skipped == 0
+
+    def test_working_days_and_daylight_saving(self):
+        """Test that weekends are skipped and the local time holds across a DST change."""
+        schedule = PlanSchedule()
+        # Friday before the European DST change on Sunday 2026-03-29
+        friday = datetime(2026, 3, 27, 6, 0, tzinfo=timezone.utc)
+        schedule.add_user("madrid", "08:00", "Europe/Madrid", working_days=range(5), now=friday)
+
+        assert [run.plan_date for run in schedule.pop_due(friday + timedelta(hours=1))] == [date(2026, 3, 27)]
+        assert schedule.next_fire_at() == datetime(2026, 3, 30, 6, 0, tzinfo=timezone.utc)
+
+    def test_missed_plans_are_caught_up_once(self):
+        """Test that only the latest missed plan is generated, and only if it is recent enough."""
+        schedule = PlanSchedule(catch_up_hours=6)
+        schedule.add_user("recent", "04:00", last_plan_date=date(2026, 2, 27), now=NOW)
+        schedule.add_user("stale", "20:00", last_plan_date=date(2026, 3, 1), now=NOW)
+
+        due = schedule.pop_due(NOW)
+
+        assert [(run.user_id, run.plan_date) for run in due] == [("recent", date(2026, 3, 3))]
+        # recent: 2026-02-28 to 03-02 skipped; stale: 03-02 too late
+        assert schedule.skipped == 4
+        assert schedule.pop_due(NOW) == []
+        assert schedule.next_fire_at() == datetime(2026, 3, 3, 20, 0, tzinfo=timezone.utc)
+
+    def test_sharding_and_rescheduling(self):
+        """Test that replicas split users and that replaced or removed users do not fire."""
+        users = [f"user-{i}" for i in range(50)]
+        shards = [PlanSchedule(shard_index=i, shard_count=3) for i in range(3)]
+        for user_id in users:
+            assert sum(shard.add_user(user_id, "06:00", now=NOW) for shard in shards) == 1
+        assert sum(len(shard) for shard in shards) == 50
+
+        schedule = PlanSchedule()
+        schedule.add_user("moved", "04:00", now=NOW)
+        schedule.add_user("moved", "06:00", now=NOW)
+        schedule.add_user("gone", "04:00", now=NOW)
+        assert schedule.remove_user("gone")
+
+        assert schedule.pop_due(NOW) == []
+        assert [run.user_id for run in schedule.pop_due(NOW + timedelta(hours=1))] == ["moved"]
+
+    def test_invalid_schedule(self):
+        """Test that invalid shards, times, time zones and working days are rejected."""
+        with pytest.raises(ValueError):
+            PlanSchedule(shard_index=2, shard_count=2)
+
+        schedule = PlanSchedule()
+        with pytest.raises(ValueError):
+            schedule.add_user("user", "8am")
+        with pytest.raises(ValueError):
+            schedule.add_user("user", "08:00", "Mars/Olympus_Mons")
+        with pytest.raises(ValueError):
+            schedule.add_user("user", "08:00", working_days=[])
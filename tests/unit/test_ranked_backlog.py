@@ -0,0 +1,80 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Unit tests for RankedBacklog."""
+
+from triage.models import JiraIssue
+from triage.ranked_backlog import RankedBacklog
+from triage.task_classifier import TaskClassifier
+
+
+def classify(key: str, priority: str = "Medium", status: str = "To Do", story_points: int = 1):
+    """Classify a simple story with the given ranking attributes."""
+    issue = JiraIssue(
+        key=key,
+        summary=f"Task {key}",
+        description="A task",
+        issue_type="Story",
+        priority=priority,
+        status=status,
+        assignee="user@example.com",
+        story_points=story_points,
+    )
+    return TaskClassifier().classify_task(issue)
+
+
+def rank_key(classification):
+    """Return the cached rank key of a classification."""
+    return classification.rank_key
+
+
+class TestRankedBacklog:
+    """Test suite for RankedBacklog."""
+
+    def test_classifier_caches_rank_key(self):
+        """Test that classification stores the rank key with the result."""
+        classification = classify("PROJ-42", priority="High", status="In Progress")
+
+        assert classification.rank_key == (0, 2, 0.5, 42)
+
+    def test_iterates_in_rank_order(self):
+        """Test that tasks come out ordered by status, priority, effort and age."""
+        backlog = RankedBacklog(rank_key)
+        backlog.sync(
+            [
+                classify("PROJ-3"),
+                classify("PROJ-2", priority="High"),
+                classify("PROJ-1", story_points=2),
+                classify("PROJ-9", status="In Progress", priority="Low"),
+            ]
+        )
+
+        assert [c.task.key for c in backlog] == ["PROJ-9", "PROJ-2", "PROJ-3", "PROJ-1"]
+        assert [c.task.key for c in backlog.top(2)] == ["PROJ-9", "PROJ-2"]
+
+    def test_apply_delta_updates_positions(self):
+        """Test that inserts, removals and re-ranks are applied in place."""
+        backlog = RankedBacklog(rank_key)
+        backlog.sync([classify("PROJ-1"), classify("PROJ-2"), classify("PROJ-3")])
+
+        backlog.apply_delta(
+            upserted=[classify("PROJ-3", priority="Highest"), classify("PROJ-4", priority="High")],
+            removed_keys=["PROJ-1"],
+        )
+
+        assert [c.task.key for c in backlog] == ["PROJ-3", "PROJ-4", "PROJ-2"]
+        assert "PROJ-1" not in backlog
+        assert len(backlog) == 3
+
+    def test_sync_removes_missing_tasks(self):
+        """Test that a full sync drops tasks that left the backlog."""
+        backlog = RankedBacklog(rank_key)
+        backlog.sync([classify("PROJ-1"), classify("PROJ-2")])
+
+        updated = classify("PROJ-2")
+        backlog.sync([updated, classify("PROJ-5")])
+
+        assert [c.task.key for c in backlog] == ["PROJ-2", "PROJ-5"]
+        assert backlog.get("PROJ-2") is updated
+        assert backlog.remove("PROJ-1") is False
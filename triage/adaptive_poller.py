@@ -0,0 +1,242 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Adaptive interval for background polling of JIRA."""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from datetime import time as dt_time
+from typing import Iterable, Optional, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PollingMetrics:
+    """Current state of an adaptive poller."""
+
+    interval_seconds: float  # Interval used for the next poll
+    reason: str  # Why the poller chose that interval
+    next_poll_at: Optional[datetime]  # When the next poll is due
+    polls: int  # Number of polls observed
+    quiet_polls: int  # Consecutive polls without blockers or changes
+
+
+class AdaptivePoller:
+    """
+    Chooses the time of the next poll from what the previous polls observed.
+
+    A poll that finds new or changed blockers resets the interval to the
+    minimum. Quiet polls and failed polls back off exponentially up to the
+    maximum; while blockers that were already handled are still open, the
+    interval backs off only up to the blocker interval. When JIRA reported a rate
+    limit, the next poll waits until it ends. Polls falling outside the
+    working hours are deferred to the start of the next working period.
+    """
+
+    # Reasons reported for the current interval
+    REASON_STARTUP = "startup"
+    REASON_CHANGES = "changes"
+    REASON_BLOCKERS = "blockers"
+    REASON_QUIET = "quiet"
+    REASON_ERROR = "error"
+    REASON_RATE_LIMITED = "rate_limited"
+    REASON_OFF_HOURS = "outside_working_hours"
+
+    # Default longest interval while handled blockers are still open in seconds
+    DEFAULT_BLOCKER_INTERVAL_SECONDS = 300
+
+    def __init__(
+        self,
+        min_interval_seconds: float = 60,
+        max_interval_seconds: float = 3600,
+        backoff_factor: float = 2.0,
+        working_hours: Optional[str] = None,
+        working_days: Optional[Iterable[int]] = None,
+        blocker_interval_seconds: float = DEFAULT_BLOCKER_INTERVAL_SECONDS,
+    ):
+        """
+        Initialize the adaptive poller.
+
+        Args:
+            min_interval_seconds: Interval after new or changed blockers (default: 60)
+            max_interval_seconds: Longest interval when the backlog is quiet (default: 3600)
+            backoff_factor: Growth of the interval after each quiet poll (default: 2.0)
+            working_hours: Daily polling window in HH:MM-HH:MM format (default: None, all day)
+            working_days: Weekdays to poll on, Monday being 0 (default: None, every day)
+            blocker_interval_seconds: Longest interval while handled blockers are still open,
+                                      kept between the minimum and maximum (default: 300)
+
+        Raises:
+            ValueError: If the bounds, the backoff factor or the working hours are invalid
+        """
+        if min_interval_seconds <= 0 or max_interval_seconds < min_interval_seconds:
+            raise ValueError(
+                f"Polling intervals must satisfy 0 < min ({min_interval_seconds}) <= max ({max_interval_seconds})"
+            )
+        if blocker_interval_seconds <= 0:
+            raise ValueError(f"blocker_interval_seconds must be positive, got {blocker_interval_seconds}")
+        if backoff_factor < 1:
+            raise ValueError(f"backoff_factor must be at least 1, got {backoff_factor}")
+
+        self.min_interval = timedelta(seconds=min_interval_seconds)
+        self.max_interval = timedelta(seconds=max_interval_seconds)
+        self.blocker_interval = min(
+            max(timedelta(seconds=blocker_interval_seconds), self.min_interval), self.max_interval
+        )
+        self.backoff_factor = backoff_factor
+        self.working_hours = self._parse_working_hours(working_hours) if working_hours else None
+        self.working_days = frozenset(working_days) if working_days is not None else frozenset(range(7))
+        if not self.working_days or not self.working_days <= set(range(7)):
+            raise ValueError(f"working_days must be weekdays between 0 and 6, got {sorted(self.working_days)}")
+
+        self.interval = self.min_interval
+        self.reason = self.REASON_STARTUP
+        self.next_poll_at: Optional[datetime] = None
+        self.polls = 0
+        self.quiet_polls = 0
+
+    @staticmethod
+    def _parse_working_hours(working_hours: str) -> Tuple[dt_time, dt_time]:
+        """
+        Parse a HH:MM-HH:MM polling window.
+
+        Args:
+            working_hours: Window such as "08:00-19:00"
+
+        Returns:
+            Tuple of start and end time
+
+        Raises:
+            ValueError: If the format is invalid or the window is empty
+        """
+        try:
+            start, end = (dt_time.fromisoformat(part.strip()) for part in working_hours.split("-"))
+        except ValueError as e:
+            raise ValueError(f"Invalid working hours: {working_hours}. Expected HH:MM-HH:MM format.") from e
+        if start >= end:
+            raise ValueError(f"Working hours must end after they start, got {working_hours}")
+        return start, end
+
+    def start(self, now: datetime) -> datetime:
+        """
+        Reset the poller and get the time of the first poll.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Now, or the start of the next working period
+        """
+        self.interval = self.min_interval
+        self.reason = self.REASON_STARTUP
+        self.quiet_polls = 0
+        return self._schedule(now)
+
+    def observe(self, blockers: int, changed: bool) -> None:
+        """
+        Adapt the interval to the outcome of a successful poll.
+
+        Args:
+            blockers: Number of open blocking tasks found
+            changed: Whether any blocking task was new or changed
+        """
+        self.polls += 1
+        if changed:
+            self.interval = self.min_interval
+            self.reason = self.REASON_CHANGES
+            self.quiet_polls = 0
+        elif blockers:
+            # Handled blockers need no immediate action, but are checked more often than a quiet backlog
+            self.interval = min(self.interval * self.backoff_factor, self.blocker_interval)
+            self.reason = self.REASON_BLOCKERS
+            self.quiet_polls = 0
+        else:
+            self.quiet_polls += 1
+            self._back_off(self.REASON_QUIET)
+
+    def observe_error(self, rate_limited: bool = False) -> None:
+        """
+        Back off after a failed poll.
+
+        Args:
+            rate_limited: Whether JIRA rejected the poll with a rate limit
+        """
+        self.polls += 1
+        self._back_off(self.REASON_RATE_LIMITED if rate_limited else self.REASON_ERROR)
+
+    def _back_off(self, reason: str) -> None:
+        """Grow the interval by the backoff factor, up to the maximum."""
+        self.interval = min(self.interval * self.backoff_factor, self.max_interval)
+        self.reason = reason
+
+    def next_poll(self, now: datetime, not_before: Optional[datetime] = None) -> datetime:
+        """
+        Get the time of the next poll.
+
+        Args:
+            now: Current time
+            not_before: End of a rate limit reported by JIRA (optional)
+
+        Returns:
+            Time of the next poll
+        """
+        due = now + self.interval
+        if not_before is not None and not_before > due:
+            due = not_before
+            self.reason = self.REASON_RATE_LIMITED
+        return self._schedule(due)
+
+    def _schedule(self, due: datetime) -> datetime:
+        """Defer a poll to the working hours and record it as the next poll."""
+        working = self._working_time(due)
+        if working != due:
+            self.reason = self.REASON_OFF_HOURS
+
+        self.next_poll_at = working
+        logger.debug(f"Next poll at {working.isoformat()} (interval {self.interval}, reason: {self.reason})")
+        return working
+
+    def _working_time(self, when: datetime) -> datetime:
+        """
+        Get the earliest time at or after a given time inside the working hours.
+
+        Args:
+            when: Requested time
+
+        Returns:
+            The requested time if it is within the working hours, otherwise the
+            start of the next working period
+        """
+        start, end = self.working_hours or (dt_time.min, None)
+        for offset in range(8):
+            day = when.date() + timedelta(days=offset)
+            if day.weekday() not in self.working_days:
+                continue
+
+            opens = datetime.combine(day, start)
+            closes = datetime.combine(day, end) if end else datetime.combine(day + timedelta(days=1), dt_time.min)
+            if when < opens:
+                return opens
+            if when < closes:
+                return when
+
+        return when
+
+    def metrics(self) -> PollingMetrics:
+        """
+        Report the current interval and the reason for it.
+
+        Returns:
+            PollingMetrics snapshot
+        """
+        return PollingMetrics(
+            interval_seconds=self.interval.total_seconds(),
+            reason=self.reason,
+            next_poll_at=self.next_poll_at,
+            polls=self.polls,
+            quiet_polls=self.quiet_polls,
+        )
@@ -0,0 +1,303 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Administrative block packing with an incrementally maintained task heap."""
+
+import heapq
+import logging
+import math
+from datetime import datetime
+from datetime import time as dt_time
+from typing import Dict, List, Tuple
+
+from triage.models import AdminBlock, TaskClassification
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class AdminBlockPacker:
+    """
+    Packs administrative tasks into one or more time-boxed admin blocks.
+
+    Admin tasks are kept in a persistent min-heap keyed by (effort, age), so
+    syncing a new backlog only touches the tasks that were added, removed or
+    re-estimated. Removed and re-estimated tasks are deleted lazily: their old
+    heap entries are skipped when popped and the heap is compacted once stale
+    entries outnumber live ones.
+    """
+
+    # Supported packing objectives
+    OBJECTIVES = ("minutes", "count")
+
+    # Working minutes per day (8 hours)
+    MINUTES_PER_DAY = 8 * 60
+
+    def __init__(self, max_minutes: int = 90, objective: str = "minutes"):
+        """
+        Initialize the admin block packer.
+
+        Args:
+            max_minutes: Maximum duration of each admin block in minutes (default: 90)
+            objective: "minutes" to fill each block as much as possible,
+                       "count" to fit as many tasks as possible (default: "minutes")
+
+        Raises:
+            ValueError: If objective is not supported
+        """
+        if objective not in self.OBJECTIVES:
+            raise ValueError(f"Invalid packing objective: {objective}. Expected one of: {', '.join(self.OBJECTIVES)}")
+
+        self.max_minutes = max_minutes
+        self.objective = objective
+
+        # Heap of (minutes, age, version, task_key); may contain stale entries
+        self._heap: List[Tuple[int, int, int, str]] = []
+
+        # Live tasks: task_key -> (version, minutes, classification)
+        self._tasks: Dict[str, Tuple[int, int, TaskClassification]] = {}
+
+        self._version = 0
+
+    def __len__(self) -> int:
+        """Return the number of admin tasks currently tracked."""
+        return len(self._tasks)
+
+    @classmethod
+    def task_minutes(cls, classification: TaskClassification) -> int:
+        """
+        Convert a task's effort estimate to whole minutes.
+
+        Minutes are rounded up so a packed block never exceeds its limit.
+
+        Args:
+            classification: Classified admin task
+
+        Returns:
+            Estimated effort in minutes
+        """
+        return math.ceil(round(classification.estimated_days * cls.MINUTES_PER_DAY, 6))
+
+    @staticmethod
+    def task_age(classification: TaskClassification) -> int:
+        """
+        Get the age proxy of a task (lower is older).
+
+        Args:
+            classification: Classified admin task
+
+        Returns:
+            Numeric part of the task key, or 0 if it has none
+        """
+        try:
+            return int(classification.task.key.rsplit("-", 1)[-1])
+        except ValueError:
+            return 0
+
+    def add(self, classification: TaskClassification) -> None:
+        """
+        Add or update an admin task.
+
+        Args:
+            classification: Classified admin task
+        """
+        key = classification.task.key
+        minutes = self.task_minutes(classification)
+
+        current = self._tasks.get(key)
+        if current is not None and current[1] == minutes:
+            # Same heap position - just refresh the classification
+            self._tasks[key] = (current[0], minutes, classification)
+            return
+
+        self._version += 1
+        self._tasks[key] = (self._version, minutes, classification)
+        heapq.heappush(self._heap, (minutes, self.task_age(classification), self._version, key))
+        self._compact_if_needed()
+
+    def remove(self, task_key: str) -> bool:
+        """
+        Remove an admin task.
+
+        Args:
+            task_key: JIRA key of the task
+
+        Returns:
+            True if the task was tracked and removed, False otherwise
+        """
+        if self._tasks.pop(task_key, None) is None:
+            return False
+
+        self._compact_if_needed()
+        return True
+
+    def sync(self, classifications: List[TaskClassification]) -> None:
+        """
+        Bring the tracked tasks in line with the current admin backlog.
+
+        Only tasks that appeared, disappeared or changed estimate cause heap
+        operations.
+
+        Args:
+            classifications: Current administrative tasks
+        """
+        current_keys = set()
+        for classification in classifications:
+            current_keys.add(classification.task.key)
+            self.add(classification)
+
+        for key in [k for k in self._tasks if k not in current_keys]:
+            self.remove(key)
+
+    @staticmethod
+    def block_minutes(scheduled_time: str) -> int:
+        """
+        Get the length of a HH:MM-HH:MM block.
+
+        Args:
+            scheduled_time: Time range such as "14:00-15:30"
+
+        Returns:
+            Length of the block in minutes
+
+        Raises:
+            ValueError: If the format is invalid or the range is empty
+        """
+        try:
+            start, end = (dt_time.fromisoformat(part.strip()) for part in scheduled_time.split("-"))
+        except ValueError as e:
+            raise ValueError(f"Invalid admin block time: {scheduled_time}. Expected HH:MM-HH:MM format.") from e
+        if start >= end:
+            raise ValueError(f"Admin block must end after it starts, got {scheduled_time}")
+
+        day = datetime.min.date()
+        return int((datetime.combine(day, end) - datetime.combine(day, start)).total_seconds() // 60)
+
+    def pack(self, scheduled_times: List[str]) -> List[AdminBlock]:
+        """
+        Pack tracked admin tasks into one block per scheduled time.
+
+        Blocks are filled in order; each task is placed in at most one block.
+        Each block holds at most max_minutes of tasks, and no more than the
+        length of its time range. The tracked tasks are not consumed.
+
+        Args:
+            scheduled_times: Time ranges of the blocks (e.g., ["14:00-15:30"])
+
+        Returns:
+            List of AdminBlocks, one per scheduled time
+
+        Raises:
+            ValueError: If a time range is invalid
+        """
+        blocks = []
+        used: set = set()
+
+        for scheduled_time in scheduled_times:
+            capacity = min(self.max_minutes, self.block_minutes(scheduled_time))
+            selected = self._pack_block(used, capacity)
+            used.update(c.task.key for c in selected)
+            total_minutes = sum(self._tasks[c.task.key][1] for c in selected)
+            blocks.append(
+                AdminBlock(tasks=selected, time_allocation_minutes=total_minutes, scheduled_time=scheduled_time)
+            )
+
+        return blocks
+
+    def _pack_block(self, excluded: set, capacity: int) -> List[TaskClassification]:
+        """
+        Select tasks for a single block.
+
+        Args:
+            excluded: Keys of tasks already placed in an earlier block
+            capacity: Minutes available in the block
+
+        Returns:
+            Selected tasks in (effort, age) order
+        """
+        candidates = self._pop_candidates(excluded, capacity)
+
+        if self.objective == "count":
+            # Candidates are already the smallest tasks that fit together, which
+            # is optimal when maximizing the number of tasks
+            return [classification for _, classification in candidates]
+
+        # Subset sum over whole minutes; for equal minutes prefer more tasks, then
+        # the lexicographically smallest index tuple (smaller and older tasks first)
+        best: Dict[int, Tuple[int, ...]] = {0: ()}
+        for index, (minutes, _) in enumerate(candidates):
+            for used, chosen in list(best.items()):
+                total = used + minutes
+                if total > capacity:
+                    continue
+                selection = chosen + (index,)
+                current = best.get(total)
+                if current is None or (-len(selection), selection) < (-len(current), current):
+                    best[total] = selection
+
+        total = max(best)
+        return [candidates[i][1] for i in best[total]]
+
+    def _pop_candidates(self, excluded: set, capacity: int) -> List[Tuple[int, TaskClassification]]:
+        """
+        Collect candidate tasks for a block, in (effort, age) order.
+
+        Entries are popped from the heap and pushed back afterwards, so the
+        cost is proportional to the number of candidates. For the count
+        objective popping stops at the first task that no longer fits; for the
+        minutes objective at most ``capacity // minutes`` tasks of each size
+        are kept, since more could never fit together.
+
+        Args:
+            excluded: Keys of tasks to skip
+            capacity: Minutes available in the block
+
+        Returns:
+            List of (minutes, classification) tuples
+        """
+        popped = []
+        candidates = []
+        per_size: Dict[int, int] = {}
+        count_total = 0
+
+        while self._heap and self._heap[0][0] <= capacity:
+            entry = heapq.heappop(self._heap)
+            minutes, _, version, key = entry
+
+            live = self._tasks.get(key)
+            if live is None or live[0] != version:
+                # Stale entry - drop it
+                continue
+
+            popped.append(entry)
+
+            if key in excluded:
+                continue
+
+            if self.objective == "count":
+                if count_total + minutes > capacity:
+                    break
+                count_total += minutes
+            else:
+                limit = capacity // minutes if minutes > 0 else capacity
+                if per_size.get(minutes, 0) >= limit:
+                    continue
+                per_size[minutes] = per_size.get(minutes, 0) + 1
+
+            candidates.append((minutes, live[2]))
+
+        for entry in popped:
+            heapq.heappush(self._heap, entry)
+
+        return candidates
+
+    def _compact_if_needed(self) -> None:
+        """Rebuild the heap once stale entries outnumber live tasks."""
+        if len(self._heap) > 2 * len(self._tasks) + 16:
+            self._heap = [
+                (minutes, self.task_age(classification), version, key)
+                for key, (version, minutes, classification) in self._tasks.items()
+            ]
+            heapq.heapify(self._heap)
+            logger.debug(f"Compacted admin task heap to {len(self._heap)} entries")
@@ -133,8 +133,6 @@ class ApprovalManager:
 
             # Emit approval_timeout event if event bus is configured
             if self.event_bus:
-                import asyncio
-
                 event = Event(
                     event_type="approval_timeout",
                     event_data={
@@ -145,14 +143,8 @@ class ApprovalManager:
                     },
                 )
                 try:
-                    # Use asyncio to run the async publish method
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        # If loop is already running, schedule the coroutine
-                        asyncio.create_task(self.event_bus.publish(event))
-                    else:
-                        # If no loop is running, run it synchronously
-                        loop.run_until_complete(self.event_bus.publish(event))
+                    # Hand over to the event bus loop thread; handlers do not run here
+                    self.event_bus.publish_threadsafe(event)
                     logger.info("Emitted approval_timeout event for daily plan")
                 except Exception as e:
                     logger.error(f"Failed to emit approval_timeout event: {e}", exc_info=True)
@@ -235,8 +227,6 @@ class ApprovalManager:
 
             # Emit approval_timeout event if event bus is configured
             if self.event_bus:
-                import asyncio
-
                 event = Event(
                     event_type="approval_timeout",
                     event_data={
@@ -248,12 +238,8 @@ class ApprovalManager:
                     },
                 )
                 try:
-                    # Use asyncio to run the async publish method
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        asyncio.create_task(self.event_bus.publish(event))
-                    else:
-                        loop.run_until_complete(self.event_bus.publish(event))
+                    # Hand over to the event bus loop thread; handlers do not run here
+                    self.event_bus.publish_threadsafe(event)
                     logger.info("Emitted approval_timeout event for decomposition")
                 except Exception as e:
                     logger.error(f"Failed to emit approval_timeout event: {e}", exc_info=True)
@@ -347,8 +333,6 @@ class ApprovalManager:
 
             # Emit approval_timeout event if event bus is configured
             if self.event_bus:
-                import asyncio
-
                 event = Event(
                     event_type="approval_timeout",
                     event_data={
@@ -360,12 +344,8 @@ class ApprovalManager:
                     },
                 )
                 try:
-                    # Use asyncio to run the async publish method
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        asyncio.create_task(self.event_bus.publish(event))
-                    else:
-                        loop.run_until_complete(self.event_bus.publish(event))
+                    # Hand over to the event bus loop thread; handlers do not run here
+                    self.event_bus.publish_threadsafe(event)
                     logger.info("Emitted approval_timeout event for blocking task replan")
                 except Exception as e:
                     logger.error(f"Failed to emit approval_timeout event: {e}", exc_info=True)
@@ -4,20 +4,28 @@
 
 """Background scheduler for asynchronous operations and polling."""
 
+import heapq
+import itertools
+import json
 import logging
 import threading
-import time
-from dataclasses import dataclass, field
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
 from datetime import time as dt_time
 from enum import Enum
 from queue import Empty, PriorityQueue
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
+from triage.adaptive_poller import AdaptivePoller, PollingMetrics
 from triage.core.event_bus import Event, EventBus
-from triage.jira_client import JiraClient
-from triage.models import DailyPlan, JiraIssue
+from triage.jira_client import JiraClient, JiraRateLimitError
+from triage.models import DailyPlan, IssueLink, JiraIssue
+from triage.operation_store import LeasedOperation, OperationStore
 from triage.plan_generator import PlanGenerator
+from triage.plan_prewarmer import PlanPrewarmer, PrewarmTask
+from triage.plan_schedule import PlanSchedule
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -40,6 +48,20 @@ class Operation:
     callback: Callable = field(compare=False)
     args: tuple = field(default_factory=tuple, compare=False)
     kwargs: dict = field(default_factory=dict, compare=False)
+    # Identity of the work; pending operations with the same key are merged
+    key: Optional[str] = field(default=None, compare=False)
+    # Set when a merge re-queued the operation at a higher priority
+    superseded: bool = field(default=False, compare=False)
+
+
+@dataclass(eq=False)
+class _Timer:
+    """A registered timer; next_run returns the following due time, or None for one-shot timers."""
+
+    name: str
+    callback: Callable[[], None]
+    next_run: Optional[Callable[[datetime], Optional[datetime]]] = None
+    cancelled: bool = False
 
 
 class BackgroundScheduler:
@@ -47,6 +69,51 @@ class BackgroundScheduler:
     Manages asynchronous operations and polling.
     """
 
+    # Longest refresh stage of daily plan pre-generation in minutes
+    PREWARM_REFRESH_MINUTES = 10
+
+    # Names of the built-in timers
+    POLL_TIMER = "poll_blocking_tasks"
+    DAILY_PLAN_TIMER = "daily_plan"
+    USER_PLAN_TIMER = "user_plans"
+
+    # Operation type of the sentinel that stops the queue processor
+    _STOP_OPERATION = "stop"
+
+    # Default number of operations executed concurrently
+    DEFAULT_MAX_WORKERS = 4
+
+    # Default concurrency limits per operation type (other types are only bounded by the pool size)
+    DEFAULT_OPERATION_LIMITS = {
+        "generate_daily_plan": 1,
+        "prewarm_daily_plan": 1,
+        "generate_user_plan": 2,
+        "handle_blocking_task": 4,
+    }
+
+    # Operation types kept in the durable operation store, with the name of their handler
+    DURABLE_OPERATIONS = {
+        "generate_daily_plan": "_generate_daily_plan",
+        "prewarm_daily_plan": "_prewarm_daily_plan",
+        "generate_user_plan": "_generate_user_plan",
+        "handle_blocking_task": "_handle_blocking_task",
+    }
+
+    # Name of the timer claiming operations from the durable operation store
+    CLAIM_TIMER = "claim_operations"
+
+    # Seconds between claims from the durable operation store
+    CLAIM_INTERVAL_SECONDS = 5
+
+    # Delay before a failed durable operation becomes visible again in seconds
+    RETRY_DELAY_SECONDS = 60
+
+    # Age after which finished durable operations and their idempotency keys are dropped in seconds
+    OPERATION_RETENTION_SECONDS = 2 * 24 * 3600
+
+    # Interval between lease extensions of a running durable operation in seconds
+    LEASE_HEARTBEAT_SECONDS = OperationStore.DEFAULT_VISIBILITY_TIMEOUT_SECONDS / 3
+
     def __init__(
         self,
         jira_client: JiraClient,
@@ -54,6 +121,12 @@ class BackgroundScheduler:
         poll_interval_minutes: int = 15,
         notification_callback: Optional[Callable] = None,
         event_bus: Optional[EventBus] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        operation_limits: Optional[Dict[str, int]] = None,
+        adaptive_poller: Optional[AdaptivePoller] = None,
+        operation_store: Optional[OperationStore] = None,
+        plan_schedule: Optional[PlanSchedule] = None,
+        generator_factory: Optional[Callable[[str], PlanGenerator]] = None,
     ):
         """
         Initialize background scheduler.
@@ -62,47 +135,140 @@ class BackgroundScheduler:
             jira_client: JIRA client for fetching tasks
             plan_generator: Plan generator for creating plans
             poll_interval_minutes: Interval between blocking task polls (default: 15)
-            notification_callback: Optional callback for notifications
+            notification_callback: Optional callback for notifications; it is
+                                   called from the worker threads
             event_bus: Event bus for emitting events (optional)
+            max_workers: Number of operations executed concurrently (default: 4)
+            operation_limits: Maximum concurrent operations per operation type,
+                              merged over DEFAULT_OPERATION_LIMITS (optional)
+            adaptive_poller: Poller adapting the interval between blocking task
+                             polls; replaces poll_interval_minutes (optional)
+            operation_store: Durable queue for the DURABLE_OPERATIONS and the
+                             schedule state, shared by scheduler replicas (optional)
+            plan_schedule: Daily plan times of the users of this replica's
+                           shard, see schedule_user_plan() (optional)
+            generator_factory: Function returning the plan generator of a user;
+                               required with plan_schedule (optional)
+
+        Raises:
+            ValueError: If the pool size or an operation limit is not positive,
+                        or plan_schedule is given without generator_factory
         """
+        limits = {**self.DEFAULT_OPERATION_LIMITS, **(operation_limits or {})}
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        invalid = {operation_type: limit for operation_type, limit in limits.items() if limit < 1}
+        if invalid:
+            raise ValueError(f"Operation limits must be at least 1, got {invalid}")
+        if plan_schedule is not None and generator_factory is None:
+            raise ValueError("Scheduling user plans requires a generator_factory")
+
         self.jira_client = jira_client
         self.plan_generator = plan_generator
         self.poll_interval_minutes = poll_interval_minutes
         self.notification_callback = notification_callback
         self.event_bus = event_bus
+        self.max_workers = max_workers
+        self.operation_limits = limits
+        self.adaptive_poller = adaptive_poller
+        self.operation_store = operation_store
+        self.plan_schedule = plan_schedule
+        self.generator_factory = generator_factory
 
         # Threading control
         self._stop_event = threading.Event()
-        self._polling_thread: Optional[threading.Thread] = None
+        self._timer_thread: Optional[threading.Thread] = None
         self._queue_thread: Optional[threading.Thread] = None
 
+        # Min-heap of (due, sequence, timer); replaced and cancelled timers are skipped when popped
+        self._timer_lock = threading.Lock()
+        self._timer_wakeup = threading.Event()
+        self._timer_heap: List[Tuple[datetime, int, _Timer]] = []
+        self._timers: Dict[str, _Timer] = {}
+        self._timer_sequence = itertools.count()
+
         # Operation queue with priority ordering
         self._operation_queue: PriorityQueue[Operation] = PriorityQueue()
 
+        # Worker pool and the operations running on it, by type and by priority
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._dispatch_condition = threading.Condition()
+        self._running_types: Counter[str] = Counter()
+        self._running_priorities: Counter[int] = Counter()
+        # Queued or held operations by key, for merging duplicates
+        self._pending: Dict[str, Operation] = {}
+        # Operations claimed from the operation store and not finished yet
+        self._leased = 0
+
+        # Status fingerprint of each blocking task that was handled, to notify once per change
+        self._blocker_lock = threading.Lock()
+        self._handled_blockers: Dict[str, Tuple[str, str]] = {}
+        # Time each open blocking task was first seen since it last stopped blocking
+        self._blocker_seen_at: Dict[str, str] = {}
+
+        # The plan generator is not thread-safe; workers take turns using it
+        self._plan_lock = threading.RLock()
+
         # Track scheduled daily plan time
         self._daily_plan_time: Optional[dt_time] = None
         self._last_plan_date: Optional[datetime] = None
 
+        # Daily plan pre-generation (None when plans are generated at the scheduled time)
+        self._prewarmer: Optional[PlanPrewarmer] = None
+        self._prewarm_done: Set[Tuple[date, str]] = set()
+
+        # Most recent plan and a fork of the generator that built it; blockers are
+        # replanned on the fork so they do not wait for a plan being generated
+        self._replan_lock = threading.Lock()
+        self._current_plan: Optional[DailyPlan] = None
+        self._replan_generator: Optional[PlanGenerator] = None
+
         if event_bus:
             logger.info("Background scheduler configured with event bus for event emission")
 
     def start(self) -> None:
         """
         Start background polling for blocking tasks.
-        Runs in separate thread.
+
+        Blocking tasks are polled right away and then every poll interval,
+        or as chosen by the adaptive poller if one is configured;
+        the daily plan timer is armed if a plan time was scheduled. Timers
+        run in a separate thread that sleeps until the next one is due.
         """
-        if self._polling_thread is not None and self._polling_thread.is_alive():
+        if self._timer_thread is not None and self._timer_thread.is_alive():
             logger.warning("Background scheduler already running")
             return
 
         # Clear stop event
         self._stop_event.clear()
 
-        # Start polling thread
-        self._polling_thread = threading.Thread(target=self._polling_loop, name="BlockingTaskPoller", daemon=True)
-        self._polling_thread.start()
+        if self.operation_store is not None:
+            # Resume the schedule where this or another replica left it
+            self.operation_store.purge(self.OPERATION_RETENTION_SECONDS)
+            last_plan_date = self.operation_store.get_state(self._last_plan_state_name())
+            if last_plan_date:
+                self._last_plan_date = date.fromisoformat(last_plan_date)
+            self.schedule_timer(
+                self.CLAIM_TIMER, lambda: self._claim_operations(), interval_seconds=self.CLAIM_INTERVAL_SECONDS
+            )
+
+        # Arm built-in timers
+        if self.adaptive_poller is not None:
+            timer = _Timer(self.POLL_TIMER, lambda: self._check_blocking_tasks(), self._next_poll_run)
+            self._add_timer(timer, self.adaptive_poller.start(self._now()))
+        else:
+            self.schedule_timer(
+                self.POLL_TIMER, lambda: self._check_blocking_tasks(), interval_seconds=self.poll_interval_minutes * 60
+            )
+        self._arm_daily_plan_timer()
+        self._arm_user_plan_timer()
+
+        # Start timer thread
+        self._timer_thread = threading.Thread(target=self._timer_loop, name="SchedulerTimers", daemon=True)
+        self._timer_thread.start()
 
-        # Start queue processing thread
+        # Start worker pool and queue processing thread
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="OperationWorker")
         self._queue_thread = threading.Thread(target=self._process_queue, name="OperationQueueProcessor", daemon=True)
         self._queue_thread.start()
 
@@ -111,29 +277,54 @@ class BackgroundScheduler:
     def stop(self) -> None:
         """
         Stop background polling gracefully.
+
+        No further operations are dispatched; the operations that are running,
+        or already taken off the queue, are allowed to finish. Operations
+        still queued are kept for the next start().
         """
-        if self._polling_thread is None or not self._polling_thread.is_alive():
+        if self._timer_thread is None or not self._timer_thread.is_alive():
             logger.warning("Background scheduler not running")
             return
 
-        # Signal threads to stop
+        # Signal threads to stop; both wake up immediately
         self._stop_event.set()
+        self._timer_wakeup.set()
+        self._operation_queue.put(Operation(priority=-1, operation_type=self._STOP_OPERATION, callback=None))
 
         # Wait for threads to finish
-        if self._polling_thread:
-            self._polling_thread.join(timeout=5.0)
+        if self._timer_thread:
+            self._timer_thread.join(timeout=5.0)
+
+        with self._dispatch_condition:
+            self._dispatch_condition.notify_all()
 
+        # Wait for the dispatcher to hand over the operation it holds, then drain the pool
         if self._queue_thread:
-            self._queue_thread.join(timeout=5.0)
+            self._queue_thread.join()
+
+        if self._executor:
+            self._executor.shutdown(wait=True)
+
+        if self.operation_store is not None:
+            self._release_queued_leases()
 
         logger.info("Background scheduler stopped")
 
-    def schedule_daily_plan(self, time_of_day: str) -> None:
+    def schedule_daily_plan(self, time_of_day: str, prewarm_minutes: int = 0) -> None:
         """
         Schedule automatic daily plan generation.
 
+        With ``prewarm_minutes`` set, the plan is generated as a draft within
+        that many minutes before the scheduled time and refreshed shortly
+        before it if the backlog changed, so it is ready at the scheduled time.
+        Pre-generation needs a plan generator with a plan cache.
+
         Args:
             time_of_day: Time in HH:MM format (e.g., "08:00")
+            prewarm_minutes: Length of the pre-generation window (default: 0, disabled)
+
+        Raises:
+            ValueError: If the time format or pre-generation window is invalid
         """
         try:
             # Parse time string
@@ -144,79 +335,528 @@ class BackgroundScheduler:
             logger.error(f"Invalid time format: {time_of_day}. Expected HH:MM format.")
             raise ValueError(f"Invalid time format: {time_of_day}") from e
 
+        self._prewarmer = None
+        if prewarm_minutes:
+            if self.plan_generator.plan_cache is None:
+                raise ValueError("Pre-generating daily plans requires a plan generator with a plan cache")
+
+            self._prewarmer = PlanPrewarmer(
+                lambda _user_id: self.plan_generator,
+                window_minutes=prewarm_minutes,
+                refresh_minutes=max(1, min(self.PREWARM_REFRESH_MINUTES, prewarm_minutes // 2)),
+            )
+            logger.info(f"Daily plan pre-generated within {prewarm_minutes} minutes before {time_of_day}")
+
+        if self._timer_thread is not None and self._timer_thread.is_alive():
+            self._arm_daily_plan_timer()
+
+    def schedule_user_plan(
+        self,
+        user_id: str,
+        time_of_day: str,
+        timezone: str = "UTC",
+        working_days: Optional[Iterable[int]] = None,
+    ) -> bool:
+        """
+        Schedule the daily plan of one of many users.
+
+        Unlike schedule_daily_plan(), which plans for the plan generator's
+        user at a local time of the scheduler, each user gets a plan at a time
+        in their own time zone, generated with the plan generator returned by
+        the generator factory. With an operation store, plans missed while no
+        replica was running are caught up from the date of the user's last plan.
+
+        Args:
+            user_id: User ID
+            time_of_day: Local plan time in HH:MM format (e.g., "08:00")
+            timezone: IANA time zone of the plan time (default: "UTC")
+            working_days: Weekdays that get a plan, Monday being 0 (default: None, every day)
+
+        Returns:
+            True if the user was scheduled, False if it belongs to another replica's shard
+
+        Raises:
+            ValueError: If no plan schedule is configured, or the time, time zone
+                        or working days are invalid
+        """
+        if self.plan_schedule is None:
+            raise ValueError("Scheduling user plans requires a plan_schedule")
+
+        last_plan_date = None
+        if self.operation_store is not None and self.plan_schedule.owns(user_id):
+            stored = self.operation_store.get_state(self._last_plan_state_name(user_id))
+            last_plan_date = date.fromisoformat(stored) if stored else None
+
+        if not self.plan_schedule.add_user(
+            user_id, time_of_day, timezone, working_days, last_plan_date, self._now().astimezone()
+        ):
+            return False
+
+        logger.info(f"Daily plan of user {user_id} scheduled for {time_of_day} ({timezone})")
+        if self._timer_thread is not None and self._timer_thread.is_alive():
+            self._arm_user_plan_timer()
+        return True
+
+    def unschedule_user_plan(self, user_id: str) -> bool:
+        """
+        Stop generating the daily plan of a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            True if the user's plan was scheduled, False otherwise
+        """
+        return self.plan_schedule is not None and self.plan_schedule.remove_user(user_id)
+
+    def schedule_timer(
+        self,
+        name: str,
+        callback: Callable[[], None],
+        delay_seconds: float = 0.0,
+        interval_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Register a timer that runs a callback when due.
+
+        A timer with the same name is replaced. Callbacks run on the timer
+        thread, so long-running work should be handed to queue_operation.
+
+        Args:
+            name: Timer name
+            callback: Function to call when the timer is due
+            delay_seconds: Delay before the first run (default: 0, run right away)
+            interval_seconds: Interval between later runs (default: None, run once)
+
+        Raises:
+            ValueError: If the delay is negative or the interval is not positive
+        """
+        if delay_seconds < 0:
+            raise ValueError(f"Timer delay must be non-negative, got {delay_seconds}")
+        if interval_seconds is not None and interval_seconds <= 0:
+            raise ValueError(f"Timer interval must be positive, got {interval_seconds}")
+
+        next_run = None
+        if interval_seconds is not None:
+            interval = timedelta(seconds=interval_seconds)
+            next_run = lambda now: now + interval  # noqa: E731
+
+        self._add_timer(_Timer(name, callback, next_run), self._now() + timedelta(seconds=delay_seconds))
+
+    def cancel_timer(self, name: str) -> bool:
+        """
+        Cancel a registered timer.
+
+        Args:
+            name: Timer name
+
+        Returns:
+            True if a timer was cancelled, False if no timer has that name
+        """
+        with self._timer_lock:
+            timer = self._timers.pop(name, None)
+            if timer is None:
+                return False
+            timer.cancelled = True
+            self._timer_wakeup.set()
+
+        logger.debug(f"Cancelled timer: {name}")
+        return True
+
     def queue_operation(
         self,
         operation_type: str,
         callback: Callable,
         priority: OperationPriority = OperationPriority.NORMAL,
         *args,
+        operation_key: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
         **kwargs,
-    ) -> None:
+    ) -> bool:
         """
         Queue an operation for execution.
 
+        An operation with the key of one that is still pending (queued and
+        not started) is merged into it: the pending operation runs once with
+        the latest arguments and the higher of both priorities.
+
+        With an operation store, the DURABLE_OPERATIONS are added to the store
+        instead and run by whichever replica claims them; the idempotency key
+        makes adding the same work again a no-op.
+
         Args:
             operation_type: Type of operation (for logging)
             callback: Function to execute
             priority: Operation priority (BLOCKING or NORMAL)
             *args: Positional arguments for callback
+            operation_key: Identity of the work, for merging duplicates (optional)
+            idempotency_key: Identity of the work in the operation store (optional)
             **kwargs: Keyword arguments for callback
+
+        Returns:
+            True if the operation was queued, False if it was merged into a pending
+            one or its idempotency key is already known
         """
+        if self.operation_store is not None and operation_type in self.DURABLE_OPERATIONS and not args:
+            queued = self.operation_store.enqueue(
+                operation_type, self._encode_payload(operation_type, kwargs), priority.value, idempotency_key
+            )
+            logger.debug(f"Stored operation: {operation_type} (priority: {priority.name}, new: {queued})")
+            if queued:
+                # Claim right away instead of at the next claim interval
+                self.schedule_timer(
+                    self.CLAIM_TIMER, lambda: self._claim_operations(), interval_seconds=self.CLAIM_INTERVAL_SECONDS
+                )
+            return queued
+
         operation = Operation(
-            priority=priority.value, operation_type=operation_type, callback=callback, args=args, kwargs=kwargs
+            priority=priority.value,
+            operation_type=operation_type,
+            callback=callback,
+            args=args,
+            kwargs=kwargs,
+            key=operation_key,
         )
 
-        self._operation_queue.put(operation)
+        with self._dispatch_condition:
+            pending = self._pending.get(operation_key) if operation_key is not None else None
+            if pending is not None and pending.priority <= operation.priority:
+                pending.args, pending.kwargs = args, kwargs
+                logger.debug(f"Merged operation {operation_type} into pending {operation_key}")
+                return False
+
+            if pending is not None:
+                # Re-queue at the higher priority; the dispatcher drops the old entry
+                pending.superseded = True
+            if operation_key is not None:
+                self._pending[operation_key] = operation
+
+            self._operation_queue.put(operation)
+            # Let the dispatcher swap in this operation if it outranks the one it holds
+            self._dispatch_condition.notify_all()
+
         logger.debug(f"Queued operation: {operation_type} (priority: {priority.name})")
+        return True
+
+    def _now(self) -> datetime:
+        """
+        Return the current time of the timer clock.
+
+        Returns:
+            Current local time
+        """
+        return datetime.now()
+
+    def _add_timer(self, timer: _Timer, due: datetime) -> None:
+        """
+        Push a timer onto the heap, replacing any timer with the same name.
+
+        Args:
+            timer: Timer to register
+            due: Time at which the timer runs next
+        """
+        with self._timer_lock:
+            # A timer replaced or cancelled while it was running is not re-armed
+            if timer.cancelled:
+                return
+            previous = self._timers.get(timer.name)
+            if previous is not None and previous is not timer:
+                previous.cancelled = True
+            self._timers[timer.name] = timer
+            heapq.heappush(self._timer_heap, (due, next(self._timer_sequence), timer))
+            # Wake the timer thread in case this timer is due before the one it waits for
+            self._timer_wakeup.set()
+
+        logger.debug(f"Timer {timer.name} due at {due.isoformat()}")
+
+    def _pop_due_timer(self, now: datetime) -> Tuple[Optional[_Timer], Optional[float]]:
+        """
+        Pop the next timer if it is due.
+
+        Args:
+            now: Current time
 
-    def _polling_loop(self) -> None:
+        Returns:
+            Tuple of the due timer (or None) and the seconds until the next
+            timer is due (None when no timer is registered)
+        """
+        with self._timer_lock:
+            # Clear under the lock so that timers added after this point wake the thread
+            self._timer_wakeup.clear()
+            while self._timer_heap and self._timer_heap[0][2].cancelled:
+                heapq.heappop(self._timer_heap)
+            if not self._timer_heap:
+                return None, None
+
+            due, _, timer = self._timer_heap[0]
+            if due > now:
+                return None, (due - now).total_seconds()
+
+            heapq.heappop(self._timer_heap)
+            return timer, None
+
+    def _timer_loop(self) -> None:
         """
-        Main polling loop that runs in background thread.
-        Checks for blocking tasks and scheduled daily plans.
+        Run timers as they become due until the scheduler is stopped.
+
+        The thread sleeps until the earliest timer is due, a timer is added or
+        the scheduler is stopped; it does not wake up while idle.
         """
-        logger.info("Polling loop started")
+        logger.info("Timer loop started")
 
         while not self._stop_event.is_set():
+            timer, timeout = self._pop_due_timer(self._now())
+            if timer is None:
+                self._timer_wakeup.wait(timeout)
+                continue
+
             try:
-                # Check for blocking tasks
-                self._check_blocking_tasks()
+                timer.callback()
+            except Exception as e:
+                # The timer keeps its schedule; the next run retries
+                logger.error(f"Error in timer {timer.name}: {e}", exc_info=True)
 
-                # Check if daily plan should be generated
-                self._check_daily_plan_schedule()
+            self._reschedule(timer)
 
-                # Sleep for poll interval (check stop event periodically)
-                for _ in range(self.poll_interval_minutes * 60):
-                    if self._stop_event.is_set():
-                        break
-                    time.sleep(1)
+        logger.info("Timer loop stopped")
 
+    def _reschedule(self, timer: _Timer) -> None:
+        """
+        Re-arm a timer that just ran, or drop it if it does not repeat.
+
+        Args:
+            timer: Timer that ran
+        """
+        due = None
+        if timer.next_run is not None and not timer.cancelled:
+            try:
+                due = timer.next_run(self._now())
             except Exception as e:
-                logger.error(f"Error in polling loop: {e}", exc_info=True)
-                # Continue polling even if there's an error
-                time.sleep(60)  # Wait a minute before retrying
+                logger.error(f"Error rescheduling timer {timer.name}: {e}", exc_info=True)
+
+        if due is not None:
+            self._add_timer(timer, due)
+            return
 
-        logger.info("Polling loop stopped")
+        with self._timer_lock:
+            if self._timers.get(timer.name) is timer:
+                del self._timers[timer.name]
+
+    def _arm_daily_plan_timer(self) -> None:
+        """
+        Register the daily plan timer if a plan time is scheduled.
+        """
+        if self._daily_plan_time is None:
+            return
+
+        timer = _Timer(self.DAILY_PLAN_TIMER, lambda: self._check_daily_plan_schedule(), self._next_daily_plan_run)
+        self._add_timer(timer, self._next_daily_plan_run(self._now()))
+
+    def _next_daily_plan_run(self, now: datetime) -> datetime:
+        """
+        Compute when the daily plan timer has to run next.
+
+        That is the scheduled plan time, or the next pending pre-generation
+        stage before it. A plan that is overdue today runs right away.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Time of the next run
+        """
+        deadline = datetime.combine(now.date(), self._daily_plan_time)
+        if self._last_plan_date == now.date():
+            deadline += timedelta(days=1)
+
+        runs = [deadline]
+        if self._prewarmer is not None:
+            runs += [
+                task.fire_at
+                for task in self._prewarmer.schedule([self.plan_generator.user_id], deadline)
+                if (deadline.date(), task.stage) not in self._prewarm_done
+            ]
+
+        return max(min(runs), now)
+
+    def _arm_user_plan_timer(self) -> None:
+        """
+        Register the user plan timer for the earliest scheduled user plan.
+        """
+        if self.plan_schedule is None:
+            return
+
+        due = self._next_user_plan_run(self._now())
+        if due is not None:
+            timer = _Timer(self.USER_PLAN_TIMER, lambda: self._check_user_plan_schedule(), self._next_user_plan_run)
+            self._add_timer(timer, due)
+
+    def _next_user_plan_run(self, now: datetime) -> Optional[datetime]:
+        """
+        Compute when the user plan timer has to run next.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Time the earliest user plan is due, now if it is overdue, or None
+            if no user plan is scheduled
+        """
+        fire_at = self.plan_schedule.next_fire_at()
+        if fire_at is None:
+            return None
+        return max(fire_at.astimezone().replace(tzinfo=None), now)
+
+    def _check_user_plan_schedule(self) -> None:
+        """
+        Queue the generation of the user plans that are due.
+        """
+        for run in self.plan_schedule.pop_due(self._now().astimezone()):
+            logger.info(f"Triggering scheduled daily plan of user {run.user_id} for {run.plan_date}")
+            self.queue_operation(
+                operation_type="generate_user_plan",
+                callback=self._generate_user_plan,
+                priority=OperationPriority.NORMAL,
+                operation_key=f"generate_user_plan:{run.user_id}",
+                idempotency_key=f"generate_user_plan:{run.user_id}:{run.plan_date.isoformat()}",
+                user_id=run.user_id,
+                plan_date=run.plan_date,
+            )
+            if self.operation_store is not None:
+                self.operation_store.set_state(self._last_plan_state_name(run.user_id), run.plan_date.isoformat())
 
     def _check_blocking_tasks(self) -> None:
         """
         Check for blocking tasks and queue re-planning if found.
+
+        Blocking tasks already handled in their current status and priority
+        are skipped; a blocking task is handled again when either changes, or
+        when it comes back after it stopped blocking. The idempotency key of
+        the handling includes the time the blocker was first seen since it
+        last stopped blocking, so a blocker that comes back is not taken for
+        the one handled before.
         """
         try:
             blocking_tasks = self.jira_client.fetch_blocking_tasks()
 
-            if blocking_tasks:
-                logger.info(f"Found {len(blocking_tasks)} blocking task(s)")
+            with self._blocker_lock:
+                # Forget blockers that were resolved
+                current = {task.key for task in blocking_tasks}
+                resolved = [key for key in self._blocker_seen_at if key not in current]
+                for key in resolved:
+                    del self._blocker_seen_at[key]
+                self._handled_blockers = {k: v for k, v in self._handled_blockers.items() if k in current}
+                new_tasks = [
+                    task
+                    for task in blocking_tasks
+                    if self._handled_blockers.get(task.key) != self._blocker_fingerprint(task)
+                ]
+
+            if self.operation_store is not None:
+                for key in resolved:
+                    self.operation_store.set_state(self._blocker_state_name(key), "")
+
+            known_tasks = []
+            if new_tasks:
+                logger.info(f"Found {len(new_tasks)} new or changed blocking task(s)")
 
                 # Queue blocking task handling with high priority
-                for task in blocking_tasks:
-                    self.queue_operation(
+                for task in new_tasks:
+                    queued = self.queue_operation(
                         operation_type="handle_blocking_task",
                         callback=self._handle_blocking_task,
                         priority=OperationPriority.BLOCKING,
+                        operation_key=f"handle_blocking_task:{task.key}",
+                        idempotency_key=(
+                            f"handle_blocking_task:{task.key}:{self._blocker_first_seen(task.key)}"
+                            f":{task.status}:{task.priority}"
+                        ),
                         task=task,
                     )
+                    if not queued and self.operation_store is not None:
+                        # Another replica, or this one before a restart, already handles it
+                        known_tasks.append(task)
+                        with self._blocker_lock:
+                            self._handled_blockers[task.key] = self._blocker_fingerprint(task)
+
+            if self.adaptive_poller is not None:
+                self.adaptive_poller.observe(len(blocking_tasks), len(new_tasks) > len(known_tasks))
         except Exception as e:
             logger.error(f"Error checking blocking tasks: {e}", exc_info=True)
+            if self.adaptive_poller is not None:
+                self.adaptive_poller.observe_error(rate_limited=isinstance(e, JiraRateLimitError))
+
+    def _next_poll_run(self, now: datetime) -> datetime:
+        """
+        Get the time of the next adaptive poll, after any rate limit reported by JIRA.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Time of the next poll
+        """
+        rate_limited_until = getattr(self.jira_client, "rate_limited_until", None)
+        if not isinstance(rate_limited_until, datetime):
+            rate_limited_until = None
+
+        return self.adaptive_poller.next_poll(now, not_before=rate_limited_until)
+
+    def polling_metrics(self) -> Optional[PollingMetrics]:
+        """
+        Get the current polling interval and the reason for it.
+
+        Returns:
+            PollingMetrics of the adaptive poller, or None with a fixed interval
+        """
+        if self.adaptive_poller is None:
+            return None
+        return self.adaptive_poller.metrics()
+
+    @staticmethod
+    def _blocker_fingerprint(task: JiraIssue) -> Tuple[str, str]:
+        """
+        Get the part of a blocking task that decides whether it is handled again.
+
+        Args:
+            task: Blocking task
+
+        Returns:
+            Tuple of status and priority
+        """
+        return (task.status, task.priority)
+
+    def _blocker_first_seen(self, task_key: str) -> str:
+        """
+        Get the time a blocking task was first seen since it last stopped blocking.
+
+        The time is kept in the operation store, when configured, so that all
+        replicas derive the same idempotency key for the same occurrence.
+
+        Args:
+            task_key: JIRA key of the blocking task
+
+        Returns:
+            First-seen time in ISO format
+        """
+        with self._blocker_lock:
+            seen_at = self._blocker_seen_at.get(task_key)
+        if seen_at is not None:
+            return seen_at
+
+        seen_at = self.operation_store.get_state(self._blocker_state_name(task_key)) if self.operation_store else None
+        if not seen_at:
+            seen_at = self._now().isoformat()
+            if self.operation_store is not None:
+                self.operation_store.set_state(self._blocker_state_name(task_key), seen_at)
+
+        with self._blocker_lock:
+            return self._blocker_seen_at.setdefault(task_key, seen_at)
+
+    @staticmethod
+    def _blocker_state_name(task_key: str) -> str:
+        """Get the name of the schedule state value holding the time a blocking task was first seen."""
+        return f"blocker_seen_at:{task_key}"
 
     def _check_daily_plan_schedule(self) -> None:
         """
@@ -225,7 +865,7 @@ class BackgroundScheduler:
         if self._daily_plan_time is None:
             return
 
-        now = datetime.now()
+        now = self._now()
         current_time = now.time()
         current_date = now.date()
 
@@ -233,6 +873,9 @@ class BackgroundScheduler:
         if self._last_plan_date == current_date:
             return
 
+        if self._prewarmer is not None:
+            self._check_prewarm_schedule(now)
+
         # Check if current time is past the scheduled time
         if current_time >= self._daily_plan_time:
             logger.info("Triggering scheduled daily plan generation")
@@ -242,70 +885,337 @@ class BackgroundScheduler:
                 operation_type="generate_daily_plan",
                 callback=self._generate_daily_plan,
                 priority=OperationPriority.NORMAL,
+                operation_key="generate_daily_plan",
+                idempotency_key=f"generate_daily_plan:{self.plan_generator.user_id}:{current_date.isoformat()}",
             )
 
             # Update last plan date
             self._last_plan_date = current_date
+            if self.operation_store is not None:
+                self.operation_store.set_state(self._last_plan_state_name(), current_date.isoformat())
 
-    def _process_queue(self) -> None:
+    def _check_prewarm_schedule(self, now: datetime) -> None:
         """
-        Process operations from the queue.
-        Runs in separate thread.
+        Queue the pre-generation run of today's plan that is due, if any.
+
+        When several stages are overdue (e.g. after a restart), only the latest
+        one is run.
+
+        Args:
+            now: Current time
         """
-        logger.info("Queue processor started")
+        deadline = datetime.combine(now.date(), self._daily_plan_time)
+        if now >= deadline:
+            return
 
-        while not self._stop_event.is_set():
+        due = [
+            task
+            for task in self._prewarmer.schedule([self.plan_generator.user_id], deadline)
+            if task.fire_at <= now and (deadline.date(), task.stage) not in self._prewarm_done
+        ]
+        if not due:
+            return
+
+        self._prewarm_done.update((deadline.date(), task.stage) for task in due)
+        self._prewarm_done = {done for done in self._prewarm_done if done[0] >= deadline.date()}
+
+        logger.info(f"Triggering {due[-1].stage} pre-generation of the daily plan")
+        self.queue_operation(
+            operation_type="prewarm_daily_plan",
+            callback=self._prewarm_daily_plan,
+            priority=OperationPriority.NORMAL,
+            operation_key="prewarm_daily_plan",
+            idempotency_key=(
+                f"prewarm_daily_plan:{self.plan_generator.user_id}:{deadline.date().isoformat()}:{due[-1].stage}"
+            ),
+            task=due[-1],
+            deadline=deadline,
+        )
+
+    def _last_plan_state_name(self, user_id: Optional[str] = None) -> str:
+        """Get the name of the schedule state value holding the date of a user's last daily plan."""
+        return f"last_plan_date:{user_id or self.plan_generator.user_id}"
+
+    @staticmethod
+    def _encode_payload(operation_type: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert the arguments of a durable operation to JSON-serializable data.
+
+        Args:
+            operation_type: One of the DURABLE_OPERATIONS
+            kwargs: Keyword arguments of the handler
+
+        Returns:
+            Payload accepted by _decode_payload
+        """
+        if operation_type == "handle_blocking_task":
+            return {"task": json.loads(json.dumps(asdict(kwargs["task"]), default=str))}
+        if operation_type == "prewarm_daily_plan":
+            task = kwargs["task"]
+            return {
+                "task": {"fire_at": task.fire_at.isoformat(), "user_id": task.user_id, "stage": task.stage},
+                "deadline": kwargs["deadline"].isoformat(),
+            }
+        if operation_type == "generate_user_plan":
+            return {"user_id": kwargs["user_id"], "plan_date": kwargs["plan_date"].isoformat()}
+        return {}
+
+    @staticmethod
+    def _decode_payload(operation_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Rebuild the handler arguments of a durable operation.
+
+        Args:
+            operation_type: One of the DURABLE_OPERATIONS
+            payload: Payload produced by _encode_payload
+
+        Returns:
+            Keyword arguments of the handler
+        """
+        if operation_type == "handle_blocking_task":
+            task = dict(payload["task"])
+            task["issue_links"] = [IssueLink(**link) for link in task.get("issue_links", [])]
+            return {"task": JiraIssue(**task)}
+        if operation_type == "prewarm_daily_plan":
+            task = payload["task"]
+            return {
+                "task": PrewarmTask(datetime.fromisoformat(task["fire_at"]), task["user_id"], task["stage"]),
+                "deadline": datetime.fromisoformat(payload["deadline"]),
+            }
+        if operation_type == "generate_user_plan":
+            return {"user_id": payload["user_id"], "plan_date": date.fromisoformat(payload["plan_date"])}
+        return {}
+
+    def _claim_operations(self) -> None:
+        """
+        Claim durable operations for the idle workers and queue them locally.
+        """
+        with self._dispatch_condition:
+            limit = self.max_workers - self._leased
+        if limit <= 0:
+            return
+
+        for leased in self.operation_store.claim(limit):
+            operation = Operation(
+                priority=leased.priority,
+                operation_type=leased.operation_type,
+                callback=self._run_leased_operation,
+                args=(leased,),
+            )
+            with self._dispatch_condition:
+                self._leased += 1
+                self._operation_queue.put(operation)
+                self._dispatch_condition.notify_all()
+            logger.debug(f"Claimed operation {leased.operation_type} (attempt {leased.attempts})")
+
+    def _run_leased_operation(self, leased: LeasedOperation) -> Any:
+        """
+        Run a claimed durable operation and settle its lease.
+
+        A failed operation is returned to the store and retried after
+        RETRY_DELAY_SECONDS. The lease is extended every LEASE_HEARTBEAT_SECONDS
+        while the operation runs, so long operations are not claimed again by
+        another replica.
+
+        Args:
+            leased: Operation claimed from the store
+
+        Returns:
+            Result of the handler
+        """
+        heartbeat = f"lease:{leased.operation_id}"
+        self.schedule_timer(
+            heartbeat,
+            lambda: self._extend_lease(leased),
+            delay_seconds=self.LEASE_HEARTBEAT_SECONDS,
+            interval_seconds=self.LEASE_HEARTBEAT_SECONDS,
+        )
+        try:
+            handler = getattr(self, self.DURABLE_OPERATIONS[leased.operation_type])
             try:
-                # Get operation from queue (with timeout to check stop event)
-                operation = self._operation_queue.get(timeout=1.0)
+                result = handler(**self._decode_payload(leased.operation_type, leased.payload))
+            except Exception:
+                self.operation_store.release(leased, delay_seconds=self.RETRY_DELAY_SECONDS)
+                raise
+
+            if not self.operation_store.complete(leased):
+                logger.warning(f"Lease of operation {leased.operation_type} expired before it completed")
+            return result
+        finally:
+            self.cancel_timer(heartbeat)
+            with self._dispatch_condition:
+                self._leased -= 1
+            if not self._stop_event.is_set():
+                self.schedule_timer(
+                    self.CLAIM_TIMER, lambda: self._claim_operations(), interval_seconds=self.CLAIM_INTERVAL_SECONDS
+                )
+
+    def _extend_lease(self, leased: LeasedOperation) -> None:
+        """
+        Extend the lease of a running durable operation by the visibility timeout.
 
-                logger.info(f"Processing operation: {operation.operation_type} " f"(priority: {operation.priority})")
+        Args:
+            leased: Operation claimed from the store
+        """
+        if self.operation_store.extend_lease(leased, OperationStore.DEFAULT_VISIBILITY_TIMEOUT_SECONDS):
+            logger.debug(f"Extended lease of operation {leased.operation_type}")
+        else:
+            logger.warning(f"Lost lease of running operation {leased.operation_type}")
 
-                # Execute operation
-                try:
-                    result = operation.callback(*operation.args, **operation.kwargs)
+    def _release_queued_leases(self) -> None:
+        """
+        Return claimed operations that did not start before stop() to the store.
+        """
+        kept = []
+        while True:
+            try:
+                operation = self._operation_queue.get_nowait()
+            except Empty:
+                break
+            self._operation_queue.task_done()
+            if operation.callback == self._run_leased_operation:
+                self.operation_store.release(operation.args[0])
+                self._leased -= 1
+            else:
+                kept.append(operation)
 
-                    # Send notification if callback provided
-                    if self.notification_callback:
-                        self.notification_callback(
-                            operation_type=operation.operation_type, status="completed", result=result
-                        )
+        for operation in kept:
+            self._operation_queue.put(operation)
 
-                except Exception as e:
-                    logger.error(f"Error executing operation {operation.operation_type}: {e}", exc_info=True)
+    def _process_queue(self) -> None:
+        """
+        Dispatch operations from the queue to the worker pool.
 
-                    # Send error notification
-                    if self.notification_callback:
-                        self.notification_callback(
-                            operation_type=operation.operation_type, status="failed", error=str(e)
-                        )
+        Runs in separate thread until stop() queues the stop sentinel, which
+        is ordered before every other operation. The operation taken off the
+        queue is held until it may run (see _can_dispatch); an operation of
+        higher priority queued in the meantime takes its place.
+        """
+        logger.info("Queue processor started")
 
-                # Mark task as done
+        while True:
+            try:
+                operation = self._operation_queue.get()
                 self._operation_queue.task_done()
+                if operation.operation_type == self._STOP_OPERATION:
+                    break
+                if operation.superseded:
+                    continue
+
+                with self._dispatch_condition:
+                    while not self._can_dispatch(operation):
+                        operation = self._swap_for_queued(operation)
+                        if not self._can_dispatch(operation):
+                            self._dispatch_condition.wait()
+
+                    # From here on, duplicates are new work
+                    if operation.key is not None and self._pending.get(operation.key) is operation:
+                        del self._pending[operation.key]
+                    self._running_types[operation.operation_type] += 1
+                    self._running_priorities[operation.priority] += 1
+
+                self._executor.submit(self._run_operation, operation)
 
-            except Empty:
-                # No operations in queue, continue
-                continue
             except Exception as e:
                 logger.error(f"Error in queue processor: {e}", exc_info=True)
 
         logger.info("Queue processor stopped")
 
-    def _handle_blocking_task(self, task: JiraIssue) -> None:
+    def _can_dispatch(self, operation: Operation) -> bool:
+        """
+        Check whether an operation may start now.
+
+        It needs a free worker, its type must be below its concurrency limit
+        and no operation of higher priority may be running, so that blocking
+        operations complete before normal ones start.
+        Must be called with the dispatch condition held.
+
+        Args:
+            operation: Operation to dispatch
+
+        Returns:
+            True if the operation can be submitted to the pool
+        """
+        if sum(self._running_types.values()) >= self.max_workers:
+            return False
+
+        limit = self.operation_limits.get(operation.operation_type)
+        if limit is not None and self._running_types[operation.operation_type] >= limit:
+            return False
+
+        return not any(count for priority, count in self._running_priorities.items() if priority < operation.priority)
+
+    def _swap_for_queued(self, operation: Operation) -> Operation:
+        """
+        Exchange a held operation for a queued one of higher priority.
+
+        Args:
+            operation: Operation held by the dispatcher
+
+        Returns:
+            The operation to hold from now on
+        """
+        try:
+            queued = self._operation_queue.get_nowait()
+        except Empty:
+            return operation
+        self._operation_queue.task_done()
+        if queued.superseded:
+            return operation
+
+        # The stop sentinel stays queued until the held operation is dispatched
+        if queued.operation_type != self._STOP_OPERATION and queued.priority < operation.priority:
+            queued, operation = operation, queued
+
+        self._operation_queue.put(queued)
+        return operation
+
+    def _run_operation(self, operation: Operation) -> None:
+        """
+        Execute an operation on a worker and wake the dispatcher when done.
+
+        Args:
+            operation: Operation to execute
+        """
+        logger.info(f"Processing operation: {operation.operation_type} " f"(priority: {operation.priority})")
+
+        try:
+            result = operation.callback(*operation.args, **operation.kwargs)
+
+            # Send notification if callback provided
+            if self.notification_callback:
+                self.notification_callback(operation_type=operation.operation_type, status="completed", result=result)
+
+        except Exception as e:
+            logger.error(f"Error executing operation {operation.operation_type}: {e}", exc_info=True)
+
+            # Send error notification
+            if self.notification_callback:
+                self.notification_callback(operation_type=operation.operation_type, status="failed", error=str(e))
+
+        finally:
+            with self._dispatch_condition:
+                self._running_types[operation.operation_type] -= 1
+                self._running_priorities[operation.priority] -= 1
+                self._dispatch_condition.notify_all()
+
+    def _handle_blocking_task(self, task: JiraIssue) -> Optional[DailyPlan]:
         """
         Handle a detected blocking task.
 
         Args:
             task: Blocking task that was detected
+
+        Returns:
+            Re-plan including the blocking task, or None if no plan was generated yet
         """
         logger.info(f"Handling blocking task: {task.key} - {task.summary}")
 
         # Emit task_blocked event if event bus is configured
         if self.event_bus:
-            import asyncio
-
             event = Event(
                 event_type="task_blocked",
+                key=task.key,
                 event_data={
                     "task_key": task.key,
                     "task_summary": task.summary,
@@ -315,37 +1225,76 @@ class BackgroundScheduler:
                 },
             )
             try:
-                # Use asyncio to run the async publish method
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If loop is already running, schedule the coroutine
-                    asyncio.create_task(self.event_bus.publish(event))
-                else:
-                    # If no loop is running, run it synchronously
-                    loop.run_until_complete(self.event_bus.publish(event))
+                # Hand over to the event bus loop thread; handlers do not run here
+                self.event_bus.publish_threadsafe(event)
                 logger.info(f"Emitted task_blocked event for {task.key}")
             except Exception as e:
                 logger.error(f"Failed to emit task_blocked event: {e}", exc_info=True)
 
-        # In a full implementation, this would:
-        # 1. Load current plan
-        # 2. Generate re-plan with blocking task
-        # 3. Present to user for approval
-        # 4. Replace current plan if approved
-
-        # For now, just log the detection
         logger.info(f"Blocking task detected: {task.key}")
 
+        with self._blocker_lock:
+            self._handled_blockers[task.key] = self._blocker_fingerprint(task)
+
+        # Replan from the snapshot of the current plan; JIRA is only queried if it is stale.
+        # The re-plan is returned for approval and does not replace the current plan.
+        with self._replan_lock:
+            if self._current_plan is None:
+                return None
+            replan = self._replan_generator.generate_replan(task, self._current_plan)
+        logger.info(f"Re-plan generated for blocking task {task.key}")
+
+        return replan
+
+    def _generate_user_plan(self, user_id: str, plan_date: date) -> DailyPlan:
+        """
+        Generate the scheduled daily plan of a user.
+
+        Args:
+            user_id: User ID
+            plan_date: Local date of the plan
+
+        Returns:
+            Generated DailyPlan
+        """
+        plan = self.generator_factory(user_id).generate_daily_plan(plan_date=plan_date)
+        logger.info(f"Daily plan of user {user_id} generated for {plan_date}")
+        return plan
+
+    def _prewarm_daily_plan(self, task: PrewarmTask, deadline: datetime) -> DailyPlan:
+        """
+        Generate or refresh the draft of the next daily plan.
+
+        Args:
+            task: Pre-generation task to run
+            deadline: Scheduled time of the plan
+
+        Returns:
+            Draft DailyPlan
+        """
+        with self._plan_lock:
+            return self._prewarmer.run(task, deadline)
+
     def _generate_daily_plan(self) -> DailyPlan:
         """
         Generate daily plan.
 
+        A pre-generated draft of today's plan is used as-is when available.
+
         Returns:
             Generated DailyPlan
         """
         logger.info("Generating daily plan")
 
-        plan = self.plan_generator.generate_daily_plan()
+        with self._plan_lock:
+            plan = self.plan_generator.get_stored_plan() if self._prewarmer is not None else None
+            if plan is None:
+                plan = self.plan_generator.generate_daily_plan()
+            replan_generator = self.plan_generator.fork()
+
+        with self._replan_lock:
+            self._current_plan = plan
+            self._replan_generator = replan_generator
 
         logger.info(
             f"Daily plan generated with {len(plan.priorities)} priorities "
@@ -7,14 +7,19 @@
 import logging
 import os
 import sys
+from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import click
 from dotenv import load_dotenv
 
+from triage.closure_analytics import ClosureAnalytics
+from triage.closure_store import create_closure_store
+from triage.dependency_graph import DependencyGraph
 from triage.jira_client import JiraAuthError, JiraClient, JiraConnectionError
 from triage.plan_generator import PlanGenerator
+from triage.plan_renderer import PlanRenderer
 from triage.task_classifier import TaskClassifier
 
 # Load environment variables from .env file
@@ -35,6 +40,15 @@ class Config:
         self.jira_project = os.environ.get("JIRA_PROJECT", "")  # Optional project filter
         self.admin_time_start = os.environ.get("ADMIN_TIME_START", "14:00")
         self.admin_time_end = os.environ.get("ADMIN_TIME_END", "15:30")
+        # Optional extra admin blocks, comma-separated (e.g., "09:00-09:30,17:00-17:30")
+        self.admin_extra_blocks = [
+            block.strip() for block in os.environ.get("ADMIN_EXTRA_BLOCKS", "").split(",") if block.strip()
+        ]
+        # Closure records: PostgreSQL if DATABASE_URL is set, SQLite in CLOSURE_TRACKING_DIR otherwise
+        self.database_url = os.environ.get("DATABASE_URL", "")
+        self.closure_tracking_dir = os.environ.get(
+            "CLOSURE_TRACKING_DIR", os.path.join(os.getcwd(), ".triage", "closure")
+        )
 
     def validate(self) -> tuple[bool, Optional[str]]:
         """
@@ -85,6 +99,7 @@ def cli(ctx):
       triage generate-plan              # Generate daily plan
       triage generate-plan -o plan.md   # Save to file
       triage generate-plan --debug      # Debug mode
+      triage closure-stats --team       # Closure trends
       triage --help                     # View help
 
     \b
@@ -100,9 +115,17 @@ def cli(ctx):
 @click.option(
     "--closure-rate", type=float, metavar="FLOAT", help="Previous day closure rate (0.0-1.0, e.g., 0.67 for 67%%)"
 )
+@click.option(
+    "--days",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    metavar="N",
+    help="Plan the next N working days from one backlog snapshot",
+)
 @click.option("--debug", is_flag=True, help="Enable detailed logging for debugging")
 @click.pass_context
-def generate_plan(ctx, output: Optional[str], closure_rate: Optional[float], debug: bool):
+def generate_plan(ctx, output: Optional[str], closure_rate: Optional[float], days: int, debug: bool):
     """Generate a daily plan from current JIRA tasks.
 
     This command fetches your active JIRA tasks, classifies them, and generates
@@ -137,6 +160,12 @@ def generate_plan(ctx, output: Optional[str], closure_rate: Optional[float], deb
 
       ADMIN_TIME_START  Admin block start time (default: 14:00)
       ADMIN_TIME_END    Admin block end time (default: 15:30)
+      ADMIN_EXTRA_BLOCKS  Additional admin blocks, comma-separated
+                        Example: 09:00-09:30,17:00-17:30
+
+      CLOSURE_TRACKING_DIR  Directory of the closure record database
+                        (default: .triage/closure)
+      DATABASE_URL      Store closure records in PostgreSQL instead
 
     \b
     Priority selection criteria:
@@ -162,6 +191,10 @@ def generate_plan(ctx, output: Optional[str], closure_rate: Optional[float], deb
       $ triage generate-plan --closure-rate 0.67
       # (2 out of 3 tasks completed = 67%)
 
+    \b
+      # Preview the whole working week
+      $ triage generate-plan --days 5 -o week.md
+
     \b
       # Debug mode with detailed logging
       $ triage generate-plan --debug
@@ -247,11 +280,20 @@ def generate_plan(ctx, output: Optional[str], closure_rate: Optional[float], deb
             project=config.jira_project if config.jira_project else None,
         )
 
-        classifier = TaskClassifier()
+        # Issue links decide which tasks wait on work outside the backlog
+        dependency_graph = DependencyGraph(jira_client)
+        classifier = TaskClassifier(dependency_graph=dependency_graph)
 
         # Update admin time if configured
         admin_time = f"{config.admin_time_start}-{config.admin_time_end}"
-        plan_generator = PlanGenerator(jira_client, classifier)
+        plan_generator = PlanGenerator(
+            jira_client,
+            classifier,
+            closure_tracking_dir=config.closure_tracking_dir,
+            admin_block_times=[admin_time] + config.admin_extra_blocks,
+            closure_store=create_closure_store(config.closure_tracking_dir, config.database_url or None),
+            dependency_graph=dependency_graph,
+        )
         plan_generator.DEFAULT_ADMIN_TIME = admin_time
 
         # Generate plan
@@ -265,41 +307,62 @@ def generate_plan(ctx, output: Optional[str], closure_rate: Optional[float], deb
             click.echo("📋 " + click.style("Fetching and classifying tasks...", fg="cyan"), err=True)
             logger.info("Generating plan for all projects")
 
-        plan = plan_generator.generate_daily_plan(previous_closure_rate=closure_rate)
-
-        # Format as markdown
-        markdown_output = plan.to_markdown()
+        if days > 1:
+            # One fetch and one ranking for the whole horizon
+            plans = plan_generator.generate_horizon_plan(days=days, previous_closure_rate=closure_rate)
+        else:
+            plans = [plan_generator.generate_daily_plan(previous_closure_rate=closure_rate)]
 
         # Output to file or stdout
+        renderer = PlanRenderer.default()
         if output:
+            # Stream the Markdown so large backlogs are never held in memory as one document
             output_path = Path(output)
-            output_path.write_text(markdown_output)
+            with output_path.open("w") as f:
+                for i, plan in enumerate(plans):
+                    if i:
+                        f.write("\n\n---\n\n")
+                    renderer.write_markdown(plan, f)
             click.echo("", err=True)
             click.echo("✅ " + click.style("Plan saved to:", fg="green", bold=True) + f" {output_path}", err=True)
             logger.info(f"Plan written to file: {output_path}")
         else:
             click.echo()  # Blank line before output
-            click.echo(markdown_output)
+            for i, plan in enumerate(plans):
+                if i:
+                    click.echo("\n---\n")
+                for line in renderer.iter_markdown(plan):
+                    click.echo(line)
             logger.debug("Plan written to stdout")
 
         # Print summary to stderr
-        click.echo("", err=True)
-        click.echo("📊 " + click.style("Plan Summary", fg="blue", bold=True) + f" - {plan.date}", err=True)
-        click.echo(
-            "   • Priorities: " + click.style(str(len(plan.priorities)), fg="green", bold=True) + " tasks", err=True
-        )
-        click.echo(
-            "   • Admin: "
-            + click.style(str(len(plan.admin_block.tasks)), fg="yellow")
-            + f" tasks ({plan.admin_block.time_allocation_minutes} min)",
-            err=True,
-        )
-        click.echo("   • Other: " + click.style(str(len(plan.other_tasks)), fg="white") + " tasks", err=True)
+        for plan in plans:
+            click.echo("", err=True)
+            click.echo("📊 " + click.style("Plan Summary", fg="blue", bold=True) + f" - {plan.date}", err=True)
+            click.echo(
+                "   • Priorities: " + click.style(str(len(plan.priorities)), fg="green", bold=True) + " tasks", err=True
+            )
+            click.echo(
+                "   • Admin: "
+                + click.style(str(len(plan.admin_block.tasks)), fg="yellow")
+                + f" tasks ({plan.admin_block.time_allocation_minutes} min)",
+                err=True,
+            )
+            for admin_block in plan.additional_admin_blocks:
+                click.echo(
+                    "   • Admin ("
+                    + admin_block.scheduled_time
+                    + "): "
+                    + click.style(str(len(admin_block.tasks)), fg="yellow")
+                    + f" tasks ({admin_block.time_allocation_minutes} min)",
+                    err=True,
+                )
+            click.echo("   • Other: " + click.style(str(len(plan.other_tasks)), fg="white") + " tasks", err=True)
 
-        if plan.previous_closure_rate is not None:
-            rate_pct = int(plan.previous_closure_rate * 100)
-            rate_color = "green" if rate_pct >= 67 else "yellow" if rate_pct >= 33 else "red"
-            click.echo("   • Previous closure: " + click.style(f"{rate_pct}%", fg=rate_color, bold=True), err=True)
+            if plan.previous_closure_rate is not None:
+                rate_pct = int(plan.previous_closure_rate * 100)
+                rate_color = "green" if rate_pct >= 67 else "yellow" if rate_pct >= 33 else "red"
+                click.echo("   • Previous closure: " + click.style(f"{rate_pct}%", fg=rate_color, bold=True), err=True)
 
         click.echo("", err=True)
 
@@ -566,6 +629,61 @@ def decompose(ctx, task_key: str, output: Optional[str], auto_create: bool, debu
         sys.exit(1)
 
 
+@cli.command("closure-stats")
+@click.option("--as-of", type=click.DateTime(formats=["%Y-%m-%d"]), help="Last day of the windows (default: today)")
+@click.option("--user", "users", multiple=True, metavar="USER", help="Only include this user (repeatable)")
+@click.option("--team", is_flag=True, help="Also show the aggregate trend of all selected users")
+@click.option("--history-days", type=click.IntRange(min=1), metavar="DAYS", help="Days of history for streaks")
+def closure_stats(as_of, users: Tuple[str, ...], team: bool, history_days: Optional[int]):
+    """Show rolling closure trends from recorded closure history.
+
+    For each user, shows the mean daily closure rate over the last 7, 30 and
+    90 days, the number of incomplete priorities carried over, and streaks of
+    fully closed days. Closure records are read from DATABASE_URL if set,
+    otherwise from the local SQLite store in CLOSURE_TRACKING_DIR.
+
+    \b
+    Examples:
+      $ triage closure-stats
+      $ triage closure-stats --user alice --user bob --team
+      $ triage closure-stats --as-of 2026-02-27 --history-days 365
+    """
+    config = Config()
+    as_of_date = as_of.date() if as_of else date.today()
+
+    store = create_closure_store(config.closure_tracking_dir, config.database_url or None)
+    try:
+        analytics = ClosureAnalytics(store)
+        user_ids = list(users) or None
+        trends = list(analytics.user_trends(as_of_date, user_ids, history_days).values())
+        if team:
+            trends.append(analytics.team_trend(as_of_date, user_ids, history_days))
+    finally:
+        store.close()
+
+    if not trends:
+        click.echo(f"No closure records found up to {as_of_date.isoformat()}")
+        return
+
+    def _rate(value: Optional[float]) -> str:
+        return f"{value:.0%}" if value is not None else "-"
+
+    windows = ClosureAnalytics.WINDOWS
+    header = ["User"] + [f"{w}d rate" for w in windows] + [f"{w}d carry" for w in windows] + ["Streak", "Best"]
+    rows = [
+        [trend.user_id]
+        + [_rate(trend.rolling_closure_rate[w]) for w in windows]
+        + [str(trend.carry_over[w]) for w in windows]
+        + [str(trend.current_streak), str(trend.longest_streak)]
+        for trend in trends
+    ]
+
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    click.echo(f"Closure trends as of {as_of_date.isoformat()}")
+    for row in [header] + rows:
+        click.echo("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+
+
 def main():
     """Entry point for the CLI."""
     cli()
@@ -0,0 +1,229 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Rolling-window closure analytics over stored closure records."""
+
+import logging
+import operator
+from array import array
+from datetime import date, timedelta
+from itertools import accumulate, groupby
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from triage.closure_store import ClosureStore
+from triage.models import ClosureTrend
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class _DailySeries:
+    """Per-day closure columns of one user (or team), indexed by day offset."""
+
+    __slots__ = ("rates", "completed", "total", "carried", "recorded")
+
+    def __init__(self, days: int):
+        """Allocate zeroed columns for a number of days."""
+        self.rates = array("d", bytes(8 * days))
+        self.completed = array("l", [0]) * days
+        self.total = array("l", [0]) * days
+        self.carried = array("l", [0]) * days
+        self.recorded = bytearray(days)
+
+
+class ClosureAnalytics:
+    """
+    Computes closure trends per user and per team.
+
+    History is loaded with a single range query into compact per-day arrays
+    (one slot per calendar day, days without a plan are skipped by the
+    metrics). Window metrics are computed with slice sums and prefix sums over
+    those arrays, so the cost is linear in the number of stored records.
+    """
+
+    # Rolling windows in days
+    WINDOWS = (7, 30, 90)
+
+    # Default days of history loaded (the longest window); pass history_days for longer streaks
+    HISTORY_DAYS = 90
+
+    def __init__(self, closure_store: ClosureStore):
+        """
+        Initialize closure analytics.
+
+        Args:
+            closure_store: Store holding the closure records
+        """
+        self.closure_store = closure_store
+
+    def user_trends(
+        self, as_of: date, user_ids: Optional[Iterable[str]] = None, history_days: Optional[int] = None
+    ) -> Dict[str, ClosureTrend]:
+        """
+        Compute closure trends of individual users.
+
+        Args:
+            as_of: Last day included in the windows
+            user_ids: Users to include (default: all users with records)
+            history_days: Days of history for streaks (default: HISTORY_DAYS)
+
+        Returns:
+            Dictionary mapping user IDs to their ClosureTrend
+        """
+        start_date, series = self._load_series(as_of, user_ids, history_days)
+        trends = {user_id: self._summarize(user_id, as_of, s) for user_id, s in series.items()}
+        logger.debug(f"Computed closure trends for {len(trends)} users since {start_date}")
+        return trends
+
+    def team_trend(
+        self,
+        as_of: date,
+        user_ids: Optional[Iterable[str]] = None,
+        history_days: Optional[int] = None,
+        team_id: str = "team",
+    ) -> ClosureTrend:
+        """
+        Compute the closure trend of a team.
+
+        The team's daily closure rate is completed over planned priorities of
+        all members on that day.
+
+        Args:
+            as_of: Last day included in the windows
+            user_ids: Team members (default: all users with records)
+            history_days: Days of history for streaks (default: HISTORY_DAYS)
+            team_id: ID reported for the team
+
+        Returns:
+            ClosureTrend of the team
+        """
+        start_date, series = self._load_series(as_of, user_ids, history_days)
+        days = (as_of - start_date).days + 1
+
+        team = _DailySeries(days)
+        for member in series.values():
+            team.completed = array("l", map(operator.add, team.completed, member.completed))
+            team.total = array("l", map(operator.add, team.total, member.total))
+            team.carried = array("l", map(operator.add, team.carried, member.carried))
+            team.recorded = bytearray(map(operator.or_, team.recorded, member.recorded))
+
+        team.rates = array("d", map(lambda c, t: c / t if t else 0.0, team.completed, team.total))
+        return self._summarize(team_id, as_of, team)
+
+    def rolling_closure_rates(
+        self, start_date: date, end_date: date, window: int, user_id: str
+    ) -> List[Optional[float]]:
+        """
+        Compute a user's rolling mean closure rate for every day of a range.
+
+        Args:
+            start_date: First day of the series
+            end_date: Last day of the series
+            window: Window length in days
+            user_id: User to compute the series for
+
+        Returns:
+            One value per day from start_date to end_date (None where the window has no plans)
+        """
+        history_start = start_date - timedelta(days=window - 1)
+        series = self._load_range(history_start, end_date, [user_id]).get(user_id)
+        if series is None:
+            return [None] * ((end_date - start_date).days + 1)
+
+        rate_sums = list(accumulate(series.rates, initial=0.0))
+        plan_counts = list(accumulate(series.recorded, initial=0))
+
+        return [
+            (rate_sums[i] - rate_sums[i - window]) / (plan_counts[i] - plan_counts[i - window])
+            if plan_counts[i] != plan_counts[i - window]
+            else None
+            for i in range(window, len(rate_sums))
+        ]
+
+    def _load_series(
+        self, as_of: date, user_ids: Optional[Iterable[str]], history_days: Optional[int]
+    ) -> Tuple[date, Dict[str, _DailySeries]]:
+        """Load enough history for the largest window and the streaks."""
+        days = max(history_days or self.HISTORY_DAYS, max(self.WINDOWS))
+        start_date = as_of - timedelta(days=days - 1)
+        return start_date, self._load_range(start_date, as_of, user_ids)
+
+    def _load_range(
+        self, start_date: date, end_date: date, user_ids: Optional[Iterable[str]]
+    ) -> Dict[str, _DailySeries]:
+        """
+        Load closure records of a date range into per-user daily arrays.
+
+        Args:
+            start_date: First day of the range
+            end_date: Last day of the range
+            user_ids: Users to load (default: all users)
+
+        Returns:
+            Dictionary mapping user IDs to their daily series
+        """
+        days = (end_date - start_date).days + 1
+        series: Dict[str, _DailySeries] = {}
+
+        for user_id, plan_date, rate, completed, total, carried in self.closure_store.load_daily_totals(
+            start_date, end_date, user_ids
+        ):
+            user_series = series.get(user_id)
+            if user_series is None:
+                user_series = series[user_id] = _DailySeries(days)
+
+            i = (plan_date - start_date).days
+            user_series.rates[i] = rate
+            user_series.completed[i] = completed
+            user_series.total[i] = total
+            user_series.carried[i] = carried
+            user_series.recorded[i] = 1
+
+        return series
+
+    def _summarize(self, user_id: str, as_of: date, series: _DailySeries) -> ClosureTrend:
+        """
+        Compute window metrics and streaks from a daily series ending at as_of.
+
+        Args:
+            user_id: User or team ID
+            as_of: Last day of the series
+            series: Daily closure columns
+
+        Returns:
+            ClosureTrend for the series
+        """
+        days = len(series.recorded)
+
+        rolling_closure_rate: Dict[int, Optional[float]] = {}
+        carry_over: Dict[int, int] = {}
+        for window in self.WINDOWS:
+            lo = max(0, days - window)
+            plans = sum(series.recorded[lo:])
+            rolling_closure_rate[window] = sum(series.rates[lo:]) / plans if plans else None
+            carry_over[window] = sum(series.carried[lo:])
+
+        # Fully closed flags of planned days only; days without a plan do not break a streak
+        closed = [
+            total > 0 and completed >= total
+            for completed, total, recorded in zip(series.completed, series.total, series.recorded)
+            if recorded
+        ]
+        longest_streak = max((sum(1 for _ in run) for is_closed, run in groupby(closed) if is_closed), default=0)
+
+        current_streak = 0
+        for is_closed in reversed(closed):
+            if not is_closed:
+                break
+            current_streak += 1
+
+        return ClosureTrend(
+            user_id=user_id,
+            as_of=as_of,
+            days_recorded=len(closed),
+            rolling_closure_rate=rolling_closure_rate,
+            carry_over=carry_over,
+            current_streak=current_streak,
+            longest_streak=longest_streak,
+        )
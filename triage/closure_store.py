@@ -0,0 +1,632 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Indexed storage for daily closure records."""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from triage.models import ClosureRecord
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# User ID used when closure records are not tracked per user
+DEFAULT_USER_ID = "default"
+
+# Daily totals row: (user_id, plan_date, closure_rate, completed_priorities, total_priorities, carried_over)
+DailyTotals = Tuple[str, date, float, int, int, int]
+
+
+class ClosureStore(ABC):
+    """
+    Storage backend for closure records.
+
+    Records are kept per user and plan date. Completions are appended as
+    individual rows, and history is answered with a single range query.
+    """
+
+    @abstractmethod
+    def save_record(self, record: ClosureRecord, user_id: str = DEFAULT_USER_ID) -> None:
+        """
+        Insert or replace the closure record of a plan date.
+
+        Args:
+            record: Closure record to save
+            user_id: Owner of the plan
+        """
+        pass
+
+    @abstractmethod
+    def load_record(self, plan_date: date, user_id: str = DEFAULT_USER_ID) -> Optional[ClosureRecord]:
+        """
+        Load the closure record of a plan date.
+
+        Args:
+            plan_date: Date of the plan
+            user_id: Owner of the plan
+
+        Returns:
+            ClosureRecord if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    def record_completion(
+        self, task_key: str, completion_date: date, was_priority: bool, user_id: str = DEFAULT_USER_ID
+    ) -> None:
+        """
+        Append a task completion and update the closure record of that date.
+
+        Args:
+            task_key: JIRA key of completed task
+            completion_date: Date task was completed
+            was_priority: Whether task was a priority task
+            user_id: Owner of the plan
+        """
+        pass
+
+    @abstractmethod
+    def load_history(
+        self, start_date: date, end_date: date, user_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, List[ClosureRecord]]:
+        """
+        Load closure records of a date range, grouped by user.
+
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+            user_ids: Users to load (default: all users)
+
+        Returns:
+            Dictionary mapping user IDs to their records in date order
+        """
+        pass
+
+    def load_range(self, start_date: date, end_date: date, user_id: str = DEFAULT_USER_ID) -> List[ClosureRecord]:
+        """
+        Load one user's closure records of a date range.
+
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+            user_id: Owner of the plans
+
+        Returns:
+            Closure records in date order
+        """
+        return self.load_history(start_date, end_date, [user_id]).get(user_id, [])
+
+    def load_daily_totals(
+        self, start_date: date, end_date: date, user_ids: Optional[Iterable[str]] = None
+    ) -> List[DailyTotals]:
+        """
+        Load the numeric columns of closure records for analytics.
+
+        Backends override this with a query that skips building full records.
+
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+            user_ids: Users to load (default: all users)
+
+        Returns:
+            List of (user_id, plan_date, closure_rate, completed, total, carried_over) tuples,
+            where carried_over is the number of incomplete priorities
+        """
+        return [
+            (user_id, r.date, r.closure_rate, r.completed_priorities, r.total_priorities, len(r.incomplete_tasks))
+            for user_id, records in self.load_history(start_date, end_date, user_ids).items()
+            for r in records
+        ]
+
+    def close(self) -> None:
+        """Release resources held by the store."""
+        pass
+
+    @staticmethod
+    def _apply_completion(data: Dict[str, Any], task_key: str) -> None:
+        """
+        Count a priority completion in a stored record.
+
+        Args:
+            data: Record fields (completed_priorities, total_priorities, incomplete_tasks, closure_rate)
+            task_key: JIRA key of completed task
+        """
+        data["completed_priorities"] += 1
+        if task_key in data["incomplete_tasks"]:
+            data["incomplete_tasks"].remove(task_key)
+
+        total = data["total_priorities"]
+        data["closure_rate"] = data["completed_priorities"] / total if total > 0 else 0.0
+
+
+class SQLiteClosureStore(ClosureStore):
+    """
+    Closure store backed by a local SQLite database.
+
+    This is the default backend. A single connection is shared between
+    threads and guarded by a lock.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS closure_records (
+        user_id TEXT NOT NULL,
+        plan_date TEXT NOT NULL,
+        total_priorities INTEGER NOT NULL,
+        completed_priorities INTEGER NOT NULL,
+        closure_rate REAL NOT NULL,
+        incomplete_tasks TEXT NOT NULL DEFAULT '[]',
+        out_of_scope_tasks TEXT NOT NULL DEFAULT '[]',
+        PRIMARY KEY (user_id, plan_date)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_closure_records_date
+    ON closure_records(plan_date);
+
+    CREATE TABLE IF NOT EXISTS closure_completions (
+        user_id TEXT NOT NULL,
+        task_key TEXT NOT NULL,
+        completion_date TEXT NOT NULL,
+        was_priority INTEGER NOT NULL,
+        recorded_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_closure_completions_user_date
+    ON closure_completions(user_id, completion_date);
+    """
+
+    def __init__(self, database_path: str):
+        """
+        Open (and create if needed) a SQLite closure store.
+
+        Args:
+            database_path: Path of the database file, or ":memory:"
+        """
+        if database_path != ":memory:":
+            Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.database_path = database_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(database_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+
+        with self._lock, self._conn:
+            self._conn.executescript(self.SCHEMA)
+
+        logger.info(f"SQLite closure store opened at: {database_path}")
+
+    def save_record(self, record: ClosureRecord, user_id: str = DEFAULT_USER_ID) -> None:
+        """Insert or replace the closure record of a plan date."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO closure_records (user_id, plan_date, total_priorities, "
+                "completed_priorities, closure_rate, incomplete_tasks, out_of_scope_tasks) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    user_id,
+                    record.date.isoformat(),
+                    record.total_priorities,
+                    record.completed_priorities,
+                    record.closure_rate,
+                    json.dumps(record.incomplete_tasks),
+                    json.dumps(record.out_of_scope_tasks),
+                ),
+            )
+
+    def load_record(self, plan_date: date, user_id: str = DEFAULT_USER_ID) -> Optional[ClosureRecord]:
+        """Load the closure record of a plan date."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM closure_records WHERE user_id = ? AND plan_date = ?",
+                (user_id, plan_date.isoformat()),
+            ).fetchone()
+
+        return self._row_to_record(row) if row else None
+
+    def record_completion(
+        self, task_key: str, completion_date: date, was_priority: bool, user_id: str = DEFAULT_USER_ID
+    ) -> None:
+        """Append a task completion and update the closure record of that date."""
+        plan_date = completion_date.isoformat()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO closure_completions (user_id, task_key, completion_date, was_priority) "
+                "VALUES (?, ?, ?, ?)",
+                (user_id, task_key, plan_date, int(was_priority)),
+            )
+
+            if not was_priority:
+                return
+
+            row = self._conn.execute(
+                "SELECT total_priorities, completed_priorities, incomplete_tasks FROM closure_records "
+                "WHERE user_id = ? AND plan_date = ?",
+                (user_id, plan_date),
+            ).fetchone()
+            if row is None:
+                return
+
+            data = {
+                "total_priorities": row["total_priorities"],
+                "completed_priorities": row["completed_priorities"],
+                "incomplete_tasks": json.loads(row["incomplete_tasks"]),
+            }
+            self._apply_completion(data, task_key)
+
+            self._conn.execute(
+                "UPDATE closure_records SET completed_priorities = ?, closure_rate = ?, incomplete_tasks = ? "
+                "WHERE user_id = ? AND plan_date = ?",
+                (
+                    data["completed_priorities"],
+                    data["closure_rate"],
+                    json.dumps(data["incomplete_tasks"]),
+                    user_id,
+                    plan_date,
+                ),
+            )
+
+    def load_history(
+        self, start_date: date, end_date: date, user_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, List[ClosureRecord]]:
+        """Load closure records of a date range, grouped by user."""
+        query = "SELECT * FROM closure_records WHERE plan_date BETWEEN ? AND ?"
+        params: List[Any] = [start_date.isoformat(), end_date.isoformat()]
+
+        if user_ids is not None:
+            user_ids = list(user_ids)
+            query += f" AND user_id IN ({', '.join('?' for _ in user_ids)})"
+            params.extend(user_ids)
+
+        query += " ORDER BY user_id, plan_date"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        history: Dict[str, List[ClosureRecord]] = {}
+        for row in rows:
+            history.setdefault(row["user_id"], []).append(self._row_to_record(row))
+        return history
+
+    def load_daily_totals(
+        self, start_date: date, end_date: date, user_ids: Optional[Iterable[str]] = None
+    ) -> List[DailyTotals]:
+        """Load the numeric columns of closure records for analytics."""
+        query = (
+            "SELECT user_id, plan_date, closure_rate, completed_priorities, total_priorities, "
+            "json_array_length(incomplete_tasks) FROM closure_records WHERE plan_date BETWEEN ? AND ?"
+        )
+        params: List[Any] = [start_date.isoformat(), end_date.isoformat()]
+
+        if user_ids is not None:
+            user_ids = list(user_ids)
+            query += f" AND user_id IN ({', '.join('?' for _ in user_ids)})"
+            params.extend(user_ids)
+
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            cursor.row_factory = None
+            rows = cursor.fetchall()
+
+        parse = date.fromisoformat
+        return [(row[0], parse(row[1]), row[2], row[3], row[4], row[5]) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _row_to_record(row: sqlite3.Row) -> ClosureRecord:
+        """Convert a closure_records row to a ClosureRecord."""
+        return ClosureRecord(
+            date=date.fromisoformat(row["plan_date"]),
+            total_priorities=row["total_priorities"],
+            completed_priorities=row["completed_priorities"],
+            closure_rate=row["closure_rate"],
+            incomplete_tasks=json.loads(row["incomplete_tasks"]),
+            out_of_scope_tasks=json.loads(row["out_of_scope_tasks"]),
+        )
+
+
+class PostgresClosureStore(ClosureStore):
+    """
+    Closure store backed by PostgreSQL through an asyncpg pool.
+
+    The store exposes the same synchronous interface as the SQLite backend.
+    Queries are submitted to the event loop that owns the pool: either an
+    existing pool and its (running) loop are passed in, or the store creates
+    a pool on a private loop thread from a database URL. Methods must not be
+    called from the pool's own loop thread.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS closure_records (
+        user_id VARCHAR(255) NOT NULL,
+        plan_date DATE NOT NULL,
+        total_priorities INTEGER NOT NULL,
+        completed_priorities INTEGER NOT NULL,
+        closure_rate DOUBLE PRECISION NOT NULL,
+        incomplete_tasks JSONB NOT NULL DEFAULT '[]',
+        out_of_scope_tasks JSONB NOT NULL DEFAULT '[]',
+        PRIMARY KEY (user_id, plan_date)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_closure_records_date
+    ON closure_records(plan_date);
+
+    CREATE TABLE IF NOT EXISTS closure_completions (
+        id SERIAL PRIMARY KEY,
+        user_id VARCHAR(255) NOT NULL,
+        task_key VARCHAR(255) NOT NULL,
+        completion_date DATE NOT NULL,
+        was_priority BOOLEAN NOT NULL,
+        recorded_at TIMESTAMP NOT NULL DEFAULT NOW()
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_closure_completions_user_date
+    ON closure_completions(user_id, completion_date);
+    """
+
+    # Maximum time to wait for a single store operation in seconds
+    OPERATION_TIMEOUT_SECONDS = 30
+
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        pool: Optional[Any] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        """
+        Initialize a PostgreSQL closure store.
+
+        Args:
+            database_url: PostgreSQL connection URL, used when no pool is given
+            pool: Existing asyncpg pool (optional)
+            loop: Running event loop that owns ``pool`` (required with ``pool``)
+
+        Raises:
+            ValueError: If neither database_url nor pool is given, or pool is given without loop
+        """
+        if pool is None and not database_url:
+            raise ValueError("Either database_url or pool is required")
+        if pool is not None and loop is None:
+            raise ValueError("loop is required when an existing pool is given")
+
+        self.database_url = database_url
+        self._pool = pool
+        self._loop = loop
+        self._owns_loop = loop is None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._schema_ready = False
+
+        logger.info("Initialized PostgresClosureStore")
+
+    def run(self, coro) -> Any:
+        """Run a coroutine on the pool's loop and wait for the result."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._loop.run_forever, name="ClosureStoreLoop", daemon=True)
+            self._loop_thread.start()
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return future.result(timeout=self.OPERATION_TIMEOUT_SECONDS)
+
+    async def acquire_pool(self):
+        """Get the pool, creating it and the schema on first use."""
+        if self._pool is None:
+            import asyncpg
+
+            logger.info("Creating database connection pool for closure records")
+            self._pool = await asyncpg.create_pool(self.database_url, min_size=1, max_size=5, command_timeout=30)
+
+        if not self._schema_ready:
+            async with self._pool.acquire() as conn:
+                await conn.execute(self.SCHEMA)
+            self._schema_ready = True
+
+        return self._pool
+
+    def save_record(self, record: ClosureRecord, user_id: str = DEFAULT_USER_ID) -> None:
+        """Insert or replace the closure record of a plan date."""
+
+        async def _save():
+            pool = await self.acquire_pool()
+            await pool.execute(
+                """
+                INSERT INTO closure_records
+                    (user_id, plan_date, total_priorities, completed_priorities, closure_rate,
+                     incomplete_tasks, out_of_scope_tasks)
+                VALUES ($1, $2, $3, $4, $5, $6::jsonb, $7::jsonb)
+                ON CONFLICT (user_id, plan_date) DO UPDATE SET
+                    total_priorities = EXCLUDED.total_priorities,
+                    completed_priorities = EXCLUDED.completed_priorities,
+                    closure_rate = EXCLUDED.closure_rate,
+                    incomplete_tasks = EXCLUDED.incomplete_tasks,
+                    out_of_scope_tasks = EXCLUDED.out_of_scope_tasks
+                """,
+                user_id,
+                record.date,
+                record.total_priorities,
+                record.completed_priorities,
+                record.closure_rate,
+                json.dumps(record.incomplete_tasks),
+                json.dumps(record.out_of_scope_tasks),
+            )
+
+        self.run(_save())
+
+    def load_record(self, plan_date: date, user_id: str = DEFAULT_USER_ID) -> Optional[ClosureRecord]:
+        """Load the closure record of a plan date."""
+
+        async def _load():
+            pool = await self.acquire_pool()
+            return await pool.fetchrow(
+                "SELECT * FROM closure_records WHERE user_id = $1 AND plan_date = $2", user_id, plan_date
+            )
+
+        row = self.run(_load())
+        return self._row_to_record(row) if row else None
+
+    def record_completion(
+        self, task_key: str, completion_date: date, was_priority: bool, user_id: str = DEFAULT_USER_ID
+    ) -> None:
+        """Append a task completion and update the closure record of that date."""
+
+        async def _record():
+            pool = await self.acquire_pool()
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        "INSERT INTO closure_completions (user_id, task_key, completion_date, was_priority) "
+                        "VALUES ($1, $2, $3, $4)",
+                        user_id,
+                        task_key,
+                        completion_date,
+                        was_priority,
+                    )
+
+                    if not was_priority:
+                        return
+
+                    row = await conn.fetchrow(
+                        "SELECT total_priorities, completed_priorities, incomplete_tasks FROM closure_records "
+                        "WHERE user_id = $1 AND plan_date = $2 FOR UPDATE",
+                        user_id,
+                        completion_date,
+                    )
+                    if row is None:
+                        return
+
+                    data = {
+                        "total_priorities": row["total_priorities"],
+                        "completed_priorities": row["completed_priorities"],
+                        "incomplete_tasks": json.loads(row["incomplete_tasks"]),
+                    }
+                    self._apply_completion(data, task_key)
+
+                    await conn.execute(
+                        "UPDATE closure_records SET completed_priorities = $1, closure_rate = $2, "
+                        "incomplete_tasks = $3::jsonb WHERE user_id = $4 AND plan_date = $5",
+                        data["completed_priorities"],
+                        data["closure_rate"],
+                        json.dumps(data["incomplete_tasks"]),
+                        user_id,
+                        completion_date,
+                    )
+
+        self.run(_record())
+
+    def load_history(
+        self, start_date: date, end_date: date, user_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, List[ClosureRecord]]:
+        """Load closure records of a date range, grouped by user."""
+        user_list = list(user_ids) if user_ids is not None else None
+
+        async def _load():
+            pool = await self.acquire_pool()
+            if user_list is None:
+                return await pool.fetch(
+                    "SELECT * FROM closure_records WHERE plan_date BETWEEN $1 AND $2 ORDER BY user_id, plan_date",
+                    start_date,
+                    end_date,
+                )
+            return await pool.fetch(
+                "SELECT * FROM closure_records WHERE plan_date BETWEEN $1 AND $2 AND user_id = ANY($3::varchar[]) "
+                "ORDER BY user_id, plan_date",
+                start_date,
+                end_date,
+                user_list,
+            )
+
+        history: Dict[str, List[ClosureRecord]] = {}
+        for row in self.run(_load()):
+            history.setdefault(row["user_id"], []).append(self._row_to_record(row))
+        return history
+
+    def load_daily_totals(
+        self, start_date: date, end_date: date, user_ids: Optional[Iterable[str]] = None
+    ) -> List[DailyTotals]:
+        """Load the numeric columns of closure records for analytics."""
+        user_list = list(user_ids) if user_ids is not None else None
+        query = (
+            "SELECT user_id, plan_date, closure_rate, completed_priorities, total_priorities, "
+            "jsonb_array_length(incomplete_tasks) AS carried_over FROM closure_records "
+            "WHERE plan_date BETWEEN $1 AND $2"
+        )
+
+        async def _load():
+            pool = await self.acquire_pool()
+            if user_list is None:
+                return await pool.fetch(query, start_date, end_date)
+            return await pool.fetch(query + " AND user_id = ANY($3::varchar[])", start_date, end_date, user_list)
+
+        return [tuple(row) for row in self.run(_load())]
+
+    def close(self) -> None:
+        """Close the pool (if created by the store) and stop the private loop."""
+        if self._owns_loop and self._loop is not None:
+            if self._pool is not None:
+                self.run(self._pool.close())
+                self._pool = None
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._loop_thread:
+                self._loop_thread.join(timeout=5.0)
+            self._loop = None
+
+    @staticmethod
+    def _row_to_record(row: Any) -> ClosureRecord:
+        """Convert a closure_records row to a ClosureRecord."""
+
+        def _keys(value: Any) -> List[str]:
+            # asyncpg returns JSONB as text unless a codec is registered
+            return list(json.loads(value) if isinstance(value, str) else value)
+
+        return ClosureRecord(
+            date=row["plan_date"],
+            total_priorities=row["total_priorities"],
+            completed_priorities=row["completed_priorities"],
+            closure_rate=row["closure_rate"],
+            incomplete_tasks=_keys(row["incomplete_tasks"]),
+            out_of_scope_tasks=_keys(row["out_of_scope_tasks"]),
+        )
+
+
+# PostgreSQL stores of the process by database URL, so every caller shares one pool
+_postgres_stores: Dict[str, PostgresClosureStore] = {}
+_postgres_stores_lock = threading.Lock()
+
+
+def create_closure_store(closure_tracking_dir: str, database_url: Optional[str] = None) -> ClosureStore:
+    """
+    Create the closure store for a deployment.
+
+    PostgreSQL stores are shared per database URL within the process, so the
+    handlers of a Lambda container (and the plan cache and operation store
+    built on top of the closure store) reuse a single asyncpg pool instead of
+    each opening their own.
+
+    Args:
+        closure_tracking_dir: Directory of the SQLite database file
+        database_url: PostgreSQL connection URL; when set, records are stored in PostgreSQL
+
+    Returns:
+        PostgresClosureStore if database_url is set, SQLiteClosureStore otherwise
+    """
+    if database_url:
+        with _postgres_stores_lock:
+            store = _postgres_stores.get(database_url)
+            if store is None:
+                store = _postgres_stores[database_url] = PostgresClosureStore(database_url=database_url)
+            return store
+
+    return SQLiteClosureStore(str(Path(closure_tracking_dir) / "closure.db"))
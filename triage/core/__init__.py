@@ -9,11 +9,24 @@ Contains core business logic APIs and event infrastructure for plugin integratio
 """
 
 from triage.core.actions_api import CoreActionResult, CoreActionsAPI
-from triage.core.event_bus import Event, EventBus
+from triage.core.event_bus import (
+    CircuitBreaker,
+    Event,
+    EventBus,
+    EventBusBridge,
+    EventQueue,
+    EventQueueMetrics,
+    HandlerMetrics,
+)
 
 __all__ = [
     "CoreActionsAPI",
     "CoreActionResult",
     "EventBus",
+    "EventBusBridge",
+    "EventQueue",
+    "EventQueueMetrics",
+    "HandlerMetrics",
+    "CircuitBreaker",
     "Event",
 ]
@@ -15,6 +15,9 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Any, Dict, List, Optional
 
+from triage.models import ClosureTrend
+from triage.plan_renderer import PlanRenderer
+
 
 @dataclass
 class CoreActionResult:
@@ -57,18 +60,27 @@ class CoreActionsAPI:
         self.logger = logging.getLogger(__name__)
 
     async def generate_plan(
-        self, user_id: str, plan_date: Optional[date] = None, closure_rate: Optional[float] = None
+        self,
+        user_id: str,
+        plan_date: Optional[date] = None,
+        closure_rate: Optional[float] = None,
+        other_tasks_limit: Optional[int] = None,
+        other_tasks_cursor: Optional[str] = None,
     ) -> CoreActionResult:
         """
         Generate a daily plan for the user.
 
         Fetches active tasks from JIRA, classifies them, and generates a
-        structured daily plan with up to 3 priority tasks.
+        structured daily plan with up to 3 priority tasks. With
+        other_tasks_limit set, the Markdown only lists one page of the other
+        tasks and data["other_tasks_cursor"] points to the next page.
 
         Args:
             user_id: User identifier
             plan_date: Date for the plan (defaults to today)
             closure_rate: Previous day's closure rate (optional)
+            other_tasks_limit: Maximum number of other tasks in the Markdown (default: all)
+            other_tasks_cursor: Cursor of the first other task in the Markdown (default: first page)
 
         Returns:
             CoreActionResult: Result with plan data or error
@@ -120,22 +132,62 @@ class CoreActionsAPI:
             self.logger.info(f"Fetching active tasks for user: {user_id}")
             issues = await self._fetch_user_tasks(user_id)
 
-            # Classify tasks
-            self.logger.info(f"Classifying {len(issues)} tasks")
-            classified = [self.task_classifier.classify_task(issue) for issue in issues]
-
-            # Generate daily plan
-            self.logger.info("Generating daily plan")
+            # Generate daily plan; the generator classifies the tasks after syncing
+            # its dependency graph with them
+            self.logger.info(f"Generating daily plan from {len(issues)} tasks")
             plan = self.plan_generator.generate_daily_plan(
-                classified_tasks=classified, plan_date=plan_date, previous_closure_rate=closure_rate
+                issues=issues, plan_date=plan_date, previous_closure_rate=closure_rate
             )
 
-            return CoreActionResult(success=True, data={"plan": plan, "markdown": plan.to_markdown()})
+            rendered = PlanRenderer.default().render(
+                plan,
+                formats=("markdown",),
+                other_tasks_limit=other_tasks_limit,
+                other_tasks_cursor=other_tasks_cursor,
+            )
+            return CoreActionResult(
+                success=True,
+                data={"plan": plan, "markdown": rendered.markdown, "other_tasks_cursor": rendered.next_cursor},
+            )
 
         except Exception as e:
             self.logger.error(f"Plan generation failed: {e}", exc_info=True)
             return CoreActionResult(success=False, error=str(e), error_code="PLAN_GENERATION_FAILED")
 
+    async def get_stored_plan(self, user_id: str, plan_date: Optional[date] = None) -> CoreActionResult:
+        """
+        Get the stored plan of a date without contacting JIRA.
+
+        Args:
+            user_id: User identifier
+            plan_date: Date of the plan (defaults to today)
+
+        Returns:
+            CoreActionResult: Result with data["plan"], or error_code PLAN_NOT_FOUND if no plan is stored
+        """
+        if not user_id or not isinstance(user_id, str) or not user_id.strip():
+            return CoreActionResult(
+                success=False,
+                error="user_id is required and must be a non-empty string",
+                error_code="INVALID_USER_ID",
+            )
+
+        if not self.plan_generator:
+            return CoreActionResult(
+                success=False, error="Core components not initialized", error_code="NOT_INITIALIZED"
+            )
+
+        try:
+            plan = self.plan_generator.get_stored_plan(plan_date or date.today())
+        except Exception as e:
+            self.logger.error(f"Loading stored plan failed: {e}", exc_info=True)
+            return CoreActionResult(success=False, error=str(e), error_code="PLAN_LOAD_FAILED")
+
+        if plan is None:
+            return CoreActionResult(success=False, error="No stored plan for this date", error_code="PLAN_NOT_FOUND")
+
+        return CoreActionResult(success=True, data={"plan": plan})
+
     async def approve_plan(
         self, user_id: str, plan_date: date, approved: bool, feedback: Optional[str] = None
     ) -> CoreActionResult:
@@ -313,13 +365,110 @@ class CoreActionsAPI:
             self.logger.error(f"Task decomposition failed: {e}", exc_info=True)
             return CoreActionResult(success=False, error=str(e), error_code="DECOMPOSITION_FAILED")
 
-    async def get_status(self, user_id: str, plan_date: Optional[date] = None) -> CoreActionResult:
+    async def decompose_tasks(
+        self, user_id: str, task_keys: List[str], create_keys: Optional[List[str]] = None
+    ) -> CoreActionResult:
+        """
+        Decompose several long-running tasks at once.
+
+        All parents are fetched with one search and proposed in one pass. The
+        subtasks of the parents listed in create_keys (the approved ones) are
+        then created in JIRA concurrently across parents, in order within each
+        parent. Failures are reported per parent.
+
+        Args:
+            user_id: User identifier
+            task_keys: JIRA keys of the tasks to decompose
+            create_keys: Keys of the tasks whose subtasks should be created (default: none)
+
+        Returns:
+            CoreActionResult: Result with one entry per task, in task_keys order
+        """
+        try:
+            # Validate user_id
+            if not user_id or not isinstance(user_id, str) or not user_id.strip():
+                return CoreActionResult(
+                    success=False,
+                    error="user_id is required and must be a non-empty string",
+                    error_code="INVALID_USER_ID",
+                )
+
+            # Validate task_keys
+            if (
+                not isinstance(task_keys, (list, tuple))
+                or not task_keys
+                or not all(isinstance(key, str) and key.strip() for key in task_keys)
+            ):
+                return CoreActionResult(
+                    success=False,
+                    error="task_keys must be a non-empty list of keys in format PROJECT-123",
+                    error_code="INVALID_TASK_KEY",
+                )
+
+            create_keys = set(create_keys or [])
+            unknown = create_keys.difference(task_keys)
+            if unknown:
+                return CoreActionResult(
+                    success=False,
+                    error=f"create_keys must be a subset of task_keys: {', '.join(sorted(unknown))}",
+                    error_code="INVALID_TASK_KEY",
+                )
+
+            if not self.jira_client or not self.plan_generator:
+                return CoreActionResult(
+                    success=False, error="Core components not initialized", error_code="NOT_INITIALIZED"
+                )
+
+            task_keys = list(dict.fromkeys(task_keys))
+            self.logger.info(f"Decomposing {len(task_keys)} tasks for user {user_id}")
+
+            # Fetch all parents with one search and propose all subtasks in one pass
+            tasks = self.jira_client.fetch_tasks_by_keys(task_keys)
+            proposals = self.plan_generator.propose_decompositions(tasks[key] for key in task_keys if key in tasks)
+
+            # Create the approved decompositions
+            created = self.plan_generator.create_decompositions(
+                {key: specs for key, specs in proposals.items() if key in create_keys}
+            )
+
+            results = []
+            for key in task_keys:
+                subtasks = proposals.get(key, [])
+                result = created.get(key)
+                results.append(
+                    {
+                        "task_key": key,
+                        "subtasks": [self._subtask_to_dict(spec) for spec in subtasks],
+                        "count": len(subtasks),
+                        "created_keys": result.created_keys if result else [],
+                        "error": "Task not found" if key not in tasks else (result.error if result else None),
+                    }
+                )
+
+            return CoreActionResult(
+                success=True,
+                data={
+                    "results": results,
+                    "count": sum(r["count"] for r in results),
+                    "created": sum(len(r["created_keys"]) for r in results),
+                },
+            )
+
+        except Exception as e:
+            self.logger.error(f"Batch task decomposition failed: {e}", exc_info=True)
+            return CoreActionResult(success=False, error=str(e), error_code="DECOMPOSITION_FAILED")
+
+    async def get_status(
+        self, user_id: str, plan_date: Optional[date] = None, include_trends: bool = False
+    ) -> CoreActionResult:
         """
         Get current plan status and task progress.
 
         Args:
             user_id: User identifier
             plan_date: Date of the plan (defaults to today)
+            include_trends: Add the user's and the team's 7/30/90-day closure trends,
+                streaks and carry-over (default: False)
 
         Returns:
             CoreActionResult: Result with status information
@@ -347,6 +496,9 @@ class CoreActionsAPI:
             # Fetch current plan and task statuses
             status = await self._fetch_plan_status(user_id, plan_date)
 
+            if include_trends:
+                status["trends"] = await self._fetch_closure_trends(user_id, plan_date)
+
             return CoreActionResult(success=True, data=status)
 
         except Exception as e:
@@ -433,15 +585,25 @@ class CoreActionsAPI:
         subtask_specs = self.plan_generator.propose_decomposition(task)
 
         # Convert SubtaskSpec objects to dictionaries
-        return [
-            {
-                "summary": spec.summary,
-                "description": spec.description,
-                "estimated_days": spec.estimated_days,
-                "order": spec.order,
-            }
-            for spec in subtask_specs
-        ]
+        return [self._subtask_to_dict(spec) for spec in subtask_specs]
+
+    @staticmethod
+    def _subtask_to_dict(spec: Any) -> Dict[str, Any]:
+        """
+        Convert a subtask specification to a dictionary.
+
+        Args:
+            spec: SubtaskSpec to convert
+
+        Returns:
+            Dictionary with summary, description, estimated_days and order
+        """
+        return {
+            "summary": spec.summary,
+            "description": spec.description,
+            "estimated_days": spec.estimated_days,
+            "order": spec.order,
+        }
 
     async def _process_approval(
         self, user_id: str, plan_date: date, approved: bool, feedback: Optional[str]
@@ -463,6 +625,10 @@ class CoreActionsAPI:
         # 2. Trigger notifications
         # 3. Update plan state
 
+        # The stored plan is regenerated on the next request
+        if self.plan_generator:
+            self.plan_generator.invalidate_stored_plan(plan_date)
+
         # For now, return the approval information
         result = {
             "user_id": user_id,
@@ -511,6 +677,34 @@ class CoreActionsAPI:
             "message": "No plan found for this date",
         }
 
+    async def _fetch_closure_trends(self, user_id: str, as_of: date) -> Dict[str, Any]:
+        """
+        Fetch rolling closure metrics of a user and of the team.
+
+        Args:
+            user_id: User identifier
+            as_of: Last day included in the windows
+
+        Returns:
+            Dictionary with the user's rolling closure rates, carry-over counts
+            and streaks, and the same metrics of the team under "team"
+        """
+        trends = self._trend_to_dict(self.plan_generator.get_closure_trend(as_of, user_id=user_id))
+        trends["team"] = self._trend_to_dict(self.plan_generator.get_team_closure_trend(as_of))
+        return trends
+
+    @staticmethod
+    def _trend_to_dict(trend: ClosureTrend) -> Dict[str, Any]:
+        """Convert a ClosureTrend to a JSON-serializable dictionary."""
+        return {
+            "as_of": trend.as_of.isoformat(),
+            "days_recorded": trend.days_recorded,
+            "rolling_closure_rate": {f"{window}d": rate for window, rate in trend.rolling_closure_rate.items()},
+            "carry_over": {f"{window}d": count for window, count in trend.carry_over.items()},
+            "current_streak": trend.current_streak,
+            "longest_streak": trend.longest_streak,
+        }
+
     async def _update_user_settings(self, user_id: str, settings: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update user settings.
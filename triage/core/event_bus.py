@@ -11,10 +11,15 @@ task blocked, etc.) that plugins can subscribe to and react to.
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import threading
+import time
+import weakref
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
 
 @dataclass
@@ -30,12 +35,670 @@ class Event:
     event_data: Dict[str, Any]  # Event payload with context
     timestamp: datetime = field(default_factory=datetime.now)
     source: str = "triage_core"  # Source of the event
+    key: Optional[str] = None  # Subject of the event; queued events with the same type and key can be coalesced
 
 
 # Type alias for event handler functions
 EventHandler = Callable[[Event], Awaitable[None]]
 
 
+@dataclass(frozen=True)
+class EventQueueMetrics:
+    """Current state of an event queue."""
+
+    depth: int  # Events waiting to be processed
+    high_priority_depth: int  # Events waiting in the high-priority lane
+    max_size: int  # Capacity of the queue, 0 when unbounded
+    high_water: int  # Largest depth seen
+    dropped: Dict[str, int]  # Events dropped by overflow policies, per event type
+    coalesced: Dict[str, int]  # Events merged into a queued event, per event type
+
+
+class EventQueue(asyncio.Queue):
+    """
+    Bounded queue of events with priority lanes and per-event-type overflow policies.
+
+    Events of the high-priority types go to a separate lane that is drained
+    first. To keep the normal lane from starving, at most
+    ``high_lane_burst`` high-priority events are taken in a row while normal
+    events are waiting. Both lanes share the capacity of the queue.
+
+    When the queue is full, the overflow policy of the event type decides
+    what happens to a new event:
+
+    - block: the producer waits until there is room (backpressure)
+    - drop_oldest: the oldest queued event of the same type is discarded
+    - drop_newest: the new event is discarded
+    - coalesce: a queued event of the same type and key is replaced by the
+      new one, keeping its place in the queue; this also applies when the
+      queue is not full
+
+    drop_oldest and coalesce wait like block when there is no queued event of
+    the same type to discard or replace, so one event type never evicts
+    another.
+    """
+
+    # Overflow policies
+    OVERFLOW_BLOCK = "block"
+    OVERFLOW_DROP_OLDEST = "drop_oldest"
+    OVERFLOW_DROP_NEWEST = "drop_newest"
+    OVERFLOW_COALESCE = "coalesce"
+    OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST, OVERFLOW_COALESCE)
+
+    # Number of drops of an event type between two warnings
+    DROP_LOG_INTERVAL = 1000
+
+    # Lanes, in the order they are drained
+    LANE_HIGH = 0
+    LANE_NORMAL = 1
+
+    # Default number of high-priority events taken in a row while normal events wait
+    DEFAULT_HIGH_LANE_BURST = 4
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow_policies: Optional[Dict[str, str]] = None,
+        default_policy: str = OVERFLOW_BLOCK,
+        high_priority_event_types: Iterable[str] = (),
+        high_lane_burst: int = DEFAULT_HIGH_LANE_BURST,
+    ):
+        """
+        Initialize the event queue.
+
+        Args:
+            maxsize: Maximum number of queued events, 0 for unbounded (default: 0)
+            overflow_policies: Overflow policy per event type (optional)
+            default_policy: Overflow policy of other event types (default: block)
+            high_priority_event_types: Event types queued in the high-priority lane (default: none)
+            high_lane_burst: High-priority events taken in a row while normal events wait (default: 4)
+
+        Raises:
+            ValueError: If maxsize is negative, high_lane_burst is not positive or a policy is unknown
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative, got {maxsize}")
+        if high_lane_burst < 1:
+            raise ValueError(f"high_lane_burst must be at least 1, got {high_lane_burst}")
+        policies = {**(overflow_policies or {}), None: default_policy}
+        invalid = {
+            event_type: policy for event_type, policy in policies.items() if policy not in self.OVERFLOW_POLICIES
+        }
+        if invalid:
+            raise ValueError(f"Unknown overflow policies {invalid}, expected one of {self.OVERFLOW_POLICIES}")
+
+        super().__init__(maxsize)
+        self.high_priority_event_types = frozenset(high_priority_event_types)
+        self.high_lane_burst = high_lane_burst
+        self.overflow_policies = dict(overflow_policies or {})
+        self.default_policy = default_policy
+        self.high_water = 0
+        self.dropped: Counter[str] = Counter()
+        self.coalesced: Counter[str] = Counter()
+        self.logger = logging.getLogger(__name__)
+
+    def _init(self, maxsize: int) -> None:
+        """Create the lanes; called by asyncio.Queue.__init__."""
+        self._lanes: Tuple[Deque[Event], Deque[Event]] = (deque(), deque())
+        # High-priority events taken in a row while normal events were waiting
+        self._high_streak = 0
+
+    def _put(self, event: Event) -> None:
+        """Append an event to its lane."""
+        self._lanes[self.lane_for(event.event_type)].append(event)
+
+    def _get(self) -> Event:
+        """Take the next event, draining the high-priority lane first within its burst."""
+        high, normal = self._lanes
+        if high and not normal:
+            self._high_streak = 0
+            return high.popleft()
+        if high and self._high_streak < self.high_lane_burst:
+            self._high_streak += 1
+            return high.popleft()
+
+        self._high_streak = 0
+        return normal.popleft()
+
+    def qsize(self) -> int:
+        """Number of events in both lanes."""
+        return sum(len(lane) for lane in self._lanes)
+
+    def empty(self) -> bool:
+        """Check whether both lanes are empty."""
+        return not any(self._lanes)
+
+    def lane_for(self, event_type: str) -> int:
+        """
+        Get the lane of an event type.
+
+        Args:
+            event_type: Type of event
+
+        Returns:
+            int: LANE_HIGH or LANE_NORMAL
+        """
+        return self.LANE_HIGH if event_type in self.high_priority_event_types else self.LANE_NORMAL
+
+    def policy_for(self, event_type: str) -> str:
+        """
+        Get the overflow policy of an event type.
+
+        Args:
+            event_type: Type of event
+
+        Returns:
+            str: Overflow policy
+        """
+        return self.overflow_policies.get(event_type, self.default_policy)
+
+    async def put(self, event: Event) -> bool:
+        """
+        Queue an event, applying its overflow policy.
+
+        Args:
+            event: Event to queue
+
+        Returns:
+            bool: True if the event was queued or merged into a queued event,
+            False if it was dropped
+        """
+        policy = self.policy_for(event.event_type)
+
+        if policy == self.OVERFLOW_COALESCE and self._replace(event):
+            self.coalesced[event.event_type] += 1
+            return True
+
+        if self.full():
+            if policy == self.OVERFLOW_DROP_NEWEST:
+                self._record_drop(event.event_type)
+                return False
+            if policy == self.OVERFLOW_DROP_OLDEST:
+                oldest = self._remove_oldest(event.event_type)
+                if oldest is not None:
+                    self._record_drop(oldest.event_type)
+
+        await super().put(event)
+        self.high_water = max(self.high_water, self.qsize())
+        return True
+
+    def _replace(self, event: Event) -> bool:
+        """
+        Replace a queued event with the same type and key.
+
+        Args:
+            event: New event
+
+        Returns:
+            bool: True if a queued event was replaced
+        """
+        lane = self._lanes[self.lane_for(event.event_type)]
+        for i, queued in enumerate(lane):
+            if queued.event_type == event.event_type and queued.key == event.key:
+                lane[i] = event
+                return True
+        return False
+
+    def _remove_oldest(self, event_type: str) -> Optional[Event]:
+        """
+        Remove the oldest queued event of a type.
+
+        Args:
+            event_type: Type of event
+
+        Returns:
+            The removed event, or None if no event of that type is queued
+        """
+        lane = self._lanes[self.lane_for(event_type)]
+        for i, queued in enumerate(lane):
+            if queued.event_type == event_type:
+                del lane[i]
+                # The removed event will never be processed
+                self.task_done()
+                return queued
+        return None
+
+    def _record_drop(self, event_type: str, count: int = 1) -> None:
+        """Count events dropped by their overflow policy, warning on the first and every DROP_LOG_INTERVAL drops."""
+        before = self.dropped[event_type]
+        self.dropped[event_type] += count
+        if (before + count - 1) // self.DROP_LOG_INTERVAL == (before - 1) // self.DROP_LOG_INTERVAL:
+            return
+        self.logger.warning(
+            f"Event queue full ({self.maxsize}): dropped {event_type} event "
+            f"({self.dropped[event_type]} dropped so far)"
+        )
+
+    def idle(self) -> bool:
+        """Check whether every queued event was taken and marked done."""
+        return self._unfinished_tasks == 0
+
+    def metrics(self) -> EventQueueMetrics:
+        """
+        Report the depth of the queue and what the overflow policies discarded.
+
+        Returns:
+            EventQueueMetrics snapshot
+        """
+        return EventQueueMetrics(
+            depth=self.qsize(),
+            high_priority_depth=len(self._lanes[self.LANE_HIGH]),
+            max_size=self.maxsize,
+            high_water=self.high_water,
+            dropped=dict(self.dropped),
+            coalesced=dict(self.coalesced),
+        )
+
+
+class CircuitBreaker:
+    """
+    Quarantines a failing handler.
+
+    The breaker opens after ``failure_threshold`` consecutive failures and
+    stays open for ``reset_seconds``. It then lets a single trial call
+    through (half-open): a success closes it again, a failure re-opens it.
+    """
+
+    # Breaker states
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_seconds: Time the breaker stays open before a trial call
+
+        Raises:
+            ValueError: If the threshold is not positive or the reset time is negative
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be at least 1, got {failure_threshold}")
+        if reset_seconds < 0:
+            raise ValueError(f"reset_seconds must be non-negative, got {reset_seconds}")
+
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may go through, starting the trial call when the breaker is due to reset.
+
+        Returns:
+            bool: True if the call may go through
+        """
+        if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+            self.state = self.HALF_OPEN
+            return True
+        return self.state == self.CLOSED
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> bool:
+        """
+        Count a failed call, opening the breaker at the threshold or after a failed trial call.
+
+        Returns:
+            bool: True if the breaker opened
+        """
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+            return True
+        return False
+
+
+@dataclass(frozen=True)
+class HandlerMetrics:
+    """Latency and health of one event handler subscription."""
+
+    event_type: str  # Event type the handler is subscribed to
+    handler: str  # Qualified name of the handler
+    circuit_state: str  # CircuitBreaker state
+    calls: int  # Invocations, including the ones that failed or timed out
+    timeouts: int  # Invocations cancelled at the timeout
+    failures: int  # Invocations that raised an exception
+    skipped: int  # Events not delivered while the handler was quarantined
+    latency_histogram: Dict[float, int]  # Invocations per latency bucket, by upper bound in seconds
+
+
+@dataclass(eq=False)
+class _HandlerStats:
+    """Latency histogram and circuit breaker of a handler subscription."""
+
+    breaker: CircuitBreaker
+    latency_counts: List[int]
+    calls: int = 0
+    timeouts: int = 0
+    failures: int = 0
+    skipped: int = 0
+
+
+class EventBusBridge:
+    """
+    Feeds the event queue of a bus from synchronous code on a dedicated event loop thread.
+
+    Synchronous callers, such as the worker threads of the background
+    scheduler, hand events over and get a future back instead of creating or
+    borrowing an event loop per event. A single long-lived loop thread puts
+    the events in the bus's EventQueue in the order they were handed over,
+    where the overflow policies of their types apply, and runs the bus's
+    queue consumers while events are queued, so handlers never run on the
+    caller's thread.
+
+    Events waiting to be put in a full queue are held by the bridge, at most
+    as many as the queue holds. Once that many are pending, the overflow
+    policy of a new event applies on the caller's thread: drop_newest drops
+    it, drop_oldest evicts the oldest pending event of its type, and block,
+    or a policy with no pending event of its type to evict, makes the caller
+    wait for room. Coalesce merges a new event into a pending event with the
+    same type and key whether or not the limit is reached. Dropped and
+    merged events are counted by the event queue.
+    """
+
+    # Name of the event loop thread
+    THREAD_NAME = "EventBusLoop"
+
+    def __init__(self, event_bus: "EventBus"):
+        """
+        Initialize the bridge.
+
+        The bridge only keeps a weak reference to the event bus, so it does not
+        keep an otherwise unused bus and its loop thread alive.
+
+        Args:
+            event_bus: Event bus to publish to
+        """
+        self._event_bus = weakref.ref(event_bus)
+        self._lock = threading.Lock()
+        # Signalled whenever a pending event is put in the queue
+        self._room = threading.Condition(self._lock)
+        # Events handed over and not in the queue yet: those waiting for the drain task, and the one it is putting
+        self._backlog: Deque[Tuple[Event, concurrent.futures.Future]] = deque()
+        self._pending = 0
+        self._drain_task: Optional[asyncio.Task] = None
+        self._draining = False
+        # Events dropped or merged by the bridge, not yet counted by the event queue
+        self._dropped: Counter[str] = Counter()
+        self._coalesced: Counter[str] = Counter()
+        self._counting = False
+        # Consumers of the bus's queue, and the task stopping them once the queue is idle
+        self._consumers: Optional[asyncio.Task] = None
+        self._idle_watch: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closing = False
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def pending(self) -> int:
+        """Number of events handed over and not in the event queue yet."""
+        return self._pending
+
+    def is_running(self) -> bool:
+        """
+        Check whether the event loop thread is running.
+
+        Returns:
+            bool: True if the loop thread is alive
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, event: Event) -> concurrent.futures.Future:
+        """
+        Hand an event over to the loop thread.
+
+        Starts the loop thread on first use. The returned future completes once
+        the event is in the bus's queue, with True if it was queued or merged
+        and False if its overflow policy dropped it. The call only waits when
+        as many events as the queue holds are pending and the policy of the
+        event is to wait for room.
+
+        Args:
+            event: Event to publish
+
+        Returns:
+            Future completed when the event has been queued
+
+        Raises:
+            RuntimeError: If the bridge has been closed or the event bus no longer exists
+        """
+        event_bus = self._event_bus()
+        if event_bus is None:
+            raise RuntimeError("Event bus no longer exists")
+        event_queue = event_bus.event_queue
+        policy = event_queue.policy_for(event.event_type)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+
+        with self._lock:
+            if self._thread is None and not self._closing:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run, name=self.THREAD_NAME, daemon=True)
+                self._thread.start()
+
+            while True:
+                if self._closing:
+                    raise RuntimeError("Event bus bridge is closed")
+
+                if policy == EventQueue.OVERFLOW_COALESCE and self._replace(event):
+                    self._count(self._coalesced, event.event_type)
+                    self._settle(future, True)
+                    return future
+
+                if not self._full(event_queue):
+                    break
+                if policy == EventQueue.OVERFLOW_DROP_NEWEST:
+                    self._count(self._dropped, event.event_type)
+                    self._settle(future, False)
+                    return future
+                if policy == EventQueue.OVERFLOW_DROP_OLDEST and self._evict_oldest(event.event_type):
+                    self._pending -= 1
+                    break
+                if threading.current_thread() is self._thread:
+                    # Waiting on the loop thread would stop the events it waits for
+                    break
+                self._room.wait()
+
+            self._backlog.append((event, future))
+            self._pending += 1
+            if not self._draining:
+                self._draining = True
+                self._loop.call_soon_threadsafe(self._start_drain)
+
+        return future
+
+    def _full(self, event_queue: EventQueue) -> bool:
+        """Check whether as many events as the queue holds are pending; never for an unbounded queue."""
+        return 0 < event_queue.maxsize <= self._pending
+
+    def _replace(self, event: Event) -> bool:
+        """
+        Replace a pending event with the same type and key, keeping its place and future.
+
+        Args:
+            event: New event
+
+        Returns:
+            bool: True if a pending event was replaced
+        """
+        for i, (pending, future) in enumerate(self._backlog):
+            if pending.event_type == event.event_type and pending.key == event.key:
+                self._backlog[i] = (event, future)
+                return True
+        return False
+
+    def _evict_oldest(self, event_type: str) -> bool:
+        """
+        Drop the oldest pending event of a type, completing its future with False.
+
+        Args:
+            event_type: Type of event
+
+        Returns:
+            bool: True if a pending event was dropped
+        """
+        for i, (pending, future) in enumerate(self._backlog):
+            if pending.event_type == event_type:
+                del self._backlog[i]
+                self._count(self._dropped, event_type)
+                self._settle(future, False)
+                return True
+        return False
+
+    def _count(self, counter: Counter, event_type: str) -> None:
+        """
+        Tally an event dropped or merged by the bridge; called with the lock held.
+
+        The event queue's counters belong to the loop thread, so the tallies
+        are handed to it in one go rather than per event.
+
+        Args:
+            counter: Tally of dropped or of merged events
+            event_type: Type of the event
+        """
+        counter[event_type] += 1
+        if not self._counting:
+            self._counting = True
+            self._loop.call_soon_threadsafe(self._flush_counts)
+
+    def _flush_counts(self) -> None:
+        """Add the events dropped or merged by the bridge to the event queue's counters."""
+        with self._lock:
+            dropped, self._dropped = self._dropped, Counter()
+            coalesced, self._coalesced = self._coalesced, Counter()
+            self._counting = False
+
+        event_bus = self._event_bus()
+        if event_bus is None:
+            return
+        for event_type, count in dropped.items():
+            event_bus.event_queue._record_drop(event_type, count)
+        event_bus.event_queue.coalesced.update(coalesced)
+
+    @staticmethod
+    def _settle(future: concurrent.futures.Future, result: bool) -> None:
+        """Complete a future unless its caller cancelled it."""
+        if future.set_running_or_notify_cancel():
+            future.set_result(result)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting events and stop the loop thread once pending events are processed.
+
+        Args:
+            timeout: Seconds to wait for pending events, or None to wait until they are processed
+        """
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            self._room.notify_all()
+            if self._thread is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            self.logger.warning(f"Event bus bridge closed with {self.pending} events still pending")
+
+    def _run(self) -> None:
+        """Run the event loop of the bridge until it is closed."""
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+            self.logger.debug("Event bus loop thread stopped")
+
+    def _start_drain(self) -> None:
+        """Start the task putting handed over events in the bus's queue."""
+        self._drain_task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        """
+        Put handed over events in the bus's queue, one at a time and in order, until none are left.
+
+        Starts the bus's queue consumers on this loop if they are not running.
+        """
+        event_bus = self._event_bus()
+        if event_bus is not None and (self._consumers is None or self._consumers.done()):
+            self._consumers = asyncio.create_task(event_bus._run_consumers())
+
+        while True:
+            with self._lock:
+                if not self._backlog:
+                    self._draining = False
+                    break
+                event, future = self._backlog.popleft()
+
+            try:
+                if event_bus is None:
+                    raise RuntimeError("Event bus no longer exists")
+                queued = await event_bus.publish_async(event)
+            except Exception as e:
+                self.logger.error(f"Error queueing handed over event {event.event_type}: {e}", exc_info=True)
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+            else:
+                self._settle(future, queued)
+            finally:
+                with self._lock:
+                    self._pending -= 1
+                    self._room.notify_all()
+
+        if event_bus is not None:
+            self._watch_idle(event_bus.event_queue)
+
+    def _watch_idle(self, event_queue: EventQueue) -> None:
+        """Stop the consumers once the bus's queue is idle, so they do not keep an unused bus alive."""
+        if self._consumers is not None and (self._idle_watch is None or self._idle_watch.done()):
+            self._idle_watch = asyncio.create_task(self._stop_when_idle(event_queue))
+
+    async def _stop_when_idle(self, event_queue: EventQueue) -> None:
+        """
+        Wait until every queued event was processed, then stop the consumers if nothing new arrived.
+
+        Args:
+            event_queue: Queue of the bus
+        """
+        await event_queue.join()
+        if event_queue.idle() and not self._draining:
+            await self._stop_consumers()
+
+    async def _stop_consumers(self) -> None:
+        """Cancel the queue consumers and wait for them to stop."""
+        consumers, self._consumers = self._consumers, None
+        if consumers is not None:
+            consumers.cancel()
+            await asyncio.gather(consumers, return_exceptions=True)
+
+    async def _shutdown(self) -> None:
+        """Wait until handed over events are processed, then stop the consumers and the loop."""
+        if self._drain_task is not None:
+            await asyncio.gather(self._drain_task, return_exceptions=True)
+
+        event_bus = self._event_bus()
+        if event_bus is not None and self._consumers is not None:
+            await event_bus.event_queue.join()
+        await self._stop_consumers()
+        if self._idle_watch is not None:
+            self._idle_watch.cancel()
+            await asyncio.gather(self._idle_watch, return_exceptions=True)
+
+        self._loop.stop()
+
+
 class EventBus:
     """
     Pub/sub event bus for core-to-plugin communication.
@@ -49,16 +712,96 @@ class EventBus:
     - Multiple subscribers per event type
     - Error isolation (one handler failure doesn't affect others)
     - Queue-based processing for high-volume scenarios
+    - Thread-safe publishing from synchronous code via a dedicated loop thread
+    - Bounded queue with per-event-type overflow policies
+    - Concurrent queue consumers with a high-priority lane and per-key ordering
+    - Per-handler timeouts, quarantine of handlers that keep timing out and
+      per-handler latency histograms
     """
 
-    def __init__(self):
-        """Initialize the event bus."""
+    # Default capacity of the event queue
+    DEFAULT_MAX_QUEUE_SIZE = 1000
+
+    # Default number of consumer tasks processing queued events
+    DEFAULT_CONSUMERS = 4
+
+    # Event types queued in the high-priority lane by default
+    DEFAULT_HIGH_PRIORITY_EVENT_TYPES = ("task_blocked", "approval_timeout")
+
+    # Default time a handler may take per event in seconds
+    DEFAULT_HANDLER_TIMEOUT_SECONDS = 10.0
+
+    # Consecutive timeouts after which a handler is quarantined
+    QUARANTINE_AFTER_TIMEOUTS = 3
+
+    # Default time a quarantined handler is skipped before it is tried again in seconds
+    DEFAULT_QUARANTINE_SECONDS = 60.0
+
+    # Upper bounds of the handler latency histogram buckets in seconds
+    LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, float("inf"))
+
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        overflow_policies: Optional[Dict[str, str]] = None,
+        default_overflow_policy: str = EventQueue.OVERFLOW_BLOCK,
+        consumers: int = DEFAULT_CONSUMERS,
+        high_priority_event_types: Iterable[str] = DEFAULT_HIGH_PRIORITY_EVENT_TYPES,
+        handler_timeout_seconds: Optional[float] = DEFAULT_HANDLER_TIMEOUT_SECONDS,
+        event_timeouts: Optional[Dict[str, float]] = None,
+        quarantine_seconds: float = DEFAULT_QUARANTINE_SECONDS,
+    ):
+        """
+        Initialize the event bus.
+
+        Args:
+            max_queue_size: Capacity of the queue used by publish_async(), 0 for unbounded (default: 1000)
+            overflow_policies: Overflow policy per event type, one of EventQueue.OVERFLOW_POLICIES (optional)
+            default_overflow_policy: Overflow policy of other event types (default: block)
+            consumers: Number of consumer tasks started by start_processing() (default: 4)
+            high_priority_event_types: Event types drained first from the queue
+                                       (default: task_blocked, approval_timeout)
+            handler_timeout_seconds: Time a handler may take per event, None for no limit (default: 10)
+            event_timeouts: Handler timeout per event type, overriding handler_timeout_seconds (optional)
+            quarantine_seconds: Time a handler that keeps timing out is skipped (default: 60)
+
+        Raises:
+            ValueError: If the queue size is negative, consumers is not positive, a policy
+                        is unknown, or a timeout or the quarantine time is invalid
+        """
+        if consumers < 1:
+            raise ValueError(f"consumers must be at least 1, got {consumers}")
+        timeouts = {**(event_timeouts or {}), None: handler_timeout_seconds}
+        invalid = {
+            event_type: timeout for event_type, timeout in timeouts.items() if timeout is not None and timeout <= 0
+        }
+        if invalid:
+            raise ValueError(f"Handler timeouts must be positive, got {invalid}")
+        if quarantine_seconds < 0:
+            raise ValueError(f"quarantine_seconds must be non-negative, got {quarantine_seconds}")
+
         self.subscribers: Dict[str, List[EventHandler]] = {}
-        self.event_queue: asyncio.Queue = asyncio.Queue()
+        self.event_queue: EventQueue = EventQueue(
+            max_queue_size,
+            overflow_policies,
+            default_overflow_policy,
+            high_priority_event_types=high_priority_event_types,
+        )
+        self.consumers = consumers
+        self.handler_timeout_seconds = handler_timeout_seconds
+        self.event_timeouts = dict(event_timeouts or {})
+        self.quarantine_seconds = quarantine_seconds
         self.logger = logging.getLogger(__name__)
+        # Timeouts given at subscription, and latency and circuit breaker per subscription
+        self._handler_timeouts: Dict[Tuple[str, EventHandler], Optional[float]] = {}
+        self._handler_stats: Dict[Tuple[str, EventHandler], _HandlerStats] = {}
         self._processing_task: Optional[asyncio.Task] = None
+        # Events taken from the queue while an earlier event with the same key was processed
+        self._key_backlog: Dict[str, Deque[Event]] = {}
+        self._bridge: Optional[EventBusBridge] = None
+        self._bridge_lock = threading.Lock()
 
-    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+    def subscribe(self, event_type: str, handler: EventHandler, timeout_seconds: Optional[float] = None) -> None:
         """
         Subscribe to an event type.
 
@@ -68,7 +811,17 @@ class EventBus:
         Args:
             event_type: Type of event to subscribe to (e.g., 'plan_generated')
             handler: Async function to call when event occurs
+            timeout_seconds: Time the handler may take per event, overriding the
+                             event type's timeout (optional)
+
+        Raises:
+            ValueError: If the timeout is not positive
         """
+        if timeout_seconds is not None:
+            if timeout_seconds <= 0:
+                raise ValueError(f"Handler timeout must be positive, got {timeout_seconds}")
+            self._handler_timeouts[(event_type, handler)] = timeout_seconds
+
         if event_type not in self.subscribers:
             self.subscribers[event_type] = []
 
@@ -92,6 +845,9 @@ class EventBus:
         if event_type in self.subscribers:
             try:
                 self.subscribers[event_type].remove(handler)
+                if handler not in self.subscribers[event_type]:
+                    self._handler_timeouts.pop((event_type, handler), None)
+                    self._handler_stats.pop((event_type, handler), None)
                 self.logger.info(f"Unsubscribed handler from event type: {event_type}")
                 return True
             except ValueError:
@@ -105,7 +861,9 @@ class EventBus:
 
         Immediately invokes all registered handlers for the event type.
         Handlers are executed concurrently, and errors are isolated (one
-        handler failure doesn't prevent others from executing).
+        handler failure doesn't prevent others from executing). Each handler
+        is cancelled at its timeout, so publishing takes at most the longest
+        timeout; handlers in quarantine after repeated timeouts are skipped.
 
         Args:
             event: Event to publish
@@ -119,7 +877,7 @@ class EventBus:
         self.logger.info(f"Publishing event: {event.event_type} to {len(handlers)} subscribers")
 
         # Execute all handlers concurrently
-        tasks = [self._safe_invoke_handler(handler, event) for handler in handlers]
+        tasks = [self._invoke_with_timeout(handler, event) for handler in handlers]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Log any errors
@@ -127,66 +885,268 @@ class EventBus:
             if isinstance(result, Exception):
                 self.logger.error(f"Handler {i} failed for event {event.event_type}: {result}", exc_info=result)
 
-    async def publish_async(self, event: Event) -> None:
+    async def publish_async(self, event: Event) -> bool:
         """
         Publish event asynchronously via queue.
 
         Adds the event to a queue for background processing. This is useful
         for high-volume scenarios where you don't want to block the caller
-        waiting for all handlers to complete.
+        waiting for all handlers to complete. When the queue is full, the
+        overflow policy of the event type applies: the caller waits for room,
+        or an event is dropped or coalesced (see EventQueue).
 
         Note: You must call start_processing() to begin processing queued events.
 
         Args:
             event: Event to publish
+
+        Returns:
+            bool: True if the event was queued or merged into a queued event,
+            False if it was dropped
         """
-        await self.event_queue.put(event)
+        queued = await self.event_queue.put(event)
         self.logger.debug(f"Queued event: {event.event_type} " f"(queue size: {self.event_queue.qsize()})")
+        return queued
+
+    def queue_metrics(self) -> EventQueueMetrics:
+        """
+        Report the depth of the event queue and its drop counts.
 
-    async def _safe_invoke_handler(self, handler: EventHandler, event: Event) -> None:
+        Returns:
+            EventQueueMetrics snapshot
         """
-        Safely invoke an event handler with error isolation.
+        return self.event_queue.metrics()
+
+    def publish_threadsafe(self, event: Event) -> concurrent.futures.Future:
+        """
+        Publish an event from any thread.
+
+        Hands the event over to the bus's event loop thread, which is started on
+        first use, puts it in the event queue and runs the queue consumers. Use
+        this from synchronous code such as scheduler workers instead of creating
+        or borrowing an event loop per event. The queue is then consumed on that
+        thread, so start_processing() must not be used on the same bus. The call
+        returns right away unless as many events as the queue holds are already
+        waiting to be queued; the overflow policy of the event then applies on
+        the caller's thread (see EventBusBridge).
+
+        Args:
+            event: Event to publish
+
+        Returns:
+            Future completed once the event is queued, with True if it was
+            queued or merged and False if it was dropped
+        """
+        with self._bridge_lock:
+            if self._bridge is None:
+                self._bridge = EventBusBridge(self)
+                # Stop the loop thread once the bus is no longer used
+                weakref.finalize(self, self._bridge.close, 0)
+            bridge = self._bridge
+
+        return bridge.submit(event)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the event loop thread used by publish_threadsafe().
+
+        Events already handed over are still processed. A later call to
+        publish_threadsafe() starts a new loop thread.
+
+        Args:
+            timeout: Seconds to wait for pending events, or None to wait until they are published
+        """
+        with self._bridge_lock:
+            bridge, self._bridge = self._bridge, None
+
+        if bridge is not None:
+            bridge.close(timeout)
+
+    def handler_timeout(self, event_type: str, handler: EventHandler) -> Optional[float]:
+        """
+        Get the time a handler may take per event.
+
+        Args:
+            event_type: Event type the handler is subscribed to
+            handler: Handler function
+
+        Returns:
+            Timeout in seconds, or None if the handler is not limited
+        """
+        if (event_type, handler) in self._handler_timeouts:
+            return self._handler_timeouts[(event_type, handler)]
+        return self.event_timeouts.get(event_type, self.handler_timeout_seconds)
+
+    async def _invoke_with_timeout(self, handler: EventHandler, event: Event) -> None:
+        """
+        Invoke a handler within its timeout, recording its latency and health.
 
         Args:
             handler: Handler function to invoke
             event: Event to pass to handler
         """
+        stats = self._stats_for(event.event_type, handler)
+        if not stats.breaker.allow():
+            stats.skipped += 1
+            return
+
+        stats.calls += 1
+        started = time.monotonic()
         try:
-            await handler(event)
+            await asyncio.wait_for(handler(event), self.handler_timeout(event.event_type, handler))
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            name = self._handler_name(handler)
+            if stats.breaker.record_failure():
+                self.logger.warning(
+                    f"Quarantined handler {name} for {event.event_type} events for {self.quarantine_seconds}s "
+                    f"after {stats.breaker.consecutive_failures} consecutive timeouts"
+                )
+            else:
+                self.logger.warning(f"Handler {name} timed out on event {event.event_type}")
         except Exception as e:
+            stats.failures += 1
+            # Only timeouts count towards quarantine; a handler failing fast does not stall publishing
+            stats.breaker.record_success()
             self.logger.error(f"Event handler raised exception: {e}", exc_info=True)
             # Don't re-raise - we want to isolate handler errors
+        else:
+            stats.breaker.record_success()
+        finally:
+            elapsed = time.monotonic() - started
+            bucket = next(i for i, bound in enumerate(self.LATENCY_BUCKETS_SECONDS) if elapsed <= bound)
+            stats.latency_counts[bucket] += 1
+
+    def _stats_for(self, event_type: str, handler: EventHandler) -> _HandlerStats:
+        """
+        Get the latency and circuit breaker of a handler subscription, creating them on first use.
+
+        Args:
+            event_type: Event type the handler is subscribed to
+            handler: Handler function
+
+        Returns:
+            Statistics of the subscription
+        """
+        stats = self._handler_stats.get((event_type, handler))
+        if stats is None:
+            stats = _HandlerStats(
+                breaker=CircuitBreaker(self.QUARANTINE_AFTER_TIMEOUTS, self.quarantine_seconds),
+                latency_counts=[0] * len(self.LATENCY_BUCKETS_SECONDS),
+            )
+            self._handler_stats[(event_type, handler)] = stats
+        return stats
+
+    @staticmethod
+    def _handler_name(handler: EventHandler) -> str:
+        """Get a readable name of a handler."""
+        return getattr(handler, "__qualname__", repr(handler))
+
+    def handler_metrics(self) -> List[HandlerMetrics]:
+        """
+        Report the latency histogram and health of every handler that received events.
+
+        Returns:
+            List[HandlerMetrics]: One entry per handler subscription
+        """
+        return [
+            HandlerMetrics(
+                event_type=event_type,
+                handler=self._handler_name(handler),
+                circuit_state=stats.breaker.state,
+                calls=stats.calls,
+                timeouts=stats.timeouts,
+                failures=stats.failures,
+                skipped=stats.skipped,
+                latency_histogram=dict(zip(self.LATENCY_BUCKETS_SECONDS, stats.latency_counts)),
+            )
+            for (event_type, handler), stats in self._handler_stats.items()
+        ]
 
     async def process_queue(self) -> None:
         """
         Process events from queue (background task).
 
         Continuously processes events from the queue until stopped.
-        This method is designed to run as a background task.
+        This method is designed to run as a background task; several of
+        them can run concurrently. Events with the same key are processed
+        one at a time, in the order they are taken from the queue: an event
+        whose key is being processed is handed to the consumer processing it.
         """
         self.logger.info("Event queue processing started")
 
         while True:
             try:
                 event = await self.event_queue.get()
-                await self.publish(event)
-                self.event_queue.task_done()
+                if event.key is not None:
+                    if event.key in self._key_backlog:
+                        self._key_backlog[event.key].append(event)
+                        continue
+                    self._key_backlog[event.key] = deque()
+                await self._process_in_order(event)
             except asyncio.CancelledError:
                 self.logger.info("Event queue processing cancelled")
                 break
             except Exception as e:
                 self.logger.error(f"Error processing queued event: {e}", exc_info=True)
 
+    async def _process_in_order(self, event: Event) -> None:
+        """
+        Publish a queued event, then the events held back behind it for its key.
+
+        Args:
+            event: Event taken from the queue
+        """
+        while event is not None:
+            try:
+                await self.publish(event)
+            except asyncio.CancelledError:
+                # Events held back for the key are not processed either
+                self.event_queue.task_done()
+                for _ in self._key_backlog.pop(event.key, ()):
+                    self.event_queue.task_done()
+                raise
+            except Exception as e:
+                self.logger.error(f"Error processing queued event: {e}", exc_info=True)
+            self.event_queue.task_done()
+
+            event = self._next_for_key(event.key)
+
+    def _next_for_key(self, key: Optional[str]) -> Optional[Event]:
+        """
+        Take the next event held back for a key, releasing the key when there is none.
+
+        Args:
+            key: Key of the event that was just processed
+
+        Returns:
+            The next event with that key, or None
+        """
+        if key is None:
+            return None
+
+        backlog = self._key_backlog[key]
+        if backlog:
+            return backlog.popleft()
+
+        del self._key_backlog[key]
+        return None
+
+    async def _run_consumers(self) -> None:
+        """Run the configured number of queue consumers until cancelled."""
+        await asyncio.gather(*(self.process_queue() for _ in range(self.consumers)))
+
     def start_processing(self) -> None:
         """
         Start background processing of queued events.
 
-        Creates a background task that continuously processes events from
-        the queue. Call stop_processing() to stop the background task.
+        Creates a background task running the configured number of
+        concurrent consumers of the queue. Call stop_processing() to stop
+        the background task.
         """
         if self._processing_task is None or self._processing_task.done():
-            self._processing_task = asyncio.create_task(self.process_queue())
-            self.logger.info("Started event queue processing task")
+            self._processing_task = asyncio.create_task(self._run_consumers())
+            self.logger.info(f"Started event queue processing task with {self.consumers} consumers")
         else:
             self.logger.warning("Event queue processing already running")
 
@@ -194,8 +1154,8 @@ class EventBus:
         """
         Stop background processing of queued events.
 
-        Cancels the background processing task. Any events remaining in the
-        queue will not be processed.
+        Cancels the background processing task and its consumers. Any events
+        remaining in the queue will not be processed.
         """
         if self._processing_task and not self._processing_task.done():
             self._processing_task.cancel()
@@ -232,7 +1192,12 @@ class EventBus:
         if event_type:
             if event_type in self.subscribers:
                 del self.subscribers[event_type]
+                for subscriptions in (self._handler_timeouts, self._handler_stats):
+                    for key in [key for key in subscriptions if key[0] == event_type]:
+                        del subscriptions[key]
                 self.logger.info(f"Cleared subscribers for event type: {event_type}")
         else:
             self.subscribers.clear()
+            self._handler_timeouts.clear()
+            self._handler_stats.clear()
             self.logger.info("Cleared all event subscribers")
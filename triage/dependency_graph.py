@@ -0,0 +1,525 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Issue-link dependency graph of the backlog with transitive blocking analysis."""
+
+import logging
+import time
+from collections import Counter, defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from triage.jira_client import JiraClient
+from triage.models import IssueState, JiraIssue
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Directed "blocker -> blocked" edge between two issue keys
+Edge = Tuple[str, str]
+
+
+class DependencyGraph:
+    """
+    Graph of "blocks" relations between backlog issues and the issues they link to.
+
+    Nodes are the issues of the backlog snapshot plus the external issues
+    they link to. Edges point from a blocker to the issue it blocks and are
+    indexed in both directions. An edge declared by both ends (A "blocks" B,
+    B "is blocked by" A) is reference counted, so it disappears only when
+    neither end declares it anymore.
+
+    Backlog issues are active, so they count as unresolved. The state of
+    external issues is hydrated from JIRA with batched ``key in (...)``
+    lookups, and external issues that no longer exist count as resolved.
+    Until an external issue is hydrated it counts as unresolved, so a task is
+    never released early. Incremental updates only look up new external
+    issues; a full sync also refreshes the unresolved ones that were last
+    looked up more than ``external_ttl_seconds`` ago, so a blocker resolved
+    outside the backlog releases its tasks on the next sync.
+
+    Updates are incremental: only issues whose links changed are re-indexed,
+    and derived scores are recomputed on demand. Updates return the backlog
+    issues whose blocked status or "unblocks" score may have changed, so
+    callers can re-rank just those.
+    """
+
+    # Link types (as seen from the linking issue) meaning the target blocks it
+    BLOCKED_BY_LINK_TYPES = ("is blocked by", "depends on", "blocked by")
+
+    # Link types (as seen from the linking issue) meaning it blocks the target
+    BLOCKS_LINK_TYPES = ("blocks", "is a dependency of")
+
+    # Default age after which a sync looks up unresolved external issues again (every sync)
+    DEFAULT_EXTERNAL_TTL_SECONDS = 0.0
+
+    def __init__(
+        self, jira_client: Optional[JiraClient] = None, external_ttl_seconds: float = DEFAULT_EXTERNAL_TTL_SECONDS
+    ):
+        """
+        Initialize an empty dependency graph.
+
+        Args:
+            jira_client: JIRA client used to hydrate external issues (optional;
+                         without it external issues stay unresolved)
+            external_ttl_seconds: Age after which a sync looks up an unresolved
+                                  external issue again (default: 0, every sync)
+
+        Raises:
+            ValueError: If external_ttl_seconds is negative
+        """
+        if external_ttl_seconds < 0:
+            raise ValueError(f"external_ttl_seconds must be non-negative, got {external_ttl_seconds}")
+
+        self.jira_client = jira_client
+        self.external_ttl_seconds = external_ttl_seconds
+
+        # Backlog issues by key
+        self._issues: Dict[str, JiraIssue] = {}
+
+        # Edges declared by each backlog issue, and how many issues declare each edge
+        self._declared: Dict[str, Set[Edge]] = {}
+        self._edge_refs: Counter = Counter()
+
+        # Adjacency indexes: key -> keys blocking it, key -> keys it blocks
+        self._blockers: Dict[str, Set[str]] = defaultdict(set)
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
+
+        # External issues: key -> resolved (None until hydrated), and when each was looked up
+        self._external: Dict[str, Optional[bool]] = {}
+        self._checked_at: Dict[str, float] = {}
+
+        # Memoized "unblocks N tasks" scores, cleared on every change
+        self._unblocks: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of backlog issues in the graph."""
+        return len(self._issues)
+
+    def __contains__(self, task_key: object) -> bool:
+        """Check whether an issue is part of the backlog snapshot."""
+        return task_key in self._issues
+
+    def sync(self, issues: Iterable[JiraIssue]) -> Set[str]:
+        """
+        Bring the graph in line with a complete backlog snapshot.
+
+        Issues that are new or whose links changed are re-indexed, issues
+        missing from the snapshot are removed, new external issues are
+        hydrated and unresolved ones are looked up again once their TTL expired.
+
+        Args:
+            issues: All active issues of the backlog
+
+        Returns:
+            Keys of backlog issues whose blocked status or "unblocks" score may have changed
+        """
+        issues = list(issues)
+        current_keys = {issue.key for issue in issues}
+        affected = self._apply(upserted=issues, removed_keys=[key for key in self._issues if key not in current_keys])
+        return affected | self.hydrate(refresh=True)
+
+    def update(self, upserted: Iterable[JiraIssue] = (), removed_keys: Iterable[str] = ()) -> Set[str]:
+        """
+        Apply changed and removed backlog issues.
+
+        Only the edges of the given issues are touched, so the cost is
+        proportional to the size of the change. A removed issue that other
+        issues still link to becomes external and is hydrated.
+
+        Args:
+            upserted: New or changed backlog issues
+            removed_keys: Keys of issues that left the backlog
+
+        Returns:
+            Keys of backlog issues whose blocked status or "unblocks" score may
+            have changed: the issues upstream of a changed edge (their scores)
+            and the issues downstream of it (their blockers)
+        """
+        return self._apply(upserted, removed_keys) | self.hydrate()
+
+    def _apply(self, upserted: Iterable[JiraIssue], removed_keys: Iterable[str]) -> Set[str]:
+        """
+        Re-index changed and removed backlog issues without looking up external issues.
+
+        Args:
+            upserted: New or changed backlog issues
+            removed_keys: Keys of issues that left the backlog
+
+        Returns:
+            Keys of backlog issues upstream or downstream of a changed edge
+        """
+        changed_edges: Set[Edge] = set()
+
+        for task_key in removed_keys:
+            if self._issues.pop(task_key, None) is not None:
+                changed_edges |= self._set_edges(task_key, set())
+                self._track_external(task_key)
+
+        for issue in upserted:
+            edges = self._declared_edges(issue)
+            is_new = issue.key not in self._issues
+            self._issues[issue.key] = issue
+            self._external.pop(issue.key, None)
+            self._checked_at.pop(issue.key, None)
+            if is_new or edges != self._declared.get(issue.key, set()):
+                changed_edges |= self._set_edges(issue.key, edges)
+
+        affected = set()
+        if changed_edges:
+            self._unblocks.clear()
+            affected = self._reachable({blocker for blocker, _ in changed_edges}, self._blockers)
+            affected |= self._reachable({blocked for _, blocked in changed_edges}, self._dependents)
+
+        return affected
+
+    def hydrate(self, refresh: bool = False) -> Set[str]:
+        """
+        Look up the state of external issues, MAX_KEYS_PER_QUERY at a time.
+
+        Args:
+            refresh: Also look up unresolved issues whose last lookup is older
+                     than external_ttl_seconds (default: only issues never looked up)
+
+        Returns:
+            Keys of backlog issues downstream of external issues that became resolved or unresolved
+        """
+        if self.jira_client is None:
+            return set()
+
+        expired_before = time.monotonic() - self.external_ttl_seconds
+        pending = [
+            key
+            for key, resolved in self._external.items()
+            if resolved is None or (refresh and not resolved and self._checked_at.get(key, 0.0) <= expired_before)
+        ]
+        if not pending:
+            return set()
+
+        logger.info(f"Hydrating {len(pending)} external issues")
+        flipped = set()
+        batch_size = self.jira_client.MAX_KEYS_PER_QUERY
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            states = self.jira_client.fetch_issue_states(batch)
+            checked_at = time.monotonic()
+            for key in batch:
+                # Issues that no longer exist cannot block anything
+                state = states.get(key)
+                resolved = state is None or self._is_done(state)
+                if resolved != bool(self._external[key]):
+                    flipped.add(key)
+                self._external[key] = resolved
+                self._checked_at[key] = checked_at
+
+        if not flipped:
+            return set()
+
+        logger.info(f"{len(flipped)} external issues changed state")
+        self._unblocks.clear()
+        return self._reachable(flipped, self._dependents)
+
+    def is_resolved(self, task_key: str) -> bool:
+        """
+        Check whether an issue is resolved.
+
+        Args:
+            task_key: JIRA key of the issue
+
+        Returns:
+            True for hydrated external issues that are done or no longer exist
+        """
+        return task_key not in self._issues and self._external.get(task_key) is True
+
+    def blockers(self, task_key: str) -> List[str]:
+        """
+        Get the unresolved issues directly blocking an issue.
+
+        Args:
+            task_key: JIRA key of the issue
+
+        Returns:
+            Sorted keys of unresolved direct blockers
+        """
+        return sorted(key for key in self._blockers.get(task_key, ()) if not self.is_resolved(key))
+
+    def is_blocked(self, task_key: str) -> bool:
+        """
+        Check whether an issue is waiting on an unresolved blocker.
+
+        Links to resolved blockers do not count.
+
+        Args:
+            task_key: JIRA key of the issue
+
+        Returns:
+            True if at least one direct blocker is unresolved
+        """
+        return any(not self.is_resolved(key) for key in self._blockers.get(task_key, ()))
+
+    def root_blockers(self, task_key: str) -> Set[str]:
+        """
+        Follow the chains of unresolved blockers to the issues that hold them up.
+
+        A root blocker is an unresolved issue with no unresolved blocker of its
+        own. When a chain ends in a dependency cycle, the members of the cycle
+        are the root blockers.
+
+        Args:
+            task_key: JIRA key of the issue
+
+        Returns:
+            Keys of the root blockers (empty if the issue is not blocked)
+        """
+        upstream = set()
+        stack = self.blockers(task_key)
+        while stack:
+            key = stack.pop()
+            if key not in upstream:
+                upstream.add(key)
+                stack.extend(self.blockers(key))
+
+        roots = set()
+        for component in self._components(upstream, self.blockers):
+            members = set(component)
+            if all(set(self.blockers(key)) <= members for key in component):
+                roots.update(members)
+
+        roots.discard(task_key)
+        return roots
+
+    def is_externally_blocked(self, task_key: str) -> bool:
+        """
+        Check whether an issue is held up by work outside the backlog.
+
+        An issue whose chains of blockers all lead back into the backlog can
+        be unblocked by finishing backlog work first.
+
+        Args:
+            task_key: JIRA key of the issue
+
+        Returns:
+            True if at least one root blocker is an external issue
+        """
+        return any(key not in self._issues for key in self.root_blockers(task_key))
+
+    def unblocks_count(self, task_key: str) -> int:
+        """
+        Count the backlog issues that transitively wait on an issue.
+
+        Args:
+            task_key: JIRA key of the issue
+
+        Returns:
+            Number of distinct backlog issues downstream of the issue
+        """
+        count = self._unblocks.get(task_key)
+        if count is not None:
+            return count
+
+        visited = {task_key}
+        stack = list(self._dependents.get(task_key, ()))
+        while stack:
+            key = stack.pop()
+            if key not in visited:
+                visited.add(key)
+                stack.extend(self._dependents.get(key, ()))
+
+        count = sum(1 for key in visited if key != task_key and key in self._issues)
+        self._unblocks[task_key] = count
+        return count
+
+    def find_cycles(self) -> List[List[str]]:
+        """
+        Find dependency cycles.
+
+        Returns:
+            Sorted member keys of each cycle, sorted by first key
+        """
+        cycles = [
+            sorted(component)
+            for component in self._components(list(self._dependents), lambda key: self._dependents.get(key, ()))
+            if len(component) > 1 or component[0] in self._dependents.get(component[0], ())
+        ]
+        if cycles:
+            logger.warning(f"Found {len(cycles)} dependency cycles")
+        return sorted(cycles)
+
+    @staticmethod
+    def _components(nodes: Iterable[str], successors: Callable[[str], Iterable[str]]) -> List[List[str]]:
+        """
+        Find the strongly connected components reachable from some nodes.
+
+        Uses an iterative Tarjan search, so deep chains do not hit the
+        recursion limit.
+
+        Args:
+            nodes: Nodes to start from
+            successors: Function returning the successors of a node
+
+        Returns:
+            Components in reverse topological order
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components = []
+
+        for root in nodes:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(sorted(successors(root))))]
+
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+
+                if child is not None:
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(successors(child)))))
+                    elif child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        return components
+
+    def external_states(self) -> Dict[str, Optional[bool]]:
+        """
+        Get the hydrated state of external issues.
+
+        Returns:
+            Dictionary mapping external keys to resolved (None if not hydrated)
+        """
+        return dict(self._external)
+
+    def _reachable(self, keys: Set[str], index: Dict[str, Set[str]]) -> Set[str]:
+        """
+        Collect the backlog issues reachable from some issues along an adjacency index.
+
+        Args:
+            keys: Issues to start from (included in the result if in the backlog)
+            index: _blockers to walk upstream, _dependents to walk downstream
+
+        Returns:
+            Keys of the reached backlog issues
+        """
+        visited = set(keys)
+        stack = list(keys)
+        while stack:
+            for key in index.get(stack.pop(), ()):
+                if key not in visited:
+                    visited.add(key)
+                    stack.append(key)
+        return {key for key in visited if key in self._issues}
+
+    def _declared_edges(self, issue: JiraIssue) -> Set[Edge]:
+        """
+        Get the blocking edges declared by an issue's links.
+
+        Args:
+            issue: Backlog issue
+
+        Returns:
+            Set of (blocker, blocked) edges
+        """
+        edges = set()
+        for link in issue.issue_links:
+            link_type = link.link_type.lower()
+            if not link.target_key or link.target_key == issue.key:
+                continue
+            if any(blocked_by in link_type for blocked_by in self.BLOCKED_BY_LINK_TYPES):
+                edges.add((link.target_key, issue.key))
+            elif link_type in self.BLOCKS_LINK_TYPES:
+                edges.add((issue.key, link.target_key))
+        return edges
+
+    def _set_edges(self, task_key: str, edges: Set[Edge]) -> Set[Edge]:
+        """
+        Replace the edges declared by a backlog issue, updating the adjacency indexes.
+
+        Args:
+            task_key: Key of the declaring issue
+            edges: Edges it declares now
+
+        Returns:
+            Edges added to or removed from the graph (not those still declared by the other end)
+        """
+        previous = self._declared.pop(task_key, set())
+        if edges:
+            self._declared[task_key] = edges
+
+        changed = set()
+        for blocker, blocked in previous - edges:
+            self._edge_refs[(blocker, blocked)] -= 1
+            if self._edge_refs[(blocker, blocked)] > 0:
+                continue
+            del self._edge_refs[(blocker, blocked)]
+            self._discard_index(self._dependents, blocker, blocked)
+            self._discard_index(self._blockers, blocked, blocker)
+            self._track_external(blocker)
+            self._track_external(blocked)
+            changed.add((blocker, blocked))
+
+        for blocker, blocked in edges - previous:
+            self._edge_refs[(blocker, blocked)] += 1
+            if self._edge_refs[(blocker, blocked)] == 1:
+                changed.add((blocker, blocked))
+            self._dependents[blocker].add(blocked)
+            self._blockers[blocked].add(blocker)
+            self._track_external(blocker)
+            self._track_external(blocked)
+
+        return changed
+
+    def _track_external(self, task_key: str) -> None:
+        """
+        Start or stop tracking an issue outside the backlog, depending on whether any edge references it.
+
+        Args:
+            task_key: Key of the issue
+        """
+        if task_key in self._issues:
+            return
+        if task_key in self._blockers or task_key in self._dependents:
+            self._external.setdefault(task_key, None)
+        else:
+            self._external.pop(task_key, None)
+            self._checked_at.pop(task_key, None)
+
+    @staticmethod
+    def _discard_index(index: Dict[str, Set[str]], key: str, value: str) -> None:
+        """Remove a value from an adjacency index, dropping empty entries."""
+        values = index.get(key)
+        if values is None:
+            return
+        values.discard(value)
+        if not values:
+            del index[key]
+
+    @staticmethod
+    def _is_done(state: IssueState) -> bool:
+        """Check whether an issue state is resolved."""
+        return state.status_category == "done" or state.resolution is not None
@@ -7,12 +7,14 @@
 import base64
 import logging
 import random
+import re
 import time
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 
 import requests
 
-from triage.models import IssueLink, JiraIssue, SubtaskSpec
+from triage.models import IssueLink, IssueState, JiraIssue, SubtaskContext, SubtaskSpec
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -48,6 +50,9 @@ class JiraClient:
     Uses API token authentication for simplicity and security.
     """
 
+    # Maximum number of issue keys per "key in (...)" search
+    MAX_KEYS_PER_QUERY = 100
+
     def __init__(
         self,
         base_url: str,
@@ -75,6 +80,9 @@ class JiraClient:
         self.max_retries = max_retries
         self.initial_backoff = initial_backoff
 
+        # End of the latest rate limit reported by JIRA, for callers that pace their requests
+        self.rate_limited_until: Optional[datetime] = None
+
         logger.info(f"Initializing JIRA client for {self.base_url}")
         if self.project:
             logger.info(f"Project filter: {self.project}")
@@ -172,9 +180,16 @@ class JiraClient:
                             logger.warning(f"Rate limited. Exponential backoff with jitter: {wait_time:.2f}s")
 
                         logger.info(f"Waiting {wait_time:.2f}s before retry...")
+                        self.rate_limited_until = datetime.now() + timedelta(seconds=wait_time)
                         time.sleep(wait_time)
                         continue
                     else:
+                        try:
+                            wait_time = float(retry_after)
+                        except (TypeError, ValueError):
+                            wait_time = self.initial_backoff * (2**attempt)
+                        self.rate_limited_until = datetime.now() + timedelta(seconds=wait_time)
+
                         error_msg = (
                             f"JIRA rate limit exceeded after {self.max_retries} retries. "
                             f"Please wait before making more requests."
@@ -527,13 +542,146 @@ class JiraClient:
                     raise e
             raise
 
-    def create_subtask(self, parent_key: str, subtask: SubtaskSpec) -> str:
+    def fetch_issue_states(self, keys: List[str]) -> Dict[str, IssueState]:
+        """
+        Fetch the status and resolution of specific issues with a single search.
+
+        Uses one ``key in (...)`` JQL query requesting only status, resolution
+        and assignee, instead of fetching the whole backlog. Issues that no
+        longer exist (deleted, or moved to another project and re-keyed) are
+        missing from the result.
+
+        Args:
+            keys: JIRA keys of the issues (at most MAX_KEYS_PER_QUERY)
+
+        Returns:
+            Dictionary mapping requested keys to their current state
+
+        Raises:
+            ValueError: If more than MAX_KEYS_PER_QUERY keys are requested
+            JiraConnectionError: If JIRA is unavailable
+            JiraAuthError: If authentication fails
+        """
+        keys = list(dict.fromkeys(keys))
+        if len(keys) > self.MAX_KEYS_PER_QUERY:
+            raise ValueError(f"At most {self.MAX_KEYS_PER_QUERY} keys can be fetched at once, got {len(keys)}")
+
+        logger.info(f"Fetching state of {len(keys)} issues from JIRA")
+
+        remaining = keys
+        while remaining:
+            jql = f"key in ({', '.join(remaining)})"
+            try:
+                response = self._make_request_with_retry(
+                    "GET",
+                    f"{self.base_url}/rest/api/3/search/jql",
+                    params={"jql": jql, "maxResults": len(remaining), "fields": "status,resolution,assignee"},
+                    timeout=30,
+                )
+                break
+            except JiraInvalidQueryError as e:
+                remaining = self._drop_invalid_keys(remaining, e)
+        else:
+            return {}
+
+        requested = set(remaining)
+        states = {}
+
+        for issue_data in response.json().get("issues", []):
+            key = issue_data.get("key", "")
+            if key not in requested:
+                # Issue was moved and answered under its new key
+                continue
+
+            fields = issue_data.get("fields", {})
+            status = fields.get("status") or {}
+            resolution = fields.get("resolution") or {}
+            assignee = fields.get("assignee") or {}
+
+            states[key] = IssueState(
+                key=key,
+                status=status.get("name", ""),
+                status_category=(status.get("statusCategory") or {}).get("key", ""),
+                resolution=resolution.get("name"),
+                assignee=assignee.get("emailAddress", ""),
+            )
+
+        logger.debug(f"Fetched state of {len(states)}/{len(keys)} issues")
+        return states
+
+    def fetch_tasks_by_keys(self, keys: List[str]) -> Dict[str, JiraIssue]:
+        """
+        Fetch specific issues with full metadata using ``key in (...)`` searches.
+
+        Keys are fetched MAX_KEYS_PER_QUERY at a time, so N issues cost
+        ceil(N / MAX_KEYS_PER_QUERY) requests instead of N. Issues that do not
+        exist are missing from the result.
+
+        Args:
+            keys: JIRA keys of the issues
+
+        Returns:
+            Dictionary mapping requested keys to their issues
+
+        Raises:
+            JiraConnectionError: If JIRA is unavailable
+            JiraAuthError: If authentication fails
+        """
+        keys = list(dict.fromkeys(keys))
+        logger.info(f"Fetching {len(keys)} issues by key from JIRA")
+
+        issues = {}
+        for start in range(0, len(keys), self.MAX_KEYS_PER_QUERY):
+            remaining = keys[start : start + self.MAX_KEYS_PER_QUERY]
+            while remaining:
+                try:
+                    batch = self._fetch_with_api_version(f"key in ({', '.join(remaining)})")
+                    break
+                except JiraInvalidQueryError as e:
+                    remaining = self._drop_invalid_keys(remaining, e)
+            else:
+                continue
+
+            requested = set(remaining)
+            issues.update((issue.key, issue) for issue in batch if issue.key in requested)
+
+        logger.debug(f"Fetched {len(issues)}/{len(keys)} issues by key")
+        return issues
+
+    @staticmethod
+    def _drop_invalid_keys(keys: List[str], error: JiraInvalidQueryError) -> List[str]:
+        """
+        Remove the keys a rejected ``key in (...)`` query complained about.
+
+        JIRA rejects the whole query if one of the keys does not exist; the
+        error message names the offending keys.
+
+        Args:
+            keys: Keys of the rejected query
+            error: Error raised for the query
+
+        Returns:
+            Keys to retry the query with
+
+        Raises:
+            JiraInvalidQueryError: If the error does not name any of the keys
+        """
+        invalid_keys = set(re.findall(r"'([A-Za-z][A-Za-z0-9_]*-\d+)'", str(error)))
+        if not invalid_keys.intersection(keys):
+            raise error
+        logger.warning(f"Skipping issues that no longer exist: {', '.join(sorted(invalid_keys))}")
+        return [key for key in keys if key not in invalid_keys]
+
+    def create_subtask(self, parent_key: str, subtask: SubtaskSpec, context: Optional[SubtaskContext] = None) -> str:
         """
         Create a subtask under a parent issue.
 
         Args:
             parent_key: JIRA key of parent issue (e.g., PROJ-123)
             subtask: Subtask specification with title, description, estimate
+            context: Project and subtask issue type of the parent, as returned by
+                get_subtask_context (looked up if not given). Passing it avoids
+                two lookups per subtask when creating several under one parent.
 
         Returns:
             JIRA key of created subtask
@@ -546,6 +694,63 @@ class JiraClient:
         logger.info(f"Creating subtask for parent {parent_key}: {subtask.summary}")
         logger.debug(f"Subtask effort: {subtask.estimated_days} days, order: {subtask.order}")
 
+        if context is None:
+            context = self.get_subtask_context(parent_key)
+
+        # Prepare subtask creation payload
+        # Convert estimated days to story points (1.25 days per story point)
+        story_points = max(1, int(subtask.estimated_days / 1.25))
+        logger.debug(f"Calculated story points: {story_points}")
+
+        payload = {
+            "fields": {
+                "project": {"key": context.project_key},
+                "parent": {"key": parent_key},
+                "summary": subtask.summary,
+                "description": subtask.description,
+                "issuetype": {"id": context.issue_type_id},
+            }
+        }
+
+        # Add story points if the field exists (customfield_10016 is common)
+        # We'll try to add it, but won't fail if it's not available
+        if story_points:
+            payload["fields"]["customfield_10016"] = story_points
+
+        # Create the subtask
+        logger.debug("Creating subtask in JIRA")
+        create_response = self._make_request_with_retry(
+            "POST", f"{self.base_url}/rest/api/3/issue", json=payload, timeout=30
+        )
+
+        # Handle 410 Gone - try API v2
+        if create_response.status_code == 410:
+            logger.warning("API v3 returned 410, falling back to API v2")
+            create_response = self._make_request_with_retry(
+                "POST", f"{self.base_url}/rest/api/2/issue", json=payload, timeout=30
+            )
+
+        # Extract and return the created subtask key
+        result = create_response.json()
+        subtask_key = result["key"]
+        logger.info(f"Successfully created subtask: {subtask_key}")
+        return subtask_key
+
+    def get_subtask_context(self, parent_key: str) -> SubtaskContext:
+        """
+        Look up the project and subtask issue type to create subtasks of a parent with.
+
+        Args:
+            parent_key: JIRA key of parent issue (e.g., PROJ-123)
+
+        Returns:
+            SubtaskContext of the parent
+
+        Raises:
+            JiraConnectionError: If JIRA is unavailable or the project has no subtask issue type
+            JiraAuthError: If authentication fails
+            JiraRateLimitError: If rate limit exceeded
+        """
         # First, fetch the parent issue to get project and issue type information
         logger.debug(f"Fetching parent issue {parent_key}")
         parent_response = self._make_request_with_retry(
@@ -602,44 +807,7 @@ class JiraClient:
             logger.error(error_msg)
             raise JiraConnectionError(error_msg)
 
-        # Prepare subtask creation payload
-        # Convert estimated days to story points (1.25 days per story point)
-        story_points = max(1, int(subtask.estimated_days / 1.25))
-        logger.debug(f"Calculated story points: {story_points}")
-
-        payload = {
-            "fields": {
-                "project": {"key": project_key},
-                "parent": {"key": parent_key},
-                "summary": subtask.summary,
-                "description": subtask.description,
-                "issuetype": {"id": subtask_type_id},
-            }
-        }
-
-        # Add story points if the field exists (customfield_10016 is common)
-        # We'll try to add it, but won't fail if it's not available
-        if story_points:
-            payload["fields"]["customfield_10016"] = story_points
-
-        # Create the subtask
-        logger.debug("Creating subtask in JIRA")
-        create_response = self._make_request_with_retry(
-            "POST", f"{self.base_url}/rest/api/3/issue", json=payload, timeout=30
-        )
-
-        # Handle 410 Gone - try API v2
-        if create_response.status_code == 410:
-            logger.warning("API v3 returned 410, falling back to API v2")
-            create_response = self._make_request_with_retry(
-                "POST", f"{self.base_url}/rest/api/2/issue", json=payload, timeout=30
-            )
-
-        # Extract and return the created subtask key
-        result = create_response.json()
-        subtask_key = result["key"]
-        logger.info(f"Successfully created subtask: {subtask_key}")
-        return subtask_key
+        return SubtaskContext(project_key=project_key, issue_type_id=subtask_type_id)
 
     def get_task_by_key(self, task_key: str) -> Optional[JiraIssue]:
         """
@@ -7,7 +7,7 @@
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class TaskCategory(Enum):
@@ -57,6 +57,8 @@ class TaskClassification:
     has_dependencies: bool  # Has third-party dependencies
     estimated_days: float  # Effort estimate in days
     blocking_reason: Optional[str] = None  # Why task is blocking (if applicable)
+    # Cached ranking key (status, priority, effort, age), computed once at classification time
+    rank_key: Optional[Tuple[int, int, float, int]] = field(default=None, compare=False, repr=False)
 
 
 @dataclass
@@ -79,119 +81,20 @@ class DailyPlan:
     previous_closure_rate: Optional[float] = None  # Previous day's closure rate
     decomposition_suggestions: List[TaskClassification] = field(default_factory=list)  # Tasks that should be decomposed
     blocked_tasks: List[TaskClassification] = field(default_factory=list)  # Tasks blocked or waiting
+    additional_admin_blocks: List[AdminBlock] = field(default_factory=list)  # Extra admin blocks, if configured
 
     def to_markdown(self) -> str:
         """Format plan as structured markdown.
 
+        Rendering is delegated to the shared PlanRenderer, which reuses the
+        fragments of tasks rendered before.
+
         Returns:
             Structured markdown representation of the daily plan
         """
-        lines = []
-
-        # Header
-        lines.append(f"# Daily Plan - {self.date.strftime('%Y-%m-%d')}")
-        lines.append("")
-
-        # Previous day closure rate
-        if self.previous_closure_rate is not None:
-            # Calculate completed/total based on closure rate
-            # Assuming max 3 priorities, but could be less
-            # We'll estimate based on the rate
-            percentage = int(self.previous_closure_rate * 100)
-
-            # For display purposes, we'll show a reasonable completed/total
-            # If rate is 1.0, show 3/3; if 0.67, show 2/3; if 0.33, show 1/3; if 0.0, show 0/3
-            if self.previous_closure_rate >= 0.95:
-                completed, total = 3, 3
-            elif self.previous_closure_rate >= 0.6:
-                completed, total = 2, 3
-            elif self.previous_closure_rate >= 0.3:
-                completed, total = 1, 3
-            else:
-                completed, total = 0, 3
-
-            lines.append("## Previous Day")
-            lines.append(f"- Closure Rate: {completed}/{total} tasks completed ({percentage}%)")
-            lines.append("")
-
-        # Today's priorities
-        lines.append("## Today's Priorities")
-        lines.append("")
-
-        if not self.priorities:
-            lines.append("No priority tasks for today.")
-            lines.append("")
-        else:
-            for i, classification in enumerate(self.priorities, 1):
-                task = classification.task
-                effort_hours = classification.estimated_days * 8  # Convert days to hours
-                lines.append(f"{i}. **[{task.key}] {task.summary}**")
-                lines.append(f"   - Effort: {effort_hours:.1f} hours")
-                lines.append(f"   - Type: {task.issue_type}")
-                if task.priority:
-                    lines.append(f"   - Priority: {task.priority}")
-                if task.status:
-                    lines.append(f"   - Status: {task.status}")
-                lines.append("")
-
-        # Blocked/waiting tasks
-        if self.blocked_tasks:
-            lines.append("## 🚫 Blocked/Waiting Tasks")
-            lines.append("")
-            lines.append("These tasks cannot be worked on until unblocked:")
-            lines.append("")
-            for classification in self.blocked_tasks:
-                task = classification.task
-                lines.append(f"- **[{task.key}] {task.summary}**")
-                lines.append(f"  - Status: {task.status}")
-                if classification.has_dependencies:
-                    lines.append("  - Reason: Blocked by dependencies")
-                if task.priority:
-                    lines.append(f"  - Priority: {task.priority}")
-                lines.append("")
-
-        # Decomposition suggestions
-        if self.decomposition_suggestions:
-            lines.append("## ⚠️ Tasks Requiring Decomposition")
-            lines.append("")
-            lines.append("The following tasks are too large to complete in one day.")
-            lines.append("Consider breaking them into smaller subtasks:")
-            lines.append("")
-            for classification in self.decomposition_suggestions:
-                task = classification.task
-                effort_days = classification.estimated_days
-                lines.append(f"- **[{task.key}] {task.summary}**")
-                lines.append(f"  - Current estimate: {effort_days:.1f} days")
-                if task.story_points:
-                    lines.append(f"  - Story points: {task.story_points} SP")
-                lines.append(f"  - Suggestion: Break into {int(effort_days) + 1} daily-closable subtasks")
-                lines.append(f"  - Command: `triage decompose {task.key}`")
-                lines.append("")
-
-        # Administrative block
-        if self.admin_block.tasks:
-            lines.append(f"## Administrative Block ({self.admin_block.scheduled_time})")
-            lines.append("")
-            for classification in self.admin_block.tasks:
-                task = classification.task
-                lines.append(f"- [ ] [{task.key}] {task.summary}")
-            lines.append("")
-
-        # Other active tasks
-        if self.other_tasks:
-            lines.append("## Other Active Tasks (For Reference)")
-            lines.append("")
-            for classification in self.other_tasks:
-                task = classification.task
-                status_note = ""
-                if classification.has_dependencies:
-                    status_note = " (blocked by dependencies)"
-                elif classification.category == TaskCategory.BLOCKING:
-                    status_note = " (blocker priority)"
-                lines.append(f"- [{task.key}] {task.summary}{status_note}")
-            lines.append("")
-
-        return "\n".join(lines)
+        from triage.plan_renderer import PlanRenderer
+
+        return PlanRenderer.default().render_markdown(self)
 
 
 @dataclass
@@ -204,6 +107,24 @@ class SubtaskSpec:
     order: int  # Sequence order
 
 
+@dataclass(frozen=True)
+class SubtaskContext:
+    """Project and issue type that subtasks of a parent issue are created with."""
+
+    project_key: str  # e.g., "PROJ"
+    issue_type_id: str  # ID of the project's subtask issue type
+
+
+@dataclass
+class DecompositionResult:
+    """Outcome of decomposing one parent task in a batch."""
+
+    parent_key: str  # e.g., "PROJ-123"
+    subtasks: List[SubtaskSpec] = field(default_factory=list)  # Proposed subtasks in order
+    created_keys: List[str] = field(default_factory=list)  # Keys of created subtasks, in subtask order
+    error: Optional[str] = None  # Set if the parent could not be fetched or creation stopped early
+
+
 @dataclass
 class TaskCompletion:
     """Record of a completed task."""
@@ -222,6 +143,39 @@ class ClosureRecord:
     completed_priorities: int  # Number of completed priority tasks
     closure_rate: float  # Completion rate (0.0-1.0)
     incomplete_tasks: List[str]  # Keys of incomplete priority tasks
+    out_of_scope_tasks: List[str] = field(default_factory=list)  # Keys of priorities moved out of scope
+
+
+@dataclass
+class ClosureTrend:
+    """Closure metrics of a user or team over rolling windows."""
+
+    user_id: str  # User ID, or team ID for team aggregates
+    as_of: date  # Last day included in the windows
+    days_recorded: int  # Days with a plan in the history
+    rolling_closure_rate: Dict[int, Optional[float]]  # Window days -> mean daily closure rate (None if no plans)
+    carry_over: Dict[int, int]  # Window days -> number of incomplete priorities carried over
+    current_streak: int  # Consecutive planned days fully closed, ending at as_of
+    longest_streak: int  # Longest run of fully closed planned days in the history
+
+
+class ClosureOutcome(Enum):
+    """End-of-day outcome of a priority task."""
+
+    RESOLVED = "resolved"  # Finished
+    INCOMPLETE = "incomplete"  # Still open and in scope
+    OUT_OF_SCOPE = "out_of_scope"  # Reassigned, moved, deleted or closed without being done
+
+
+@dataclass
+class IssueState:
+    """Current status and resolution of a JIRA issue."""
+
+    key: str  # e.g., "PROJ-123"
+    status: str  # e.g., "Done"
+    status_category: str  # "new", "indeterminate" or "done"
+    resolution: Optional[str] = None  # e.g., "Done", "Won't Do"; None if unresolved
+    assignee: str = ""  # User email, empty if unassigned
 
 
 @dataclass
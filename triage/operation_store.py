@@ -0,0 +1,604 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Durable queue of scheduler operations and shared schedule state."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from triage.closure_store import ClosureStore, PostgresClosureStore
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LeasedOperation:
+    """An operation claimed from a durable queue; valid while its lease is held."""
+
+    operation_id: int
+    operation_type: str
+    priority: int
+    payload: Dict[str, Any]
+    attempts: int  # Number of claims including this one
+    lease_token: str
+    idempotency_key: Optional[str] = None
+
+
+class OperationStore(ABC):
+    """
+    Durable queue of scheduler operations, shared by scheduler replicas.
+
+    Operations are delivered at least once. A claim leases an operation to
+    one replica for a visibility timeout; an operation that is neither
+    completed nor released before the lease expires (e.g. because the
+    replica died) becomes visible again and is claimed by another replica.
+    Handlers must therefore tolerate running twice.
+
+    Enqueueing with an idempotency key that is already known is a no-op, for
+    as long as the operation is kept (see purge), so replicas and restarts
+    can enqueue the same work without running it twice.
+
+    The store also keeps small named values of schedule state, such as the
+    date of the last generated daily plan.
+    """
+
+    # Default lease duration of claimed operations in seconds
+    DEFAULT_VISIBILITY_TIMEOUT_SECONDS = 600
+
+    # Claims after which a failing operation is given up
+    MAX_ATTEMPTS = 5
+
+    @abstractmethod
+    def enqueue(
+        self,
+        operation_type: str,
+        payload: Dict[str, Any],
+        priority: int = 1,
+        idempotency_key: Optional[str] = None,
+        delay_seconds: float = 0,
+    ) -> bool:
+        """
+        Add an operation to the queue.
+
+        Args:
+            operation_type: Type of operation
+            payload: JSON-serializable arguments of the operation
+            priority: Priority, lower values first (default: 1)
+            idempotency_key: Identity of the work; duplicates are ignored (optional)
+            delay_seconds: Delay before the operation becomes visible (default: 0)
+
+        Returns:
+            True if the operation was added, False if its idempotency key is already known
+        """
+        pass
+
+    @abstractmethod
+    def claim(
+        self, limit: int = 1, visibility_timeout_seconds: float = DEFAULT_VISIBILITY_TIMEOUT_SECONDS
+    ) -> List[LeasedOperation]:
+        """
+        Lease the next visible operations, in priority order.
+
+        Operations whose lease expired are visible again, unless they were
+        already claimed MAX_ATTEMPTS times, in which case they are given up.
+
+        Args:
+            limit: Maximum number of operations to claim (default: 1)
+            visibility_timeout_seconds: Lease duration (default: DEFAULT_VISIBILITY_TIMEOUT_SECONDS)
+
+        Returns:
+            Claimed operations
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, operation: LeasedOperation) -> bool:
+        """
+        Mark a claimed operation as done.
+
+        Args:
+            operation: Claimed operation
+
+        Returns:
+            True if the lease was still held, False if it expired and was claimed again
+        """
+        pass
+
+    @abstractmethod
+    def release(self, operation: LeasedOperation, delay_seconds: float = 0) -> bool:
+        """
+        Return a claimed operation to the queue after a failure.
+
+        The operation is given up if it was already claimed MAX_ATTEMPTS times.
+
+        Args:
+            operation: Claimed operation
+            delay_seconds: Delay before the operation becomes visible again (default: 0)
+
+        Returns:
+            True if the lease was still held, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    def extend_lease(self, operation: LeasedOperation, visibility_timeout_seconds: float) -> bool:
+        """
+        Extend the lease of a long-running operation.
+
+        Args:
+            operation: Claimed operation
+            visibility_timeout_seconds: New lease duration from now
+
+        Returns:
+            True if the lease was still held, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    def purge(self, older_than_seconds: float) -> int:
+        """
+        Delete finished operations, forgetting their idempotency keys.
+
+        Args:
+            older_than_seconds: Minimum age of the operations to delete
+
+        Returns:
+            Number of deleted operations
+        """
+        pass
+
+    @abstractmethod
+    def get_state(self, name: str) -> Optional[str]:
+        """
+        Read a schedule state value.
+
+        Args:
+            name: Name of the value
+
+        Returns:
+            The value, or None if it was never set
+        """
+        pass
+
+    @abstractmethod
+    def set_state(self, name: str, value: str) -> None:
+        """
+        Write a schedule state value.
+
+        Args:
+            name: Name of the value
+            value: New value
+        """
+        pass
+
+    def close(self) -> None:
+        """Release resources held by the store."""
+        pass
+
+
+class SQLiteOperationStore(OperationStore):
+    """
+    Operation store backed by a local SQLite database.
+
+    A single connection is shared between threads and guarded by a lock.
+    Claims run in immediate transactions, so several processes can share the
+    database file.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS scheduler_operations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        operation_type TEXT NOT NULL,
+        priority INTEGER NOT NULL,
+        payload TEXT NOT NULL,
+        idempotency_key TEXT UNIQUE,
+        status TEXT NOT NULL DEFAULT 'queued',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        available_at REAL NOT NULL,
+        lease_token TEXT,
+        lease_expires_at REAL,
+        updated_at REAL NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_scheduler_operations_ready
+    ON scheduler_operations(status, priority, available_at);
+
+    CREATE TABLE IF NOT EXISTS scheduler_state (
+        name TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        updated_at REAL NOT NULL
+    );
+    """
+
+    def __init__(self, database_path: str):
+        """
+        Open (and create if needed) a SQLite operation store.
+
+        Args:
+            database_path: Path of the database file, or ":memory:"
+        """
+        if database_path != ":memory:":
+            Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.database_path = database_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(database_path, check_same_thread=False)
+
+        with self._lock, self._conn:
+            self._conn.executescript(self.SCHEMA)
+
+        logger.info(f"SQLite operation store opened at: {database_path}")
+
+    def enqueue(
+        self,
+        operation_type: str,
+        payload: Dict[str, Any],
+        priority: int = 1,
+        idempotency_key: Optional[str] = None,
+        delay_seconds: float = 0,
+    ) -> bool:
+        """Add an operation to the queue."""
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                """
+                INSERT OR IGNORE INTO scheduler_operations
+                    (operation_type, priority, payload, idempotency_key, available_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (operation_type, priority, json.dumps(payload), idempotency_key, now + delay_seconds, now),
+            )
+        return cursor.rowcount == 1
+
+    def claim(
+        self,
+        limit: int = 1,
+        visibility_timeout_seconds: float = OperationStore.DEFAULT_VISIBILITY_TIMEOUT_SECONDS,
+    ) -> List[LeasedOperation]:
+        """Lease the next visible operations, in priority order."""
+        now = time.time()
+        token = uuid.uuid4().hex
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    """
+                    UPDATE scheduler_operations SET status = 'failed', lease_token = NULL, updated_at = ?
+                    WHERE status = 'leased' AND lease_expires_at <= ? AND attempts >= ?
+                    """,
+                    (now, now, self.MAX_ATTEMPTS),
+                )
+                rows = self._conn.execute(
+                    """
+                    SELECT id, operation_type, priority, payload, attempts, idempotency_key
+                    FROM scheduler_operations
+                    WHERE (status = 'queued' AND available_at <= ?) OR (status = 'leased' AND lease_expires_at <= ?)
+                    ORDER BY priority, id
+                    LIMIT ?
+                    """,
+                    (now, now, limit),
+                ).fetchall()
+                self._conn.executemany(
+                    """
+                    UPDATE scheduler_operations
+                    SET status = 'leased', lease_token = ?, lease_expires_at = ?, attempts = attempts + 1,
+                        updated_at = ?
+                    WHERE id = ?
+                    """,
+                    [(token, now + visibility_timeout_seconds, now, row[0]) for row in rows],
+                )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+        return [
+            LeasedOperation(
+                operation_id=row[0],
+                operation_type=row[1],
+                priority=row[2],
+                payload=json.loads(row[3]),
+                attempts=row[4] + 1,
+                lease_token=token,
+                idempotency_key=row[5],
+            )
+            for row in rows
+        ]
+
+    def _update_leased(self, operation: LeasedOperation, assignments: str, *values: Any) -> bool:
+        """Update a leased operation if its lease is still held."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"""
+                UPDATE scheduler_operations SET {assignments}, updated_at = ?
+                WHERE id = ? AND status = 'leased' AND lease_token = ?
+                """,
+                (*values, time.time(), operation.operation_id, operation.lease_token),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, operation: LeasedOperation) -> bool:
+        """Mark a claimed operation as done."""
+        return self._update_leased(operation, "status = 'done', lease_token = NULL")
+
+    def release(self, operation: LeasedOperation, delay_seconds: float = 0) -> bool:
+        """Return a claimed operation to the queue after a failure."""
+        status = "failed" if operation.attempts >= self.MAX_ATTEMPTS else "queued"
+        return self._update_leased(
+            operation, "status = ?, lease_token = NULL, available_at = ?", status, time.time() + delay_seconds
+        )
+
+    def extend_lease(self, operation: LeasedOperation, visibility_timeout_seconds: float) -> bool:
+        """Extend the lease of a long-running operation."""
+        return self._update_leased(operation, "lease_expires_at = ?", time.time() + visibility_timeout_seconds)
+
+    def purge(self, older_than_seconds: float) -> int:
+        """Delete finished operations, forgetting their idempotency keys."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM scheduler_operations WHERE status IN ('done', 'failed') AND updated_at < ?",
+                (time.time() - older_than_seconds,),
+            )
+        return cursor.rowcount
+
+    def get_state(self, name: str) -> Optional[str]:
+        """Read a schedule state value."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM scheduler_state WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, name: str, value: str) -> None:
+        """Write a schedule state value."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scheduler_state (name, value, updated_at) VALUES (?, ?, ?)",
+                (name, value, time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class PostgresOperationStore(OperationStore):
+    """
+    Operation store kept in PostgreSQL, for replicas of a shared deployment.
+
+    The store shares the connection pool and event loop of a
+    PostgresClosureStore instead of opening its own. Claims lock rows with
+    FOR UPDATE SKIP LOCKED, so concurrent replicas never claim the same
+    operation while its lease is held.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS scheduler_operations (
+        id BIGSERIAL PRIMARY KEY,
+        operation_type VARCHAR(255) NOT NULL,
+        priority INTEGER NOT NULL,
+        payload JSONB NOT NULL,
+        idempotency_key VARCHAR(512) UNIQUE,
+        status VARCHAR(16) NOT NULL DEFAULT 'queued',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        available_at TIMESTAMPTZ NOT NULL,
+        lease_token VARCHAR(64),
+        lease_expires_at TIMESTAMPTZ,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_scheduler_operations_ready
+    ON scheduler_operations(status, priority, available_at);
+
+    CREATE TABLE IF NOT EXISTS scheduler_state (
+        name VARCHAR(255) PRIMARY KEY,
+        value TEXT NOT NULL,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    );
+    """
+
+    def __init__(self, closure_store: PostgresClosureStore):
+        """
+        Initialize a PostgreSQL operation store.
+
+        Args:
+            closure_store: PostgreSQL closure store whose pool is shared
+        """
+        self.closure_store = closure_store
+        self._schema_ready = False
+
+    async def _acquire_pool(self):
+        """Get the shared pool, creating the operation tables on first use."""
+        pool = await self.closure_store.acquire_pool()
+        if not self._schema_ready:
+            async with pool.acquire() as conn:
+                await conn.execute(self.SCHEMA)
+            self._schema_ready = True
+        return pool
+
+    def enqueue(
+        self,
+        operation_type: str,
+        payload: Dict[str, Any],
+        priority: int = 1,
+        idempotency_key: Optional[str] = None,
+        delay_seconds: float = 0,
+    ) -> bool:
+        """Add an operation to the queue."""
+
+        async def _enqueue():
+            pool = await self._acquire_pool()
+            return await pool.fetchval(
+                """
+                INSERT INTO scheduler_operations (operation_type, priority, payload, idempotency_key, available_at)
+                VALUES ($1, $2, $3::jsonb, $4, NOW() + make_interval(secs => $5))
+                ON CONFLICT (idempotency_key) DO NOTHING
+                RETURNING id
+                """,
+                operation_type,
+                priority,
+                json.dumps(payload),
+                idempotency_key,
+                float(delay_seconds),
+            )
+
+        return self.closure_store.run(_enqueue()) is not None
+
+    def claim(
+        self,
+        limit: int = 1,
+        visibility_timeout_seconds: float = OperationStore.DEFAULT_VISIBILITY_TIMEOUT_SECONDS,
+    ) -> List[LeasedOperation]:
+        """Lease the next visible operations, in priority order."""
+        token = uuid.uuid4().hex
+
+        async def _claim():
+            pool = await self._acquire_pool()
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        """
+                        UPDATE scheduler_operations SET status = 'failed', lease_token = NULL, updated_at = NOW()
+                        WHERE status = 'leased' AND lease_expires_at <= NOW() AND attempts >= $1
+                        """,
+                        self.MAX_ATTEMPTS,
+                    )
+                    return await conn.fetch(
+                        """
+                        UPDATE scheduler_operations
+                        SET status = 'leased', lease_token = $1, attempts = attempts + 1, updated_at = NOW(),
+                            lease_expires_at = NOW() + make_interval(secs => $2)
+                        WHERE id IN (
+                            SELECT id FROM scheduler_operations
+                            WHERE (status = 'queued' AND available_at <= NOW())
+                               OR (status = 'leased' AND lease_expires_at <= NOW())
+                            ORDER BY priority, id
+                            LIMIT $3
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        RETURNING id, operation_type, priority, payload, attempts, idempotency_key
+                        """,
+                        token,
+                        float(visibility_timeout_seconds),
+                        limit,
+                    )
+
+        rows = sorted(self.closure_store.run(_claim()), key=lambda row: (row["priority"], row["id"]))
+        return [
+            LeasedOperation(
+                operation_id=row["id"],
+                operation_type=row["operation_type"],
+                priority=row["priority"],
+                # asyncpg returns JSONB as text unless a codec is registered
+                payload=json.loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"],
+                attempts=row["attempts"],
+                lease_token=token,
+                idempotency_key=row["idempotency_key"],
+            )
+            for row in rows
+        ]
+
+    def _update_leased(self, operation: LeasedOperation, assignments: str, *values: Any) -> bool:
+        """Update a leased operation if its lease is still held."""
+
+        async def _update():
+            pool = await self._acquire_pool()
+            return await pool.execute(
+                f"""
+                UPDATE scheduler_operations SET {assignments}, updated_at = NOW()
+                WHERE id = ${len(values) + 1} AND status = 'leased' AND lease_token = ${len(values) + 2}
+                """,
+                *values,
+                operation.operation_id,
+                operation.lease_token,
+            )
+
+        return self.closure_store.run(_update()) == "UPDATE 1"
+
+    def complete(self, operation: LeasedOperation) -> bool:
+        """Mark a claimed operation as done."""
+        return self._update_leased(operation, "status = 'done', lease_token = NULL")
+
+    def release(self, operation: LeasedOperation, delay_seconds: float = 0) -> bool:
+        """Return a claimed operation to the queue after a failure."""
+        status = "failed" if operation.attempts >= self.MAX_ATTEMPTS else "queued"
+        return self._update_leased(
+            operation,
+            "status = $1, lease_token = NULL, available_at = NOW() + make_interval(secs => $2)",
+            status,
+            float(delay_seconds),
+        )
+
+    def extend_lease(self, operation: LeasedOperation, visibility_timeout_seconds: float) -> bool:
+        """Extend the lease of a long-running operation."""
+        return self._update_leased(
+            operation, "lease_expires_at = NOW() + make_interval(secs => $1)", float(visibility_timeout_seconds)
+        )
+
+    def purge(self, older_than_seconds: float) -> int:
+        """Delete finished operations, forgetting their idempotency keys."""
+
+        async def _purge():
+            pool = await self._acquire_pool()
+            return await pool.execute(
+                """
+                DELETE FROM scheduler_operations
+                WHERE status IN ('done', 'failed') AND updated_at < NOW() - make_interval(secs => $1)
+                """,
+                float(older_than_seconds),
+            )
+
+        # asyncpg returns the command status, e.g. "DELETE 3"
+        return int(self.closure_store.run(_purge()).split()[-1])
+
+    def get_state(self, name: str) -> Optional[str]:
+        """Read a schedule state value."""
+
+        async def _get():
+            pool = await self._acquire_pool()
+            return await pool.fetchval("SELECT value FROM scheduler_state WHERE name = $1", name)
+
+        return self.closure_store.run(_get())
+
+    def set_state(self, name: str, value: str) -> None:
+        """Write a schedule state value."""
+
+        async def _set():
+            pool = await self._acquire_pool()
+            await pool.execute(
+                """
+                INSERT INTO scheduler_state (name, value) VALUES ($1, $2)
+                ON CONFLICT (name) DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()
+                """,
+                name,
+                value,
+            )
+
+        self.closure_store.run(_set())
+
+
+def create_operation_store(closure_tracking_dir: str, closure_store: Optional[ClosureStore] = None) -> OperationStore:
+    """
+    Create the durable operation store for a deployment.
+
+    Args:
+        closure_tracking_dir: Directory of the SQLite database file
+        closure_store: Closure store of the deployment; a PostgreSQL store's pool is reused
+
+    Returns:
+        PostgresOperationStore if closure_store is a PostgresClosureStore, SQLiteOperationStore otherwise
+    """
+    if isinstance(closure_store, PostgresClosureStore):
+        return PostgresOperationStore(closure_store)
+
+    return SQLiteOperationStore(str(Path(closure_tracking_dir) / "operations.db"))
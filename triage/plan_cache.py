@@ -0,0 +1,345 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Persistent cache of generated daily plans keyed by backlog fingerprint."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from datetime import date
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from triage.closure_store import DEFAULT_USER_ID, ClosureStore, PostgresClosureStore
+from triage.models import AdminBlock, DailyPlan, IssueLink, JiraIssue, TaskCategory, TaskClassification
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+def backlog_fingerprint(issues: Iterable[JiraIssue], *parameters: Any) -> str:
+    """
+    Compute a stable fingerprint of a backlog and the plan parameters.
+
+    The fingerprint does not depend on the order of the issues, and changes
+    whenever any field of any issue (or any parameter) changes.
+
+    Args:
+        issues: Active JIRA issues the plan is built from
+        *parameters: JSON-serializable plan inputs besides the backlog
+
+    Returns:
+        Hex digest of the backlog and parameters
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(parameters, default=str).encode())
+
+    for issue in sorted(issues, key=lambda i: i.key):
+        digest.update(json.dumps(asdict(issue), sort_keys=True, default=str).encode())
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def plan_to_dict(plan: DailyPlan) -> Dict[str, Any]:
+    """
+    Convert a daily plan to a JSON-serializable dictionary.
+
+    Args:
+        plan: Daily plan to convert
+
+    Returns:
+        Dictionary accepted by plan_from_dict
+    """
+    data = asdict(plan)
+    data["date"] = plan.date.isoformat()
+    return json.loads(json.dumps(data, default=lambda value: value.value if isinstance(value, Enum) else str(value)))
+
+
+def plan_from_dict(data: Dict[str, Any]) -> DailyPlan:
+    """
+    Rebuild a daily plan from a dictionary produced by plan_to_dict.
+
+    Args:
+        data: Serialized plan
+
+    Returns:
+        DailyPlan equal to the serialized one
+    """
+
+    def _classification(item: Dict[str, Any]) -> TaskClassification:
+        task = dict(item["task"])
+        task["issue_links"] = [IssueLink(**link) for link in task.get("issue_links", [])]
+        rank_key = item.get("rank_key")
+        return TaskClassification(
+            task=JiraIssue(**task),
+            category=TaskCategory(item["category"]),
+            is_priority_eligible=item["is_priority_eligible"],
+            has_dependencies=item["has_dependencies"],
+            estimated_days=item["estimated_days"],
+            blocking_reason=item.get("blocking_reason"),
+            rank_key=tuple(rank_key) if rank_key is not None else None,
+        )
+
+    def _admin_block(item: Dict[str, Any]) -> AdminBlock:
+        return AdminBlock(
+            tasks=[_classification(c) for c in item["tasks"]],
+            time_allocation_minutes=item["time_allocation_minutes"],
+            scheduled_time=item["scheduled_time"],
+        )
+
+    return DailyPlan(
+        date=date.fromisoformat(data["date"]),
+        priorities=[_classification(c) for c in data["priorities"]],
+        admin_block=_admin_block(data["admin_block"]),
+        other_tasks=[_classification(c) for c in data["other_tasks"]],
+        previous_closure_rate=data.get("previous_closure_rate"),
+        decomposition_suggestions=[_classification(c) for c in data.get("decomposition_suggestions", [])],
+        blocked_tasks=[_classification(c) for c in data.get("blocked_tasks", [])],
+        additional_admin_blocks=[_admin_block(b) for b in data.get("additional_admin_blocks", [])],
+    )
+
+
+@dataclass
+class CachedPlan:
+    """A stored plan and the fingerprint of the backlog it was built from."""
+
+    plan: DailyPlan
+    fingerprint: str
+
+
+class PlanCache(ABC):
+    """
+    Storage backend for generated daily plans.
+
+    Plans are kept per user and plan date together with the fingerprint of
+    their input backlog, so a plan for an unchanged backlog is served without
+    classifying tasks or selecting priorities again.
+    """
+
+    @abstractmethod
+    def save(self, plan: DailyPlan, fingerprint: str, user_id: str = DEFAULT_USER_ID) -> None:
+        """
+        Insert or replace the stored plan of a date.
+
+        Args:
+            plan: Generated plan
+            fingerprint: Fingerprint of the backlog the plan was built from
+            user_id: Owner of the plan
+        """
+        pass
+
+    @abstractmethod
+    def load(self, plan_date: date, user_id: str = DEFAULT_USER_ID) -> Optional[CachedPlan]:
+        """
+        Load the stored plan of a date.
+
+        Args:
+            plan_date: Date of the plan
+            user_id: Owner of the plan
+
+        Returns:
+            CachedPlan if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self, user_id: str = DEFAULT_USER_ID, plan_date: Optional[date] = None) -> None:
+        """
+        Drop stored plans so the next request regenerates them.
+
+        Args:
+            user_id: Owner of the plans
+            plan_date: Date of the plan to drop (default: all of the user's plans)
+        """
+        pass
+
+    def close(self) -> None:
+        """Release resources held by the cache."""
+        pass
+
+
+class SQLitePlanCache(PlanCache):
+    """
+    Plan cache backed by a local SQLite database.
+
+    A single connection is shared between threads and guarded by a lock.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS daily_plans (
+        user_id TEXT NOT NULL,
+        plan_date TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        plan TEXT NOT NULL,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (user_id, plan_date)
+    );
+    """
+
+    def __init__(self, database_path: str):
+        """
+        Open (and create if needed) a SQLite plan cache.
+
+        Args:
+            database_path: Path of the database file, or ":memory:"
+        """
+        if database_path != ":memory:":
+            Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.database_path = database_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(database_path, check_same_thread=False)
+
+        with self._lock, self._conn:
+            self._conn.executescript(self.SCHEMA)
+
+        logger.info(f"SQLite plan cache opened at: {database_path}")
+
+    def save(self, plan: DailyPlan, fingerprint: str, user_id: str = DEFAULT_USER_ID) -> None:
+        """Insert or replace the stored plan of a date."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO daily_plans (user_id, plan_date, fingerprint, plan) VALUES (?, ?, ?, ?)",
+                (user_id, plan.date.isoformat(), fingerprint, json.dumps(plan_to_dict(plan))),
+            )
+
+    def load(self, plan_date: date, user_id: str = DEFAULT_USER_ID) -> Optional[CachedPlan]:
+        """Load the stored plan of a date."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, plan FROM daily_plans WHERE user_id = ? AND plan_date = ?",
+                (user_id, plan_date.isoformat()),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return CachedPlan(plan=plan_from_dict(json.loads(row[1])), fingerprint=row[0])
+
+    def invalidate(self, user_id: str = DEFAULT_USER_ID, plan_date: Optional[date] = None) -> None:
+        """Drop stored plans so the next request regenerates them."""
+        with self._lock, self._conn:
+            if plan_date is None:
+                self._conn.execute("DELETE FROM daily_plans WHERE user_id = ?", (user_id,))
+            else:
+                self._conn.execute(
+                    "DELETE FROM daily_plans WHERE user_id = ? AND plan_date = ?", (user_id, plan_date.isoformat())
+                )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class PostgresPlanCache(PlanCache):
+    """
+    Plan cache stored in PostgreSQL next to the closure records.
+
+    The cache shares the connection pool and event loop of a
+    PostgresClosureStore instead of opening its own.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS daily_plans (
+        user_id VARCHAR(255) NOT NULL,
+        plan_date DATE NOT NULL,
+        fingerprint VARCHAR(64) NOT NULL,
+        plan JSONB NOT NULL,
+        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (user_id, plan_date)
+    );
+    """
+
+    def __init__(self, closure_store: PostgresClosureStore):
+        """
+        Initialize a PostgreSQL plan cache.
+
+        Args:
+            closure_store: PostgreSQL closure store whose pool is shared
+        """
+        self.closure_store = closure_store
+        self._schema_ready = False
+
+    async def _acquire_pool(self):
+        """Get the shared pool, creating the plan table on first use."""
+        pool = await self.closure_store.acquire_pool()
+        if not self._schema_ready:
+            async with pool.acquire() as conn:
+                await conn.execute(self.SCHEMA)
+            self._schema_ready = True
+        return pool
+
+    def save(self, plan: DailyPlan, fingerprint: str, user_id: str = DEFAULT_USER_ID) -> None:
+        """Insert or replace the stored plan of a date."""
+
+        async def _save():
+            pool = await self._acquire_pool()
+            await pool.execute(
+                """
+                INSERT INTO daily_plans (user_id, plan_date, fingerprint, plan)
+                VALUES ($1, $2, $3, $4::jsonb)
+                ON CONFLICT (user_id, plan_date) DO UPDATE SET
+                    fingerprint = EXCLUDED.fingerprint,
+                    plan = EXCLUDED.plan,
+                    created_at = NOW()
+                """,
+                user_id,
+                plan.date,
+                fingerprint,
+                json.dumps(plan_to_dict(plan)),
+            )
+
+        self.closure_store.run(_save())
+
+    def load(self, plan_date: date, user_id: str = DEFAULT_USER_ID) -> Optional[CachedPlan]:
+        """Load the stored plan of a date."""
+
+        async def _load():
+            pool = await self._acquire_pool()
+            return await pool.fetchrow(
+                "SELECT fingerprint, plan FROM daily_plans WHERE user_id = $1 AND plan_date = $2", user_id, plan_date
+            )
+
+        row = self.closure_store.run(_load())
+        if row is None:
+            return None
+
+        # asyncpg returns JSONB as text unless a codec is registered
+        data = json.loads(row["plan"]) if isinstance(row["plan"], str) else row["plan"]
+        return CachedPlan(plan=plan_from_dict(data), fingerprint=row["fingerprint"])
+
+    def invalidate(self, user_id: str = DEFAULT_USER_ID, plan_date: Optional[date] = None) -> None:
+        """Drop stored plans so the next request regenerates them."""
+
+        async def _invalidate():
+            pool = await self._acquire_pool()
+            if plan_date is None:
+                await pool.execute("DELETE FROM daily_plans WHERE user_id = $1", user_id)
+            else:
+                await pool.execute("DELETE FROM daily_plans WHERE user_id = $1 AND plan_date = $2", user_id, plan_date)
+
+        self.closure_store.run(_invalidate())
+
+
+def create_plan_cache(closure_tracking_dir: str, closure_store: Optional[ClosureStore] = None) -> PlanCache:
+    """
+    Create the plan cache for a deployment.
+
+    Args:
+        closure_tracking_dir: Directory of the SQLite database file
+        closure_store: Closure store of the deployment; a PostgreSQL store's pool is reused
+
+    Returns:
+        PostgresPlanCache if closure_store is a PostgresClosureStore, SQLitePlanCache otherwise
+    """
+    if isinstance(closure_store, PostgresClosureStore):
+        return PostgresPlanCache(closure_store)
+
+    return SQLitePlanCache(str(Path(closure_tracking_dir) / "plans.db"))
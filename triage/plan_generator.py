@@ -4,24 +4,38 @@
 
 """Plan generation logic for creating daily execution plans."""
 
+import copy
+import heapq
 import json
 import logging
 import os
-from datetime import date
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from triage.admin_block_packer import AdminBlockPacker
+from triage.closure_analytics import ClosureAnalytics
+from triage.closure_store import DEFAULT_USER_ID, ClosureStore, SQLiteClosureStore
 from triage.core.event_bus import Event, EventBus
+from triage.dependency_graph import DependencyGraph
 from triage.jira_client import JiraClient
 from triage.models import (
     AdminBlock,
+    ClosureOutcome,
     ClosureRecord,
+    ClosureTrend,
     DailyPlan,
+    DecompositionResult,
     JiraIssue,
     SubtaskSpec,
     TaskCategory,
     TaskClassification,
 )
+from triage.plan_cache import PlanCache, backlog_fingerprint
+from triage.ranked_backlog import RankedBacklog, RankKey
 from triage.task_classifier import TaskClassifier
 
 # Set up logging
@@ -42,12 +56,43 @@ class PlanGenerator:
     # Default admin block scheduling time (post-lunch)
     DEFAULT_ADMIN_TIME = "14:00-15:30"
 
+    # Supported priority selection strategies
+    SELECTION_STRATEGIES = ("knapsack", "greedy")
+
+    # Number of top-ranked tasks considered by the knapsack selection
+    PRIORITY_CANDIDATE_POOL = 10
+
+    # Effort resolution for the knapsack selection (buckets per working day)
+    EFFORT_BUCKETS_PER_DAY = 1000
+
+    # Maximum age of the backlog snapshot used for replanning (15 minutes)
+    SNAPSHOT_MAX_AGE_SECONDS = 15 * 60
+
+    # Resolutions that close a task without it being done
+    OUT_OF_SCOPE_RESOLUTIONS = {"won't do", "won't fix", "duplicate", "cannot reproduce", "incomplete", "declined"}
+
+    # Statuses that count as done even without a resolution
+    DONE_STATUSES = {"done", "closed", "resolved", "complete", "billed"}
+
+    # Number of working days planned by generate_horizon_plan
+    HORIZON_DAYS = 5
+
+    # Maximum number of parent tasks whose subtasks are created in parallel
+    MAX_DECOMPOSITION_WORKERS = 4
+
     def __init__(
         self,
         jira_client: JiraClient,
         classifier: TaskClassifier,
         closure_tracking_dir: Optional[str] = None,
         event_bus: Optional[EventBus] = None,
+        selection_strategy: str = "knapsack",
+        admin_block_times: Optional[List[str]] = None,
+        admin_packing_objective: str = "minutes",
+        closure_store: Optional[ClosureStore] = None,
+        user_id: str = DEFAULT_USER_ID,
+        plan_cache: Optional[PlanCache] = None,
+        dependency_graph: Optional[DependencyGraph] = None,
     ):
         """
         Initialize plan generator with dependencies.
@@ -57,10 +102,40 @@ class PlanGenerator:
             classifier: Task classifier for categorizing tasks
             closure_tracking_dir: Directory for storing closure tracking data (default: .triage/closure)
             event_bus: Event bus for emitting events (optional)
+            selection_strategy: Priority selection strategy, "knapsack" (default) or "greedy"
+            admin_block_times: Time ranges of the daily admin blocks (default: [DEFAULT_ADMIN_TIME])
+            admin_packing_objective: Admin block packing objective, "minutes" (default) or "count"
+            closure_store: Store for closure records (default: SQLite database in closure_tracking_dir)
+            user_id: Owner of the closure records written by this generator (default: "default")
+            plan_cache: Store of generated plans keyed by backlog fingerprint (optional)
+            dependency_graph: Issue-link graph kept in sync with the backlog (optional);
+                              pass the same graph to the classifier so resolved
+                              blockers are ignored. Tasks that unblock more
+                              backlog work rank higher among equal priorities.
+
+        Raises:
+            ValueError: If selection_strategy or admin_packing_objective is not supported,
+                        or an admin block time is not a HH:MM-HH:MM range
         """
+        if selection_strategy not in self.SELECTION_STRATEGIES:
+            raise ValueError(
+                f"Invalid selection strategy: {selection_strategy}. "
+                f"Expected one of: {', '.join(self.SELECTION_STRATEGIES)}"
+            )
+
         self.jira_client = jira_client
         self.classifier = classifier
         self.event_bus = event_bus
+        self.selection_strategy = selection_strategy
+        self.admin_block_times = admin_block_times
+        for scheduled_time in admin_block_times or []:
+            AdminBlockPacker.block_minutes(scheduled_time)
+        self.admin_packer = AdminBlockPacker(max_minutes=self.MAX_ADMIN_MINUTES, objective=admin_packing_objective)
+        self.ranked_backlog = RankedBacklog(self._rank_key)
+
+        # Classified backlog of the last plan, used to replan without refetching
+        self._snapshot: Dict[str, TaskClassification] = {}
+        self._snapshot_taken_at: Optional[float] = None
 
         # Set up closure tracking directory
         if closure_tracking_dir is None:
@@ -69,6 +144,13 @@ class PlanGenerator:
         self.closure_tracking_dir = Path(closure_tracking_dir)
         self.closure_tracking_dir.mkdir(parents=True, exist_ok=True)
 
+        if closure_store is None:
+            closure_store = SQLiteClosureStore(str(self.closure_tracking_dir / "closure.db"))
+        self.closure_store = closure_store
+        self.user_id = user_id
+        self.plan_cache = plan_cache
+        self.dependency_graph = dependency_graph
+
         logger.info(f"Plan generator initialized with closure tracking at: {self.closure_tracking_dir}")
         if event_bus:
             logger.info("Plan generator configured with event bus for event emission")
@@ -121,6 +203,34 @@ class PlanGenerator:
 
         return eligible
 
+    def _rank_key(self, classification: TaskClassification) -> RankKey:
+        """
+        Get the sort key used to rank a task.
+
+        The key is computed by the classifier and cached on the classification,
+        so it is only computed here for classifications built elsewhere. With
+        a dependency graph, the number of backlog tasks the task unblocks
+        breaks ties between tasks of equal status and priority.
+
+        Args:
+            classification: Classified task
+
+        Returns:
+            Tuple of (status rank, priority rank, effort, age proxy), or
+            (status rank, priority rank, -unblocked tasks, effort, age proxy)
+            with a dependency graph
+        """
+        if classification.rank_key is None:
+            classification.rank_key = TaskClassifier.compute_rank_key(
+                classification.task, classification.estimated_days
+            )
+        if self.dependency_graph is None:
+            return classification.rank_key
+
+        status_rank, priority_rank, effort, age = classification.rank_key
+        unblocks = self.dependency_graph.unblocks_count(classification.task.key)
+        return (status_rank, priority_rank, -unblocks, effort, age)
+
     def _rank_tasks(self, tasks: List[TaskClassification]) -> List[TaskClassification]:
         """
         Rank tasks by status, priority, effort, and age.
@@ -131,58 +241,51 @@ class PlanGenerator:
         3. Effort (smaller first)
         4. Age (older first - using key as proxy)
 
+        Uses the rank keys cached on the classifications.
+
         Args:
             tasks: List of tasks to rank
 
         Returns:
             Sorted list of tasks
         """
-        # Define priority order
-        priority_order = {
-            "blocker": 0,
-            "highest": 1,
-            "high": 2,
-            "medium": 3,
-            "low": 4,
-            "lowest": 5,
-        }
-
-        def sort_key(classification: TaskClassification):
-            task = classification.task
-
-            # Prioritize tasks already in progress (should be completed first)
-            status_rank = 0 if task.status.lower() == "in progress" else 1
+        return sorted(tasks, key=self._rank_key)
 
-            # Get priority rank (lower is higher priority)
-            priority_rank = priority_order.get(task.priority.lower(), 3)
+    def _select_priorities(
+        self, eligible_tasks: List[TaskClassification], ranked: Optional[RankedBacklog] = None
+    ) -> List[TaskClassification]:
+        """
+        Select priority tasks using the configured selection strategy.
 
-            # Get effort (smaller is better)
-            effort = classification.estimated_days
+        Args:
+            eligible_tasks: Priority-eligible tasks (in any order)
+            ranked: The same tasks already kept in rank order (optional);
+                    avoids sorting or heap-scanning the backlog
 
-            # Get age proxy (older keys typically have lower numbers)
-            # Extract numeric part from key like "PROJ-123"
-            try:
-                key_parts = task.key.split("-")
-                if len(key_parts) >= 2:
-                    age_proxy = int(key_parts[-1])
-                else:
-                    age_proxy = 0
-            except (ValueError, IndexError):
-                age_proxy = 0
+        Returns:
+            List of up to 3 priority tasks that fit in one day, in rank order
+        """
+        if self.selection_strategy == "greedy":
+            ranked_tasks = iter(ranked) if ranked is not None else self._rank_tasks(eligible_tasks)
+            return self._select_priorities_greedy(ranked_tasks)
 
-            return (status_rank, priority_rank, effort, age_proxy)
+        if ranked is not None:
+            candidates = ranked.top(self.PRIORITY_CANDIDATE_POOL)
+        else:
+            candidates = heapq.nsmallest(self.PRIORITY_CANDIDATE_POOL, eligible_tasks, key=self._rank_key)
 
-        return sorted(tasks, key=sort_key)
+        return self._select_priorities_knapsack(candidates)
 
-    def _select_priorities(self, ranked_tasks: List[TaskClassification]) -> List[TaskClassification]:
+    def _select_priorities_greedy(self, ranked_tasks: Iterable[TaskClassification]) -> List[TaskClassification]:
         """
-        Select top tasks as priorities, respecting daily capacity.
+        Select top tasks as priorities by walking the ranked list.
 
         Selects up to 3 tasks that fit within a standard 8-hour workday.
-        Tasks are selected in priority order until capacity is reached.
+        Tasks are selected in priority order until capacity is reached;
+        tasks that would overflow the day are skipped.
 
         Args:
-            ranked_tasks: List of ranked tasks
+            ranked_tasks: Tasks in rank order
 
         Returns:
             List of up to 3 priority tasks that fit in one day
@@ -219,63 +322,360 @@ class PlanGenerator:
 
         return selected
 
-    def _group_admin_tasks(self, classifications: List[TaskClassification]) -> AdminBlock:
+    def _select_priorities_knapsack(self, candidates: List[TaskClassification]) -> List[TaskClassification]:
         """
-        Group administrative tasks into a time block with 90-minute limit.
+        Select priorities that make the best use of daily capacity.
+
+        Only the top-ranked candidates (``PRIORITY_CANDIDATE_POOL``) are
+        considered, so the whole backlog never needs sorting. The best-ranked
+        candidate that fits in a day is always kept, so a blocker or task in
+        progress is never traded for lower-ranked tasks that fill the day
+        better. Effort is rounded to the nearest of ``EFFORT_BUCKETS_PER_DAY``
+        buckets, fine enough that exact fits such as 0.35 + 0.35 + 0.3 days are
+        not lost to rounding, and a bounded 0/1 knapsack (at most
+        ``MAX_PRIORITIES`` items, one day of capacity) fills the remaining
+        capacity: the combination that fills the most capacity wins, then the
+        one with the most tasks, then the best-ranked one.
+
+        Args:
+            candidates: Top-ranked eligible tasks, in rank order
+
+        Returns:
+            List of up to 3 priority tasks that fit in one day, in rank order
+        """
+        capacity = self.EFFORT_BUCKETS_PER_DAY
+
+        # Effort in buckets; rounding errors of floats stay well below one bucket
+        weights = [round(c.estimated_days * capacity) for c in candidates]
+
+        # The best-ranked candidate that fits is kept whatever the others weigh
+        top = next((index for index, weight in enumerate(weights) if weight <= capacity), None)
+        if top is None:
+            return []
+
+        # best[(count, used)] = lexicographically smallest tuple of candidate indexes
+        # Candidates are visited in rank order, so smaller tuples are better ranked
+        best: Dict[Tuple[int, int], Tuple[int, ...]] = {(1, weights[top]): (top,)}
+
+        for index, weight in enumerate(weights[top + 1 :], start=top + 1):
+            if weight > capacity:
+                continue
+
+            for (count, used), chosen in list(best.items()):
+                if count >= self.MAX_PRIORITIES or used + weight > capacity:
+                    continue
+
+                state = (count + 1, used + weight)
+                selection = chosen + (index,)
+                if state not in best or selection < best[state]:
+                    best[state] = selection
+
+        # Most capacity used first, then most tasks; rank already broke ties per state
+        state = max(best, key=lambda s: (s[1], s[0]))
+        selected = [candidates[i] for i in best[state]]
+
+        if selected:
+            total_days = sum(c.estimated_days for c in selected)
+            logger.info(
+                f"Selected {len(selected)} priority tasks with total effort: "
+                f"{total_days:.1f} days ({total_days * 8:.1f} hours)"
+            )
+
+        return selected
+
+    def _group_admin_blocks(self, classifications: List[TaskClassification]) -> List[AdminBlock]:
+        """
+        Pack administrative tasks into the configured admin blocks.
+
+        Each block is limited to 90 minutes and to the length of its time
+        range. The packer keeps admin tasks in a
+        persistent heap, so only tasks that changed since the previous plan
+        cause heap updates.
 
         Args:
             classifications: List of all classified tasks
 
         Returns:
-            AdminBlock with tasks limited to 90 minutes
+            List of AdminBlocks, one per configured block time
         """
-        # Collect all administrative tasks
         admin_tasks = [c for c in classifications if c.category == TaskCategory.ADMINISTRATIVE]
+        self.admin_packer.sync(admin_tasks)
+
+        return self.admin_packer.pack(self._admin_block_schedule())
 
-        # Sort admin tasks by effort (smallest first) to maximize tasks that fit
-        admin_tasks_sorted = sorted(admin_tasks, key=lambda c: c.estimated_days)
+    def _admin_block_schedule(self) -> List[str]:
+        """Get the time ranges of the configured admin blocks."""
+        return self.admin_block_times or [self.DEFAULT_ADMIN_TIME]
 
-        # Calculate time allocation and limit to 90 minutes
-        selected_tasks = []
-        total_minutes = 0
+    def _group_admin_tasks(self, classifications: List[TaskClassification]) -> AdminBlock:
+        """
+        Group administrative tasks into a time block with 90-minute limit.
 
-        for task in admin_tasks_sorted:
-            # Convert days to minutes (8 hours per day)
-            task_minutes = task.estimated_days * 8 * 60
+        Args:
+            classifications: List of all classified tasks
 
-            # Check if adding this task would exceed the limit
-            if total_minutes + task_minutes <= self.MAX_ADMIN_MINUTES:
-                selected_tasks.append(task)
-                total_minutes += task_minutes
-            # If task doesn't fit, skip it and try the next one
+        Returns:
+            AdminBlock with tasks limited to 90 minutes
+        """
+        return self._group_admin_blocks(classifications)[0]
 
-        return AdminBlock(
-            tasks=selected_tasks, time_allocation_minutes=int(total_minutes), scheduled_time=self.DEFAULT_ADMIN_TIME
-        )
+    def _classify_tasks(self, issues: List[JiraIssue]) -> List[TaskClassification]:
+        """
+        Classify a list of JIRA issues.
 
-    def generate_daily_plan(self, previous_closure_rate: Optional[float] = None) -> DailyPlan:
+        Args:
+            issues: Raw JIRA issues to classify
+
+        Returns:
+            List of task classifications in the same order as the input
+        """
+        logger.debug("Classifying tasks")
+        classifications = [self.classifier.classify_task(task) for task in issues]
+        logger.info(f"Classified {len(classifications)} tasks")
+        return classifications
+
+    def generate_daily_plan(
+        self,
+        previous_closure_rate: Optional[float] = None,
+        issues: Optional[List[JiraIssue]] = None,
+        classified_tasks: Optional[List[TaskClassification]] = None,
+        plan_date: Optional[date] = None,
+    ) -> DailyPlan:
         """
         Generate a daily plan from current JIRA state.
 
+        Callers that already fetched or classified the backlog can pass it in
+        to avoid a second JIRA round-trip and classification pass. When
+        ``classified_tasks`` is given it is used as-is; otherwise ``issues`` are
+        classified; if neither is given, active tasks are fetched from JIRA.
+
+        With a plan cache configured, the stored plan of the date is returned
+        as-is when the backlog fingerprint is unchanged, skipping
+        classification and selection; otherwise the new plan is stored. The
+        backlog snapshot and ranked backlog are rebuilt from a stored plan,
+        so a later replan still works from the snapshot.
+
         Args:
             previous_closure_rate: Closure rate from previous day (0.0-1.0)
                                   If None, will attempt to load from previous day's record
+            issues: Pre-fetched active JIRA issues (optional)
+            classified_tasks: Pre-computed task classifications (optional)
+            plan_date: Date of the plan (default: today)
 
         Returns:
             DailyPlan with up to 3 priorities and admin block
         """
         logger.info("Generating daily plan")
 
-        # Fetch all active tasks from JIRA
-        logger.debug("Fetching active tasks from JIRA")
-        active_tasks = self.jira_client.fetch_active_tasks()
-        logger.info(f"Fetched {len(active_tasks)} active tasks")
+        if plan_date is None:
+            plan_date = date.today()
 
-        # Classify all tasks
-        logger.debug("Classifying tasks")
-        classifications = [self.classifier.classify_task(task) for task in active_tasks]
-        logger.info(f"Classified {len(classifications)} tasks")
+        if classified_tasks is None and issues is None:
+            # Fetch all active tasks from JIRA
+            logger.debug("Fetching active tasks from JIRA")
+            issues = self.jira_client.fetch_active_tasks()
+            logger.info(f"Fetched {len(issues)} active tasks")
+
+        self._sync_dependency_graph(issues if classified_tasks is None else [c.task for c in classified_tasks])
+
+        fingerprint = None
+        if self.plan_cache is not None:
+            if previous_closure_rate is None:
+                previous_closure_rate = self.get_previous_closure_rate(plan_date)
+
+            backlog = issues if classified_tasks is None else [c.task for c in classified_tasks]
+            fingerprint = self._plan_fingerprint(backlog, previous_closure_rate)
+
+            cached = self.plan_cache.load(plan_date, self.user_id)
+            if cached is not None and cached.fingerprint == fingerprint:
+                logger.info(f"Backlog unchanged, serving stored plan for {plan_date}")
+                self._sync_backlog_state(
+                    classified_tasks if classified_tasks is not None else self._plan_classifications(cached.plan)
+                )
+                return cached.plan
+
+        if classified_tasks is not None:
+            classifications = list(classified_tasks)
+            logger.info(f"Using {len(classifications)} pre-classified tasks")
+        else:
+            classifications = self._classify_tasks(issues)
+
+        plan = self._build_daily_plan(classifications, plan_date, previous_closure_rate)
+
+        if fingerprint is not None:
+            self.plan_cache.save(plan, fingerprint, self.user_id)
+
+        return plan
+
+    def _plan_fingerprint(self, issues: Iterable[JiraIssue], previous_closure_rate: Optional[float]) -> str:
+        """
+        Fingerprint the inputs of a daily plan.
+
+        Args:
+            issues: Active JIRA issues
+            previous_closure_rate: Closure rate shown on the plan
+
+        Returns:
+            Fingerprint of the backlog and the generator settings
+        """
+        return backlog_fingerprint(
+            issues,
+            previous_closure_rate,
+            self.selection_strategy,
+            self.admin_packer.objective,
+            self._admin_block_schedule(),
+            sorted(self.dependency_graph.external_states().items()) if self.dependency_graph is not None else None,
+        )
+
+    def _sync_dependency_graph(self, issues: List[JiraIssue]) -> None:
+        """
+        Bring the dependency graph in line with a complete backlog, before it is classified.
+
+        Args:
+            issues: All active issues of the backlog
+        """
+        if self.dependency_graph is None:
+            return
+
+        self.dependency_graph.sync(issues)
+        for cycle in self.dependency_graph.find_cycles():
+            logger.warning(f"Dependency cycle: {' -> '.join(cycle)}")
+
+    def get_stored_plan(self, plan_date: Optional[date] = None) -> Optional[DailyPlan]:
+        """
+        Get the stored plan of a date without contacting JIRA.
+
+        Args:
+            plan_date: Date of the plan (default: today)
+
+        Returns:
+            Stored DailyPlan, or None if no plan cache is configured or no plan is stored
+        """
+        if self.plan_cache is None:
+            return None
+
+        cached = self.plan_cache.load(plan_date or date.today(), self.user_id)
+        return cached.plan if cached else None
+
+    def invalidate_stored_plan(self, plan_date: Optional[date] = None) -> None:
+        """
+        Drop the stored plan of a date so the next request regenerates it.
+
+        Args:
+            plan_date: Date of the plan (default: all stored plans of the user)
+        """
+        if self.plan_cache is not None:
+            self.plan_cache.invalidate(self.user_id, plan_date)
+            logger.info(f"Invalidated stored plan for {plan_date or 'all dates'}")
+
+    def fork(self) -> "PlanGenerator":
+        """
+        Copy the generator so a replan can run while this one builds the next plan.
+
+        The fork shares the JIRA client, event bus, closure store, plan cache and
+        the classified tasks of the snapshot, which are not modified once
+        classified. It gets its own snapshot, ranked backlog, admin packer,
+        dependency graph and classifier, so neither generator sees the other's
+        changes.
+
+        Returns:
+            Independent PlanGenerator with the current backlog state
+        """
+        shared = [self.jira_client, self.event_bus, self.closure_store, self.plan_cache]
+        shared.extend(self._snapshot.values())
+        memo = {id(obj): obj for obj in shared if obj is not None}
+        return copy.deepcopy(self, memo)
+
+    def _record_snapshot(self, classifications: List[TaskClassification]) -> None:
+        """
+        Remember the classified backlog a plan was built from.
+
+        Args:
+            classifications: Complete set of classified tasks
+        """
+        self._snapshot = {c.task.key: c for c in classifications}
+        self._snapshot_taken_at = time.monotonic()
+
+    def _sync_backlog_state(self, classifications: List[TaskClassification]) -> None:
+        """
+        Bring the ranked backlog, admin packer and snapshot in line with a complete backlog.
+
+        Args:
+            classifications: Complete set of classified tasks
+        """
+        self.ranked_backlog.sync(self._filter_eligible_tasks(classifications))
+        self.admin_packer.sync([c for c in classifications if c.category == TaskCategory.ADMINISTRATIVE])
+        self._record_snapshot(classifications)
+
+    @staticmethod
+    def _plan_classifications(plan: DailyPlan) -> List[TaskClassification]:
+        """
+        Get every classified task of a plan.
+
+        Args:
+            plan: Daily plan
+
+        Returns:
+            Priorities, admin, other, decomposition and blocked tasks of the plan
+        """
+        admin_tasks = [c for block in [plan.admin_block] + plan.additional_admin_blocks for c in block.tasks]
+        return plan.priorities + admin_tasks + plan.other_tasks + plan.decomposition_suggestions + plan.blocked_tasks
+
+    def _snapshot_is_fresh(self) -> bool:
+        """Check whether the backlog snapshot exists and is recent enough to replan from."""
+        if self._snapshot_taken_at is None:
+            return False
+        return time.monotonic() - self._snapshot_taken_at <= self.SNAPSHOT_MAX_AGE_SECONDS
+
+    def _apply_snapshot_delta(
+        self, upserted: List[TaskClassification], removed_keys: Iterable[str] = ()
+    ) -> List[TaskClassification]:
+        """
+        Apply changed and removed tasks to the snapshot, ranked backlog and admin packer.
+
+        Only the tasks in the delta are touched, so the cost is proportional to
+        the size of the delta rather than the backlog.
+
+        Args:
+            upserted: New or changed classifications
+            removed_keys: Keys of tasks that left the backlog
+
+        Returns:
+            Updated list of all classified tasks
+        """
+        for task_key in removed_keys:
+            self._snapshot.pop(task_key, None)
+            self.ranked_backlog.remove(task_key)
+            self.admin_packer.remove(task_key)
+
+        for classification in upserted:
+            task_key = classification.task.key
+            self._snapshot[task_key] = classification
+
+            if self._filter_eligible_tasks([classification]):
+                self.ranked_backlog.upsert(classification)
+            else:
+                self.ranked_backlog.remove(task_key)
+
+            if classification.category == TaskCategory.ADMINISTRATIVE:
+                self.admin_packer.add(classification)
+            else:
+                self.admin_packer.remove(task_key)
+
+        return list(self._snapshot.values())
+
+    def _split_unschedulable(
+        self, classifications: List[TaskClassification]
+    ) -> Tuple[List[TaskClassification], List[TaskClassification]]:
+        """
+        Find the tasks that cannot be scheduled as they are.
 
+        Args:
+            classifications: Classified active tasks
+
+        Returns:
+            Tuple of (blocked or waiting tasks, long-running tasks to decompose)
+        """
         # Identify blocked or waiting tasks (not actionable)
         blocked_statuses = {"blocked", "waiting", "on hold", "pending"}
         blocked_tasks = [c for c in classifications if c.task.status.lower() in blocked_statuses]
@@ -291,29 +691,52 @@ class PlanGenerator:
             for c in decomposition_suggestions:
                 logger.info(f"  {c.task.key}: {c.estimated_days:.1f} days - {c.task.summary}")
 
+        return blocked_tasks, decomposition_suggestions
+
+    def _build_daily_plan(
+        self,
+        classifications: List[TaskClassification],
+        plan_date: date,
+        previous_closure_rate: Optional[float] = None,
+    ) -> DailyPlan:
+        """
+        Build a daily plan from classified tasks without touching JIRA.
+
+        Args:
+            classifications: Classified active tasks
+            plan_date: Date of the plan
+            previous_closure_rate: Closure rate from previous day (0.0-1.0)
+
+        Returns:
+            DailyPlan with up to 3 priorities and admin block
+        """
+        blocked_tasks, decomposition_suggestions = self._split_unschedulable(classifications)
+
         # Filter eligible tasks for priority selection
         eligible_tasks = self._filter_eligible_tasks(classifications)
         logger.info(f"Found {len(eligible_tasks)} priority-eligible tasks")
 
-        # Rank eligible tasks
-        ranked_tasks = self._rank_tasks(eligible_tasks)
-        logger.debug(f"Ranked {len(ranked_tasks)} tasks")
+        # Keep eligible tasks in rank order; only changed tasks are re-positioned
+        self.ranked_backlog.sync(eligible_tasks)
+        self._record_snapshot(classifications)
 
-        # Select top 3 as priorities
-        priorities = self._select_priorities(ranked_tasks)
+        # Select up to 3 priorities that fit in the day
+        priorities = self._select_priorities(eligible_tasks, ranked=self.ranked_backlog)
         logger.info(f"Selected {len(priorities)} priority tasks")
         for i, p in enumerate(priorities, 1):
             logger.info(f"  Priority {i}: {p.task.key} - {p.task.summary}")
 
         # Group administrative tasks
-        admin_block = self._group_admin_tasks(classifications)
-        logger.info(
-            f"Grouped {len(admin_block.tasks)} administrative tasks ({admin_block.time_allocation_minutes} minutes)"
-        )
+        admin_blocks = self._group_admin_blocks(classifications)
+        for block in admin_blocks:
+            logger.info(
+                f"Grouped {len(block.tasks)} administrative tasks "
+                f"({block.time_allocation_minutes} minutes) at {block.scheduled_time}"
+            )
 
         # Collect other tasks for reference (non-priority, non-admin, non-decomposition-suggestions, non-blocked)
         priority_keys = {c.task.key for c in priorities}
-        admin_keys = {c.task.key for c in admin_block.tasks}
+        admin_keys = {c.task.key for block in admin_blocks for c in block.tasks}
         decomposition_keys = {c.task.key for c in decomposition_suggestions}
         blocked_keys = {c.task.key for c in blocked_tasks}
 
@@ -329,29 +752,29 @@ class PlanGenerator:
 
         # Get previous closure rate if not provided
         if previous_closure_rate is None:
-            previous_closure_rate = self.get_previous_closure_rate(date.today())
+            previous_closure_rate = self.get_previous_closure_rate(plan_date)
             if previous_closure_rate is not None:
                 logger.info(f"Previous closure rate: {previous_closure_rate:.2%}")
 
         # Create and return daily plan
         plan = DailyPlan(
-            date=date.today(),
+            date=plan_date,
             priorities=priorities,
-            admin_block=admin_block,
+            admin_block=admin_blocks[0],
             other_tasks=other_tasks,
             previous_closure_rate=previous_closure_rate,
             decomposition_suggestions=decomposition_suggestions,
             blocked_tasks=blocked_tasks,
+            additional_admin_blocks=admin_blocks[1:],
         )
 
         logger.info(f"Daily plan generated successfully for {plan.date}")
 
         # Emit plan_generated event if event bus is configured
         if self.event_bus:
-            import asyncio
-
             event = Event(
                 event_type="plan_generated",
+                key=self.user_id,
                 event_data={
                     "plan_date": plan.date.isoformat(),
                     "priority_count": len(plan.priorities),
@@ -364,21 +787,142 @@ class PlanGenerator:
                 },
             )
             try:
-                # Use asyncio to run the async publish method
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If loop is already running, schedule the coroutine
-                    asyncio.create_task(self.event_bus.publish(event))
-                else:
-                    # If no loop is running, run it synchronously
-                    loop.run_until_complete(self.event_bus.publish(event))
+                # Hand over to the event bus loop thread; handlers do not run here
+                self.event_bus.publish_threadsafe(event)
                 logger.info(f"Emitted plan_generated event for {plan.date}")
             except Exception as e:
                 logger.error(f"Failed to emit plan_generated event: {e}", exc_info=True)
 
         return plan
 
-    def generate_replan(self, blocking_task: JiraIssue, current_plan: DailyPlan) -> DailyPlan:
+    def generate_horizon_plan(
+        self,
+        days: int = HORIZON_DAYS,
+        start_date: Optional[date] = None,
+        previous_closure_rate: Optional[float] = None,
+        issues: Optional[List[JiraIssue]] = None,
+        classified_tasks: Optional[List[TaskClassification]] = None,
+    ) -> List[DailyPlan]:
+        """
+        Plan the next working days from a single backlog snapshot.
+
+        The backlog is fetched, classified and ranked once. Days are then
+        filled in turn from the same ranked order: each day selects its
+        priorities among the tasks not placed on an earlier day, and the admin
+        blocks of all days are packed in one pass, so a task is scheduled at
+        most once across the horizon. Tasks placed on earlier days are assumed
+        done and left out of later days' other tasks. The plans are previews:
+        they are neither stored in the plan cache nor announced on the event
+        bus.
+
+        Args:
+            days: Number of working days to plan (default: HORIZON_DAYS)
+            start_date: First day of the horizon; weekends are skipped (default: today)
+            previous_closure_rate: Closure rate of the day before the horizon
+                                  If None, will attempt to load from the previous day's record
+            issues: Pre-fetched active JIRA issues (optional)
+            classified_tasks: Pre-computed task classifications (optional)
+
+        Returns:
+            One DailyPlan per working day, in date order
+
+        Raises:
+            ValueError: If days is not positive
+        """
+        if days < 1:
+            raise ValueError(f"days must be positive, got {days}")
+
+        plan_dates = self._working_days(start_date or date.today(), days)
+        logger.info(f"Generating {days}-day horizon plan from {plan_dates[0]} to {plan_dates[-1]}")
+
+        if classified_tasks is not None:
+            classifications = list(classified_tasks)
+            self._sync_dependency_graph([c.task for c in classifications])
+        else:
+            if issues is None:
+                logger.debug("Fetching active tasks from JIRA")
+                issues = self.jira_client.fetch_active_tasks()
+                logger.info(f"Fetched {len(issues)} active tasks")
+            self._sync_dependency_graph(issues)
+            classifications = self._classify_tasks(issues)
+
+        blocked_tasks, decomposition_suggestions = self._split_unschedulable(classifications)
+        unschedulable_keys = {c.task.key for c in blocked_tasks} | {c.task.key for c in decomposition_suggestions}
+
+        # Rank once; every day draws from the same ranked order
+        self.ranked_backlog.sync(self._filter_eligible_tasks(classifications))
+        self._record_snapshot(classifications)
+
+        # Pack the admin blocks of all days in one pass so no task is repeated
+        schedule = self._admin_block_schedule()
+        self.admin_packer.sync([c for c in classifications if c.category == TaskCategory.ADMINISTRATIVE])
+        admin_blocks = self.admin_packer.pack(schedule * days)
+
+        if previous_closure_rate is None:
+            previous_closure_rate = self.get_previous_closure_rate(plan_dates[0])
+
+        plans = []
+        scheduled_keys: set = set()
+
+        for day, plan_date in enumerate(plan_dates):
+            remaining = (c for c in self.ranked_backlog if c.task.key not in scheduled_keys)
+            if self.selection_strategy == "greedy":
+                priorities = self._select_priorities_greedy(remaining)
+            else:
+                priorities = self._select_priorities_knapsack(list(islice(remaining, self.PRIORITY_CANDIDATE_POOL)))
+
+            day_admin_blocks = admin_blocks[day * len(schedule) : (day + 1) * len(schedule)]
+            scheduled_keys.update(c.task.key for c in priorities)
+            scheduled_keys.update(c.task.key for block in day_admin_blocks for c in block.tasks)
+
+            plans.append(
+                DailyPlan(
+                    date=plan_date,
+                    priorities=priorities,
+                    admin_block=day_admin_blocks[0],
+                    other_tasks=[
+                        c
+                        for c in classifications
+                        if c.task.key not in scheduled_keys and c.task.key not in unschedulable_keys
+                    ],
+                    previous_closure_rate=previous_closure_rate if day == 0 else None,
+                    decomposition_suggestions=decomposition_suggestions,
+                    blocked_tasks=blocked_tasks,
+                    additional_admin_blocks=day_admin_blocks[1:],
+                )
+            )
+            logger.info(f"Planned {plan_date}: {', '.join(c.task.key for c in priorities) or 'no priorities'}")
+
+        return plans
+
+    @staticmethod
+    def _working_days(start_date: date, count: int) -> List[date]:
+        """
+        Get the first working days (Monday to Friday) from a date on.
+
+        Args:
+            start_date: First candidate day
+            count: Number of working days
+
+        Returns:
+            List of working days in order
+        """
+        working_days = []
+        current = start_date
+        while len(working_days) < count:
+            if current.weekday() < 5:
+                working_days.append(current)
+            current += timedelta(days=1)
+        return working_days
+
+    def generate_replan(
+        self,
+        blocking_task: JiraIssue,
+        current_plan: DailyPlan,
+        changed_issues: Optional[List[JiraIssue]] = None,
+        removed_keys: Optional[Iterable[str]] = None,
+        refresh: bool = False,
+    ) -> DailyPlan:
         """
         Generate new plan incorporating a blocking task.
 
@@ -386,41 +930,60 @@ class PlanGenerator:
         a new plan that includes the blocking task as a priority, potentially
         replacing some or all of the current priorities.
 
+        While the backlog snapshot of the last plan is fresh (see
+        SNAPSHOT_MAX_AGE_SECONDS), the replan works from that snapshot plus the
+        given delta and does not contact JIRA; only the blocking task and the
+        changed issues are classified. Otherwise all active tasks are fetched
+        and classified again.
+
         Args:
             blocking_task: The blocking task that triggered re-planning
             current_plan: Current plan being interrupted
+            changed_issues: Issues that changed since the last plan (optional)
+            removed_keys: Keys of tasks that left the backlog since the last plan (optional)
+            refresh: Always fetch active tasks from JIRA (default: False)
 
         Returns:
             New DailyPlan with blocking task as priority
         """
-        # Fetch all active tasks from JIRA
-        active_tasks = self.jira_client.fetch_active_tasks()
+        # The stored plan of the day no longer reflects the backlog
+        self.invalidate_stored_plan(date.today())
 
-        # Classify all tasks
-        classifications = [self.classifier.classify_task(task) for task in active_tasks]
+        fresh = not refresh and self._snapshot_is_fresh()
+        affected_keys: Set[str] = set()
+        if fresh and self.dependency_graph is not None:
+            affected_keys = self.dependency_graph.update((changed_issues or []) + [blocking_task], removed_keys or ())
 
         # Classify the blocking task
         blocking_classification = self.classifier.classify_task(blocking_task)
 
-        # Ensure the blocking task is included in classifications if not already
-        blocking_keys = {c.task.key for c in classifications}
-        if blocking_task.key not in blocking_keys:
-            classifications.append(blocking_classification)
-
-        # Filter eligible tasks for priority selection (excluding the blocking task for now)
-        eligible_tasks = self._filter_eligible_tasks(classifications)
-
-        # Rank eligible tasks
-        ranked_tasks = self._rank_tasks(eligible_tasks)
+        if fresh:
+            # Apply the delta to the snapshot of the last plan, with the tasks whose
+            # blockers or "unblocks" score changed through the delta's links
+            changed_keys = {issue.key for issue in changed_issues or []} | {blocking_task.key}
+            linked = [self._snapshot[key].task for key in sorted(affected_keys - changed_keys) if key in self._snapshot]
+            upserted = self._classify_tasks((changed_issues or []) + linked)
+            upserted.append(blocking_classification)
+            classifications = self._apply_snapshot_delta(upserted, removed_keys or ())
+            logger.info(f"Re-planning from snapshot with {len(upserted)} changed tasks")
+        else:
+            # Fetch all active tasks from JIRA
+            logger.info("Backlog snapshot is stale or missing, fetching active tasks from JIRA")
+            issues = self.jira_client.fetch_active_tasks()
+            self._sync_dependency_graph(issues)
+            classifications = self._classify_tasks(issues)
+
+            # Ensure the blocking task is included in classifications if not already
+            if blocking_task.key not in {c.task.key for c in classifications}:
+                classifications.append(blocking_classification)
+
+            self._sync_backlog_state(classifications)
 
         # Start with the blocking task as the first priority
         new_priorities = [blocking_classification]
 
         # Add up to 2 more priorities from the ranked tasks
-        # Exclude tasks that were in the current plan's priorities to give preference to new work
-        current_priority_keys = {c.task.key for c in current_plan.priorities}
-
-        for task in ranked_tasks:
+        for task in self.ranked_backlog:
             if len(new_priorities) >= self.MAX_PRIORITIES:
                 break
 
@@ -431,12 +994,12 @@ class PlanGenerator:
             # Add to new priorities
             new_priorities.append(task)
 
-        # Group administrative tasks (same as before)
-        admin_block = self._group_admin_tasks(classifications)
+        # Pack administrative tasks from the already synced packer
+        admin_blocks = self.admin_packer.pack(self._admin_block_schedule())
 
         # Collect other tasks for reference (non-priority, non-admin)
         priority_keys = {c.task.key for c in new_priorities}
-        admin_keys = {c.task.key for c in admin_block.tasks}
+        admin_keys = {c.task.key for block in admin_blocks for c in block.tasks}
 
         other_tasks = [c for c in classifications if c.task.key not in priority_keys and c.task.key not in admin_keys]
 
@@ -447,9 +1010,10 @@ class PlanGenerator:
         return DailyPlan(
             date=date.today(),
             priorities=new_priorities,
-            admin_block=admin_block,
+            admin_block=admin_blocks[0],
             other_tasks=other_tasks,
             previous_closure_rate=previous_closure_rate,
+            additional_admin_blocks=admin_blocks[1:],
         )
 
     def propose_decomposition(self, long_running_task: JiraIssue) -> List[SubtaskSpec]:
@@ -469,7 +1033,102 @@ class PlanGenerator:
         logger.info(f"Proposing decomposition for task: {long_running_task.key} - {long_running_task.summary}")
 
         # First, classify the task to get its estimated effort
-        classification = self.classifier.classify_task(long_running_task)
+        return self._decompose(self.classifier.classify_task(long_running_task))
+
+    def propose_decompositions(self, tasks: Iterable[JiraIssue]) -> Dict[str, List[SubtaskSpec]]:
+        """
+        Propose decompositions of several multi-day tasks in one pass.
+
+        Each task is classified once; tasks that are not long-running get an
+        empty proposal, as with propose_decomposition.
+
+        Args:
+            tasks: Tasks to decompose (duplicates are proposed once)
+
+        Returns:
+            Dictionary mapping parent keys to their proposed subtasks, in input order
+        """
+        proposals = {}
+        for task in tasks:
+            if task.key not in proposals:
+                proposals[task.key] = self._decompose(self.classifier.classify_task(task))
+
+        logger.info(
+            f"Proposed {sum(len(specs) for specs in proposals.values())} subtasks for {len(proposals)} parent tasks"
+        )
+        return proposals
+
+    def create_decompositions(
+        self, proposals: Dict[str, List[SubtaskSpec]], max_workers: Optional[int] = None
+    ) -> Dict[str, DecompositionResult]:
+        """
+        Create the subtasks of several parents in JIRA concurrently.
+
+        Parents are processed in parallel. The subtasks of one parent are
+        created one after the other in proposal order, so their keys follow
+        the subtask order, and the parent's project and subtask type are
+        looked up once. A failure stops the remaining subtasks of that parent
+        only.
+
+        Args:
+            proposals: Parent keys mapped to the subtasks to create under them
+            max_workers: Maximum number of parents processed at once (default: MAX_DECOMPOSITION_WORKERS)
+
+        Returns:
+            Dictionary mapping parent keys to their results, in input order
+        """
+        if not proposals:
+            return {}
+
+        workers = min(max_workers or self.MAX_DECOMPOSITION_WORKERS, len(proposals))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="decompose") as executor:
+            futures = {
+                parent_key: executor.submit(self._create_parent_subtasks, parent_key, specs)
+                for parent_key, specs in proposals.items()
+            }
+            results = {parent_key: future.result() for parent_key, future in futures.items()}
+
+        created = sum(len(result.created_keys) for result in results.values())
+        failed = sum(1 for result in results.values() if result.error)
+        logger.info(f"Created {created} subtasks for {len(results)} parent tasks ({failed} failed)")
+        return results
+
+    def _create_parent_subtasks(self, parent_key: str, specs: List[SubtaskSpec]) -> DecompositionResult:
+        """
+        Create the subtasks of one parent in order, stopping at the first failure.
+
+        Args:
+            parent_key: JIRA key of the parent task
+            specs: Subtasks to create, in order
+
+        Returns:
+            DecompositionResult with the created keys and the error, if any
+        """
+        result = DecompositionResult(parent_key=parent_key, subtasks=list(specs))
+        if not specs:
+            return result
+
+        try:
+            context = self.jira_client.get_subtask_context(parent_key)
+            for spec in sorted(specs, key=lambda spec: spec.order):
+                result.created_keys.append(self.jira_client.create_subtask(parent_key, spec, context=context))
+        except Exception as e:
+            logger.error(f"Failed to create subtasks of {parent_key} ({len(result.created_keys)} created): {e}")
+            result.error = str(e)
+
+        return result
+
+    def _decompose(self, classification: TaskClassification) -> List[SubtaskSpec]:
+        """
+        Split a classified long-running task into daily-closable subtasks.
+
+        Args:
+            classification: Classification of the task to decompose
+
+        Returns:
+            List of proposed subtasks (empty if the task is not long-running)
+        """
+        long_running_task = classification.task
         logger.debug(f"Task estimated effort: {classification.estimated_days} days")
 
         # Verify this is actually a long-running task
@@ -550,7 +1209,11 @@ This subtask should be completable within one working day."""
 
     def _get_closure_file_path(self, plan_date: date) -> Path:
         """
-        Get the file path for a closure record.
+        Get the file path of a legacy per-day closure record.
+
+        Closure records used to be written as one JSON file per day. They are
+        still read (and imported into the closure store) when the store has no
+        record for a date.
 
         Args:
             plan_date: Date of the plan
@@ -565,36 +1228,72 @@ This subtask should be completable within one working day."""
         """
         Record completion of a task.
 
+        The completion is appended to the closure store; for priority tasks the
+        closure record of that date is updated in place.
+
         Args:
             task_key: JIRA key of completed task
             completion_date: Date task was completed
             was_priority: Whether task was a priority task
         """
-        # Load or create closure record for the date
-        closure_file = self._get_closure_file_path(completion_date)
+        if was_priority:
+            # Make sure a legacy record for the date is in the store before updating it
+            self.load_closure_record(completion_date)
 
-        if closure_file.exists():
-            with open(closure_file, "r") as f:
-                data = json.load(f)
+        self.closure_store.record_completion(task_key, completion_date, was_priority, user_id=self.user_id)
+
+    def verify_priority_closure(self, priority_tasks: List[TaskClassification]) -> Dict[str, ClosureOutcome]:
+        """
+        Determine the end-of-day outcome of each priority task.
 
-            # Update completion count if this was a priority task
-            if was_priority:
-                data["completed_priorities"] = data.get("completed_priorities", 0) + 1
+        Only the priority keys are queried, in a single JIRA search. A task is:
+        - RESOLVED if it has a resolution (or a done status) meaning it was finished
+        - OUT_OF_SCOPE if it was closed without being done (e.g., "Won't Do"),
+          reassigned to someone else, moved to another project or deleted
+        - INCOMPLETE otherwise
 
-                # Remove from incomplete tasks if present
-                incomplete = data.get("incomplete_tasks", [])
-                if task_key in incomplete:
-                    incomplete.remove(task_key)
-                    data["incomplete_tasks"] = incomplete
+        Args:
+            priority_tasks: List of priority tasks from the plan
+
+        Returns:
+            Dictionary mapping priority task keys to their outcome
+        """
+        if not priority_tasks:
+            return {}
+
+        states = self.jira_client.fetch_issue_states([c.task.key for c in priority_tasks])
+
+        outcomes = {}
+        for classification in priority_tasks:
+            task = classification.task
+            state = states.get(task.key)
+
+            if state is None:
+                outcome = ClosureOutcome.OUT_OF_SCOPE
+            elif (
+                state.resolution is not None
+                or state.status_category == "done"
+                or (state.status.lower() in self.DONE_STATUSES)
+            ):
+                if state.resolution is not None and state.resolution.lower() in self.OUT_OF_SCOPE_RESOLUTIONS:
+                    outcome = ClosureOutcome.OUT_OF_SCOPE
+                else:
+                    outcome = ClosureOutcome.RESOLVED
+            elif task.assignee and state.assignee and state.assignee != task.assignee:
+                outcome = ClosureOutcome.OUT_OF_SCOPE
+            else:
+                outcome = ClosureOutcome.INCOMPLETE
 
-                # Recalculate closure rate
-                total = data.get("total_priorities", 0)
-                completed = data["completed_priorities"]
-                data["closure_rate"] = completed / total if total > 0 else 0.0
+            outcomes[task.key] = outcome
 
-            # Save updated record
-            with open(closure_file, "w") as f:
-                json.dump(data, f, indent=2)
+        counts = {outcome: 0 for outcome in ClosureOutcome}
+        for outcome in outcomes.values():
+            counts[outcome] += 1
+        logger.info(
+            f"Verified closure of {len(outcomes)} priorities: {counts[ClosureOutcome.RESOLVED]} resolved, "
+            f"{counts[ClosureOutcome.INCOMPLETE]} incomplete, {counts[ClosureOutcome.OUT_OF_SCOPE]} out of scope"
+        )
+        return outcomes
 
     def calculate_closure_rate(self, plan_date: date, priority_tasks: List[TaskClassification]) -> float:
         """
@@ -607,24 +1306,8 @@ This subtask should be completable within one working day."""
         Returns:
             Closure rate (0.0-1.0)
         """
-        # Get priority task keys
-        priority_keys = {c.task.key for c in priority_tasks}
-
-        # Fetch current task statuses from JIRA
-        active_tasks = self.jira_client.fetch_active_tasks()
-        active_keys = {task.key for task in active_tasks}
-
-        # Count completed tasks (those not in active tasks anymore)
-        completed_count = 0
-        for key in priority_keys:
-            if key not in active_keys:
-                completed_count += 1
-
-        # Calculate closure rate
-        total_priorities = len(priority_tasks)
-        closure_rate = completed_count / total_priorities if total_priorities > 0 else 0.0
-
-        return closure_rate
+        outcomes = self.verify_priority_closure(priority_tasks)
+        return self._build_closure_record(plan_date, priority_tasks, outcomes).closure_rate
 
     def save_closure_record(self, plan_date: date, priority_tasks: List[TaskClassification]) -> ClosureRecord:
         """
@@ -637,47 +1320,45 @@ This subtask should be completable within one working day."""
         Returns:
             ClosureRecord with tracking information
         """
-        # Calculate closure rate
-        closure_rate = self.calculate_closure_rate(plan_date, priority_tasks)
+        outcomes = self.verify_priority_closure(priority_tasks)
+        record = self._build_closure_record(plan_date, priority_tasks, outcomes)
 
-        # Get priority task keys
-        priority_keys = [c.task.key for c in priority_tasks]
+        self.closure_store.save_record(record, user_id=self.user_id)
 
-        # Fetch current task statuses to identify incomplete tasks
-        active_tasks = self.jira_client.fetch_active_tasks()
-        active_keys = {task.key for task in active_tasks}
+        return record
 
-        # Identify incomplete tasks
-        incomplete_tasks = [key for key in priority_keys if key in active_keys]
+    def _build_closure_record(
+        self, plan_date: date, priority_tasks: List[TaskClassification], outcomes: Dict[str, ClosureOutcome]
+    ) -> ClosureRecord:
+        """
+        Build a closure record from verified priority outcomes.
 
-        # Calculate completed count
-        total_priorities = len(priority_tasks)
-        completed_priorities = total_priorities - len(incomplete_tasks)
+        The closure rate is resolved priorities over all priorities of the plan.
+        Out-of-scope priorities are not counted as completed, but they are not
+        carried forward as incomplete either.
 
-        # Create closure record
-        record = ClosureRecord(
+        Args:
+            plan_date: Date of the plan
+            priority_tasks: List of priority tasks from the plan
+            outcomes: Outcome of each priority task
+
+        Returns:
+            ClosureRecord for the plan
+        """
+        priority_keys = [c.task.key for c in priority_tasks]
+
+        total_priorities = len(priority_keys)
+        completed_priorities = sum(1 for key in priority_keys if outcomes.get(key) == ClosureOutcome.RESOLVED)
+
+        return ClosureRecord(
             date=plan_date,
             total_priorities=total_priorities,
             completed_priorities=completed_priorities,
-            closure_rate=closure_rate,
-            incomplete_tasks=incomplete_tasks,
+            closure_rate=completed_priorities / total_priorities if total_priorities > 0 else 0.0,
+            incomplete_tasks=[key for key in priority_keys if outcomes.get(key) == ClosureOutcome.INCOMPLETE],
+            out_of_scope_tasks=[key for key in priority_keys if outcomes.get(key) == ClosureOutcome.OUT_OF_SCOPE],
         )
 
-        # Save to file
-        closure_file = self._get_closure_file_path(plan_date)
-        data = {
-            "date": plan_date.isoformat(),
-            "total_priorities": record.total_priorities,
-            "completed_priorities": record.completed_priorities,
-            "closure_rate": record.closure_rate,
-            "incomplete_tasks": record.incomplete_tasks,
-        }
-
-        with open(closure_file, "w") as f:
-            json.dump(data, f, indent=2)
-
-        return record
-
     def load_closure_record(self, plan_date: date) -> Optional[ClosureRecord]:
         """
         Load closure record for a specific date.
@@ -688,6 +1369,11 @@ This subtask should be completable within one working day."""
         Returns:
             ClosureRecord if found, None otherwise
         """
+        record = self.closure_store.load_record(plan_date, user_id=self.user_id)
+        if record is not None:
+            return record
+
+        # Fall back to a legacy per-day JSON file and import it into the store
         closure_file = self._get_closure_file_path(plan_date)
 
         if not closure_file.exists():
@@ -697,16 +1383,76 @@ This subtask should be completable within one working day."""
             with open(closure_file, "r") as f:
                 data = json.load(f)
 
-            return ClosureRecord(
+            record = ClosureRecord(
                 date=date.fromisoformat(data["date"]),
                 total_priorities=data["total_priorities"],
                 completed_priorities=data["completed_priorities"],
                 closure_rate=data["closure_rate"],
                 incomplete_tasks=data.get("incomplete_tasks", []),
+                out_of_scope_tasks=data.get("out_of_scope_tasks", []),
             )
         except (json.JSONDecodeError, KeyError, ValueError):
             return None
 
+        self.closure_store.save_record(record, user_id=self.user_id)
+        logger.info(f"Imported legacy closure record for {plan_date} into closure store")
+        return record
+
+    def load_closure_history(self, start_date: date, end_date: date) -> List[ClosureRecord]:
+        """
+        Load closure records of a date range with a single store query.
+
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+
+        Returns:
+            Closure records in date order
+        """
+        return self.closure_store.load_range(start_date, end_date, user_id=self.user_id)
+
+    def get_closure_trend(
+        self, as_of: date, history_days: Optional[int] = None, user_id: Optional[str] = None
+    ) -> ClosureTrend:
+        """
+        Get rolling closure metrics (7/30/90 days, streaks, carry-over) of a user.
+
+        Args:
+            as_of: Last day included in the windows
+            history_days: Days of history for streaks (default: ClosureAnalytics.HISTORY_DAYS)
+            user_id: User to report on (default: this generator's user)
+
+        Returns:
+            ClosureTrend for the user (empty metrics if no records exist)
+        """
+        user_id = user_id or self.user_id
+        analytics = ClosureAnalytics(self.closure_store)
+        trend = analytics.user_trends(as_of, [user_id], history_days).get(user_id)
+        if trend is None:
+            trend = ClosureTrend(
+                user_id=user_id,
+                as_of=as_of,
+                days_recorded=0,
+                rolling_closure_rate={window: None for window in analytics.WINDOWS},
+                carry_over={window: 0 for window in analytics.WINDOWS},
+                current_streak=0,
+                longest_streak=0,
+            )
+        return trend
+
+    def get_team_closure_trend(self, as_of: date, history_days: Optional[int] = None) -> ClosureTrend:
+        """
+        Get rolling closure metrics of the team (all users with closure records).
+
+        Args:
+            as_of: Last day included in the windows
+            history_days: Days of history for streaks (default: ClosureAnalytics.HISTORY_DAYS)
+
+        Returns:
+            ClosureTrend of the team
+        """
+        return ClosureAnalytics(self.closure_store).team_trend(as_of, history_days=history_days)
+
     def get_previous_closure_rate(self, current_date: date) -> Optional[float]:
         """
         Get closure rate from the previous day.
@@ -0,0 +1,142 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Speculative pre-generation of morning plans ahead of their deadline."""
+
+import logging
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List
+
+from triage.models import DailyPlan
+from triage.plan_generator import PlanGenerator
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PrewarmTask:
+    """A scheduled pre-generation of one user's plan."""
+
+    fire_at: datetime  # When the plan should be generated
+    user_id: str  # Owner of the plan
+    stage: str  # "draft" or "refresh"
+
+
+class PlanPrewarmer:
+    """
+    Generates plans as drafts in a window before the deadline.
+
+    Users are spread evenly across the window so JIRA sees a steady trickle
+    of requests instead of one burst at the deadline. Each user gets two
+    runs: a draft in the first part of the window, and a refresh in the last
+    ``refresh_minutes`` before the deadline. Both go through the generator's
+    plan cache, so the refresh only recomputes the plan when the backlog
+    fingerprint changed since the draft; at the deadline the stored plan is
+    served as-is.
+    """
+
+    # Pre-generation stages in execution order
+    STAGES = ("draft", "refresh")
+
+    def __init__(
+        self,
+        generator_factory: Callable[[str], PlanGenerator],
+        window_minutes: int = 60,
+        refresh_minutes: int = 10,
+    ):
+        """
+        Initialize the pre-warmer.
+
+        Args:
+            generator_factory: Function returning the plan generator of a user
+            window_minutes: Length of the pre-generation window before the deadline
+            refresh_minutes: Length of the final part of the window used for refreshes
+
+        Raises:
+            ValueError: If the window is not positive or does not leave room for drafts
+        """
+        if window_minutes <= 0 or refresh_minutes <= 0:
+            raise ValueError("window_minutes and refresh_minutes must be positive")
+        if refresh_minutes >= window_minutes:
+            raise ValueError(
+                f"refresh_minutes ({refresh_minutes}) must be shorter than window_minutes ({window_minutes})"
+            )
+
+        self.generator_factory = generator_factory
+        self.window_minutes = window_minutes
+        self.refresh_minutes = refresh_minutes
+
+    def schedule(self, user_ids: Iterable[str], deadline: datetime) -> List[PrewarmTask]:
+        """
+        Spread the draft and refresh runs of users across the window.
+
+        Users are ordered by a stable hash of their ID and placed at even
+        intervals, so a user keeps the same slot as long as the user set does
+        not change.
+
+        Args:
+            user_ids: Users whose plans are pre-generated
+            deadline: Time the plans must be ready
+
+        Returns:
+            Pre-generation tasks in firing order
+        """
+        users = sorted(set(user_ids), key=lambda user_id: (zlib.crc32(user_id.encode()), user_id))
+        if not users:
+            return []
+
+        window_start = deadline - timedelta(minutes=self.window_minutes)
+        refresh_start = deadline - timedelta(minutes=self.refresh_minutes)
+        stages = (
+            ("draft", window_start, refresh_start - window_start),
+            ("refresh", refresh_start, deadline - refresh_start),
+        )
+
+        tasks = [
+            PrewarmTask(fire_at=start + span * i / len(users), user_id=user_id, stage=stage)
+            for stage, start, span in stages
+            for i, user_id in enumerate(users)
+        ]
+        logger.debug(f"Scheduled {len(tasks)} pre-generation runs for {len(users)} users before {deadline}")
+        return tasks
+
+    def due(self, user_ids: Iterable[str], deadline: datetime, since: datetime, until: datetime) -> List[PrewarmTask]:
+        """
+        Get the pre-generation runs that fall in a time interval.
+
+        Args:
+            user_ids: Users whose plans are pre-generated
+            deadline: Time the plans must be ready
+            since: Start of the interval (exclusive)
+            until: End of the interval (inclusive)
+
+        Returns:
+            Pre-generation tasks with since < fire_at <= until, in firing order
+        """
+        return [task for task in self.schedule(user_ids, deadline) if since < task.fire_at <= until]
+
+    def run(self, task: PrewarmTask, deadline: datetime) -> DailyPlan:
+        """
+        Generate (or refresh) the stored plan of a user.
+
+        Args:
+            task: Pre-generation task to run
+            deadline: Time the plan must be ready; its date is the plan date
+
+        Returns:
+            Stored or newly generated DailyPlan
+
+        Raises:
+            ValueError: If the user's generator has no plan cache to keep the draft in
+        """
+        generator = self.generator_factory(task.user_id)
+        if generator.plan_cache is None:
+            raise ValueError("Pre-generating plans requires a plan generator with a plan cache")
+
+        plan = generator.generate_daily_plan(plan_date=deadline.date())
+        logger.info(f"Pre-generated {task.stage} plan for user {task.user_id} ({deadline.date()})")
+        return plan
@@ -0,0 +1,749 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Rendering of daily plans as Markdown, JSON and Slack Block Kit."""
+
+import base64
+import binascii
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from functools import cached_property
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+from triage.models import DailyPlan, TaskCategory, TaskClassification
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Supported output formats
+FORMATS = ("markdown", "json", "slack")
+
+# Classification fields a task fragment is rendered from
+FragmentKey = Tuple[str, str, str, str, str, Optional[int], TaskCategory, float, bool]
+
+
+def fragment_key(classification: TaskClassification) -> FragmentKey:
+    """
+    Get the fingerprint of the classification fields that are rendered.
+
+    Args:
+        classification: Classified task
+
+    Returns:
+        Tuple of the rendered fields; equal tuples render identically
+    """
+    task = classification.task
+    return (
+        task.key,
+        task.summary,
+        task.issue_type,
+        task.priority,
+        task.status,
+        task.story_points,
+        classification.category,
+        classification.estimated_days,
+        classification.has_dependencies,
+    )
+
+
+def encode_cursor(offset: int, plan_date: date) -> str:
+    """
+    Encode the position of an other task as an opaque page cursor.
+
+    Args:
+        offset: Index of the first other task of the page
+        plan_date: Date of the plan the cursor belongs to
+
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(f"{plan_date.isoformat()}:{offset}".encode()).decode().rstrip("=")
+
+
+def _split_cursor(cursor: str) -> Tuple[date, int]:
+    """
+    Split a page cursor into its plan date and offset.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of the plan date and the index of the first other task of the page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        cursor_date, offset = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split(":")
+        return date.fromisoformat(cursor_date), int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid page cursor: {cursor}") from e
+
+
+def decode_cursor(cursor: str, plan_date: date) -> int:
+    """
+    Decode a page cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+        plan_date: Date of the plan being paged
+
+    Returns:
+        Index of the first other task of the page
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another plan date
+    """
+    cursor_date, offset = _split_cursor(cursor)
+    if cursor_date != plan_date or offset < 0:
+        raise ValueError(f"Page cursor does not belong to the plan of {plan_date}")
+    return offset
+
+
+def cursor_plan_date(cursor: str) -> date:
+    """
+    Get the date of the plan a page cursor belongs to.
+
+    Args:
+        cursor: Cursor string produced by encode_cursor
+
+    Returns:
+        Plan date
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    return _split_cursor(cursor)[0]
+
+
+class TaskFragment:
+    """
+    Rendered pieces of one task, shared by every plan section and format.
+
+    Each piece is rendered on first use and kept for the lifetime of the
+    fragment.
+    """
+
+    def __init__(self, classification: TaskClassification):
+        """
+        Initialize a fragment.
+
+        Args:
+            classification: Classified task the fragment is rendered from
+        """
+        self.classification = classification
+
+    @cached_property
+    def priority_markdown(self) -> List[str]:
+        """Markdown lines of a priority, without its list number."""
+        task = self.classification.task
+        effort_hours = self.classification.estimated_days * 8  # Convert days to hours
+        lines = [
+            f"**[{task.key}] {task.summary}**",
+            f"   - Effort: {effort_hours:.1f} hours",
+            f"   - Type: {task.issue_type}",
+        ]
+        if task.priority:
+            lines.append(f"   - Priority: {task.priority}")
+        if task.status:
+            lines.append(f"   - Status: {task.status}")
+        lines.append("")
+        return lines
+
+    @cached_property
+    def blocked_markdown(self) -> List[str]:
+        """Markdown lines of a blocked or waiting task."""
+        task = self.classification.task
+        lines = [f"- **[{task.key}] {task.summary}**", f"  - Status: {task.status}"]
+        if self.classification.has_dependencies:
+            lines.append("  - Reason: Blocked by dependencies")
+        if task.priority:
+            lines.append(f"  - Priority: {task.priority}")
+        lines.append("")
+        return lines
+
+    @cached_property
+    def decomposition_markdown(self) -> List[str]:
+        """Markdown lines of a task that needs decomposition."""
+        task = self.classification.task
+        effort_days = self.classification.estimated_days
+        lines = [f"- **[{task.key}] {task.summary}**", f"  - Current estimate: {effort_days:.1f} days"]
+        if task.story_points:
+            lines.append(f"  - Story points: {task.story_points} SP")
+        lines.append(f"  - Suggestion: Break into {int(effort_days) + 1} daily-closable subtasks")
+        lines.append(f"  - Command: `triage decompose {task.key}`")
+        lines.append("")
+        return lines
+
+    @cached_property
+    def admin_markdown(self) -> str:
+        """Markdown checklist line of an administrative task."""
+        task = self.classification.task
+        return f"- [ ] [{task.key}] {task.summary}"
+
+    @cached_property
+    def other_markdown(self) -> str:
+        """Markdown line of a task listed for reference."""
+        task = self.classification.task
+        return f"- [{task.key}] {task.summary}{self._status_note}"
+
+    @cached_property
+    def json(self) -> Dict[str, Any]:
+        """JSON-serializable summary of the task."""
+        task = self.classification.task
+        return {
+            "key": task.key,
+            "summary": task.summary,
+            "estimated_days": self.classification.estimated_days,
+            "category": self.classification.category.value,
+            "issue_type": task.issue_type,
+            "priority": task.priority,
+            "status": task.status,
+        }
+
+    @cached_property
+    def priority_slack(self) -> str:
+        """Slack mrkdwn text of a priority, without its list number."""
+        task = self.classification.task
+        details = [f"Effort: {self.classification.estimated_days * 8:.1f} hours", f"Type: {task.issue_type}"]
+        if task.priority:
+            details.append(f"Priority: {task.priority}")
+        if task.status:
+            details.append(f"Status: {task.status}")
+        return f"*[{task.key}] {task.summary}*\n{' · '.join(details)}"
+
+    @cached_property
+    def blocked_slack(self) -> str:
+        """Slack mrkdwn line of a blocked or waiting task."""
+        task = self.classification.task
+        reason = ", blocked by dependencies" if self.classification.has_dependencies else ""
+        return f"• *[{task.key}] {task.summary}* ({task.status}{reason})"
+
+    @cached_property
+    def decomposition_slack(self) -> str:
+        """Slack mrkdwn line of a task that needs decomposition."""
+        task = self.classification.task
+        effort_days = self.classification.estimated_days
+        return (
+            f"• *[{task.key}] {task.summary}* ({effort_days:.1f} days): break into "
+            f"{int(effort_days) + 1} daily-closable subtasks with `triage decompose {task.key}`"
+        )
+
+    @cached_property
+    def admin_slack(self) -> str:
+        """Slack mrkdwn line of an administrative task."""
+        task = self.classification.task
+        return f"• [{task.key}] {task.summary}"
+
+    @cached_property
+    def other_slack(self) -> str:
+        """Slack mrkdwn line of a task listed for reference."""
+        task = self.classification.task
+        return f"• [{task.key}] {task.summary}{self._status_note}"
+
+    @property
+    def _status_note(self) -> str:
+        """Note appended to tasks listed for reference."""
+        if self.classification.has_dependencies:
+            return " (blocked by dependencies)"
+        if self.classification.category == TaskCategory.BLOCKING:
+            return " (blocker priority)"
+        return ""
+
+
+@dataclass
+class RenderedPlan:
+    """A plan rendered in one or more formats (None for formats not requested)."""
+
+    markdown: Optional[str] = None
+    json: Optional[Dict[str, Any]] = None
+    slack_blocks: Optional[List[Dict[str, Any]]] = None
+    next_cursor: Optional[str] = None  # Cursor of the next page of other tasks, None on the last page
+
+
+@dataclass
+class _Page:
+    """Bounds of the rendered page of other tasks."""
+
+    start: int
+    stop: int
+    total: int
+    next_cursor: Optional[str]
+
+
+class PlanRenderer:
+    """
+    Renders daily plans from shared per-task fragments.
+
+    A plan is walked once and every requested format is emitted in the same
+    pass. Task fragments are cached by the fingerprint of their rendered
+    fields (see fragment_key), so tasks that did not change are not rendered
+    again across replans or when the same plan is sent to many recipients.
+    """
+
+    # Maximum number of cached task fragments
+    MAX_FRAGMENTS = 4096
+
+    # Maximum text length of a Slack section block (the API limit is 3000)
+    SLACK_SECTION_MAX_CHARS = 2900
+
+    # Other tasks per page in paginated output (API and Slack)
+    OTHER_TASKS_PAGE_SIZE = 50
+
+    # Largest page of other tasks a client may request
+    MAX_OTHER_TASKS_PAGE_SIZE = 200
+
+    _default: Optional["PlanRenderer"] = None
+
+    def __init__(self, max_fragments: Optional[int] = None):
+        """
+        Initialize a renderer with an empty fragment cache.
+
+        Args:
+            max_fragments: Maximum number of cached fragments (default: MAX_FRAGMENTS)
+        """
+        self.max_fragments = max_fragments or self.MAX_FRAGMENTS
+        self._fragments: "OrderedDict[FragmentKey, TaskFragment]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def page_limit(cls, limit: Any = None) -> int:
+        """
+        Get the number of other tasks per page from a client-supplied limit.
+
+        Args:
+            limit: Requested page size as an integer or integer string (default: OTHER_TASKS_PAGE_SIZE)
+
+        Returns:
+            Page size between 1 and MAX_OTHER_TASKS_PAGE_SIZE
+
+        Raises:
+            ValueError: If the limit is not an integer
+        """
+        if limit is None or limit == "":
+            return cls.OTHER_TASKS_PAGE_SIZE
+        if isinstance(limit, bool) or not isinstance(limit, (int, str)):
+            raise ValueError(f"Invalid page limit: {limit!r}")
+        try:
+            requested = int(limit)
+        except ValueError as e:
+            raise ValueError(f"Invalid page limit: {limit!r}") from e
+        return max(1, min(requested, cls.MAX_OTHER_TASKS_PAGE_SIZE))
+
+    @classmethod
+    def default(cls) -> "PlanRenderer":
+        """Get the process-wide renderer shared by all callers."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def fragment(self, classification: TaskClassification) -> TaskFragment:
+        """
+        Get the fragment of a task, rendering it only if its fields changed.
+
+        Args:
+            classification: Classified task
+
+        Returns:
+            Cached or new TaskFragment
+        """
+        key = fragment_key(classification)
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return fragment
+
+            self.misses += 1
+            fragment = self._fragments[key] = TaskFragment(classification)
+            if len(self._fragments) > self.max_fragments:
+                self._fragments.popitem(last=False)
+            return fragment
+
+    def render_markdown(self, plan: DailyPlan) -> str:
+        """
+        Render a plan as structured Markdown.
+
+        Args:
+            plan: Daily plan to render
+
+        Returns:
+            Markdown document
+        """
+        return self.render(plan, formats=("markdown",)).markdown
+
+    def iter_markdown(
+        self, plan: DailyPlan, other_tasks_limit: Optional[int] = None, other_tasks_cursor: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream a plan as Markdown, one line at a time.
+
+        Lines are produced as the plan is walked, so memory use does not grow
+        with the size of the backlog.
+
+        Args:
+            plan: Daily plan to render
+            other_tasks_limit: Maximum number of other tasks to include (default: all)
+            other_tasks_cursor: Cursor of the first other task to include (default: first page)
+
+        Yields:
+            Markdown lines without line terminators
+        """
+        page = self._page(plan, other_tasks_limit, other_tasks_cursor)
+        return self._walk(plan, page, markdown=True, data=None, blocks=None)
+
+    def write_markdown(self, plan: DailyPlan, stream: TextIO) -> None:
+        """
+        Write a plan as Markdown to a text stream without building the document in memory.
+
+        The written text is identical to render_markdown.
+
+        Args:
+            plan: Daily plan to render
+            stream: Writable text stream
+        """
+        separator = ""
+        for line in self.iter_markdown(plan):
+            stream.write(separator)
+            stream.write(line)
+            separator = "\n"
+
+    def render(
+        self,
+        plan: DailyPlan,
+        formats: Iterable[str] = FORMATS,
+        other_tasks_limit: Optional[int] = None,
+        other_tasks_cursor: Optional[str] = None,
+    ) -> RenderedPlan:
+        """
+        Render a plan in several formats in a single pass.
+
+        With ``other_tasks_limit`` set, only one page of the other tasks is
+        rendered (the JSON still reports the total count) and the cursor of
+        the next page is returned.
+
+        Args:
+            plan: Daily plan to render
+            formats: Formats to emit, any of "markdown", "json" and "slack" (default: all)
+            other_tasks_limit: Maximum number of other tasks to include (default: all)
+            other_tasks_cursor: Cursor of the first other task to include (default: first page)
+
+        Returns:
+            RenderedPlan with the requested formats filled in
+
+        Raises:
+            ValueError: If a format is not supported or the cursor is invalid
+        """
+        formats = self._check_formats(formats)
+        page = self._page(plan, other_tasks_limit, other_tasks_cursor)
+        data: Optional[Dict[str, Any]] = {} if "json" in formats else None
+        blocks: Optional[List[Dict[str, Any]]] = [] if "slack" in formats else None
+
+        lines = self._walk(plan, page, "markdown" in formats, data, blocks)
+        if "markdown" in formats:
+            markdown = "\n".join(lines)
+        else:
+            markdown = None
+            for _ in lines:
+                pass
+
+        return RenderedPlan(markdown=markdown, json=data, slack_blocks=blocks, next_cursor=page.next_cursor)
+
+    def render_other_tasks(
+        self,
+        plan: DailyPlan,
+        formats: Iterable[str] = FORMATS,
+        other_tasks_limit: Optional[int] = None,
+        other_tasks_cursor: Optional[str] = None,
+    ) -> RenderedPlan:
+        """
+        Render one page of a plan's other tasks only, e.g. to answer a "show more" request.
+
+        Args:
+            plan: Daily plan to render
+            formats: Formats to emit, any of "markdown", "json" and "slack" (default: all)
+            other_tasks_limit: Maximum number of other tasks to include, see page_limit()
+                               (default: OTHER_TASKS_PAGE_SIZE)
+            other_tasks_cursor: Cursor of the first other task to include (default: first page)
+
+        Returns:
+            RenderedPlan with the requested formats filled in
+
+        Raises:
+            ValueError: If a format is not supported, or the limit or the cursor is invalid
+        """
+        formats = self._check_formats(formats)
+        page = self._page(plan, self.page_limit(other_tasks_limit), other_tasks_cursor)
+        data: Optional[Dict[str, Any]] = {} if "json" in formats else None
+        blocks: Optional[List[Dict[str, Any]]] = [] if "slack" in formats else None
+
+        lines = list(self._walk_other_tasks(plan, page, "markdown" in formats, data, blocks))
+        return RenderedPlan(
+            markdown="\n".join(lines) if "markdown" in formats else None,
+            json=data,
+            slack_blocks=blocks,
+            next_cursor=page.next_cursor,
+        )
+
+    @staticmethod
+    def _check_formats(formats: Iterable[str]) -> Set[str]:
+        """Validate requested formats."""
+        formats = set(formats)
+        unknown = formats.difference(FORMATS)
+        if unknown:
+            raise ValueError(f"Unsupported plan formats: {', '.join(sorted(unknown))}. Expected: {', '.join(FORMATS)}")
+        return formats
+
+    def _page(self, plan: DailyPlan, limit: Optional[int], cursor: Optional[str]) -> "_Page":
+        """
+        Resolve the page of other tasks to render.
+
+        Args:
+            plan: Daily plan being rendered
+            limit: Maximum number of other tasks (None for all)
+            cursor: Cursor of the first other task (None for the first page)
+
+        Returns:
+            Page bounds and the cursor of the next page
+        """
+        total = len(plan.other_tasks)
+        start = decode_cursor(cursor, plan.date) if cursor else 0
+        stop = total if limit is None else min(total, start + limit)
+        next_cursor = encode_cursor(stop, plan.date) if stop < total else None
+        return _Page(start=start, stop=stop, total=total, next_cursor=next_cursor)
+
+    def _walk(
+        self,
+        plan: DailyPlan,
+        page: "_Page",
+        markdown: bool,
+        data: Optional[Dict[str, Any]],
+        blocks: Optional[List[Dict[str, Any]]],
+    ) -> Iterator[str]:
+        """
+        Walk a plan once, yielding Markdown lines and filling JSON and Slack output.
+
+        Args:
+            plan: Daily plan to render
+            page: Page of other tasks to render
+            markdown: Whether to yield Markdown lines
+            data: Dictionary receiving the JSON output (None to skip)
+            blocks: List receiving the Slack blocks (None to skip)
+
+        Yields:
+            Markdown lines (nothing if markdown is False)
+        """
+        # Header
+        title = f"Daily Plan - {plan.date.strftime('%Y-%m-%d')}"
+        if markdown:
+            yield f"# {title}"
+            yield ""
+        if data is not None:
+            data["date"] = plan.date.isoformat()
+            data["previous_closure_rate"] = plan.previous_closure_rate
+        if blocks is not None:
+            blocks.append({"type": "header", "text": {"type": "plain_text", "text": title, "emoji": True}})
+
+        # Previous day closure rate
+        if plan.previous_closure_rate is not None:
+            closure_line = self._closure_rate_line(plan.previous_closure_rate)
+            if markdown:
+                yield from ("## Previous Day", f"- {closure_line}", "")
+            if blocks is not None:
+                self._append_slack_section(blocks, "*Previous Day*", [closure_line])
+
+        # Today's priorities
+        fragments = [self.fragment(c) for c in plan.priorities]
+        if markdown:
+            yield from ("## Today's Priorities", "")
+            if not fragments:
+                yield from ("No priority tasks for today.", "")
+            for i, fragment in enumerate(fragments, 1):
+                first, *rest = fragment.priority_markdown
+                yield f"{i}. {first}"
+                yield from rest
+        if data is not None:
+            data["priorities"] = [f.json for f in fragments]
+        if blocks is not None:
+            blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "*Today's Priorities*"}})
+            if not fragments:
+                blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "No priority tasks for today."}})
+            for i, fragment in enumerate(fragments, 1):
+                blocks.append(
+                    {"type": "section", "text": {"type": "mrkdwn", "text": f"{i}. {fragment.priority_slack}"}}
+                )
+
+        # Blocked/waiting tasks
+        fragments = [self.fragment(c) for c in plan.blocked_tasks]
+        if fragments and markdown:
+            yield from ("## 🚫 Blocked/Waiting Tasks", "", "These tasks cannot be worked on until unblocked:", "")
+            for fragment in fragments:
+                yield from fragment.blocked_markdown
+        if data is not None:
+            data["blocked_tasks"] = [f.json for f in fragments]
+        if fragments and blocks is not None:
+            self._append_slack_section(blocks, "*🚫 Blocked/Waiting Tasks*", [f.blocked_slack for f in fragments])
+
+        # Decomposition suggestions
+        fragments = [self.fragment(c) for c in plan.decomposition_suggestions]
+        if fragments and markdown:
+            yield from (
+                "## ⚠️ Tasks Requiring Decomposition",
+                "",
+                "The following tasks are too large to complete in one day.",
+                "Consider breaking them into smaller subtasks:",
+                "",
+            )
+            for fragment in fragments:
+                yield from fragment.decomposition_markdown
+        if data is not None:
+            data["decomposition_suggestions"] = [f.json for f in fragments]
+        if fragments and blocks is not None:
+            self._append_slack_section(
+                blocks, "*⚠️ Tasks Requiring Decomposition*", [f.decomposition_slack for f in fragments]
+            )
+
+        # Administrative blocks
+        admin_blocks_json = []
+        for admin_block in [plan.admin_block] + plan.additional_admin_blocks:
+            fragments = [self.fragment(c) for c in admin_block.tasks]
+            heading = f"Administrative Block ({admin_block.scheduled_time})"
+            if fragments and markdown:
+                yield from (f"## {heading}", "")
+                for fragment in fragments:
+                    yield fragment.admin_markdown
+                yield ""
+            if data is not None:
+                admin_blocks_json.append(
+                    {
+                        "tasks": [f.json for f in fragments],
+                        "time_allocation_minutes": admin_block.time_allocation_minutes,
+                        "scheduled_time": admin_block.scheduled_time,
+                    }
+                )
+            if fragments and blocks is not None:
+                self._append_slack_section(blocks, f"*{heading}*", [f.admin_slack for f in fragments])
+        if data is not None:
+            data["admin_block"] = admin_blocks_json[0]
+            data["additional_admin_blocks"] = admin_blocks_json[1:]
+
+        # Other active tasks
+        yield from self._walk_other_tasks(plan, page, markdown, data, blocks)
+
+    def _walk_other_tasks(
+        self,
+        plan: DailyPlan,
+        page: "_Page",
+        markdown: bool,
+        data: Optional[Dict[str, Any]],
+        blocks: Optional[List[Dict[str, Any]]],
+    ) -> Iterator[str]:
+        """
+        Render one page of the other tasks section.
+
+        Only the tasks of the page are visited, so the cost does not depend on
+        the size of the backlog.
+
+        Args:
+            plan: Daily plan to render
+            page: Page of other tasks to render
+            markdown: Whether to yield Markdown lines
+            data: Dictionary receiving the JSON output (None to skip)
+            blocks: List receiving the Slack blocks (None to skip)
+
+        Yields:
+            Markdown lines (nothing if markdown is False)
+        """
+        if data is not None:
+            data["other_tasks"] = []
+            data["other_tasks_count"] = page.total
+            data["other_tasks_next_cursor"] = page.next_cursor
+        if page.start >= page.stop:
+            return
+
+        slack_lines: List[str] = []
+        if markdown:
+            yield from ("## Other Active Tasks (For Reference)", "")
+
+        for classification in islice(plan.other_tasks, page.start, page.stop):
+            fragment = self.fragment(classification)
+            if markdown:
+                yield fragment.other_markdown
+            if data is not None:
+                data["other_tasks"].append(fragment.json)
+            if blocks is not None:
+                slack_lines.append(fragment.other_slack)
+
+        remaining = page.total - page.stop
+        if markdown:
+            if remaining:
+                yield f"- _...and {remaining} more_"
+            yield ""
+        if blocks is not None:
+            self._append_slack_section(blocks, "*Other Active Tasks (For Reference)*", slack_lines)
+            if remaining or page.start:
+                blocks.append(
+                    {
+                        "type": "context",
+                        "elements": [
+                            {
+                                "type": "mrkdwn",
+                                "text": f"Showing {page.start + 1}-{page.stop} of {page.total} other tasks",
+                            }
+                        ],
+                    }
+                )
+
+    @staticmethod
+    def _closure_rate_line(closure_rate: float) -> str:
+        """
+        Describe a closure rate as completed out of planned tasks.
+
+        The plan only keeps the rate, so the counts assume 3 priorities.
+
+        Args:
+            closure_rate: Closure rate (0.0-1.0)
+
+        Returns:
+            Closure rate line, e.g. "Closure Rate: 2/3 tasks completed (67%)"
+        """
+        percentage = int(closure_rate * 100)
+
+        # If rate is 1.0, show 3/3; if 0.67, show 2/3; if 0.33, show 1/3; if 0.0, show 0/3
+        if closure_rate >= 0.95:
+            completed, total = 3, 3
+        elif closure_rate >= 0.6:
+            completed, total = 2, 3
+        elif closure_rate >= 0.3:
+            completed, total = 1, 3
+        else:
+            completed, total = 0, 3
+
+        return f"Closure Rate: {completed}/{total} tasks completed ({percentage}%)"
+
+    def _append_slack_section(self, blocks: List[Dict[str, Any]], heading: str, lines: List[str]) -> None:
+        """
+        Append a titled list as Slack section blocks within the text size limit.
+
+        Args:
+            blocks: Blocks to append to
+            heading: Bold heading of the section
+            lines: Lines of the section
+        """
+        chunk = [heading]
+        size = len(heading)
+        for line in lines:
+            if size + 1 + len(line) > self.SLACK_SECTION_MAX_CHARS:
+                blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "\n".join(chunk)}})
+                chunk, size = [], -1
+            chunk.append(line[: self.SLACK_SECTION_MAX_CHARS])
+            size += 1 + len(chunk[-1])
+        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "\n".join(chunk)}})
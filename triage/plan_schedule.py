@@ -0,0 +1,307 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Per-user daily plan times across time zones, sharded across scheduler replicas."""
+
+import heapq
+import itertools
+import logging
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from datetime import timezone as dt_timezone
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class UserPlanTime:
+    """When a user's daily plan is due."""
+
+    user_id: str  # Owner of the plan
+    plan_time: dt_time  # Local time the plan must be ready
+    timezone: ZoneInfo  # Time zone of the plan time
+    working_days: FrozenSet[int]  # Weekdays that get a plan, Monday being 0
+
+
+@dataclass(frozen=True)
+class ScheduledPlan:
+    """A daily plan that fell due."""
+
+    user_id: str  # Owner of the plan
+    plan_date: date  # Local date of the plan
+    fire_at: datetime  # Time the plan was due (UTC)
+
+
+class PlanSchedule:
+    """
+    Min-heap of the next daily plan time of many users.
+
+    Each user has a local plan time, a time zone and working days. The heap
+    holds one entry per user with the UTC time of the user's next plan, so
+    popping a due plan and scheduling the user's next one costs O(log n).
+    Users are sharded by a stable hash of their ID; a replica only keeps the
+    users of its own shard.
+
+    Plans that fell due while nobody was popping them (e.g. while the
+    scheduler was down) are caught up: the latest missed plan of a user is
+    returned if it is at most ``catch_up_hours`` late, older ones are skipped.
+    """
+
+    # Default lateness up to which a missed plan is still generated in hours
+    DEFAULT_CATCH_UP_HOURS = 12
+
+    def __init__(self, shard_index: int = 0, shard_count: int = 1, catch_up_hours: float = DEFAULT_CATCH_UP_HOURS):
+        """
+        Initialize the schedule.
+
+        Args:
+            shard_index: Shard kept by this replica, from 0 to shard_count - 1 (default: 0)
+            shard_count: Number of scheduler replicas (default: 1)
+            catch_up_hours: Lateness up to which a missed plan is still generated (default: 12)
+
+        Raises:
+            ValueError: If the shard or the catch-up window is invalid
+        """
+        if shard_count < 1 or not 0 <= shard_index < shard_count:
+            raise ValueError(f"Shard index must be between 0 and {shard_count - 1}, got {shard_index}")
+        if catch_up_hours < 0:
+            raise ValueError(f"catch_up_hours must be non-negative, got {catch_up_hours}")
+
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.catch_up = timedelta(hours=catch_up_hours)
+
+        # Min-heap of (fire_at, sequence, user_id, plan_date); entries whose
+        # sequence is no longer the user's current one are skipped when popped
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[datetime, int, str, date]] = []
+        self._users: Dict[str, Tuple[UserPlanTime, int]] = {}
+        self._sequence = itertools.count()
+
+        # Missed plans that were not caught up
+        self.skipped = 0
+
+    def __len__(self) -> int:
+        """Number of users in this shard."""
+        return len(self._users)
+
+    def __contains__(self, user_id: str) -> bool:
+        """Check whether a user is scheduled in this shard."""
+        return user_id in self._users
+
+    def shard_of(self, user_id: str) -> int:
+        """
+        Get the shard a user belongs to.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Shard index
+        """
+        return zlib.crc32(user_id.encode()) % self.shard_count
+
+    def owns(self, user_id: str) -> bool:
+        """
+        Check whether a user belongs to this replica's shard.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            True if the user is scheduled by this replica
+        """
+        return self.shard_of(user_id) == self.shard_index
+
+    def add_user(
+        self,
+        user_id: str,
+        time_of_day: str,
+        timezone: str = "UTC",
+        working_days: Optional[Iterable[int]] = None,
+        last_plan_date: Optional[date] = None,
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Schedule the daily plan of a user, replacing any previous schedule.
+
+        The first plan is the one following ``last_plan_date``, or today's plan
+        if no plan was generated yet; if it is already due, it is caught up by
+        the next pop_due().
+
+        Args:
+            user_id: User ID
+            time_of_day: Local plan time in HH:MM format (e.g., "08:00")
+            timezone: IANA time zone of the plan time (default: "UTC")
+            working_days: Weekdays that get a plan, Monday being 0 (default: None, every day)
+            last_plan_date: Local date of the user's last generated plan (optional)
+            now: Current time (default: the current time)
+
+        Returns:
+            True if the user was scheduled, False if it belongs to another shard
+
+        Raises:
+            ValueError: If the time, the time zone or the working days are invalid
+        """
+        user = UserPlanTime(
+            user_id=user_id,
+            plan_time=self._parse_time(time_of_day),
+            timezone=self._parse_timezone(timezone),
+            working_days=frozenset(range(7)) if working_days is None else frozenset(working_days),
+        )
+        if not user.working_days or not user.working_days <= set(range(7)):
+            raise ValueError(f"working_days must be weekdays between 0 and 6, got {sorted(user.working_days)}")
+
+        if not self.owns(user_id):
+            logger.debug(f"User {user_id} belongs to shard {self.shard_of(user_id)}, not {self.shard_index}")
+            return False
+
+        if last_plan_date is not None:
+            first_date = last_plan_date + timedelta(days=1)
+        else:
+            first_date = (now or datetime.now(dt_timezone.utc)).astimezone(user.timezone).date()
+
+        fire_at, plan_date = self._next_slot(user, first_date)
+        with self._lock:
+            sequence = next(self._sequence)
+            self._users[user_id] = (user, sequence)
+            heapq.heappush(self._heap, (fire_at, sequence, user_id, plan_date))
+
+        logger.debug(f"Scheduled daily plan of {user_id} for {plan_date} at {fire_at.isoformat()}")
+        return True
+
+    def remove_user(self, user_id: str) -> bool:
+        """
+        Stop scheduling the daily plan of a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            True if the user was scheduled, False otherwise
+        """
+        with self._lock:
+            return self._users.pop(user_id, None) is not None
+
+    def next_fire_at(self) -> Optional[datetime]:
+        """
+        Get the time the earliest plan is due.
+
+        Returns:
+            UTC time of the next plan, or None if no user is scheduled
+        """
+        with self._lock:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[ScheduledPlan]:
+        """
+        Take the plans that are due and schedule each user's next plan.
+
+        Args:
+            now: Current time (time zone aware)
+
+        Returns:
+            Due plans in order of their time
+        """
+        due = []
+        with self._lock:
+            while True:
+                self._drop_stale()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+
+                fire_at, sequence, user_id, plan_date = heapq.heappop(self._heap)
+                user = self._users[user_id][0]
+
+                # Only the latest of several missed plans is caught up
+                next_fire_at, next_date = self._next_slot(user, plan_date + timedelta(days=1))
+                while next_fire_at <= now:
+                    self.skipped += 1
+                    fire_at, plan_date = next_fire_at, next_date
+                    next_fire_at, next_date = self._next_slot(user, plan_date + timedelta(days=1))
+
+                if now - fire_at <= self.catch_up:
+                    due.append(ScheduledPlan(user_id=user_id, plan_date=plan_date, fire_at=fire_at))
+                else:
+                    self.skipped += 1
+                    logger.warning(f"Skipped daily plan of {user_id} for {plan_date}: due at {fire_at.isoformat()}")
+
+                heapq.heappush(self._heap, (next_fire_at, sequence, user_id, next_date))
+
+        return due
+
+    def _drop_stale(self) -> None:
+        """Pop heap entries of removed or rescheduled users. Must be called with the lock held."""
+        while self._heap:
+            _, sequence, user_id, _ = self._heap[0]
+            current = self._users.get(user_id)
+            if current is not None and current[1] == sequence:
+                return
+            heapq.heappop(self._heap)
+
+    @staticmethod
+    def _next_slot(user: UserPlanTime, first_date: date) -> Tuple[datetime, date]:
+        """
+        Get the first plan of a user on or after a local date.
+
+        Args:
+            user: User's plan time
+            first_date: Earliest local plan date
+
+        Returns:
+            Tuple of the UTC time the plan is due and its local date
+        """
+        for offset in range(7):
+            plan_date = first_date + timedelta(days=offset)
+            if plan_date.weekday() in user.working_days:
+                local = datetime.combine(plan_date, user.plan_time, tzinfo=user.timezone)
+                return local.astimezone(dt_timezone.utc), plan_date
+
+        raise ValueError(f"User {user.user_id} has no working days")
+
+    @staticmethod
+    def _parse_time(time_of_day: str) -> dt_time:
+        """
+        Parse a HH:MM plan time.
+
+        Args:
+            time_of_day: Time such as "08:00"
+
+        Returns:
+            Parsed time
+
+        Raises:
+            ValueError: If the format is invalid
+        """
+        try:
+            hour, minute = map(int, time_of_day.split(":"))
+            return dt_time(hour=hour, minute=minute)
+        except (ValueError, AttributeError) as e:
+            raise ValueError(f"Invalid time format: {time_of_day}. Expected HH:MM format.") from e
+
+    @staticmethod
+    def _parse_timezone(timezone: str) -> ZoneInfo:
+        """
+        Look up an IANA time zone.
+
+        Args:
+            timezone: Time zone name such as "Europe/Madrid"
+
+        Returns:
+            Time zone
+
+        Raises:
+            ValueError: If the time zone is unknown
+        """
+        try:
+            return ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError) as e:
+            raise ValueError(f"Unknown time zone: {timezone}") from e
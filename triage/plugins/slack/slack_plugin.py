@@ -13,12 +13,16 @@ Validates: Requirements 5.1, 5.2, 5.3, 5.4, 5.5, 5.6, 5.7
 """
 
 import logging
+from datetime import date
 from typing import Any, Dict, Optional
 
 from slack_sdk.errors import SlackApiError
 from slack_sdk.signature import SignatureVerifier
 from slack_sdk.web.async_client import AsyncWebClient
 
+from triage.models import DailyPlan
+from triage.plan_renderer import PlanRenderer, cursor_plan_date
+
 from ..installation_storage import PluginInstallationStorage
 from ..interface import (
     PluginConfig,
@@ -484,7 +488,10 @@ Need help? Contact support or visit our documentation.
         Handle /triage plan command.
 
         Generates a daily plan by invoking the generate_plan Core Action.
-        Supports optional closure_rate parameter.
+        Supports optional closure_rate parameter. Other tasks are shown one
+        page at a time; the "Show more" button (action plan_more) carries the
+        cursor of the next page and is answered with that page of the stored
+        plan, so paging does not refetch JIRA.
 
         Args:
             message: PluginMessage with command and parameters
@@ -507,28 +514,116 @@ Need help? Contact support or visit our documentation.
                     response_type="ephemeral",
                 )
 
+        if message.metadata.get("action_id") == "plan_more":
+            return await self._handle_plan_more(message, closure_rate)
+
         # Invoke Core Action
-        result = await self.core_api.generate_plan(user_id=message.user_id, closure_rate=closure_rate)
+        result = await self.core_api.generate_plan(
+            user_id=message.user_id, closure_rate=closure_rate, other_tasks_limit=PlanRenderer.OTHER_TASKS_PAGE_SIZE
+        )
 
         if result.success:
-            plan_markdown = result.data["markdown"]
+            plan = result.data["plan"]
+            metadata = {"plan_date": plan.date.isoformat() if hasattr(plan, "date") else None}
+
+            # Render Block Kit from the plan's shared task fragments
+            next_cursor = result.data.get("other_tasks_cursor")
+            if isinstance(plan, DailyPlan):
+                rendered = PlanRenderer.default().render(
+                    plan, formats=("slack",), other_tasks_limit=PlanRenderer.OTHER_TASKS_PAGE_SIZE
+                )
+                metadata["blocks"] = rendered.slack_blocks
+                next_cursor = rendered.next_cursor
 
             # Return plan with approval buttons
+            actions = [
+                {"type": "button", "text": "Approve", "action_id": "approve_plan", "style": "primary"},
+                {"type": "button", "text": "Reject", "action_id": "reject_plan", "style": "danger"},
+            ]
+            if next_cursor:
+                actions.append({"type": "button", "text": "Show more", "action_id": "plan_more", "value": next_cursor})
+
             return PluginResponse(
-                content=plan_markdown,
-                response_type="message",
-                actions=[
-                    {"type": "button", "text": "Approve", "action_id": "approve_plan", "style": "primary"},
-                    {"type": "button", "text": "Reject", "action_id": "reject_plan", "style": "danger"},
-                ],
-                metadata={
-                    "plan_date": result.data["plan"].date.isoformat() if hasattr(result.data["plan"], "date") else None
-                },
+                content=result.data["markdown"], response_type="message", actions=actions, metadata=metadata
             )
         else:
             # Return error message
             return PluginResponse(content=f"❌ Error generating plan: {result.error}", response_type="ephemeral")
 
+    async def _handle_plan_more(self, message: PluginMessage, closure_rate: Optional[float]) -> PluginResponse:
+        """
+        Handle a "Show more" click with the next page of the stored plan.
+
+        The plan is generated again only if no plan is stored for the date of
+        the cursor (e.g. the stored plan was dropped by a replan).
+
+        Args:
+            message: PluginMessage with the plan_more action and the page cursor as action_value
+            closure_rate: Previous day's closure rate, used if the plan must be generated
+
+        Returns:
+            PluginResponse with one page of other tasks
+        """
+        cursor = message.metadata.get("action_value")
+        try:
+            plan_date = cursor_plan_date(cursor) if cursor else date.today()
+        except ValueError as e:
+            logger.warning(f"Invalid plan page request: {e}")
+            return self._plan_changed_response()
+
+        result = await self.core_api.get_stored_plan(user_id=message.user_id, plan_date=plan_date)
+        if not result.success or not isinstance(result.data["plan"], DailyPlan):
+            logger.info(f"No stored plan for {plan_date}, generating it for the next page")
+            result = await self.core_api.generate_plan(
+                user_id=message.user_id, plan_date=plan_date, closure_rate=closure_rate
+            )
+            if not result.success or not isinstance(result.data["plan"], DailyPlan):
+                return PluginResponse(content=f"❌ Error generating plan: {result.error}", response_type="ephemeral")
+
+        plan = result.data["plan"]
+        return self._plan_page_response(plan, cursor, {"plan_date": plan.date.isoformat()})
+
+    @staticmethod
+    def _plan_changed_response() -> PluginResponse:
+        """Build the response to a page request that no longer matches the plan."""
+        return PluginResponse(
+            content="This plan has changed since it was sent. Run `/triage plan` to see the current plan.",
+            response_type="ephemeral",
+        )
+
+    def _plan_page_response(self, plan: DailyPlan, cursor: Optional[str], metadata: Dict[str, Any]) -> PluginResponse:
+        """
+        Build the response to a "Show more" request with the next page of other tasks.
+
+        Args:
+            plan: Current daily plan
+            cursor: Cursor of the requested page
+            metadata: Response metadata (plan_date)
+
+        Returns:
+            PluginResponse with one page of other tasks and, if more remain, another "Show more" button
+        """
+        try:
+            rendered = PlanRenderer.default().render_other_tasks(
+                plan, formats=("markdown", "slack"), other_tasks_cursor=cursor
+            )
+        except ValueError as e:
+            logger.warning(f"Invalid plan page request: {e}")
+            return self._plan_changed_response()
+
+        actions = []
+        if rendered.next_cursor:
+            actions.append(
+                {"type": "button", "text": "Show more", "action_id": "plan_more", "value": rendered.next_cursor}
+            )
+
+        return PluginResponse(
+            content=rendered.markdown,
+            response_type="message",
+            actions=actions,
+            metadata={**metadata, "blocks": rendered.slack_blocks},
+        )
+
     async def _handle_status_command(self, message: PluginMessage) -> PluginResponse:
         """
         Handle /triage status command.
@@ -735,7 +830,7 @@ Example: `/triage config max_priorities=3`
 
         Transforms channel-agnostic response into Slack's Block Kit format
         with support for:
-        - Markdown text formatting
+        - Markdown text formatting, or pre-rendered blocks from metadata["blocks"]
         - Interactive buttons
         - Attachments
         - Context metadata
@@ -755,7 +850,10 @@ Example: `/triage config max_priorities=3`
         content = response.content
         max_length = 2900  # Leave some margin
 
-        if len(content) <= max_length:
+        if response.metadata.get("blocks"):
+            # Content was already rendered as Block Kit (e.g. a plan)
+            blocks.extend(response.metadata["blocks"])
+        elif len(content) <= max_length:
             blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": content}})
         else:
             # Split into multiple blocks
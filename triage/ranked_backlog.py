@@ -0,0 +1,155 @@
+# TrIAge
+# Copyright (C) 2026 StrateCode
+# Licensed under the GNU Affero General Public License v3 (AGPLv3)
+
+"""Incrementally maintained, rank-ordered set of classified tasks."""
+
+import logging
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sortedcontainers import SortedList
+
+from triage.models import TaskClassification
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Ranking key type: (status rank, priority rank, effort, age proxy), with
+# -(tasks unblocked) before the effort when ranking with a dependency graph
+RankKey = Tuple[float, ...]
+
+
+class RankedBacklog:
+    """
+    Keeps classified tasks in rank order across plans and replans.
+
+    Tasks are stored in a sorted list keyed by (rank key, task key), so
+    inserting, removing or re-ranking a single task costs O(log n) and the
+    top-ranked tasks can be read without sorting the whole backlog.
+    """
+
+    def __init__(self, key_func: Callable[[TaskClassification], RankKey]):
+        """
+        Initialize an empty ranked backlog.
+
+        Args:
+            key_func: Function returning the rank key of a classification
+        """
+        self.key_func = key_func
+        self._order: SortedList = SortedList()
+        self._entries: Dict[str, Tuple[RankKey, TaskClassification]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of ranked tasks."""
+        return len(self._entries)
+
+    def __contains__(self, task_key: object) -> bool:
+        """Check whether a task is ranked."""
+        return task_key in self._entries
+
+    def __iter__(self) -> Iterator[TaskClassification]:
+        """Iterate over classifications in rank order."""
+        for _, task_key in self._order:
+            yield self._entries[task_key][1]
+
+    def get(self, task_key: str) -> Optional[TaskClassification]:
+        """
+        Get a ranked task by key.
+
+        Args:
+            task_key: JIRA key of the task
+
+        Returns:
+            TaskClassification if ranked, None otherwise
+        """
+        entry = self._entries.get(task_key)
+        return entry[1] if entry else None
+
+    def top(self, count: int) -> List[TaskClassification]:
+        """
+        Get the best-ranked tasks.
+
+        Args:
+            count: Maximum number of tasks to return
+
+        Returns:
+            Up to ``count`` classifications in rank order
+        """
+        return list(islice(self, count))
+
+    def upsert(self, classification: TaskClassification) -> None:
+        """
+        Insert a task or update its classification and position.
+
+        Args:
+            classification: Classified task
+        """
+        task_key = classification.task.key
+        rank_key = self.key_func(classification)
+
+        current = self._entries.get(task_key)
+        if current is not None:
+            if current[0] == rank_key:
+                # Position unchanged - just refresh the classification
+                self._entries[task_key] = (rank_key, classification)
+                return
+            self._order.remove((current[0], task_key))
+
+        self._entries[task_key] = (rank_key, classification)
+        self._order.add((rank_key, task_key))
+
+    def remove(self, task_key: str) -> bool:
+        """
+        Remove a task.
+
+        Args:
+            task_key: JIRA key of the task
+
+        Returns:
+            True if the task was ranked and removed, False otherwise
+        """
+        current = self._entries.pop(task_key, None)
+        if current is None:
+            return False
+
+        self._order.remove((current[0], task_key))
+        return True
+
+    def apply_delta(self, upserted: Iterable[TaskClassification] = (), removed_keys: Iterable[str] = ()) -> None:
+        """
+        Apply a delta of changed and removed tasks.
+
+        Args:
+            upserted: New or changed classifications
+            removed_keys: Keys of tasks that left the backlog
+        """
+        for task_key in removed_keys:
+            self.remove(task_key)
+
+        for classification in upserted:
+            self.upsert(classification)
+
+    def sync(self, classifications: List[TaskClassification]) -> None:
+        """
+        Replace the ranked set with a full backlog, touching only what changed.
+
+        Args:
+            classifications: Complete set of tasks to rank
+        """
+        if not self._entries:
+            # Bulk load is a single sort
+            entries = {c.task.key: (self.key_func(c), c) for c in classifications}
+            self._entries = entries
+            self._order = SortedList((rank_key, task_key) for task_key, (rank_key, _) in entries.items())
+            return
+
+        current_keys = {c.task.key for c in classifications}
+        removed_keys = [task_key for task_key in self._entries if task_key not in current_keys]
+        self.apply_delta(classifications, removed_keys)
+        logger.debug(f"Synced ranked backlog: {len(self._entries)} tasks, {len(removed_keys)} removed")
+
+    def clear(self) -> None:
+        """Remove all tasks."""
+        self._order.clear()
+        self._entries.clear()
@@ -5,7 +5,9 @@
 """Task classification logic for categorizing and analyzing JIRA tasks."""
 
 import logging
+from typing import Optional, Tuple
 
+from triage.dependency_graph import DependencyGraph
 from triage.models import (
     JiraIssue,
     TaskCategory,
@@ -36,6 +38,28 @@ class TaskClassifier:
     # Seconds in a working day (8 hours)
     SECONDS_PER_DAY = 8 * 60 * 60
 
+    # Priority name to rank (lower is higher priority)
+    PRIORITY_ORDER = {
+        "blocker": 0,
+        "highest": 1,
+        "high": 2,
+        "medium": 3,
+        "low": 4,
+        "lowest": 5,
+    }
+
+    def __init__(self, dependency_graph: Optional[DependencyGraph] = None):
+        """
+        Initialize the task classifier.
+
+        Args:
+            dependency_graph: Issue-link graph of the backlog (optional). When
+                              it contains an issue, only chains of unresolved
+                              blockers leading outside the backlog count as
+                              dependencies.
+        """
+        self.dependency_graph = dependency_graph
+
     def classify_task(self, issue: JiraIssue) -> TaskClassification:
         """
         Classify a single task.
@@ -100,23 +124,68 @@ class TaskClassifier:
             has_dependencies=has_dependencies,
             estimated_days=estimated_days,
             blocking_reason=blocking_reason,
+            rank_key=self.compute_rank_key(issue, estimated_days),
         )
 
+    @classmethod
+    def compute_rank_key(cls, issue: JiraIssue, estimated_days: float) -> Tuple[int, int, float, int]:
+        """
+        Compute the key used to rank a task for priority selection.
+
+        Ranking criteria (in order):
+        1. Status (In Progress first - should be completed)
+        2. Priority (Blocker > High > Medium > Low)
+        3. Effort (smaller first)
+        4. Age (older first - using key as proxy)
+
+        Args:
+            issue: Raw JIRA issue
+            estimated_days: Effort estimate in days
+
+        Returns:
+            Tuple of (status rank, priority rank, effort, age proxy)
+        """
+        # Prioritize tasks already in progress (should be completed first)
+        status_rank = 0 if issue.status.lower() == "in progress" else 1
+
+        # Get priority rank (lower is higher priority)
+        priority_rank = cls.PRIORITY_ORDER.get(issue.priority.lower(), 3)
+
+        # Get age proxy (older keys typically have lower numbers)
+        # Extract numeric part from key like "PROJ-123"
+        try:
+            key_parts = issue.key.split("-")
+            if len(key_parts) >= 2:
+                age_proxy = int(key_parts[-1])
+            else:
+                age_proxy = 0
+        except (ValueError, IndexError):
+            age_proxy = 0
+
+        return (status_rank, priority_rank, estimated_days, age_proxy)
+
     def has_third_party_dependencies(self, issue: JiraIssue) -> bool:
         """
         Check if task has dependencies on external parties.
 
         Examines issue links for "blocks", "is blocked by" relationships
-        and custom fields indicating external dependencies.
+        and custom fields indicating external dependencies. With a dependency
+        graph containing the issue, links to blockers that are already
+        resolved are ignored, and so are chains of blockers that lead back
+        into the backlog (finishing backlog work unblocks the task).
 
         Returns:
             True if task has third-party dependencies
         """
         # Check issue links for blocking relationships
-        for link in issue.issue_links:
-            link_type_lower = link.link_type.lower()
-            if any(blocking_type in link_type_lower for blocking_type in self.BLOCKING_LINK_TYPES):
+        if self.dependency_graph is not None and issue.key in self.dependency_graph:
+            if self.dependency_graph.is_externally_blocked(issue.key):
                 return True
+        else:
+            for link in issue.issue_links:
+                link_type_lower = link.link_type.lower()
+                if any(blocking_type in link_type_lower for blocking_type in self.BLOCKING_LINK_TYPES):
+                    return True
 
         # Check custom fields for external dependency indicators
         for field_name, field_value in issue.custom_fields.items():